@@ -8,10 +8,12 @@ import voluptuous as vol
 
 from homeassistant.components import stt
 from homeassistant.core import Context, HomeAssistant
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     CONF_DEBUG_RECORDING_DIR,
+    CONF_ENGINE_CONCURRENCY,
     DATA_CONFIG,
     DATA_LAST_WAKE_UP,
     DOMAIN,
@@ -68,6 +70,9 @@ CONFIG_SCHEMA = vol.Schema(
         DOMAIN: vol.Schema(
             {
                 vol.Optional(CONF_DEBUG_RECORDING_DIR): str,
+                vol.Optional(CONF_ENGINE_CONCURRENCY): {
+                    cv.string: vol.All(vol.Coerce(int), vol.Range(min=1))
+                },
             },
         )
     },
@@ -82,7 +87,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     # wake_word_id -> timestamp of last detection (monotonic_ns)
     hass.data[DATA_LAST_WAKE_UP] = {}
 
-    await async_setup_pipeline_store(hass)
+    pipeline_data = await async_setup_pipeline_store(hass)
+    pipeline_data.scheduler.async_set_concurrency(
+        hass.data[DATA_CONFIG].get(CONF_ENGINE_CONCURRENCY, {})
+    )
     await async_run_migrations(hass)
     async_register_websocket_api(hass)
 
@@ -105,6 +113,7 @@ async def async_pipeline_from_audio_stream(
     device_id: str | None = None,
     start_stage: PipelineStage = PipelineStage.STT,
     end_stage: PipelineStage = PipelineStage.TTS,
+    priority: int = 0,
 ) -> None:
     """Create an audio pipeline from an audio stream.
 
@@ -126,6 +135,7 @@ async def async_pipeline_from_audio_stream(
             tts_audio_output=tts_audio_output,
             wake_word_settings=wake_word_settings,
             audio_settings=audio_settings or AudioSettings(),
+            priority=priority,
         ),
     )
     await pipeline_input.validate()
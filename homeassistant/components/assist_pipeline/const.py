@@ -10,6 +10,7 @@ DEFAULT_PIPELINE_TIMEOUT = 60 * 5  # seconds
 DEFAULT_WAKE_WORD_TIMEOUT = 3  # seconds
 
 CONF_DEBUG_RECORDING_DIR = "debug_recording_dir"
+CONF_ENGINE_CONCURRENCY = "engine_concurrency"
 
 DATA_LAST_WAKE_UP = f"{DOMAIN}.last_wake_up"
 WAKE_WORD_COOLDOWN = 2  # seconds
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import array
 import asyncio
+
+# Suppressing disable=deprecated-module is needed for Python 3.11
+import audioop  # pylint: disable=deprecated-module
 from collections import defaultdict, deque
 from collections.abc import AsyncGenerator, AsyncIterable, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import asdict, dataclass, field
 from enum import StrEnum
+from functools import partial
 import logging
 from pathlib import Path
 from queue import Empty, Queue
@@ -29,7 +33,7 @@ from homeassistant.components import (
 from homeassistant.components.tts.media_source import (
     generate_media_source_id as tts_generate_media_source_id,
 )
-from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.collection import (
     CHANGE_UPDATED,
@@ -75,6 +79,7 @@ from .error import (
     WakeWordDetectionError,
     WakeWordTimeoutError,
 )
+from .scheduler import StageScheduler
 from .vad import AudioBuffer, VoiceActivityTimeout, VoiceCommandSegmenter, chunk_samples
 
 _LOGGER = logging.getLogger(__name__)
@@ -541,9 +546,12 @@ class PipelineRun:
     tts_audio_output: str | None = None
     wake_word_settings: WakeWordSettings | None = None
     audio_settings: AudioSettings = field(default_factory=AudioSettings)
+    priority: int = 0
+    """Runs with a higher priority get an engine first when it is busy."""
 
     id: str = field(default_factory=ulid_util.ulid_now)
     stt_provider: stt.SpeechToTextEntity | stt.Provider = field(init=False, repr=False)
+    stt_engine: str = field(init=False, repr=False)
     tts_engine: str = field(init=False, repr=False)
     tts_options: dict | None = field(init=False, default=None)
     wake_word_entity_id: str | None = field(init=False, default=None, repr=False)
@@ -859,6 +867,11 @@ class PipelineRun:
             )
 
         self.stt_provider = stt_provider
+        if isinstance(stt_provider, stt.Provider):
+            # Legacy providers are registered by their name
+            self.stt_engine = cast(str, stt_provider.name)
+        else:
+            self.stt_engine = stt_provider.entity_id
 
     async def speech_to_text(
         self,
@@ -875,10 +888,7 @@ class PipelineRun:
                 f"prepare conversation agent {self.intent_agent}",
             )
 
-        if isinstance(self.stt_provider, stt.Provider):
-            engine = self.stt_provider.name
-        else:
-            engine = self.stt_provider.entity_id
+        engine = self.stt_engine
 
         self.process_event(
             PipelineEvent(
@@ -902,10 +912,14 @@ class PipelineRun:
                     silence_seconds=self.audio_settings.silence_seconds
                 )
 
-            result = await self.stt_provider.async_process_audio_stream(
-                metadata,
-                self._speech_to_text_stream(audio_stream=stream, stt_vad=stt_vad),
-            )
+            # The engine is only waited for once the voice command has ended
+            async with AsyncExitStack() as engine_slot:
+                result = await self.stt_provider.async_process_audio_stream(
+                    metadata,
+                    self._speech_to_text_stream(
+                        audio_stream=stream, stt_vad=stt_vad, engine_slot=engine_slot
+                    ),
+                )
         except Exception as src_error:
             _LOGGER.exception("Unexpected error during speech-to-text")
             raise SpeechToTextError(
@@ -943,10 +957,15 @@ class PipelineRun:
         self,
         audio_stream: AsyncIterable[EnhancedAudioChunk],
         stt_vad: VoiceCommandSegmenter | None,
+        engine_slot: AsyncExitStack | None = None,
         sample_rate: int = SAMPLE_RATE,
         sample_width: int = SAMPLE_WIDTH,
     ) -> AsyncGenerator[bytes]:
-        """Yield audio chunks until VAD detects silence or speech-to-text completes."""
+        """Yield audio chunks until VAD detects silence or speech-to-text completes.
+
+        The engine slot is entered after the last chunk, so the stage is only
+        queued for the engine while the engine processes the voice command.
+        """
         sent_vad_start = False
         async for chunk in audio_stream:
             self._capture_chunk(chunk.audio)
@@ -975,6 +994,11 @@ class PipelineRun:
 
             yield chunk.audio
 
+        if engine_slot is not None:
+            await engine_slot.enter_async_context(
+                self._async_engine_slot(PipelineStage.STT, self.stt_engine)
+            )
+
     async def prepare_recognize_intent(self) -> None:
         """Prepare recognizing an intent."""
         agent_info = conversation.async_get_agent_info(
@@ -1012,15 +1036,16 @@ class PipelineRun:
         )
 
         try:
-            conversation_result = await conversation.async_converse(
-                hass=self.hass,
-                text=intent_input,
-                conversation_id=conversation_id,
-                device_id=device_id,
-                context=self.context,
-                language=self.pipeline.conversation_language,
-                agent_id=self.intent_agent,
-            )
+            async with self._async_engine_slot(PipelineStage.INTENT, self.intent_agent):
+                conversation_result = await conversation.async_converse(
+                    hass=self.hass,
+                    text=intent_input,
+                    conversation_id=conversation_id,
+                    device_id=device_id,
+                    context=self.context,
+                    language=self.pipeline.conversation_language,
+                    agent_id=self.intent_agent,
+                )
         except Exception as src_error:
             _LOGGER.exception("Unexpected error during intent recognition")
             raise IntentRecognitionError(
@@ -1097,6 +1122,10 @@ class PipelineRun:
             )
         )
 
+        pipeline_data: PipelineData = self.hass.data[DOMAIN]
+        release_engine = await pipeline_data.scheduler.async_acquire(
+            self.pipeline.id, PipelineStage.TTS, self.tts_engine, self.priority
+        )
         try:
             # Synthesize audio and get URL
             tts_media_id = tts_generate_media_source_id(
@@ -1112,11 +1141,21 @@ class PipelineRun:
                 None,
             )
         except Exception as src_error:
+            release_engine()
             _LOGGER.exception("Unexpected error during text-to-speech")
             raise TextToSpeechError(
                 code="tts-failed",
                 message="Unexpected error during text-to-speech",
             ) from src_error
+        except asyncio.CancelledError:
+            release_engine()
+            raise
+
+        # The engine keeps generating the audio after the URL is resolved
+        self.hass.async_create_background_task(
+            tts.async_get_media_source_audio(self.hass, tts_media_id),
+            f"assist_pipeline tts generation {tts_media_id}",
+        ).add_done_callback(partial(_release_engine_when_generated, release_engine))
 
         _LOGGER.debug("TTS result %s", tts_media)
         tts_output = {
@@ -1128,6 +1167,17 @@ class PipelineRun:
             PipelineEvent(PipelineEventType.TTS_END, {"tts_output": tts_output})
         )
 
+    @asynccontextmanager
+    async def _async_engine_slot(
+        self, stage: PipelineStage, engine: str
+    ) -> AsyncGenerator[None]:
+        """Process a stage once its engine can take it."""
+        pipeline_data: PipelineData = self.hass.data[DOMAIN]
+        async with pipeline_data.scheduler.async_slot(
+            self.pipeline.id, stage, engine, self.priority
+        ):
+            yield
+
     def _capture_chunk(self, audio_bytes: bytes | None) -> None:
         """Forward audio chunk to various capturing mechanisms."""
         if self.debug_recording_queue is not None:
@@ -1242,17 +1292,20 @@ class PipelineRun:
                 timestamp_ms += MS_PER_CHUNK
 
 
-def _multiply_volume(chunk: bytes, volume_multiplier: float) -> bytes:
-    """Multiplies 16-bit PCM samples by a constant."""
+@callback
+def _release_engine_when_generated(
+    release_engine: CALLBACK_TYPE, generate_task: asyncio.Task[tuple[str, bytes]]
+) -> None:
+    """Release the text-to-speech engine once it generated the audio."""
+    if not generate_task.cancelled() and (err := generate_task.exception()):
+        # Errors are reported to whoever plays the audio
+        _LOGGER.debug("Error generating text-to-speech audio: %s", err)
+    release_engine()
 
-    def _clamp(val: float) -> float:
-        """Clamp to signed 16-bit."""
-        return max(-32768, min(32767, val))
 
-    return array.array(
-        "h",
-        (int(_clamp(value * volume_multiplier)) for value in array.array("h", chunk)),
-    ).tobytes()
+def _multiply_volume(chunk: bytes, volume_multiplier: float) -> bytes:
+    """Multiplies 16-bit PCM samples by a constant, clamped to signed 16-bit."""
+    return audioop.mul(chunk, SAMPLE_WIDTH, volume_multiplier)
 
 
 def _pipeline_debug_recording_thread_proc(
@@ -1754,6 +1807,7 @@ class PipelineData:
         self.pipeline_devices: dict[str, AssistDevice] = {}
         self.pipeline_runs = PipelineRuns(pipeline_store)
         self.device_audio_queues: dict[str, DeviceAudioQueue] = {}
+        self.scheduler = StageScheduler()
 
 
 @dataclass(slots=True)
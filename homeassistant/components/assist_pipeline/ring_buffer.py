@@ -28,9 +28,17 @@ class RingBuffer:
         """Return the length of data stored in the buffer."""
         return self._length
 
-    def put(self, data: bytes) -> None:
+    def put(self, data: bytes | memoryview) -> None:
         """Put a chunk of data into the buffer, possibly wrapping around."""
+        # Slicing a memoryview does not copy the data
+        data = memoryview(data)
         data_len = len(data)
+        if data_len > self._maxlen:
+            # Only the end of the data fits
+            self._pos = (self._pos + data_len - self._maxlen) % self._maxlen
+            data = data[-self._maxlen :]
+            data_len = self._maxlen
+
         new_pos = self._pos + data_len
         if new_pos >= self._maxlen:
             # Split into two chunks
@@ -49,9 +57,10 @@ class RingBuffer:
 
     def getvalue(self) -> bytes:
         """Get bytes written to the buffer."""
-        if (self._pos + self._length) <= self._maxlen:
-            # Single chunk
-            return bytes(self._buffer[: self._length])
+        buffer = memoryview(self._buffer)
+        if self._length < self._maxlen:
+            # Single chunk, the buffer has not wrapped around yet
+            return bytes(buffer[: self._length])
 
         # Two chunks
-        return bytes(self._buffer[self._pos :] + self._buffer[: self._pos])
+        return b"".join((buffer[self._pos :], buffer[: self._pos]))
@@ -0,0 +1,202 @@
+"""Scheduling of the work of pipeline stages on their engines."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+"""Upper bounds of the latency histogram buckets (seconds)."""
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Histogram of latencies."""
+
+    buckets: tuple[float, ...] = LATENCY_BUCKETS
+    """Upper bounds of the buckets, the last bucket has no upper bound."""
+
+    counts: list[int] = field(init=False)
+    """Number of latencies in each bucket."""
+
+    count: int = 0
+    """Number of latencies."""
+
+    total: float = 0.0
+    """Sum of the latencies (seconds)."""
+
+    def __post_init__(self) -> None:
+        """Initialize the buckets."""
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def add(self, seconds: float) -> None:
+        """Add a latency."""
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the histogram."""
+        return {
+            "buckets": list(self.buckets),
+            "counts": self.counts,
+            "count": self.count,
+            "sum": self.total,
+        }
+
+
+@dataclass(slots=True)
+class StageLatency:
+    """Latencies of a pipeline stage."""
+
+    queued: LatencyHistogram = field(default_factory=LatencyHistogram)
+    """Time waiting for the engine."""
+
+    processing: LatencyHistogram = field(default_factory=LatencyHistogram)
+    """Time the engine worked on the stage."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the latencies."""
+        return {
+            "queued": self.queued.as_dict(),
+            "processing": self.processing.as_dict(),
+        }
+
+
+class EngineQueue:
+    """Queue of the work waiting for an engine, by priority and then in order."""
+
+    def __init__(self, concurrency: int | None) -> None:
+        """Initialize queue."""
+        self.concurrency = concurrency
+        """Maximum number of stages processed at once (None = no limit)."""
+
+        self.active = 0
+        """Number of stages the engine is processing."""
+
+        self._waiting: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of stages waiting for the engine."""
+        return len(self._waiting)
+
+    def _has_capacity(self) -> bool:
+        """Return True if the engine can process another stage."""
+        return self.concurrency is None or self.active < self.concurrency
+
+    async def async_acquire(self, priority: int) -> None:
+        """Wait until the engine can process a stage."""
+        if not self._waiting and self._has_capacity():
+            self.active += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (-priority, next(self._order), future)
+        heapq.heappush(self._waiting, entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                # Leave the queue
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+            else:
+                # The engine was handed over right before the cancellation
+                self.release()
+            raise
+
+    @callback
+    def release(self) -> None:
+        """Hand the engine over to the next waiting stage."""
+        self.active -= 1
+        self._start_waiting()
+
+    @callback
+    def async_set_concurrency(self, concurrency: int | None) -> None:
+        """Set the maximum number of stages processed at once."""
+        self.concurrency = concurrency
+        self._start_waiting()
+
+    def _start_waiting(self) -> None:
+        """Start the waiting stages the engine has capacity for."""
+        while self._waiting and self._has_capacity():
+            _, _, future = heapq.heappop(self._waiting)
+            self.active += 1
+            future.set_result(None)
+
+
+class StageScheduler:
+    """Schedule the work of pipeline stages on their engines.
+
+    Each engine processes a configurable number of stages at once, others
+    wait by priority. The time stages wait and are processed is recorded
+    per pipeline.
+    """
+
+    def __init__(self) -> None:
+        """Initialize scheduler."""
+        self._concurrency: dict[str, int] = {}
+        self.queues: dict[str, EngineQueue] = {}
+        self.latency: defaultdict[str, dict[str, StageLatency]] = defaultdict(dict)
+
+    @callback
+    def async_set_concurrency(self, concurrency: Mapping[str, int]) -> None:
+        """Set the maximum number of stages processed at once per engine."""
+        self._concurrency = dict(concurrency)
+        for engine, queue in self.queues.items():
+            queue.async_set_concurrency(self._concurrency.get(engine))
+
+    async def async_acquire(
+        self, pipeline_id: str, stage: str, engine: str, priority: int = 0
+    ) -> CALLBACK_TYPE:
+        """Wait until an engine can process a stage.
+
+        Returns a callback to call once the engine is done with the stage.
+        """
+        if (queue := self.queues.get(engine)) is None:
+            queue = self.queues[engine] = EngineQueue(self._concurrency.get(engine))
+
+        queued = time.monotonic()
+        await queue.async_acquire(priority)
+        started = time.monotonic()
+        released = False
+
+        @callback
+        def release() -> None:
+            """Release the engine and record the latencies."""
+            nonlocal released
+            if released:
+                return
+            released = True
+            queue.release()
+
+            latency = self.latency[pipeline_id].get(stage)
+            if latency is None:
+                latency = self.latency[pipeline_id][stage] = StageLatency()
+            latency.queued.add(started - queued)
+            latency.processing.add(time.monotonic() - started)
+
+        return release
+
+    @asynccontextmanager
+    async def async_slot(
+        self, pipeline_id: str, stage: str, engine: str, priority: int = 0
+    ) -> AsyncGenerator[None]:
+        """Process a stage once the engine can take it."""
+        release = await self.async_acquire(pipeline_id, stage, engine, priority)
+        try:
+            yield
+        finally:
+            release()
@@ -51,7 +51,7 @@ class AudioBuffer:
         """Clear the buffer."""
         self._length = 0
 
-    def append(self, data: bytes) -> None:
+    def append(self, data: bytes | memoryview) -> None:
         """Append bytes to the buffer, increasing the internal length."""
         data_len = len(data)
         if (self._length + data_len) > len(self._buffer):
@@ -62,7 +62,7 @@ class AudioBuffer:
 
     def bytes(self) -> bytes:
         """Convert written portion of buffer to bytes."""
-        return bytes(self._buffer[: self._length])
+        return bytes(memoryview(self._buffer)[: self._length])
 
     def __len__(self) -> int:
         """Get the number of bytes currently in the buffer."""
@@ -261,12 +261,19 @@ def chunk_samples(
         leftover_chunk_buffer.append(samples)
         return
 
+    if not leftover_chunk_buffer and len(samples) == bytes_per_chunk:
+        # Samples are already a full chunk
+        yield samples
+        return
+
+    # Slicing a memoryview does not copy the samples
+    samples_view = memoryview(samples)
     next_chunk_idx = 0
 
     if leftover_chunk_buffer:
         # Add to leftover chunk from previous call(s).
         bytes_to_copy = bytes_per_chunk - len(leftover_chunk_buffer)
-        leftover_chunk_buffer.append(samples[:bytes_to_copy])
+        leftover_chunk_buffer.append(samples_view[:bytes_to_copy])
         next_chunk_idx = bytes_to_copy
 
         # Process full chunk in buffer
@@ -279,5 +286,5 @@ def chunk_samples(
         next_chunk_idx += bytes_per_chunk
 
     # Capture leftover chunks
-    if rest_samples := samples[next_chunk_idx:]:
-        leftover_chunk_buffer.append(rest_samples)
+    if next_chunk_idx < len(samples):
+        leftover_chunk_buffer.append(samples_view[next_chunk_idx:])
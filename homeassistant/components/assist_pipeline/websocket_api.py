@@ -59,6 +59,7 @@ def async_register_websocket_api(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, websocket_list_runs)
     websocket_api.async_register_command(hass, websocket_list_devices)
     websocket_api.async_register_command(hass, websocket_get_run)
+    websocket_api.async_register_command(hass, websocket_get_latency)
     websocket_api.async_register_command(hass, websocket_device_capture)
 
 
@@ -76,6 +77,7 @@ def async_register_websocket_api(hass: HomeAssistant) -> None:
                 vol.Optional("conversation_id"): vol.Any(str, None),
                 vol.Optional("device_id"): vol.Any(str, None),
                 vol.Optional("timeout"): vol.Any(float, int),
+                vol.Optional("priority"): int,
             },
         ),
         cv.key_value_schemas(
@@ -234,6 +236,7 @@ async def websocket_run(
         },
         wake_word_settings=wake_word_settings,
         audio_settings=audio_settings or AudioSettings(),
+        priority=msg.get("priority", 0),
     )
 
     pipeline_input = PipelineInput(**input_args)
@@ -379,6 +382,33 @@ def websocket_get_run(
     )
 
 
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "assist_pipeline/pipeline_debug/latency",
+        vol.Required("pipeline_id"): str,
+    }
+)
+def websocket_get_latency(
+    hass: HomeAssistant,
+    connection: websocket_api.connection.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Get the latency histograms of the stages of a pipeline."""
+    pipeline_data: PipelineData = hass.data[DOMAIN]
+    stage_latency = pipeline_data.scheduler.latency.get(msg["pipeline_id"], {})
+
+    connection.send_result(
+        msg["id"],
+        {
+            "stages": {
+                stage: latency.as_dict() for stage, latency in stage_latency.items()
+            }
+        },
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "assist_pipeline/language/list",
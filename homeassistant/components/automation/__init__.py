@@ -70,6 +70,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.reload import config_hash
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -376,6 +377,11 @@ class BaseAutomationEntity(ToggleEntity, ABC):
             return {CONF_ID: self.unique_id}
         return None
 
+    @cached_property
+    def raw_config_hash(self) -> int | None:
+        """Return a hash of the raw config, used to match configs on reload."""
+        return config_hash(self.raw_config)
+
     @cached_property
     @abstractmethod
     def referenced_labels(self) -> set[str]:
@@ -898,6 +904,7 @@ class AutomationEntityConfig:
     raw_config: ConfigType | None
     validation_error: str | None
     validation_status: ValidationStatus
+    raw_config_hash: int | None
 
 
 async def _prepare_automation_config(
@@ -927,6 +934,7 @@ async def _prepare_automation_config(
                 raw_config,
                 validation_error,
                 validation_status,
+                config_hash(raw_config),
             )
         )
 
@@ -1030,7 +1038,11 @@ async def _async_process_config(
         automation: BaseAutomationEntity, config: AutomationEntityConfig
     ) -> bool:
         name = _automation_name(config)
-        return automation.name == name and automation.raw_config == config.raw_config
+        return (
+            automation.name == name
+            and automation.raw_config_hash == config.raw_config_hash
+            and automation.raw_config == config.raw_config
+        )
 
     def find_matches(
         automations: list[BaseAutomationEntity],
@@ -1041,12 +1053,17 @@ async def _async_process_config(
         An automation or configuration is only allowed to match at most once to handle
         the case of multiple automations with identical configuration.
 
+        Configurations without an ID are indexed by name and config hash, so
+        matching is linear in the number of automations.
+
         Returns a tuple of sets of indices: ({automation_matches}, {config_matches})
         """
         automation_matches: set[int] = set()
         config_matches: set[int] = set()
         automation_configs_with_id: dict[str, tuple[int, AutomationEntityConfig]] = {}
-        automation_configs_without_id: list[tuple[int, AutomationEntityConfig]] = []
+        automation_configs_without_id: dict[
+            tuple[str, int | None], list[tuple[int, AutomationEntityConfig]]
+        ] = {}
 
         for config_idx, automation_config in enumerate(automation_configs):
             if automation_id := automation_config.config_block.get(CONF_ID):
@@ -1055,7 +1072,13 @@ async def _async_process_config(
                     automation_config,
                 )
                 continue
-            automation_configs_without_id.append((config_idx, automation_config))
+            automation_configs_without_id.setdefault(
+                (
+                    _automation_name(automation_config),
+                    automation_config.raw_config_hash,
+                ),
+                [],
+            ).append((config_idx, automation_config))
 
         for automation_idx, automation in enumerate(automations):
             if automation.unique_id:
@@ -1069,7 +1092,9 @@ async def _async_process_config(
                     config_matches.add(config_idx)
                 continue
 
-            for config_idx, automation_config in automation_configs_without_id:
+            for config_idx, automation_config in automation_configs_without_id.get(
+                (str(automation.name), automation.raw_config_hash), ()
+            ):
                 if config_idx in config_matches:
                     # Only allow an automation config to match at most once
                     continue
@@ -1114,7 +1139,11 @@ def _automation_matches_config(
     if not config:
         return False
     name = _automation_name(config)
-    return automation.name == name and automation.raw_config == config.raw_config
+    return (
+        automation.name == name
+        and automation.raw_config_hash == config.raw_config_hash
+        and automation.raw_config == config.raw_config
+    )
 
 
 async def _async_process_single_config(
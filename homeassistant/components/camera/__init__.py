@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import collections
-from collections.abc import Awaitable, Callable, Iterable
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
 from contextlib import suppress
 from dataclasses import asdict
 from datetime import datetime, timedelta
@@ -16,6 +16,7 @@ from random import SystemRandom
 import time
 from typing import Any, Final, cast, final
 
+import aiohttp
 from aiohttp import hdrs, web
 import attr
 import voluptuous as vol
@@ -63,21 +64,25 @@ from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import ConfigType, VolDictType
 from homeassistant.loader import bind_hass
 
+from .broadcast import StillImageBroadcaster, async_mjpeg_frames
 from .const import (  # noqa: F401
     _DEPRECATED_STREAM_TYPE_HLS,
     _DEPRECATED_STREAM_TYPE_WEB_RTC,
     CAMERA_IMAGE_TIMEOUT,
+    CAMERA_MJPEG_STREAM_TIMEOUT,
     CAMERA_STREAM_SOURCE_TIMEOUT,
     CONF_DURATION,
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
     DATA_RTSP_TO_WEB_RTC,
     DOMAIN,
+    PREF_IMAGE_CACHE_MAX_AGE,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
     SERVICE_RECORD,
     StreamType,
 )
+from .image_cache import CameraImageCache
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
 
@@ -174,7 +179,39 @@ async def _async_get_image(
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
     are handled.
+
+    Concurrent requests share a single fetch from the camera and images
+    are served from the cache of the camera while they are younger than
+    its image_cache_max_age.
     """
+    return await camera.image_cache.async_get_image(
+        camera.hass,
+        width,
+        height,
+        _image_cache_max_age(camera),
+        partial(_async_fetch_image, camera, timeout),
+        _scale_image,
+    )
+
+
+def _image_cache_max_age(camera: Camera) -> float:
+    """Return the image cache max age preference, or the one of the camera."""
+    if (
+        (registry_entry := camera.registry_entry) is not None
+        and (camera_options := registry_entry.options.get(DOMAIN)) is not None
+        and (max_age := camera_options.get(PREF_IMAGE_CACHE_MAX_AGE)) is not None
+    ):
+        return cast(float, max_age)
+    return camera.image_cache_max_age
+
+
+async def _async_fetch_image(
+    camera: Camera,
+    timeout: int = 10,
+    width: int | None = None,
+    height: int | None = None,
+) -> Image:
+    """Fetch a snapshot image from a camera without the cache."""
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
             image_bytes = (
@@ -185,24 +222,23 @@ async def _async_get_image(
                 else await camera.async_camera_image(width=width, height=height)
             )
             if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
+                image = Image(camera.content_type, image_bytes)
+                if width is not None and height is not None:
+                    return _scale_image(image, width, height)
 
                 return image
 
     raise HomeAssistantError("Unable to get image")
 
 
+def _scale_image(image: Image, width: int, height: int) -> Image:
+    """Scale a jpeg image, other images are returned as is."""
+    content_type = image.content_type
+    if "jpeg" in content_type or "jpg" in content_type:
+        return Image(content_type, scale_jpeg_camera_image(image, width, height))
+    return image
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -313,6 +349,52 @@ async def async_get_still_stream(
     return response
 
 
+async def _async_still_images(
+    image_cb: Callable[[], Awaitable[bytes | None]], interval: float
+) -> AsyncGenerator[bytes]:
+    """Yield the camera images which changed, fetched every interval."""
+    last_image = None
+
+    while True:
+        last_fetch = time.monotonic()
+        img_bytes = await image_cb()
+        if not img_bytes:
+            break
+
+        if img_bytes != last_image:
+            yield img_bytes
+            last_image = img_bytes
+
+        next_fetch = last_fetch + interval
+        now = time.monotonic()
+        if next_fetch > now:
+            sleep_time = next_fetch - now
+            await asyncio.sleep(sleep_time)
+
+
+async def _async_proxy_mjpeg_frames(
+    open_stream: Callable[[], Awaitable[aiohttp.ClientResponse]],
+) -> AsyncGenerator[bytes]:
+    """Yield the images of an MJPEG stream fetched from the camera."""
+    try:
+        async with asyncio.timeout(CAMERA_MJPEG_STREAM_TIMEOUT):
+            response = await open_stream()
+    except (TimeoutError, aiohttp.ClientError) as err:
+        _LOGGER.debug("Error opening the MJPEG stream of the camera: %s", err)
+        return
+
+    try:
+        response.raise_for_status()
+        async for frame in async_mjpeg_frames(
+            response.headers.get(hdrs.CONTENT_TYPE, ""), response.content.iter_any()
+        ):
+            yield frame
+    except (aiohttp.ClientError, ValueError) as err:
+        _LOGGER.debug("Error reading the MJPEG stream of the camera: %s", err)
+    finally:
+        response.close()
+
+
 def _get_camera_from_entity_id(hass: HomeAssistant, entity_id: str) -> Camera:
     """Get camera component from entity_id."""
     if (component := hass.data.get(DOMAIN)) is None:
@@ -469,6 +551,7 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "brand",
     "frame_interval",
     "frontend_stream_type",
+    "image_cache_max_age",
     "is_on",
     "is_recording",
     "is_streaming",
@@ -489,6 +572,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _attr_brand: str | None = None
     _attr_frame_interval: float = MIN_STREAM_INTERVAL
     _attr_frontend_stream_type: StreamType | None
+    _attr_image_cache_max_age: float = 0
     _attr_is_on: bool = True
     _attr_is_recording: bool = False
     _attr_is_streaming: bool = False
@@ -508,6 +592,9 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self.image_cache = CameraImageCache()
+        self._still_image_broadcasters: dict[float, StillImageBroadcaster] = {}
+        self._mjpeg_broadcaster: StillImageBroadcaster | None = None
 
     @cached_property
     def entity_picture(self) -> str:
@@ -569,6 +656,14 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Return the interval between frames of the mjpeg stream."""
         return self._attr_frame_interval
 
+    @cached_property
+    def image_cache_max_age(self) -> float:
+        """Return the seconds a snapshot is served from the image cache.
+
+        Concurrent requests always share a single fetch from the camera.
+        """
+        return self._attr_image_cache_max_age
+
     @property
     def frontend_stream_type(self) -> StreamType | None:
         """Return the type of stream supported by this camera.
@@ -657,10 +752,50 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        The viewers of a stream with the same interval share a single loop
+        fetching the images from the camera.
+        """
+        if (broadcaster := self._still_image_broadcasters.get(interval)) is None:
+            broadcaster = StillImageBroadcaster(
+                self.hass,
+                partial(_async_still_images, self.async_camera_image, interval),
+            )
+            self._still_image_broadcasters[interval] = broadcaster
+        subscriber = broadcaster.async_subscribe()
+        try:
+            return await async_get_still_stream(
+                request, subscriber.async_next_image, self.content_type, interval
+            )
+        finally:
+            broadcaster.async_unsubscribe(subscriber)
+            if not broadcaster.has_subscribers:
+                self._still_image_broadcasters.pop(interval, None)
+
+    async def handle_async_proxy_mjpeg_stream(
+        self,
+        request: web.Request,
+        open_stream: Callable[[], Awaitable[aiohttp.ClientResponse]],
+    ) -> web.StreamResponse:
+        """Proxy the MJPEG stream of the camera to all viewers.
+
+        The camera stream is opened by the first viewer and its images are
+        sent to every viewer, it is closed when the last viewer leaves.
+        """
+        if (broadcaster := self._mjpeg_broadcaster) is None:
+            broadcaster = self._mjpeg_broadcaster = StillImageBroadcaster(
+                self.hass, partial(_async_proxy_mjpeg_frames, open_stream)
+            )
+        subscriber = broadcaster.async_subscribe()
+        try:
+            return await async_get_still_stream(
+                request, subscriber.async_next_image, self.content_type, 0
+            )
+        finally:
+            broadcaster.async_unsubscribe(subscriber)
+            if not broadcaster.has_subscribers:
+                self._mjpeg_broadcaster = None
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
@@ -964,6 +1099,9 @@ async def websocket_get_prefs(
         vol.Required("entity_id"): cv.entity_id,
         vol.Optional(PREF_PRELOAD_STREAM): bool,
         vol.Optional(PREF_ORIENTATION): vol.Coerce(Orientation),
+        vol.Optional(PREF_IMAGE_CACHE_MAX_AGE): vol.Any(
+            None, vol.All(vol.Coerce(float), vol.Range(min=0))
+        ),
     }
 )
 @websocket_api.async_response
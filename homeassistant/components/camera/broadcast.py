@@ -0,0 +1,178 @@
+"""Share the still images of a camera between the viewers of a stream."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+
+from aiohttp import hdrs
+
+from homeassistant.core import HomeAssistant, callback
+
+# Drop the data of a stream without boundary instead of buffering it
+MAX_MJPEG_PART_SIZE = 10 * 1024 * 1024
+
+
+def _mjpeg_boundary(content_type: str) -> bytes | None:
+    """Return the boundary of a multipart content type."""
+    media_type, _, params = content_type.partition(";")
+    if not media_type.strip().lower().startswith("multipart/"):
+        return None
+    for param in params.split(";"):
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "boundary" and (value := value.strip().strip('"')):
+            return value.encode()
+    return None
+
+
+async def async_mjpeg_frames(
+    content_type: str, chunks: AsyncIterator[bytes]
+) -> AsyncGenerator[bytes]:
+    """Yield the images of a multipart MJPEG stream.
+
+    Cameras do not agree on whether the boundary of the content type
+    includes the leading dashes, so the parts are split on the boundary
+    itself. The Content-Length of a part is used when it is sent.
+    """
+    if (boundary := _mjpeg_boundary(content_type)) is None:
+        raise ValueError(f"Not a multipart stream: {content_type}")
+
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        while True:
+            if (start := buffer.find(boundary)) == -1:
+                # Keep the end which may be the start of the next boundary
+                del buffer[: -len(boundary)]
+                break
+            del buffer[:start]
+            if (headers_end := buffer.find(b"\r\n\r\n")) == -1:
+                break
+            body_start = headers_end + 4
+            content_length: int | None = None
+            for line in bytes(buffer[len(boundary) : headers_end]).split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == hdrs.CONTENT_LENGTH.lower().encode():
+                    try:
+                        content_length = int(value)
+                    except ValueError:
+                        content_length = None
+            if content_length is not None:
+                if len(buffer) < (body_end := body_start + content_length):
+                    break
+                frame = bytes(buffer[body_start:body_end])
+                del buffer[:body_end]
+            else:
+                if (body_end := buffer.find(boundary, body_start)) == -1:
+                    if len(buffer) > MAX_MJPEG_PART_SIZE:
+                        del buffer[: len(boundary)]
+                    break
+                frame = (
+                    bytes(buffer[body_start:body_end])
+                    .removesuffix(b"--")
+                    .removesuffix(b"\r\n")
+                )
+                del buffer[:body_end]
+            if frame:
+                yield frame
+
+
+class StillImageSubscriber:
+    """A viewer of a still image stream.
+
+    Only the latest image is kept, a viewer which is slower than the
+    camera skips images instead of delaying the other viewers.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the subscriber."""
+        self._image: bytes | None = None
+        self._closed = False
+        self._event = asyncio.Event()
+
+    @callback
+    def async_publish(self, image: bytes) -> None:
+        """Replace the image waiting to be sent with a newer one."""
+        self._image = image
+        self._event.set()
+
+    @callback
+    def async_close(self) -> None:
+        """End the stream after the image waiting to be sent."""
+        self._closed = True
+        self._event.set()
+
+    async def async_next_image(self) -> bytes | None:
+        """Wait for the next image, None when the stream ended."""
+        await self._event.wait()
+        self._event.clear()
+        image, self._image = self._image, None
+        if self._closed:
+            # Keep returning None once the stream ended
+            self._event.set()
+        return image
+
+
+class StillImageBroadcaster:
+    """Fetch the still images of a camera once for all viewers.
+
+    The images are fetched while there are subscribers, the fetch loop is
+    stopped when the last subscriber leaves.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, images: Callable[[], AsyncIterator[bytes]]
+    ) -> None:
+        """Initialize the broadcaster."""
+        self._hass = hass
+        self._images = images
+        self._subscribers: set[StillImageSubscriber] = set()
+        self._latest: bytes | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Return if the stream has viewers."""
+        return bool(self._subscribers)
+
+    @callback
+    def async_subscribe(self) -> StillImageSubscriber:
+        """Add a viewer, starting from the latest image."""
+        subscriber = StillImageSubscriber()
+        if self._latest is not None:
+            subscriber.async_publish(self._latest)
+        self._subscribers.add(subscriber)
+        if self._task is None:
+            self._task = self._hass.async_create_background_task(
+                self._async_broadcast(), "camera still image broadcast"
+            )
+        return subscriber
+
+    @callback
+    def async_unsubscribe(self, subscriber: StillImageSubscriber) -> None:
+        """Remove a viewer and stop fetching images after the last one."""
+        self._subscribers.discard(subscriber)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._latest = None
+
+    async def _async_broadcast(self) -> None:
+        """Fetch the images and publish them to the viewers."""
+        try:
+            async for image in self._images():
+                self._latest = image
+                for subscriber in self._subscribers:
+                    subscriber.async_publish(image)
+        finally:
+            if self._task is asyncio.current_task():
+                self._async_end()
+
+    @callback
+    def _async_end(self) -> None:
+        """End the stream of the viewers when the camera stopped."""
+        # The next viewer starts a new fetch loop
+        self._task = None
+        self._latest = None
+        for subscriber in self._subscribers:
+            subscriber.async_close()
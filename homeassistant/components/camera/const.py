@@ -18,6 +18,7 @@ DATA_RTSP_TO_WEB_RTC: Final = "rtsp_to_web_rtc"
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
 PREF_ORIENTATION: Final = "orientation"
+PREF_IMAGE_CACHE_MAX_AGE: Final = "image_cache_max_age"
 
 SERVICE_RECORD: Final = "record"
 
@@ -26,6 +27,7 @@ CONF_DURATION: Final = "duration"
 
 CAMERA_STREAM_SOURCE_TIMEOUT: Final = 10
 CAMERA_IMAGE_TIMEOUT: Final = 10
+CAMERA_MJPEG_STREAM_TIMEOUT: Final = 10
 
 
 class StreamType(StrEnum):
@@ -0,0 +1,134 @@
+"""Cache of camera images shared by concurrent requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from . import Image
+
+type _ImageSize = tuple[int | None, int | None]
+
+FULL_SIZE: _ImageSize = (None, None)
+
+# Resized variants beyond this are evicted, least recently used first
+MAX_CACHED_IMAGES = 8
+
+
+@dataclass(slots=True)
+class _CachedImage:
+    """An image and the time it was fetched."""
+
+    image: Image
+    fetched: float
+
+
+class CameraImageCache:
+    """Cache the images of a camera.
+
+    Concurrent requests for an image of the same size share a single fetch
+    from the camera. Fetched images are served from the cache until they are
+    older than the max age, and resized variants of a cached full size image
+    are cached per width and height. The images are ordered from the least
+    to the most recently used.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.hits = 0
+        self.misses = 0
+        self.deduplicated = 0
+        self._images: dict[_ImageSize, _CachedImage] = {}
+        self._fetches: dict[_ImageSize, asyncio.Task[Image]] = {}
+
+    async def async_get_image(
+        self,
+        hass: HomeAssistant,
+        width: int | None,
+        height: int | None,
+        max_age: float,
+        fetch: Callable[[int | None, int | None], Coroutine[Any, Any, Image]],
+        resize: Callable[[Image, int, int], Image],
+    ) -> Image:
+        """Return a cached image or fetch it once for all concurrent requests."""
+        now = time.monotonic()
+        size = (width, height)
+        if (cached := self._images.get(size)) and now - cached.fetched < max_age:
+            self.hits += 1
+            self._images[size] = self._images.pop(size)
+            return cached.image
+
+        if (
+            width is not None
+            and height is not None
+            and (full := self._images.get(FULL_SIZE))
+            and now - full.fetched < max_age
+        ):
+            # The variant expires together with the image it is resized from
+            self.hits += 1
+            image = resize(full.image, width, height)
+            self._store(size, _CachedImage(image, full.fetched))
+            return image
+
+        if (task := self._fetches.get(size)) is not None:
+            self.deduplicated += 1
+        else:
+            self.misses += 1
+            task = hass.async_create_task(
+                self._async_fetch(size, fetch(width, height), max_age > 0),
+                f"camera image fetch {size}",
+                eager_start=False,
+            )
+            self._fetches[size] = task
+            task.add_done_callback(self._fetch_done)
+        # Shield the fetch so other requests still get the image when a
+        # request is cancelled
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self,
+        size: _ImageSize,
+        fetch: Coroutine[Any, Any, Image],
+        store: bool,
+    ) -> Image:
+        """Fetch an image and store it in the cache."""
+        image = await fetch
+        if store:
+            if size == FULL_SIZE:
+                # Drop the variants of the previous image
+                self._images.clear()
+            self._store(size, _CachedImage(image, time.monotonic()))
+        return image
+
+    def _store(self, size: _ImageSize, cached: _CachedImage) -> None:
+        """Store an image and evict the least recently used variants."""
+        self._images.pop(size, None)
+        self._images[size] = cached
+        while len(self._images) > MAX_CACHED_IMAGES:
+            # The full size image is kept while its variants are used
+            del self._images[next(key for key in self._images if key != FULL_SIZE)]
+
+    def _fetch_done(self, task: asyncio.Task[Image]) -> None:
+        """Remove a finished fetch."""
+        for size, fetch_task in self._fetches.items():
+            if fetch_task is task:
+                del self._fetches[size]
+                break
+        if not task.cancelled():
+            # Retrieve the exception, the requests may all have been cancelled
+            task.exception()
+
+    def diagnostics(self) -> dict[str, int]:
+        """Return the hit and miss counters of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "deduplicated": self.deduplicated,
+            "cached_images": len(self._images),
+        }
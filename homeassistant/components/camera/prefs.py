@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import asdict, dataclass
-from typing import Final, cast
+from typing import Any, Final, cast
 
 from homeassistant.components.stream import Orientation
 from homeassistant.core import HomeAssistant
@@ -13,7 +13,12 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 
-from .const import DOMAIN, PREF_ORIENTATION, PREF_PRELOAD_STREAM
+from .const import (
+    DOMAIN,
+    PREF_IMAGE_CACHE_MAX_AGE,
+    PREF_ORIENTATION,
+    PREF_PRELOAD_STREAM,
+)
 
 STORAGE_KEY: Final = DOMAIN
 STORAGE_VERSION: Final = 1
@@ -54,12 +59,14 @@ class CameraPreferences:
         *,
         preload_stream: bool | UndefinedType = UNDEFINED,
         orientation: Orientation | UndefinedType = UNDEFINED,
+        image_cache_max_age: float | None | UndefinedType = UNDEFINED,
     ) -> dict[str, bool | Orientation]:
         """Update camera preferences.
 
         Also update the DynamicStreamSettings if they exist.
         preload_stream is stored in a Store
-        orientation is stored in the Entity Registry
+        orientation and image_cache_max_age are stored in the Entity Registry,
+        an image_cache_max_age of None restores the max age of the camera
 
         Returns a dict with the preferences on success.
         Raises HomeAssistantError on failure.
@@ -74,19 +81,34 @@ class CameraPreferences:
             await self._store.async_save(self._preload_prefs)
 
         if orientation is not UNDEFINED:
-            if (registry := er.async_get(self._hass)).async_get(entity_id):
-                registry.async_update_entity_options(
-                    entity_id, DOMAIN, {PREF_ORIENTATION: orientation}
-                )
-            else:
-                raise HomeAssistantError(
-                    "Orientation is only supported on entities set up through config"
-                    " flows"
-                )
+            self._async_update_entity_options(
+                entity_id, "Orientation", PREF_ORIENTATION, orientation
+            )
             if dynamic_stream_settings:
                 dynamic_stream_settings.orientation = orientation
+
+        if image_cache_max_age is not UNDEFINED:
+            self._async_update_entity_options(
+                entity_id,
+                "Image cache max age",
+                PREF_IMAGE_CACHE_MAX_AGE,
+                image_cache_max_age,
+            )
         return asdict(await self.get_dynamic_stream_settings(entity_id))
 
+    def _async_update_entity_options(
+        self, entity_id: str, name: str, key: str, value: Any
+    ) -> None:
+        """Update a camera preference in the entity registry options."""
+        registry = er.async_get(self._hass)
+        if not (reg_entry := registry.async_get(entity_id)):
+            raise HomeAssistantError(
+                f"{name} is only supported on entities set up through config flows"
+            )
+        registry.async_update_entity_options(
+            entity_id, DOMAIN, {**reg_entry.options.get(DOMAIN, {}), key: value}
+        )
+
     async def get_dynamic_stream_settings(
         self, entity_id: str
     ) -> DynamicStreamSettings:
@@ -47,6 +47,7 @@ from homeassistant.util.json import JsonObjectType, json_loads_object
 from .const import DEFAULT_EXPOSED_ATTRIBUTES, DOMAIN, ConversationEntityFeature
 from .entity import ConversationEntity
 from .models import ConversationInput, ConversationResult
+from .sentence_index import SentenceIndex, SlotListIndex
 from .trace import ConversationTraceEventType, async_conversation_trace_append
 
 _LOGGER = logging.getLogger(__name__)
@@ -84,6 +85,7 @@ class LanguageIntents:
     intent_responses: dict[str, Any]
     error_responses: dict[str, Any]
     language_variant: str | None
+    sentence_index: SentenceIndex | None
 
 
 @dataclass(slots=True)
@@ -161,6 +163,7 @@ class DefaultAgent(ConversationEntity):
         # intent -> [sentences]
         self._config_intents: dict[str, Any] = config_intents
         self._slot_lists: dict[str, SlotList] | None = None
+        self._slot_list_index: SlotListIndex | None = None
 
         # Sentences that will trigger a callback (skipping intent recognition)
         self._trigger_sentences: list[TriggerData] = []
@@ -241,6 +244,7 @@ class DefaultAgent(ConversationEntity):
             slot_lists,
             intent_context,
             language,
+            self._slot_list_index,
         )
 
         _LOGGER.debug(
@@ -434,15 +438,23 @@ class DefaultAgent(ConversationEntity):
         slot_lists: dict[str, SlotList],
         intent_context: dict[str, Any] | None,
         language: str,
+        slot_list_index: SlotListIndex | None = None,
     ) -> RecognizeResult | None:
         """Search intents for a match to user input."""
+        intents = lang_intents.intents
+        if lang_intents.sentence_index is not None:
+            # Leave out the sentences and names that cannot match the text
+            intents = lang_intents.sentence_index.prune(user_input.text)
+            if slot_list_index is not None:
+                slot_lists = slot_list_index.prune(user_input.text)
+
         custom_result: RecognizeResult | None = None
         name_result: RecognizeResult | None = None
         best_results: list[RecognizeResult] = []
         best_text_chunks_matched: int | None = None
         for result in recognize_all(
             user_input.text,
-            lang_intents.intents,
+            intents,
             slot_lists=slot_lists,
             intent_context=intent_context,
             language=language,
@@ -501,7 +513,7 @@ class DefaultAgent(ConversationEntity):
         maybe_result: RecognizeResult | None = None
         for result in recognize_all(
             user_input.text,
-            lang_intents.intents,
+            intents,
             slot_lists=slot_lists,
             intent_context=intent_context,
             allow_unmatched_entities=True,
@@ -794,12 +806,18 @@ class DefaultAgent(ConversationEntity):
         intent_responses = responses_dict.get("intents", {})
         error_responses = responses_dict.get("errors", {})
 
+        # Only languages that separate words with whitespace are indexed
+        sentence_index = (
+            None if intents.settings.ignore_whitespace else SentenceIndex(intents)
+        )
+
         return LanguageIntents(
             intents,
             intents_dict,
             intent_responses,
             error_responses,
             language_variant,
+            sentence_index,
         )
 
     @core.callback
@@ -810,6 +828,7 @@ class DefaultAgent(ConversationEntity):
         if self._unsub_clear_slot_list is None:
             return
         self._slot_lists = None
+        self._slot_list_index = None
         for unsub in self._unsub_clear_slot_list:
             unsub()
         self._unsub_clear_slot_list = None
@@ -900,6 +919,7 @@ class DefaultAgent(ConversationEntity):
             "name": TextSlotList.from_tuples(entity_names, allow_template=False),
             "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
         }
+        self._slot_list_index = SlotListIndex(self._slot_lists)
 
         self._listen_clear_slot_list()
 
@@ -0,0 +1,144 @@
+"""Index of the words needed to match sentence templates and slot list values."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import dataclasses
+import re
+
+from hassil.expression import (
+    Expression,
+    RuleReference,
+    Sentence,
+    Sequence,
+    SequenceType,
+    TextChunk,
+)
+from hassil.intents import Intent, IntentData, Intents, SlotList, TextSlotList
+from hassil.recognize import PUNCTUATION
+from hassil.util import normalize_text
+
+_WORD_SEPARATOR = re.compile(r"[\s_-]+")
+
+
+def _normalize(text: str) -> str:
+    """Normalize text the way hassil compares it to text chunks."""
+    return PUNCTUATION.sub("", normalize_text(text))
+
+
+def _text_words(text: str) -> frozenset[str]:
+    """Return the words of a text chunk."""
+    return frozenset(
+        word for word in _WORD_SEPARATOR.split(PUNCTUATION.sub(" ", text)) if word
+    )
+
+
+def _required_words(
+    expression: Expression,
+    expansion_rules: Mapping[str, Sentence],
+    seen_rules: frozenset[str] = frozenset(),
+) -> frozenset[str]:
+    """Return the words every match of an expression contains.
+
+    Text chunks are matched literally, so a text which does not contain one
+    of the words can not match the expression. Lists and unknown or recursive
+    rules do not require any word.
+    """
+    if isinstance(expression, TextChunk):
+        return _text_words(expression.text)
+    if isinstance(expression, Sequence):
+        item_words = [
+            _required_words(item, expansion_rules, seen_rules)
+            for item in expression.items
+        ]
+        if expression.type == SequenceType.GROUP:
+            return frozenset().union(*item_words)
+        # Only the words of all alternatives (and permutations) are required
+        return frozenset.intersection(*item_words) if item_words else frozenset()
+    if (
+        isinstance(expression, RuleReference)
+        and expression.rule_name not in seen_rules
+        and (rule := expansion_rules.get(expression.rule_name)) is not None
+    ):
+        return _required_words(
+            rule, expansion_rules, seen_rules | {expression.rule_name}
+        )
+    return frozenset()
+
+
+def _present_words(vocabulary: Iterable[str], text: str) -> set[str]:
+    """Return the words of the vocabulary found in a normalized text."""
+    return {word for word in vocabulary if word in text}
+
+
+class SentenceIndex:
+    """Index of the words the sentence templates of a language require.
+
+    Blocks of sentences which all require a word the text does not contain
+    can not match, so they are left out before hassil recognizes the text.
+    """
+
+    def __init__(self, intents: Intents) -> None:
+        """Compile the sentence templates of the intents."""
+        self.intents = intents
+        self._blocks: list[tuple[str, IntentData, list[frozenset[str]]]] = []
+        vocabulary: set[str] = set()
+        for intent in intents.intents.values():
+            for intent_data in intent.data:
+                expansion_rules = {
+                    **intents.expansion_rules,
+                    **intent_data.expansion_rules,
+                }
+                sentence_words = [
+                    _required_words(sentence, expansion_rules)
+                    for sentence in intent_data.sentences
+                ]
+                vocabulary.update(*sentence_words)
+                self._blocks.append((intent.name, intent_data, sentence_words))
+        self._vocabulary = frozenset(vocabulary)
+
+    def prune(self, text: str) -> Intents:
+        """Return the intents with the sentence blocks which may match the text."""
+        present = _present_words(self._vocabulary, _normalize(text))
+        intents: dict[str, Intent] = {}
+        for intent_name, intent_data, sentence_words in self._blocks:
+            if not any(words <= present for words in sentence_words):
+                continue
+            if (intent := intents.get(intent_name)) is None:
+                intent = intents[intent_name] = Intent(intent_name)
+            intent.data.append(intent_data)
+        return dataclasses.replace(self.intents, intents=intents)
+
+
+class SlotListIndex:
+    """Index of the words of the values of text slot lists."""
+
+    def __init__(self, slot_lists: dict[str, SlotList]) -> None:
+        """Compile the values of the slot lists."""
+        self.slot_lists = slot_lists
+        self._values: dict[str, tuple[TextSlotList, list[frozenset[str]]]] = {}
+        vocabulary: set[str] = set()
+        for list_name, slot_list in slot_lists.items():
+            if not isinstance(slot_list, TextSlotList):
+                continue
+            value_words = [
+                _required_words(value.text_in, {}) for value in slot_list.values
+            ]
+            vocabulary.update(*value_words)
+            self._values[list_name] = (slot_list, value_words)
+        self._vocabulary = frozenset(vocabulary)
+
+    def prune(self, text: str) -> dict[str, SlotList]:
+        """Return the slot lists with the values which may match the text."""
+        present = _present_words(self._vocabulary, _normalize(text))
+        slot_lists = dict(self.slot_lists)
+        for list_name, (slot_list, value_words) in self._values.items():
+            slot_lists[list_name] = dataclasses.replace(
+                slot_list,
+                values=[
+                    value
+                    for value, words in zip(slot_list.values, value_words, strict=True)
+                    if words <= present
+                ],
+            )
+        return slot_lists
@@ -2,6 +2,7 @@
 
 DOMAIN = "derivative"
 
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
 CONF_ROUND_DIGITS = "round"
 CONF_TIME_WINDOW = "time_window"
 CONF_UNIT = "unit"
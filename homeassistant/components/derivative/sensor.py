@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from decimal import Decimal, DecimalException
+from decimal import Decimal
 import logging
 from typing import TYPE_CHECKING
 
@@ -25,6 +25,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device import async_device_info_to_link_from_entity
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -32,6 +33,7 @@ from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
+    CONF_MIN_UPDATE_INTERVAL,
     CONF_ROUND_DIGITS,
     CONF_TIME_WINDOW,
     CONF_UNIT,
@@ -75,6 +77,7 @@ PLATFORM_SCHEMA = SENSOR_PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_UNIT_TIME, default=UnitOfTime.HOURS): vol.In(UNIT_TIME),
         vol.Optional(CONF_UNIT): cv.string,
         vol.Optional(CONF_TIME_WINDOW, default=DEFAULT_TIME_WINDOW): cv.time_period,
+        vol.Optional(CONF_MIN_UPDATE_INTERVAL): cv.positive_time_period,
     }
 )
 
@@ -100,6 +103,11 @@ async def async_setup_entry(
         # Before we had support for optional selectors, "none" was used for selecting nothing
         unit_prefix = None
 
+    if min_update_interval_dict := config_entry.options.get(CONF_MIN_UPDATE_INTERVAL):
+        min_update_interval = cv.time_period(min_update_interval_dict)
+    else:
+        min_update_interval = None
+
     derivative_sensor = DerivativeSensor(
         name=config_entry.title,
         round_digits=int(config_entry.options[CONF_ROUND_DIGITS]),
@@ -109,6 +117,7 @@ async def async_setup_entry(
         unit_of_measurement=None,
         unit_prefix=unit_prefix,
         unit_time=config_entry.options[CONF_UNIT_TIME],
+        min_update_interval=min_update_interval,
         device_info=device_info,
     )
 
@@ -130,6 +139,7 @@ async def async_setup_platform(
         unit_of_measurement=config.get(CONF_UNIT),
         unit_prefix=config[CONF_UNIT_PREFIX],
         unit_time=config[CONF_UNIT_TIME],
+        min_update_interval=config.get(CONF_MIN_UPDATE_INTERVAL),
         unique_id=None,
     )
 
@@ -153,6 +163,7 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
         unit_prefix: str | None,
         unit_time: UnitOfTime,
         unique_id: str | None,
+        min_update_interval: timedelta | None = None,
         device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize the derivative sensor."""
@@ -162,7 +173,7 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
         self._round_digits = round_digits
         self._state: float | int | Decimal = 0
         # List of tuples with (timestamp_start, timestamp_end, derivative)
-        self._state_list: list[tuple[datetime, datetime, Decimal]] = []
+        self._state_list: list[tuple[datetime, datetime, float]] = []
 
         self._attr_name = name if name is not None else f"{source_entity} derivative"
         self._attr_extra_state_attributes = {ATTR_SOURCE_ID: source_entity}
@@ -178,6 +189,20 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
         self._unit_prefix = UNIT_PREFIXES[unit_prefix]
         self._unit_time = UNIT_TIME[unit_time]
         self._time_window = time_window.total_seconds()
+        self._min_update_interval: timedelta | None = (
+            None  # write the state on every update
+            if min_update_interval is None or min_update_interval.total_seconds() == 0
+            else min_update_interval
+        )
+        self._write_debouncer: Debouncer[None] | None = None
+
+    @callback
+    def _async_schedule_write_ha_state(self) -> None:
+        """Write the state, at most once per min_update_interval if it is set."""
+        if self._write_debouncer is None:
+            self.async_write_ha_state()
+        else:
+            self._write_debouncer.async_schedule_call()
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
@@ -192,6 +217,16 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
             except SyntaxError as err:
                 _LOGGER.warning("Could not restore last state: %s", err)
 
+        if self._min_update_interval is not None:
+            self._write_debouncer = Debouncer(
+                self.hass,
+                _LOGGER,
+                cooldown=self._min_update_interval.total_seconds(),
+                immediate=True,
+                function=self.async_write_ha_state,
+            )
+            self.async_on_remove(self._write_debouncer.async_shutdown)
+
         @callback
         def calc_derivative(event: Event[EventStateChangedData]) -> None:
             """Handle the sensor state changes."""
@@ -217,26 +252,24 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
                 < self._time_window
             ]
 
+            # Floats are precise enough for a rate and much cheaper than Decimals
+            elapsed_time = (
+                new_state.last_updated - old_state.last_updated
+            ).total_seconds()
             try:
-                elapsed_time = (
-                    new_state.last_updated - old_state.last_updated
-                ).total_seconds()
-                delta_value = Decimal(new_state.state) - Decimal(old_state.state)
-                new_derivative = (
-                    delta_value
-                    / Decimal(elapsed_time)
-                    / Decimal(self._unit_prefix)
-                    * Decimal(self._unit_time)
-                )
-
+                delta_value = float(new_state.state) - float(old_state.state)
             except ValueError as err:
-                _LOGGER.warning("While calculating derivative: %s", err)
-            except DecimalException as err:
                 _LOGGER.warning(
                     "Invalid state (%s > %s): %s", old_state.state, new_state.state, err
                 )
-            except AssertionError as err:
-                _LOGGER.error("Could not calculate derivative: %s", err)
+                return
+            try:
+                new_derivative = (
+                    delta_value / elapsed_time / self._unit_prefix * self._unit_time
+                )
+            except ZeroDivisionError as err:
+                _LOGGER.warning("While calculating derivative: %s", err)
+                return
 
             # add latest derivative to the window list
             self._state_list.append(
@@ -258,13 +291,13 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
             if elapsed_time > self._time_window:
                 derivative = new_derivative
             else:
-                derivative = Decimal(0)
+                derivative = 0.0
                 for start, end, value in self._state_list:
                     weight = calculate_weight(start, end, new_state.last_updated)
-                    derivative = derivative + (value * Decimal(weight))
+                    derivative += value * weight
 
             self._state = derivative
-            self.async_write_ha_state()
+            self._async_schedule_write_ha_state()
 
         self.async_on_remove(
             async_track_state_change_event(
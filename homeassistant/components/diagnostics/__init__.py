@@ -27,6 +27,7 @@ from homeassistant.helpers.json import (
 )
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.update_coordinator import async_get_refresh_statistics
 from homeassistant.loader import (
     Manifest,
     async_get_custom_components,
@@ -209,6 +210,7 @@ async def _async_get_json_file_response(
         "custom_components": custom_components,
         "integration_manifest": async_format_manifest(integration.manifest),
         "setup_times": async_get_domain_setup_times(hass, domain),
+        "refresh_statistics": async_get_refresh_statistics(hass, d_id),
         "data": data,
     }
     try:
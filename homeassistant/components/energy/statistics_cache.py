@@ -0,0 +1,197 @@
+"""Cache statistics results of the energy dashboard."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from homeassistant.components.recorder import (
+    EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
+    EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
+    EVENT_RECORDER_STATISTICS_UPDATED,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+
+MAX_CACHED_RESULTS = 128
+
+
+class StatisticsQuery(NamedTuple):
+    """A statistics_during_period query."""
+
+    start_time: datetime
+    end_time: datetime | None
+    statistic_ids: frozenset[str]
+    period: str
+    units: tuple[tuple[str, str], ...]
+    types: frozenset[str]
+
+    @property
+    def short_term(self) -> bool:
+        """Return if the result is based on short term statistics."""
+        return self.period == "5minute"
+
+    @property
+    def all_statistic_ids(self) -> frozenset[str]:
+        """Return the ids of the statistics the result is based on."""
+        return self.statistic_ids
+
+
+class FossilEnergyConsumptionQuery(NamedTuple):
+    """A fossil energy consumption query."""
+
+    start_time: datetime
+    end_time: datetime
+    energy_statistic_ids: frozenset[str]
+    co2_statistic_id: str
+    period: str
+
+    @property
+    def short_term(self) -> bool:
+        """Return if the result is based on short term statistics."""
+        return False
+
+    @property
+    def all_statistic_ids(self) -> frozenset[str]:
+        """Return the ids of the statistics the result is based on."""
+        return self.energy_statistic_ids | {self.co2_statistic_id}
+
+
+type CacheKey = StatisticsQuery | FossilEnergyConsumptionQuery
+
+
+class EnergyStatisticsCache:
+    """Cache statistics results until new statistics are compiled or changed.
+
+    Several dashboards open at the same time request the same statistics,
+    the results are shared until the recorder compiles new statistics.
+    Identical queries which are already being fetched are awaited instead of
+    being fetched again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._results: dict[CacheKey, Any] = {}
+        self._pending: dict[CacheKey, asyncio.Future[Any]] = {}
+
+    async def async_get_many[_KeyT: CacheKey](
+        self,
+        keys: list[_KeyT],
+        fetch: Callable[[list[_KeyT]], Awaitable[list[Any]]],
+    ) -> list[Any]:
+        """Return the results of keys, fetching the missing ones in one call."""
+        results: dict[_KeyT, Any] = {}
+        waiting: dict[_KeyT, asyncio.Future[Any]] = {}
+        fetching: dict[_KeyT, asyncio.Future[Any]] = {}
+        loop = asyncio.get_running_loop()
+        for key in keys:
+            if key in results or key in waiting or key in fetching:
+                continue
+            if key in self._results:
+                results[key] = self._results[key]
+            elif (future := self._pending.get(key)) is not None:
+                waiting[key] = future
+            else:
+                fetching[key] = self._pending[key] = loop.create_future()
+
+        if fetching:
+            try:
+                fetched = await fetch(list(fetching))
+            except Exception as err:
+                for key, future in fetching.items():
+                    if self._pending.get(key) is future:
+                        del self._pending[key]
+                    future.set_exception(err)
+                    # Mark the exception retrieved, waiters re-raise it
+                    future.exception()
+                raise
+            except BaseException:
+                for key, future in fetching.items():
+                    if self._pending.get(key) is future:
+                        del self._pending[key]
+                    future.cancel()
+                raise
+            for (key, future), result in zip(fetching.items(), fetched, strict=True):
+                # Results fetched while the cache was invalidated are not stored
+                if self._pending.get(key) is future:
+                    del self._pending[key]
+                    self._async_store(key, result)
+                future.set_result(result)
+                results[key] = result
+
+        for key, future in waiting.items():
+            results[key] = await asyncio.shield(future)
+
+        return [results[key] for key in keys]
+
+    async def async_get[_KeyT: CacheKey](
+        self, key: _KeyT, fetch: Callable[[_KeyT], Awaitable[Any]]
+    ) -> Any:
+        """Return the result of a key, fetching it if missing."""
+
+        async def _fetch(keys: list[_KeyT]) -> list[Any]:
+            return [await fetch(keys[0])]
+
+        return (await self.async_get_many([key], _fetch))[0]
+
+    @callback
+    def _async_store(self, key: CacheKey, result: Any) -> None:
+        """Store a result, evicting the oldest one if the cache is full."""
+        if len(self._results) >= MAX_CACHED_RESULTS:
+            del self._results[next(iter(self._results))]
+        self._results[key] = result
+
+    @callback
+    def async_invalidate(self, short_term_only: bool = False) -> None:
+        """Invalidate cached results."""
+        if not short_term_only:
+            self._results.clear()
+            self._pending.clear()
+            return
+        for cache in (self._results, self._pending):
+            for key in [key for key in cache if key.short_term]:
+                del cache[key]
+
+    @callback
+    def async_invalidate_statistics(self, statistic_ids: Iterable[str]) -> None:
+        """Invalidate cached results based on any of statistic_ids."""
+        statistic_ids = set(statistic_ids)
+        for cache in (self._results, self._pending):
+            for key in [
+                key
+                for key in cache
+                if not statistic_ids.isdisjoint(key.all_statistic_ids)
+            ]:
+                del cache[key]
+
+
+@singleton("energy_statistics_cache")
+@callback
+def async_get_statistics_cache(hass: HomeAssistant) -> EnergyStatisticsCache:
+    """Return the statistics cache, invalidated when statistics change."""
+    cache = EnergyStatisticsCache()
+
+    @callback
+    def _async_short_term_statistics_generated(event: Event) -> None:
+        cache.async_invalidate(short_term_only=True)
+
+    @callback
+    def _async_hourly_statistics_generated(event: Event) -> None:
+        cache.async_invalidate()
+
+    @callback
+    def _async_statistics_updated(event: Event) -> None:
+        cache.async_invalidate_statistics(event.data["statistic_ids"])
+
+    hass.bus.async_listen(
+        EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
+        _async_short_term_statistics_generated,
+    )
+    hass.bus.async_listen(
+        EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
+        _async_hourly_statistics_generated,
+    )
+    hass.bus.async_listen(EVENT_RECORDER_STATISTICS_UPDATED, _async_statistics_updated)
+    return cache
@@ -8,17 +8,20 @@ from collections.abc import Callable, Coroutine
 from datetime import timedelta
 import functools
 from itertools import chain
-from typing import Any, cast
+from typing import Any, Literal, cast
 
 import voluptuous as vol
 
 from homeassistant.components import recorder, websocket_api
 from homeassistant.components.recorder.statistics import StatisticsRow
+from homeassistant.components.recorder.websocket_api import UNIT_SCHEMA
+from homeassistant.components.websocket_api import messages
 from homeassistant.const import UnitOfEnergy
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.singleton import singleton
 from homeassistant.util import dt as dt_util
 
@@ -30,6 +33,11 @@ from .data import (
     EnergyPreferencesUpdate,
     async_get_manager,
 )
+from .statistics_cache import (
+    FossilEnergyConsumptionQuery,
+    StatisticsQuery,
+    async_get_statistics_cache,
+)
 from .types import EnergyPlatform, GetSolarForecastType, SolarForecastType
 from .validate import async_validate
 
@@ -52,6 +60,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_validate)
     websocket_api.async_register_command(hass, ws_solar_forecast)
     websocket_api.async_register_command(hass, ws_get_fossil_energy_consumption)
+    websocket_api.async_register_command(hass, ws_get_statistics_during_periods)
 
 
 @singleton("energy_platforms")
@@ -268,15 +277,33 @@ async def ws_get_fossil_energy_consumption(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
-    statistic_ids = set(msg["energy_statistic_ids"])
-    statistic_ids.add(msg["co2_statistic_id"])
+    cache = async_get_statistics_cache(hass)
+    result = await cache.async_get(
+        FossilEnergyConsumptionQuery(
+            start_time,
+            end_time,
+            frozenset(msg["energy_statistic_ids"]),
+            msg["co2_statistic_id"],
+            msg["period"],
+        ),
+        functools.partial(_async_get_fossil_energy_consumption, hass),
+    )
+    connection.send_result(msg["id"], result)
+
+
+async def _async_get_fossil_energy_consumption(
+    hass: HomeAssistant, query: FossilEnergyConsumptionQuery
+) -> dict[str, float]:
+    """Calculate amount of fossil based energy."""
+    statistic_ids = set(query.energy_statistic_ids)
+    statistic_ids.add(query.co2_statistic_id)
 
     # Fetch energy + CO2 statistics
     statistics = await recorder.get_instance(hass).async_add_executor_job(
         recorder.statistics.statistics_during_period,
         hass,
-        start_time,
-        end_time,
+        query.start_time,
+        query.end_time,
         statistic_ids,
         "hour",
         {"energy": UnitOfEnergy.KILO_WATT_HOUR},
@@ -284,7 +311,7 @@ async def ws_get_fossil_energy_consumption(
     )
 
     def _combine_change_statistics(
-        stats: dict[str, list[StatisticsRow]], statistic_ids: list[str]
+        stats: dict[str, list[StatisticsRow]], statistic_ids: frozenset[str]
     ) -> dict[float, float]:
         """Combine multiple statistics, returns a dict indexed by start time."""
         result: defaultdict[float, float] = defaultdict(float)
@@ -332,13 +359,13 @@ async def ws_get_fossil_energy_consumption(
         return result
 
     merged_energy_statistics = _combine_change_statistics(
-        statistics, msg["energy_statistic_ids"]
+        statistics, query.energy_statistic_ids
     )
     indexed_co2_statistics = cast(
         dict[float, float],
         {
             period["start"]: period["mean"]
-            for period in statistics.get(msg["co2_statistic_id"], {})
+            for period in statistics.get(query.co2_statistic_id, {})
         },
     )
 
@@ -348,8 +375,8 @@ async def ws_get_fossil_energy_consumption(
         for start, delta in merged_energy_statistics.items()
     ]
 
-    if msg["period"] == "hour":
-        reduced_fossil_energy = [
+    if query.period == "hour":
+        reduced_fossil_energy: list[dict[str, Any]] = [
             {
                 "start": dt_util.utc_from_timestamp(period["start"]).isoformat(),
                 "delta": period["delta"],
@@ -357,7 +384,7 @@ async def ws_get_fossil_energy_consumption(
             for period in fossil_energy
         ]
 
-    elif msg["period"] == "day":
+    elif query.period == "day":
         _same_day_ts, _day_start_end_ts = recorder.statistics.reduce_day_ts_factory()
         reduced_fossil_energy = _reduce_deltas(
             fossil_energy,
@@ -377,5 +404,120 @@ async def ws_get_fossil_energy_consumption(
             timedelta(days=1),
         )
 
-    result = {period["start"]: period["delta"] for period in reduced_fossil_energy}
-    connection.send_result(msg["id"], result)
+    return {period["start"]: period["delta"] for period in reduced_fossil_energy}
+
+
+def _statistics_during_periods(
+    hass: HomeAssistant, queries: list[StatisticsQuery]
+) -> list[dict[str, list[StatisticsRow]]]:
+    """Fetch statistics for several queries in the executor."""
+    results: list[dict[str, list[StatisticsRow]]] = []
+    for query in queries:
+        result = recorder.statistics.statistics_during_period(
+            hass,
+            query.start_time,
+            query.end_time,
+            set(query.statistic_ids),
+            cast(Literal["5minute", "day", "hour", "week", "month"], query.period),
+            dict(query.units),
+            cast(
+                set[
+                    Literal[
+                        "change", "last_reset", "max", "mean", "min", "state", "sum"
+                    ]
+                ],
+                set(query.types),
+            ),
+        )
+        include_last_reset = "last_reset" in query.types
+        for statistic_rows in result.values():
+            for row in statistic_rows:
+                row["start"] = int(row["start"] * 1000)
+                row["end"] = int(row["end"] * 1000)
+                if include_last_reset and (last_reset := row["last_reset"]) is not None:
+                    row["last_reset"] = int(last_reset * 1000)
+        results.append(result)
+    return results
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "energy/statistics_during_periods",
+        vol.Required("queries"): [
+            {
+                vol.Required("start_time"): str,
+                vol.Optional("end_time"): str,
+                vol.Required("statistic_ids"): vol.All([str], vol.Length(min=1)),
+                vol.Required("period"): vol.Any(
+                    "5minute", "hour", "day", "week", "month"
+                ),
+                vol.Optional("units"): UNIT_SCHEMA,
+                vol.Optional("types"): vol.All(
+                    [
+                        vol.Any(
+                            "change", "last_reset", "max", "mean", "min", "state", "sum"
+                        )
+                    ],
+                    vol.Coerce(set),
+                ),
+            }
+        ],
+    }
+)
+@websocket_api.async_response
+async def ws_get_statistics_during_periods(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Fetch statistics of several statistic ids and periods in one batch.
+
+    Results are cached until new statistics are compiled and shared between
+    connections.
+    """
+    queries: list[StatisticsQuery] = []
+    for query in msg["queries"]:
+        if start_time := dt_util.parse_datetime(query["start_time"]):
+            start_time = dt_util.as_utc(start_time)
+        else:
+            connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+            return
+
+        if (end_time_str := query.get("end_time")) is None:
+            end_time = None
+        elif end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+
+        if (types := query.get("types")) is None:
+            types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
+        queries.append(
+            StatisticsQuery(
+                start_time,
+                end_time,
+                frozenset(query["statistic_ids"]),
+                query["period"],
+                tuple(sorted(query.get("units", {}).items())),
+                frozenset(types),
+            )
+        )
+
+    instance = recorder.get_instance(hass)
+
+    async def _async_fetch(
+        queries: list[StatisticsQuery],
+    ) -> list[dict[str, list[StatisticsRow]]]:
+        return await instance.async_add_executor_job(
+            _statistics_during_periods, hass, queries
+        )
+
+    results = await async_get_statistics_cache(hass).async_get_many(
+        queries, _async_fetch
+    )
+    connection.send_message(
+        await instance.async_add_executor_job(
+            json_bytes, messages.result_message(msg["id"], results)
+        )
+    )
@@ -410,7 +410,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         ("frontend_es5", not is_dev),
     ):
         static_paths_configs.append(
-            StaticPathConfig(f"/{path}", str(root_path / path), should_cache)
+            StaticPathConfig(
+                f"/{path}",
+                str(root_path / path),
+                should_cache,
+                # Files of the installed frontend do not change
+                index_files=should_cache,
+            )
         )
 
     static_paths_configs.append(
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import aclosing
 from datetime import datetime as dt, timedelta
+from functools import partial
 from http import HTTPStatus
-from typing import cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import voluptuous as vol
 
 from homeassistant.components import frontend
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import history
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE
+from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE, CONTENT_TYPE_JSON
 from homeassistant.core import HomeAssistant, valid_entity_id
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
@@ -21,8 +23,13 @@ from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
 from . import websocket_api
-from .const import DOMAIN
-from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
+from .const import DOMAIN, HISTORY_CHUNK_SIZE, HISTORY_PENDING_CHUNKS
+from .helpers import (
+    async_iterate_in_executor,
+    entities_may_have_state_changes_after,
+    has_recorder_run_after,
+    significant_states_json,
+)
 
 CONF_ORDER = "use_include_order"
 
@@ -60,7 +67,7 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         query = request.query
@@ -116,10 +123,11 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
-        return cast(
-            web.Response,
-            await get_instance(hass).async_add_executor_job(
-                self._sorted_significant_states_json,
+        # The states are streamed, only a few chunks of them are held in memory
+        chunks = async_iterate_in_executor(
+            hass,
+            partial(
+                self._significant_states_json,
                 hass,
                 start_time,
                 end_time,
@@ -129,9 +137,22 @@ class HistoryPeriodView(HomeAssistantView):
                 minimal_response,
                 no_attributes,
             ),
+            HISTORY_PENDING_CHUNKS,
         )
-
-    def _sorted_significant_states_json(
+        async with aclosing(chunks):
+            # Errors of the query are returned before the response is started
+            data = await anext(chunks)
+            response = web.StreamResponse(
+                headers={hdrs.CONTENT_TYPE: CONTENT_TYPE_JSON}
+            )
+            await response.prepare(request)
+            await response.write(data)
+            async for data in chunks:
+                await response.write(data)
+        await response.write_eof()
+        return response
+
+    def _significant_states_json(
         self,
         hass: HomeAssistant,
         start_time: dt,
@@ -141,22 +162,21 @@ class HistoryPeriodView(HomeAssistantView):
         significant_changes_only: bool,
         minimal_response: bool,
         no_attributes: bool,
-    ) -> web.Response:
-        """Fetch significant stats from the database as json."""
+    ) -> Iterator[bytes]:
+        """Fetch significant states from the database and encode them as json."""
         with session_scope(hass=hass, read_only=True) as session:
-            return self.json(
-                list(
-                    history.get_significant_states_with_session(
-                        hass,
-                        session,
-                        start_time,
-                        end_time,
-                        entity_ids,
-                        None,
-                        include_start_time_state,
-                        significant_changes_only,
-                        minimal_response,
-                        no_attributes,
-                    ).values()
-                )
+            yield from significant_states_json(
+                history.stream_significant_states_with_session(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    chunk_size=HISTORY_CHUNK_SIZE,
+                ),
+                by_entity_id=False,
             )
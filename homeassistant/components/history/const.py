@@ -5,3 +5,9 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Number of states fetched and encoded at a time when streaming history
+HISTORY_CHUNK_SIZE = 4096
+
+# Number of encoded chunks waiting to be written when streaming history
+HISTORY_PENDING_CHUNKS = 4
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Iterable, Iterator
 from datetime import datetime as dt
+import threading
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
 
 
 def entities_may_have_state_changes_after(
@@ -31,3 +35,67 @@ def has_recorder_run_after(hass: HomeAssistant, run_time: dt) -> bool:
     return run_time >= process_timestamp(
         get_instance(hass).recorder_runs_manager.first.start
     )
+
+
+def significant_states_json(
+    chunks: Iterable[tuple[str, list[Any]]], by_entity_id: bool
+) -> Iterator[bytes]:
+    """Encode streamed significant states one chunk at a time.
+
+    Yields the fragments of a JSON list with the list of states of every
+    entity, or of an object keyed by entity_id when by_entity_id is set.
+    The first fragment is only yielded once the first chunk was read.
+    """
+    prefix = b"{" if by_entity_id else b"["
+    current_entity_id: str | None = None
+    for entity_id, states in chunks:
+        encoded_states = json_bytes(states)[1:-1]
+        if entity_id == current_entity_id:
+            yield b"," + encoded_states
+            continue
+        if current_entity_id is not None:
+            prefix = b"],"
+        if by_entity_id:
+            prefix += json_bytes(entity_id) + b":"
+        yield prefix + b"[" + encoded_states
+        current_entity_id = entity_id
+    suffix = b"}" if by_entity_id else b"]"
+    if current_entity_id is None:
+        yield prefix + suffix
+    else:
+        yield b"]" + suffix
+
+
+async def async_iterate_in_executor(
+    hass: HomeAssistant, iterable: Callable[[], Iterable[bytes]], max_pending: int
+) -> AsyncGenerator[bytes]:
+    """Iterate in the recorder executor and yield the items in the event loop.
+
+    At most max_pending items wait to be consumed, the executor job waits
+    when the consumer is slower. The job is stopped when the consumer stops.
+    """
+    loop = hass.loop
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    slots = threading.Semaphore(max_pending)
+    stopped = threading.Event()
+
+    def _produce() -> None:
+        try:
+            for item in iterable():
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    job = get_instance(hass).async_add_executor_job(_produce)
+    try:
+        while (item := await queue.get()) is not None:
+            yield item
+            slots.release()
+        await job
+    finally:
+        stopped.set()
+        # Wake up the job if it waits for a slot
+        slots.release()
@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -39,8 +40,12 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
+from .const import EVENT_COALESCE_TIME, HISTORY_CHUNK_SIZE, MAX_PENDING_HISTORY_STATES
+from .helpers import (
+    entities_may_have_state_changes_after,
+    has_recorder_run_after,
+    significant_states_json,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -74,24 +79,36 @@ def _ws_get_significant_states(
     minimal_response: bool,
     no_attributes: bool,
 ) -> bytes:
-    """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
+    """Fetch history significant_states and convert them to json in the executor.
+
+    The states are encoded chunk by chunk while they are streamed from the
+    database. A websocket result is a single message, so the chunks are
+    appended to the message as they are encoded instead of being kept until
+    the end.
+    """
+    message = bytearray(messages.construct_result_message(msg_id, b""))
+    # Keep the closing brace of the result message for the end
+    del message[-1:]
+    with session_scope(hass=hass, read_only=True) as session:
+        for data in significant_states_json(
+            history.stream_significant_states_with_session(
                 hass,
+                session,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
                 True,
+                HISTORY_CHUNK_SIZE,
             ),
-        )
-    )
+            by_entity_id=True,
+        ):
+            message += data
+    message += b"}"
+    return bytes(message)
 
 
 @websocket_api.websocket_command(
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 import datetime
+from operator import attrgetter
 
 from homeassistant.components.recorder import get_instance, history
 from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
@@ -14,6 +16,8 @@ from .helpers import async_calculate_period, floored_timestamp
 
 MIN_TIME_UTC = datetime.datetime.min.replace(tzinfo=dt_util.UTC)
 
+_LAST_CHANGED_KEY = attrgetter("last_changed")
+
 
 @dataclass
 class HistoryStatsState:
@@ -50,6 +54,11 @@ class HistoryStats:
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
         self._history_current_period: list[HistoryState] = []
+        # Running totals for the transitions between consecutive states in
+        # _history_current_period, kept up to date as states are appended
+        # and evicted so updates do not have to walk the whole period
+        self._matched_microseconds_between_states = 0
+        self._match_count_between_states = 0
         self._previous_run_before_start = False
         self._entity_states = set(entity_states)
         self._duration = duration
@@ -83,7 +92,7 @@ class HistoryStats:
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
-            self._history_current_period = []
+            self._async_set_history([])
             self._previous_run_before_start = True
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
@@ -91,13 +100,18 @@ class HistoryStats:
         # We avoid querying the database if the below did NOT happen:
         #
         # - The previous run happened before the start time
-        # - The start time changed
+        # - The start time moved backwards or past the previous end
         # - The period shrank in size
         # - The previous period ended before now
         #
+        # A start time moving forward within the previous period only
+        # evicts the states that fell out of the period.
+        #
         if (
             not self._previous_run_before_start
-            and current_period_start_timestamp == previous_period_start_timestamp
+            and previous_period_start_timestamp
+            <= current_period_start_timestamp
+            <= previous_period_end_timestamp
             and (
                 current_period_end_timestamp == previous_period_end_timestamp
                 or (
@@ -107,13 +121,16 @@ class HistoryStats:
             )
         ):
             new_data = False
+            if current_period_start_timestamp != previous_period_start_timestamp:
+                self._async_evict_history_before(current_period_start_timestamp)
+                new_data = True
             if event and (new_state := event.data["new_state"]) is not None:
                 if (
                     current_period_start_timestamp
                     <= floored_timestamp(new_state.last_changed)
                     <= current_period_end_timestamp
                 ):
-                    self._history_current_period.append(
+                    self._async_append_history(
                         HistoryState(
                             new_state.state, new_state.last_changed.timestamp()
                         )
@@ -149,10 +166,68 @@ class HistoryStats:
             current_period_start_timestamp,
             current_period_end_timestamp,
         )
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
+        self._async_set_history(
+            [
+                HistoryState(state.state, state.last_changed.timestamp())
+                for state in states
+            ]
+        )
+
+    def _async_transition(
+        self, previous: HistoryState, current: HistoryState
+    ) -> tuple[int, int]:
+        """Return the microseconds matched and the match count of a transition."""
+        if previous.state in self._entity_states:
+            return _microseconds(current.last_changed - previous.last_changed), 0
+        return 0, 1 if current.state in self._entity_states else 0
+
+    def _async_add_transition(
+        self, previous: HistoryState, current: HistoryState, sign: int
+    ) -> None:
+        """Add (sign 1) or remove (sign -1) a transition from the running totals."""
+        microseconds, count = self._async_transition(previous, current)
+        self._matched_microseconds_between_states += sign * microseconds
+        self._match_count_between_states += sign * count
+
+    def _async_set_history(self, history: list[HistoryState]) -> None:
+        """Replace the history of the current period."""
+        self._history_current_period = history
+        self._matched_microseconds_between_states = 0
+        self._match_count_between_states = 0
+        for previous, current in zip(history, history[1:], strict=False):
+            self._async_add_transition(previous, current, 1)
+
+    def _async_append_history(self, history_state: HistoryState) -> None:
+        """Append a state change to the history of the current period."""
+        history = self._history_current_period
+        if history:
+            last = history[-1]
+            if (
+                last.state == history_state.state
+                and last.last_changed == history_state.last_changed
+            ):
+                # Attribute only change, nothing to record
+                return
+            self._async_add_transition(last, history_state, 1)
+        history.append(history_state)
+
+    def _async_evict_history_before(self, start_timestamp: float) -> None:
+        """Evict the states which fell out of a period starting at start_timestamp.
+
+        The last state at or before the start is kept as the state at the
+        start of the period, the same way the database provides it.
+        """
+        history = self._history_current_period
+        if not (evict := bisect_right(history, start_timestamp, key=_LAST_CHANGED_KEY)):
+            return
+        # Remove all transitions out of the evicted states, including the one
+        # from the state kept at the start to the first state in the period
+        for idx in range(min(evict, len(history) - 1)):
+            self._async_add_transition(history[idx], history[idx + 1], -1)
+        del history[: evict - 1]
+        history[0] = HistoryState(history[0].state, start_timestamp)
+        if len(history) > 1:
+            self._async_add_transition(history[0], history[1], 1)
 
     def _state_changes_during_period(
         self, start_ts: float, end_ts: float
@@ -176,32 +251,31 @@ class HistoryStats:
         # state_changes_during_period is called with include_start_time_state=True
         # which is the default and always provides the state at the start
         # of the period
-        previous_state_matches = (
-            self._history_current_period
-            and self._history_current_period[0].state in self._entity_states
-        )
-        last_state_change_timestamp = start_timestamp
-        elapsed = 0.0
-        match_count = 1 if previous_state_matches else 0
-
-        # Make calculations
-        for history_state in self._history_current_period:
-            current_state_matches = history_state.state in self._entity_states
-            state_change_timestamp = history_state.last_changed
+        if not (history := self._history_current_period):
+            return 0.0, 0
+        first_state = history[0]
+        last_state = history[-1]
+        microseconds = self._matched_microseconds_between_states
+        match_count = self._match_count_between_states
 
-            if previous_state_matches:
-                elapsed += state_change_timestamp - last_state_change_timestamp
-            elif current_state_matches:
-                match_count += 1
-
-            previous_state_matches = current_state_matches
-            last_state_change_timestamp = state_change_timestamp
+        if first_state.state in self._entity_states:
+            match_count += 1
+            microseconds += _microseconds(first_state.last_changed - start_timestamp)
 
         # Count time elapsed between last history state and end of measure
-        if previous_state_matches:
+        if last_state.state in self._entity_states:
             measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_state_change_timestamp
+            microseconds += _microseconds(measure_end - last_state.last_changed)
 
         # Save value in seconds
-        seconds_matched = elapsed
+        seconds_matched = microseconds / 1_000_000
         return seconds_matched, match_count
+
+
+def _microseconds(seconds: float) -> int:
+    """Return a duration in whole microseconds.
+
+    Keeping the running totals in integers avoids accumulating floating point
+    errors while states are added to and evicted from them.
+    """
+    return round(seconds * 1_000_000)
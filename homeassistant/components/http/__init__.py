@@ -10,6 +10,7 @@ from functools import partial
 from ipaddress import IPv4Network, IPv6Network, ip_network
 import logging
 import os
+from pathlib import Path
 import socket
 import ssl
 from tempfile import NamedTemporaryFile
@@ -64,7 +65,7 @@ from .forwarded import async_setup_forwarded
 from .headers import setup_headers
 from .request_context import setup_request_context
 from .security_filter import setup_security_filter
-from .static import CACHE_HEADERS, CachingStaticResource
+from .static import CACHE_HEADERS, CachingStaticResource, index_static_directory
 from .web_runner import HomeAssistantTCPSite
 
 CONF_SERVER_HOST: Final = "server_host"
@@ -143,6 +144,9 @@ class StaticPathConfig:
     url_path: str
     path: str
     cache_headers: bool = True
+    # Index the files of a directory with cache headers at registration,
+    # only for files which do not change while running
+    index_files: bool = False
 
 
 _STATIC_CLASSES = {
@@ -431,8 +435,14 @@ class HomeAssistantHTTP:
     ) -> dict[str, CachingStaticResource | web.StaticResource | None]:
         """Create a list of static resources."""
         return {
-            config.url_path: _STATIC_CLASSES[config.cache_headers](
-                config.url_path, config.path
+            config.url_path: (
+                CachingStaticResource(
+                    config.url_path,
+                    config.path,
+                    index=index_static_directory(Path(config.path)),
+                )
+                if config.index_files and config.cache_headers
+                else _STATIC_CLASSES[config.cache_headers](config.url_path, config.path)
             )
             if os.path.isdir(config.path)
             else None
@@ -3,30 +3,127 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from dataclasses import dataclass
+import os
 from pathlib import Path
-from typing import Final
+import re
+from typing import Any, Final
 
 from aiohttp.hdrs import CACHE_CONTROL, CONTENT_TYPE
 from aiohttp.web import FileResponse, Request, StreamResponse
-from aiohttp.web_fileresponse import CONTENT_TYPES, FALLBACK_CONTENT_TYPE
+from aiohttp.web_fileresponse import (
+    CONTENT_TYPES,
+    ENCODING_EXTENSIONS,
+    FALLBACK_CONTENT_TYPE,
+)
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
 
 CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {CACHE_CONTROL: CACHE_HEADER}
+IMMUTABLE_CACHE_TIME: Final = 365 * 86400  # = 1 year
+IMMUTABLE_CACHE_HEADER = f"public, max-age={IMMUTABLE_CACHE_TIME}, immutable"
 RESPONSE_CACHE: LRU[tuple[str, Path], tuple[Path, str]] = LRU(512)
 
+# Names of files with a content hash, like 1010.v1vKN-oOh_0.js or
+# en-0123456789abcdef0123456789abcdef.json, a base64url hash must contain
+# a digit to tell it apart from words like app.development.js
+HASHED_FILE_NAME = re.compile(
+    r"(?:^|[.-])[0-9a-f]{8,}\.|\.(?=[\w-]{0,10}[0-9])[\w-]{11}\."
+)
+
+
+@dataclass(slots=True, frozen=True)
+class IndexedFile:
+    """A file of a static directory and its precompressed variants."""
+
+    content_type: str
+    cache_header: str
+    # Path, stat result and encoding of the variants in order of preference,
+    # ending with the uncompressed file
+    variants: tuple[tuple[Path, os.stat_result, str | None], ...]
+
+
+def index_static_directory(directory: Path) -> dict[str, IndexedFile]:
+    """Index the files of a static directory by their relative URL.
+
+    This method does blocking I/O and must be run in the executor.
+    """
+    index: dict[str, IndexedFile] = {}
+    for root, _, files in os.walk(directory):
+        root_path = Path(root)
+        names = set(files)
+        for name in files:
+            path = root_path / name
+            if path.is_symlink():
+                # Leave symlinks to the checks of the static resource
+                continue
+            variants: list[tuple[Path, os.stat_result, str | None]] = []
+            for extension, encoding in ENCODING_EXTENSIONS.items():
+                if (variant_name := f"{name}{extension}") in names:
+                    variant = root_path / variant_name
+                    variants.append((variant, variant.stat(), encoding))
+            variants.append((path, path.stat(), None))
+            index[path.relative_to(directory).as_posix()] = IndexedFile(
+                CONTENT_TYPES.guess_type(path)[0] or FALLBACK_CONTENT_TYPE,
+                IMMUTABLE_CACHE_HEADER
+                if HASHED_FILE_NAME.search(name)
+                else CACHE_HEADER,
+                tuple(variants),
+            )
+    return index
+
+
+class IndexedFileResponse(FileResponse):
+    """File response using the stat results of the index."""
+
+    def __init__(self, indexed_file: IndexedFile, chunk_size: int) -> None:
+        """Initialize the response for an indexed file."""
+        super().__init__(indexed_file.variants[-1][0], chunk_size=chunk_size)
+        self._indexed_file = indexed_file
+
+    def _get_file_path_stat_encoding(
+        self, accept_encoding: str
+    ) -> tuple[Path, os.stat_result, str | None]:
+        """Return the first variant accepted by the client without a stat call."""
+        for variant in self._indexed_file.variants:
+            if variant[2] is None or variant[2] in accept_encoding:
+                return variant
+        raise AssertionError("The uncompressed file is always accepted")
+
 
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
 
+    def __init__(
+        self,
+        prefix: str,
+        directory: str | Path,
+        *,
+        index: Mapping[str, IndexedFile] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the resource with an optional index of its files.
+
+        Indexed files are served without resolving their path or calling stat,
+        so the index must only be used for files which do not change.
+        """
+        super().__init__(prefix, directory, **kwargs)
+        self._index = index or {}
+
     async def _handle(self, request: Request) -> StreamResponse:
         """Wrap base handler to cache file path resolution and content type guess."""
         rel_url = request.match_info["filename"]
-        key = (rel_url, self._directory)
         response: StreamResponse
 
+        if indexed_file := self._index.get(rel_url):
+            response = IndexedFileResponse(indexed_file, self._chunk_size)
+            response.headers[CONTENT_TYPE] = indexed_file.content_type
+            response.headers[CACHE_CONTROL] = indexed_file.cache_header
+            return response
+
+        key = (rel_url, self._directory)
         if key in RESPONSE_CACHE:
             file_path, content_type = RESPONSE_CACHE[key]
             response = FileResponse(file_path, chunk_size=self._chunk_size)
@@ -47,6 +47,7 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -96,12 +97,16 @@ from .const import (
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_DIRECTORY,
+    SPOOL_FULL_MESSAGE,
+    SPOOL_MAX_SIZE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .spool import InfluxSpool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -349,7 +354,7 @@ def get_influx_connection(  # noqa: C901
         if CONF_SSL_CA_CERT in conf:
             kwargs[CONF_SSL_CA_CERT] = conf[CONF_SSL_CA_CERT]
         bucket = conf.get(CONF_BUCKET)
-        influx = InfluxDBClientV2(**kwargs)
+        influx = InfluxDBClientV2(**kwargs, enable_gzip=True)
         query_api = influx.query_api()
         initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
         write_api = influx.write_api(write_options=initial_write_mode)
@@ -429,7 +434,7 @@ def get_influx_connection(  # noqa: C901
     if CONF_SSL in conf:
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
-    influx = InfluxDBClient(**kwargs)
+    influx = InfluxDBClient(**kwargs, gzip=True)
 
     def write_v1(json):
         """Write data to V1 influx."""
@@ -493,7 +498,10 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool = InfluxSpool(hass.config.path(STORAGE_DIR, SPOOL_DIRECTORY), SPOOL_MAX_SIZE)
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, spool
+    )
     instance.start()
 
     def shutdown(event):
@@ -510,7 +518,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, event_to_json, max_tries, spool):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
@@ -519,8 +527,11 @@ class InfluxThread(threading.Thread):
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.spool: InfluxSpool = spool
         self.write_errors = 0
+        self.write_latency: float | None = None
         self.shutdown = False
+        self._replay_after = 0.0
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
@@ -529,11 +540,22 @@ class InfluxThread(threading.Thread):
         item = (time.monotonic(), event)
         self.queue.put(item)
 
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of events waiting to be written."""
+        return self.queue.qsize() + len(self.spool)
+
     @staticmethod
     def batch_timeout():
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
+    def first_timeout(self):
+        """Return number of seconds to wait for a first event."""
+        if not self.spool:
+            return None
+        return max(0, self._replay_after - time.monotonic())
+
     def get_events_json(self):
         """Return a batch of events formatted for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
@@ -545,7 +567,7 @@ class InfluxThread(threading.Thread):
 
         with suppress(queue.Empty):
             while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
+                timeout = self.first_timeout() if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
 
@@ -568,17 +590,45 @@ class InfluxThread(threading.Thread):
 
         return count, json
 
+    def _write(self, json):
+        """Write events to influxdb, keeping track of the write latency."""
+        start = time.monotonic()
+        self.influx.write(json)
+        self.write_latency = time.monotonic() - start
+        _LOGGER.debug(WROTE_MESSAGE, len(json), self.write_latency, self.queue_depth)
+
+    def _spool(self, json):
+        """Spool events until influxdb is available again."""
+        self.write_errors += len(json)
+        self._replay_after = time.monotonic() + RETRY_DELAY
+        if dropped := self.spool.append(json):
+            _LOGGER.warning(SPOOL_FULL_MESSAGE, dropped)
+
+    def replay_spool(self):
+        """Write spooled events in order once influxdb is available again."""
+        if time.monotonic() < self._replay_after:
+            return
+        try:
+            written = self.spool.replay(self._write)
+        except ConnectionError:
+            self._replay_after = time.monotonic() + RETRY_DELAY
+            return
+        _LOGGER.error(RESUMED_MESSAGE, written)
+        self.write_errors = 0
+
     def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
-        for retry in range(self.max_tries + 1):
-            try:
-                self.influx.write(json)
+        """Write preprocessed events to influxdb, with retry.
 
-                if self.write_errors:
-                    _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
-                    self.write_errors = 0
+        Events are spooled to disk when influxdb is unavailable, new events
+        are spooled as well until the spooled ones could be written.
+        """
+        if self.spool:
+            self._spool(json)
+            return
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
+        for retry in range(self.max_tries + 1):
+            try:
+                self._write(json)
                 break
             except ValueError as err:
                 _LOGGER.error(err)
@@ -587,14 +637,15 @@ class InfluxThread(threading.Thread):
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
                 else:
-                    if not self.write_errors:
-                        _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    _LOGGER.error(err)
+                    self._spool(json)
 
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
             _, json = self.get_events_json()
+            if self.spool:
+                self.replay_spool()
             if json:
                 self.write_to_influxdb(json)
 
@@ -78,6 +78,8 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+SPOOL_DIRECTORY = "influxdb_spool"
+SPOOL_MAX_SIZE = 32 * 1024 * 1024  # bytes
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -118,8 +120,10 @@ QUERY_ERROR = (
 )
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
-RESUMED_MESSAGE = "Resumed, lost %d events."
-WROTE_MESSAGE = "Wrote %d events."
+RESUMED_MESSAGE = "Resumed, wrote %d spooled events."
+SPOOL_FULL_MESSAGE = "Spool is full, dropped %d old events."
+SPOOL_CORRUPT_MESSAGE = "Dropped unreadable spool segment %s: %s."
+WROTE_MESSAGE = "Wrote %d events in %.3f seconds, %d queued."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
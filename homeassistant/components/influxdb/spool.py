@@ -0,0 +1,127 @@
+"""Spool events to disk while InfluxDB is unavailable."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from contextlib import suppress
+import gzip
+import logging
+import os
+from typing import Any, NamedTuple, cast
+import zlib
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+from .const import SPOOL_CORRUPT_MESSAGE
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".json.gz"
+
+
+class _Segment(NamedTuple):
+    """A spooled batch of events."""
+
+    name: str
+    size: int
+    events: int
+
+
+class InfluxSpool:
+    """Bounded on-disk log of the batches which could not be written.
+
+    Every batch is stored as a gzip compressed segment, segments are
+    replayed oldest first and the oldest ones are dropped when the spool
+    grows beyond its maximum size.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initialize the spool, picking up segments of a previous run."""
+        self.path = path
+        self.max_size = max_size
+        self._segments: deque[_Segment] = deque()
+        self._size = 0
+        self._events = 0
+        self._next_id = 0
+        names: list[str] = []
+        with suppress(FileNotFoundError):
+            names = sorted(
+                name for name in os.listdir(path) if name.endswith(SEGMENT_SUFFIX)
+            )
+        for name in names:
+            try:
+                segment_id, events = name.removesuffix(SEGMENT_SUFFIX).split("-")
+                segment = _Segment(
+                    name, os.path.getsize(os.path.join(path, name)), int(events)
+                )
+                self._next_id = int(segment_id) + 1
+            except (OSError, ValueError) as err:
+                _LOGGER.warning(SPOOL_CORRUPT_MESSAGE, name, err)
+                continue
+            self._add(segment)
+
+    def __len__(self) -> int:
+        """Return the number of spooled events."""
+        return self._events
+
+    @property
+    def size(self) -> int:
+        """Return the size of the spool in bytes."""
+        return self._size
+
+    def append(self, json: list[dict[str, Any]]) -> int:
+        """Spool a batch, return the number of old events dropped to make room."""
+        data = gzip.compress(json_bytes(json))
+        name = f"{self._next_id:012d}-{len(json)}{SEGMENT_SUFFIX}"
+        self._next_id += 1
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, name), "wb") as file:
+            file.write(data)
+        self._add(_Segment(name, len(data), len(json)))
+
+        dropped = 0
+        while self._size > self.max_size and len(self._segments) > 1:
+            dropped += self._remove_oldest().events
+        return dropped
+
+    def replay(self, write: Callable[[list[dict[str, Any]]], None]) -> int:
+        """Write the spooled batches in order, return the number of events written.
+
+        Raises ConnectionError and keeps the remaining batches when InfluxDB
+        is still unavailable.
+        """
+        written = 0
+        while self._segments:
+            segment = self._segments[0]
+            try:
+                with open(os.path.join(self.path, segment.name), "rb") as file:
+                    json = cast(
+                        list[dict[str, Any]],
+                        json_loads(gzip.decompress(file.read())),
+                    )
+            except (OSError, EOFError, ValueError, zlib.error) as err:
+                _LOGGER.warning(SPOOL_CORRUPT_MESSAGE, segment.name, err)
+            else:
+                try:
+                    write(json)
+                except ValueError as err:
+                    _LOGGER.error(err)
+                else:
+                    written += segment.events
+            self._remove_oldest()
+        return written
+
+    def _add(self, segment: _Segment) -> None:
+        self._segments.append(segment)
+        self._size += segment.size
+        self._events += segment.events
+
+    def _remove_oldest(self) -> _Segment:
+        segment = self._segments.popleft()
+        self._size -= segment.size
+        self._events -= segment.events
+        with suppress(FileNotFoundError):
+            os.unlink(os.path.join(self.path, segment.name))
+        return segment
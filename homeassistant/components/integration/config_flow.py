@@ -27,6 +27,7 @@ from homeassistant.helpers.schema_config_entry_flow import (
 
 from .const import (
     CONF_MAX_SUB_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
     CONF_ROUND_DIGITS,
     CONF_SOURCE_SENSOR,
     CONF_UNIT_PREFIX,
@@ -104,6 +105,9 @@ async def _get_options_dict(handler: SchemaCommonFlowHandler | None) -> dict:
         vol.Optional(CONF_MAX_SUB_INTERVAL): selector.DurationSelector(
             selector.DurationSelectorConfig(allow_negative=False)
         ),
+        vol.Optional(CONF_MIN_UPDATE_INTERVAL): selector.DurationSelector(
+            selector.DurationSelectorConfig(allow_negative=False)
+        ),
     }
 
 
@@ -8,6 +8,7 @@ CONF_UNIT_OF_MEASUREMENT = "unit"
 CONF_UNIT_PREFIX = "unit_prefix"
 CONF_UNIT_TIME = "unit_time"
 CONF_MAX_SUB_INTERVAL = "max_sub_interval"
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
 
 METHOD_TRAPEZOIDAL = "trapezoidal"
 METHOD_LEFT = "left"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal, InvalidOperation
@@ -40,6 +41,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device import async_device_info_to_link_from_entity
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -52,6 +54,7 @@ from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
     CONF_MAX_SUB_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
     CONF_ROUND_DIGITS,
     CONF_SOURCE_SENSOR,
     CONF_UNIT_OF_MEASUREMENT,
@@ -98,6 +101,7 @@ PLATFORM_SCHEMA = vol.All(
             vol.Optional(CONF_UNIT_TIME, default=UnitOfTime.HOURS): vol.In(UNIT_TIME),
             vol.Remove(CONF_UNIT_OF_MEASUREMENT): cv.string,
             vol.Optional(CONF_MAX_SUB_INTERVAL): cv.positive_time_period,
+            vol.Optional(CONF_MIN_UPDATE_INTERVAL): cv.positive_time_period,
             vol.Optional(CONF_METHOD, default=METHOD_TRAPEZOIDAL): vol.In(
                 INTEGRATION_METHODS
             ),
@@ -112,57 +116,63 @@ class _IntegrationMethod(ABC):
         return _NAME_TO_INTEGRATION_METHOD[method_name]()
 
     @abstractmethod
-    def validate_states(self, left: str, right: str) -> tuple[Decimal, Decimal] | None:
+    def validate_states[_NumberT: (Decimal, float)](
+        self, left: str, right: str, parse: Callable[[str], _NumberT | None]
+    ) -> tuple[_NumberT, _NumberT] | None:
         """Check state requirements for integration."""
 
     @abstractmethod
-    def calculate_area_with_two_states(
-        self, elapsed_time: Decimal, left: Decimal, right: Decimal
-    ) -> Decimal:
+    def calculate_area_with_two_states[_NumberT: (Decimal, float)](
+        self, elapsed_time: _NumberT, left: _NumberT, right: _NumberT
+    ) -> _NumberT:
         """Calculate area given two states."""
 
-    def calculate_area_with_one_state(
-        self, elapsed_time: Decimal, constant_state: Decimal
-    ) -> Decimal:
+    def calculate_area_with_one_state[_NumberT: (Decimal, float)](
+        self, elapsed_time: _NumberT, constant_state: _NumberT
+    ) -> _NumberT:
         return constant_state * elapsed_time
 
 
 class _Trapezoidal(_IntegrationMethod):
-    def calculate_area_with_two_states(
-        self, elapsed_time: Decimal, left: Decimal, right: Decimal
-    ) -> Decimal:
+    def calculate_area_with_two_states[_NumberT: (Decimal, float)](
+        self, elapsed_time: _NumberT, left: _NumberT, right: _NumberT
+    ) -> _NumberT:
         return elapsed_time * (left + right) / 2
 
-    def validate_states(self, left: str, right: str) -> tuple[Decimal, Decimal] | None:
-        if (left_dec := _decimal_state(left)) is None or (
-            right_dec := _decimal_state(right)
-        ) is None:
+    def validate_states[_NumberT: (Decimal, float)](
+        self, left: str, right: str, parse: Callable[[str], _NumberT | None]
+    ) -> tuple[_NumberT, _NumberT] | None:
+        if (left_num := parse(left)) is None or (right_num := parse(right)) is None:
             return None
-        return (left_dec, right_dec)
+        return (left_num, right_num)
 
 
 class _Left(_IntegrationMethod):
-    def calculate_area_with_two_states(
-        self, elapsed_time: Decimal, left: Decimal, right: Decimal
-    ) -> Decimal:
+    def calculate_area_with_two_states[_NumberT: (Decimal, float)](
+        self, elapsed_time: _NumberT, left: _NumberT, right: _NumberT
+    ) -> _NumberT:
         return self.calculate_area_with_one_state(elapsed_time, left)
 
-    def validate_states(self, left: str, right: str) -> tuple[Decimal, Decimal] | None:
-        if (left_dec := _decimal_state(left)) is None:
+    def validate_states[_NumberT: (Decimal, float)](
+        self, left: str, right: str, parse: Callable[[str], _NumberT | None]
+    ) -> tuple[_NumberT, _NumberT] | None:
+        if (left_num := parse(left)) is None:
             return None
-        return (left_dec, left_dec)
+        return (left_num, left_num)
 
 
 class _Right(_IntegrationMethod):
-    def calculate_area_with_two_states(
-        self, elapsed_time: Decimal, left: Decimal, right: Decimal
-    ) -> Decimal:
+    def calculate_area_with_two_states[_NumberT: (Decimal, float)](
+        self, elapsed_time: _NumberT, left: _NumberT, right: _NumberT
+    ) -> _NumberT:
         return self.calculate_area_with_one_state(elapsed_time, right)
 
-    def validate_states(self, left: str, right: str) -> tuple[Decimal, Decimal] | None:
-        if (right_dec := _decimal_state(right)) is None:
+    def validate_states[_NumberT: (Decimal, float)](
+        self, left: str, right: str, parse: Callable[[str], _NumberT | None]
+    ) -> tuple[_NumberT, _NumberT] | None:
+        if (right_num := parse(right)) is None:
             return None
-        return (right_dec, right_dec)
+        return (right_num, right_num)
 
 
 def _decimal_state(state: str) -> Decimal | None:
@@ -172,6 +182,13 @@ def _decimal_state(state: str) -> Decimal | None:
         return None
 
 
+def _float_state(state: str) -> float | None:
+    try:
+        return float(state)
+    except (ValueError, TypeError):
+        return None
+
+
 _NAME_TO_INTEGRATION_METHOD: dict[str, type[_IntegrationMethod]] = {
     METHOD_LEFT: _Left,
     METHOD_RIGHT: _Right,
@@ -257,6 +274,11 @@ async def async_setup_entry(
     else:
         max_sub_interval = None
 
+    if min_update_interval_dict := config_entry.options.get(CONF_MIN_UPDATE_INTERVAL):
+        min_update_interval = cv.time_period(min_update_interval_dict)
+    else:
+        min_update_interval = None
+
     round_digits = config_entry.options.get(CONF_ROUND_DIGITS)
     if round_digits:
         round_digits = int(round_digits)
@@ -271,6 +293,7 @@ async def async_setup_entry(
         unit_time=config_entry.options[CONF_UNIT_TIME],
         device_info=device_info,
         max_sub_interval=max_sub_interval,
+        min_update_interval=min_update_interval,
     )
 
     async_add_entities([integral])
@@ -292,6 +315,7 @@ async def async_setup_platform(
         unit_prefix=config.get(CONF_UNIT_PREFIX),
         unit_time=config[CONF_UNIT_TIME],
         max_sub_interval=config.get(CONF_MAX_SUB_INTERVAL),
+        min_update_interval=config.get(CONF_MIN_UPDATE_INTERVAL),
     )
 
     async_add_entities([integral])
@@ -314,6 +338,7 @@ class IntegrationSensor(RestoreSensor):
         unit_prefix: str | None,
         unit_time: UnitOfTime,
         max_sub_interval: timedelta | None,
+        min_update_interval: timedelta | None = None,
         device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize the integration sensor."""
@@ -342,6 +367,14 @@ class IntegrationSensor(RestoreSensor):
         self._last_integration_time: datetime = datetime.now(tz=UTC)
         self._last_integration_trigger = _IntegrationTrigger.StateEvent
         self._attr_suggested_display_precision = round_digits or 2
+        self._min_update_interval: timedelta | None = (
+            None  # write the state on every update
+            if min_update_interval is None or min_update_interval.total_seconds() == 0
+            else min_update_interval
+        )
+        self._write_debouncer: Debouncer[None] | None = None
+        # Area not yet added to the state when the state updates are rate limited
+        self._pending_area: float | None = None
 
     def _calculate_unit(self, source_unit: str) -> str:
         """Multiply source_unit with time unit of the integral.
@@ -406,6 +439,26 @@ class IntegrationSensor(RestoreSensor):
         )
         self._last_valid_state = self._state
 
+    def _apply_pending_area(self) -> None:
+        """Add the area summed up since the last state update to the integral."""
+        if self._pending_area is not None:
+            self._update_integral(Decimal(repr(self._pending_area)))
+            self._pending_area = None
+
+    @callback
+    def _async_write_pending_state(self) -> None:
+        """Write the state including the area integrated since the last update."""
+        self._apply_pending_area()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_schedule_write_ha_state(self) -> None:
+        """Write the state, at most once per min_update_interval if it is set."""
+        if self._write_debouncer is None:
+            self.async_write_ha_state()
+        else:
+            self._write_debouncer.async_schedule_call()
+
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
         await super().async_added_to_hass()
@@ -426,6 +479,16 @@ class IntegrationSensor(RestoreSensor):
                 self._last_valid_state,
             )
 
+        if self._min_update_interval is not None:
+            self._write_debouncer = Debouncer(
+                self.hass,
+                _LOGGER,
+                cooldown=self._min_update_interval.total_seconds(),
+                immediate=True,
+                function=self._async_write_pending_state,
+            )
+            self.async_on_remove(self._write_debouncer.async_shutdown)
+
         if self._max_sub_interval is not None:
             source_state = self.hass.states.get(self._sensor_source_id)
             self._schedule_max_sub_interval_exceeded_if_state_is_numeric(source_state)
@@ -540,24 +603,42 @@ class IntegrationSensor(RestoreSensor):
         self._derive_and_set_attributes_from_state(new_state)
 
         if old_last_reported is None and old_state is None:
-            self.async_write_ha_state()
-            return
-
-        if not (
-            states := self._method.validate_states(old_state_state, new_state.state)
-        ):
-            self.async_write_ha_state()
+            self._async_schedule_write_ha_state()
             return
 
         if TYPE_CHECKING:
             assert old_last_reported is not None
-        elapsed_seconds = Decimal(
+        elapsed_seconds = (
             (new_state.last_reported - old_last_reported).total_seconds()
             if self._last_integration_trigger == _IntegrationTrigger.StateEvent
             else (new_state.last_reported - self._last_integration_time).total_seconds()
         )
 
-        area = self._method.calculate_area_with_two_states(elapsed_seconds, *states)
+        if self._write_debouncer is not None:
+            # The state is not written for every sample, sum up the areas as
+            # floats and add them to the integral when the state is written
+            if float_states := self._method.validate_states(
+                old_state_state, new_state.state, _float_state
+            ):
+                self._pending_area = (
+                    self._pending_area or 0.0
+                ) + self._method.calculate_area_with_two_states(
+                    elapsed_seconds, *float_states
+                )
+            self._write_debouncer.async_schedule_call()
+            return
+
+        if not (
+            states := self._method.validate_states(
+                old_state_state, new_state.state, _decimal_state
+            )
+        ):
+            self.async_write_ha_state()
+            return
+
+        area = self._method.calculate_area_with_two_states(
+            Decimal(elapsed_seconds), *states
+        )
 
         self._update_integral(area)
         self.async_write_ha_state()
@@ -590,7 +671,7 @@ class IntegrationSensor(RestoreSensor):
                     elapsed_seconds, source_state_dec
                 )
                 self._update_integral(area)
-                self.async_write_ha_state()
+                self._async_schedule_write_ha_state()
 
                 self._last_integration_time = datetime.now(tz=UTC)
                 self._last_integration_trigger = _IntegrationTrigger.TimeElapsed
@@ -630,6 +711,8 @@ class IntegrationSensor(RestoreSensor):
     @property
     def extra_restore_state_data(self) -> IntegrationSensorExtraStoredData:
         """Return sensor specific state data to be restored."""
+        # Don't lose the area integrated since the last state update
+        self._apply_pending_area()
         return IntegrationSensorExtraStoredData(
             self.native_value,
             self.native_unit_of_measurement,
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import AsyncIterator
 from contextlib import suppress
+from functools import partial
 
 import aiohttp
 from aiohttp import web
@@ -22,10 +23,7 @@ from homeassistant.const import (
     HTTP_DIGEST_AUTHENTICATION,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import (
-    async_aiohttp_proxy_web,
-    async_get_clientsession,
-)
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.httpx_client import get_async_client
@@ -218,8 +216,8 @@ class MjpegCamera(Camera):
         if self._authentication == HTTP_DIGEST_AUTHENTICATION:
             return await self._handle_async_mjpeg_digest_stream(request)
 
-        # connect to stream
+        # connect to stream, shared by all viewers
         websession = async_get_clientsession(self.hass, verify_ssl=self._verify_ssl)
-        stream_coro = websession.get(self._mjpeg_url, auth=self._auth)
-
-        return await async_aiohttp_proxy_web(self.hass, request, stream_coro)
+        return await self.handle_async_proxy_mjpeg_stream(
+            request, partial(websession.get, self._mjpeg_url, auth=self._auth)
+        )
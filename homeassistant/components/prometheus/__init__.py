@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from contextlib import suppress
 import logging
 import string
 from typing import Any, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
-from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client import openmetrics
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -72,6 +72,8 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .exposition import Counter, Gauge, MetricFamily
+
 _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
@@ -118,8 +120,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -141,6 +141,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
+    hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH], metrics))
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
         EVENT_ENTITY_REGISTRY_UPDATED,
@@ -186,7 +187,7 @@ class PrometheusMetrics:
             self.metrics_prefix = f"{namespace}_"
         else:
             self.metrics_prefix = ""
-        self._metrics: dict[str, MetricWrapperBase] = {}
+        self._metrics: dict[str, MetricFamily] = {}
         self._climate_units = climate_units
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
@@ -220,20 +221,20 @@ class PrometheusMetrics:
 
         labels = self._labels(state)
         state_change = self._metric(
-            "state_change", prometheus_client.Counter, "The number of state changes"
+            "state_change", Counter, "The number of state changes"
         )
         state_change.labels(**labels).inc()
 
         entity_available = self._metric(
             "entity_available",
-            prometheus_client.Gauge,
+            Gauge,
             "Entity is available (not in the unavailable or unknown state)",
         )
         entity_available.labels(**labels).set(float(state.state not in ignored_states))
 
         last_updated_time_seconds = self._metric(
             "last_updated_time_seconds",
-            prometheus_client.Gauge,
+            Gauge,
             "The last_updated timestamp",
         )
         last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
@@ -268,9 +269,7 @@ class PrometheusMetrics:
     ) -> None:
         """Remove labelsets matching the given entity id from all metrics."""
         for metric in list(self._metrics.values()):
-            for sample in cast(list[prometheus_client.Metric], metric.collect())[
-                0
-            ].samples:
+            for sample in metric.collect()[0].samples:
                 if sample.labels["entity"] == entity_id and (
                     not friendly_name or sample.labels["friendly_name"] == friendly_name
                 ):
@@ -282,11 +281,51 @@ class PrometheusMetrics:
                     with suppress(KeyError):
                         metric.remove(*sample.labels.values())
 
+    def collect(self) -> Iterator[prometheus_client.Metric]:
+        """Collect the metrics of the process and of the entities."""
+        yield from prometheus_client.REGISTRY.collect()
+        for metric in list(self._metrics.values()):
+            yield from metric.collect()
+
+    def generate_latest(self) -> bytes:
+        """Return the metrics in the Prometheus text format.
+
+        Only the series updated since the previous scrape are encoded again.
+        """
+        return b"".join(
+            [
+                prometheus_client.generate_latest(prometheus_client.REGISTRY),
+                *(metric.encode() for metric in list(self._metrics.values())),
+            ]
+        )
+
+    def generate_openmetrics(self) -> bytes:
+        """Return the metrics in the OpenMetrics text format.
+
+        Only the series updated since the previous scrape are encoded again.
+        """
+        process_metrics = cast(
+            bytes,
+            openmetrics.exposition.generate_latest(  # type: ignore[no-untyped-call]
+                prometheus_client.REGISTRY
+            ),
+        )
+        return b"".join(
+            [
+                process_metrics.removesuffix(b"# EOF\n"),
+                *(
+                    metric.encode_openmetrics()
+                    for metric in list(self._metrics.values())
+                ),
+                b"# EOF\n",
+            ]
+        )
+
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
             metric = self._metric(
                 f"{state.domain}_attr_{key.lower()}",
-                prometheus_client.Gauge,
+                Gauge,
                 f"{key} attribute of {state.domain} entity",
             )
 
@@ -296,7 +335,7 @@ class PrometheusMetrics:
             except (ValueError, TypeError):
                 pass
 
-    def _metric[_MetricBaseT: MetricWrapperBase](
+    def _metric[_MetricBaseT: MetricFamily](
         self,
         metric: str,
         factory: type[_MetricBaseT],
@@ -317,7 +356,6 @@ class PrometheusMetrics:
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
             )
             return cast(_MetricBaseT, self._metrics[metric])
 
@@ -357,7 +395,7 @@ class PrometheusMetrics:
         if (battery_level := state.attributes.get(ATTR_BATTERY_LEVEL)) is not None:
             metric = self._metric(
                 "battery_level_percent",
-                prometheus_client.Gauge,
+                Gauge,
                 "Battery level as a percentage of its capacity",
             )
             try:
@@ -369,7 +407,7 @@ class PrometheusMetrics:
     def _handle_binary_sensor(self, state: State) -> None:
         metric = self._metric(
             "binary_sensor_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
@@ -378,7 +416,7 @@ class PrometheusMetrics:
     def _handle_input_boolean(self, state: State) -> None:
         metric = self._metric(
             "input_boolean_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
@@ -388,13 +426,13 @@ class PrometheusMetrics:
         if unit := self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)):
             metric = self._metric(
                 f"{domain}_state_{unit}",
-                prometheus_client.Gauge,
+                Gauge,
                 f"State of the {title} measured in {unit}",
             )
         else:
             metric = self._metric(
                 f"{domain}_state",
-                prometheus_client.Gauge,
+                Gauge,
                 f"State of the {title}",
             )
 
@@ -418,23 +456,21 @@ class PrometheusMetrics:
     def _handle_device_tracker(self, state: State) -> None:
         metric = self._metric(
             "device_tracker_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
     def _handle_person(self, state: State) -> None:
-        metric = self._metric(
-            "person_state", prometheus_client.Gauge, "State of the person (0/1)"
-        )
+        metric = self._metric("person_state", Gauge, "State of the person (0/1)")
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
     def _handle_cover(self, state: State) -> None:
         metric = self._metric(
             "cover_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the cover (0/1)",
             ["state"],
         )
@@ -449,7 +485,7 @@ class PrometheusMetrics:
         if position is not None:
             position_metric = self._metric(
                 "cover_position",
-                prometheus_client.Gauge,
+                Gauge,
                 "Position of the cover (0-100)",
             )
             position_metric.labels(**self._labels(state)).set(float(position))
@@ -458,7 +494,7 @@ class PrometheusMetrics:
         if tilt_position is not None:
             tilt_position_metric = self._metric(
                 "cover_tilt_position",
-                prometheus_client.Gauge,
+                Gauge,
                 "Tilt Position of the cover (0-100)",
             )
             tilt_position_metric.labels(**self._labels(state)).set(float(tilt_position))
@@ -466,7 +502,7 @@ class PrometheusMetrics:
     def _handle_light(self, state: State) -> None:
         metric = self._metric(
             "light_brightness_percent",
-            prometheus_client.Gauge,
+            Gauge,
             "Light brightness percentage (0..100)",
         )
 
@@ -482,9 +518,7 @@ class PrometheusMetrics:
             pass
 
     def _handle_lock(self, state: State) -> None:
-        metric = self._metric(
-            "lock_state", prometheus_client.Gauge, "State of the lock (0/1)"
-        )
+        metric = self._metric("lock_state", Gauge, "State of the lock (0/1)")
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
@@ -498,7 +532,7 @@ class PrometheusMetrics:
                 )
             metric = self._metric(
                 metric_name,
-                prometheus_client.Gauge,
+                Gauge,
                 metric_description,
             )
             metric.labels(**self._labels(state)).set(temp)
@@ -532,7 +566,7 @@ class PrometheusMetrics:
         if current_action := state.attributes.get(ATTR_HVAC_ACTION):
             metric = self._metric(
                 "climate_action",
-                prometheus_client.Gauge,
+                Gauge,
                 "HVAC action",
                 ["action"],
             )
@@ -546,7 +580,7 @@ class PrometheusMetrics:
         if current_mode and available_modes:
             metric = self._metric(
                 "climate_mode",
-                prometheus_client.Gauge,
+                Gauge,
                 "HVAC mode",
                 ["mode"],
             )
@@ -560,7 +594,7 @@ class PrometheusMetrics:
         if preset_mode and available_preset_modes:
             preset_metric = self._metric(
                 "climate_preset_mode",
-                prometheus_client.Gauge,
+                Gauge,
                 "Preset mode enum",
                 ["mode"],
             )
@@ -574,7 +608,7 @@ class PrometheusMetrics:
         if fan_mode and available_fan_modes:
             fan_mode_metric = self._metric(
                 "climate_fan_mode",
-                prometheus_client.Gauge,
+                Gauge,
                 "Fan mode enum",
                 ["mode"],
             )
@@ -588,14 +622,14 @@ class PrometheusMetrics:
         if humidifier_target_humidity_percent:
             metric = self._metric(
                 "humidifier_target_humidity_percent",
-                prometheus_client.Gauge,
+                Gauge,
                 "Target Relative Humidity",
             )
             metric.labels(**self._labels(state)).set(humidifier_target_humidity_percent)
 
         metric = self._metric(
             "humidifier_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the humidifier (0/1)",
         )
         try:
@@ -609,7 +643,7 @@ class PrometheusMetrics:
         if current_mode and available_modes:
             metric = self._metric(
                 "humidifier_mode",
-                prometheus_client.Gauge,
+                Gauge,
                 "Humidifier Mode",
                 ["mode"],
             )
@@ -631,7 +665,7 @@ class PrometheusMetrics:
             if unit:
                 documentation = f"Sensor data measured in {unit}"
 
-            _metric = self._metric(metric, prometheus_client.Gauge, documentation)
+            _metric = self._metric(metric, Gauge, documentation)
 
             try:
                 value = self.state_as_number(state)
@@ -708,9 +742,7 @@ class PrometheusMetrics:
         return units.get(unit, default)
 
     def _handle_switch(self, state: State) -> None:
-        metric = self._metric(
-            "switch_state", prometheus_client.Gauge, "State of the switch (0/1)"
-        )
+        metric = self._metric("switch_state", Gauge, "State of the switch (0/1)")
 
         try:
             value = self.state_as_number(state)
@@ -721,9 +753,7 @@ class PrometheusMetrics:
         self._handle_attributes(state)
 
     def _handle_fan(self, state: State) -> None:
-        metric = self._metric(
-            "fan_state", prometheus_client.Gauge, "State of the fan (0/1)"
-        )
+        metric = self._metric("fan_state", Gauge, "State of the fan (0/1)")
 
         try:
             value = self.state_as_number(state)
@@ -735,7 +765,7 @@ class PrometheusMetrics:
         if fan_speed_percent is not None:
             fan_speed_metric = self._metric(
                 "fan_speed_percent",
-                prometheus_client.Gauge,
+                Gauge,
                 "Fan speed percent (0-100)",
             )
             fan_speed_metric.labels(**self._labels(state)).set(float(fan_speed_percent))
@@ -744,7 +774,7 @@ class PrometheusMetrics:
         if fan_is_oscillating is not None:
             fan_oscillating_metric = self._metric(
                 "fan_is_oscillating",
-                prometheus_client.Gauge,
+                Gauge,
                 "Whether the fan is oscillating (0/1)",
             )
             fan_oscillating_metric.labels(**self._labels(state)).set(
@@ -756,7 +786,7 @@ class PrometheusMetrics:
         if fan_preset_mode and available_modes:
             fan_preset_metric = self._metric(
                 "fan_preset_mode",
-                prometheus_client.Gauge,
+                Gauge,
                 "Fan preset mode enum",
                 ["mode"],
             )
@@ -769,7 +799,7 @@ class PrometheusMetrics:
         if fan_direction is not None:
             fan_direction_metric = self._metric(
                 "fan_direction_reversed",
-                prometheus_client.Gauge,
+                Gauge,
                 "Fan direction reversed (bool)",
             )
             if fan_direction == DIRECTION_FORWARD:
@@ -783,7 +813,7 @@ class PrometheusMetrics:
     def _handle_automation(self, state: State) -> None:
         metric = self._metric(
             "automation_triggered_count",
-            prometheus_client.Counter,
+            Counter,
             "Count of times an automation has been triggered",
         )
 
@@ -792,7 +822,7 @@ class PrometheusMetrics:
     def _handle_counter(self, state: State) -> None:
         metric = self._metric(
             "counter_value",
-            prometheus_client.Gauge,
+            Gauge,
             "Value of counter entities",
         )
 
@@ -801,7 +831,7 @@ class PrometheusMetrics:
     def _handle_update(self, state: State) -> None:
         metric = self._metric(
             "update_state",
-            prometheus_client.Gauge,
+            Gauge,
             "Update state, indicating if an update is available (0/1)",
         )
         value = self.state_as_number(state)
@@ -814,19 +844,32 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, metrics: PrometheusMetrics) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._metrics = metrics
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
         hass = request.app[KEY_HASS]
-        body = await hass.async_add_executor_job(
-            prometheus_client.generate_latest, prometheus_client.REGISTRY
-        )
-        return web.Response(
-            body=body,
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
-        )
+        if any(
+            accepted.split(";")[0].strip() == "application/openmetrics-text"
+            for accepted in request.headers.get(hdrs.ACCEPT, "").split(",")
+        ):
+            body = await hass.async_add_executor_job(self._metrics.generate_openmetrics)
+            response = web.Response(
+                body=body,
+                headers={hdrs.CONTENT_TYPE: openmetrics.exposition.CONTENT_TYPE_LATEST},
+                zlib_executor_size=32768,
+            )
+        else:
+            body = await hass.async_add_executor_job(self._metrics.generate_latest)
+            response = web.Response(
+                body=body,
+                content_type=CONTENT_TYPE_TEXT_PLAIN,
+                zlib_executor_size=32768,
+            )
+        response.enable_compression()
+        return response
@@ -0,0 +1,240 @@
+"""Metric families which keep their text exposition encoded."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, cast
+
+import prometheus_client
+from prometheus_client.utils import floatToGoString
+
+
+def _format_value(value: float) -> str:
+    return cast(str, floatToGoString(value))  # type: ignore[no-untyped-call]
+
+
+def _escape_help(documentation: str) -> str:
+    return documentation.replace("\\", r"\\").replace("\n", r"\n")
+
+
+def _escape_openmetrics_help(documentation: str) -> str:
+    return _escape_help(documentation).replace('"', r"\"")
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+class Series:
+    """A labelled series of a metric family."""
+
+    __slots__ = ("_family", "created", "labelstr", "labelvalues", "value")
+
+    def __init__(
+        self, family: MetricFamily, labelvalues: tuple[str, ...], labelstr: str
+    ) -> None:
+        """Initialize the series."""
+        self._family = family
+        self.labelvalues = labelvalues
+        self.labelstr = labelstr
+        self.value = 0.0
+        self.created = time.time()
+
+    def set(self, value: float) -> None:
+        """Set the value of the series."""
+        family = self._family
+        with family.lock:
+            self.value = float(value)
+            family.dirty.add(self.labelvalues)
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the value of the series."""
+        family = self._family
+        with family.lock:
+            self.value += amount
+            family.dirty.add(self.labelvalues)
+
+
+class MetricFamily:
+    """A metric family which re-encodes only the series changed since a scrape.
+
+    The families mirror the labels/set/inc/remove API of prometheus_client,
+    the text exposition of a series is kept until its value changes so a
+    scrape only has to format the series which were updated in between.
+    The Prometheus and OpenMetrics text formats share the encoded series.
+    """
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: list[str]) -> None:
+        """Initialize the metric family."""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._label_order = sorted(
+            range(len(labelnames)), key=lambda index: labelnames[index]
+        )
+        self.lock = threading.Lock()
+        self.dirty: set[tuple[str, ...]] = set()
+        self._series: dict[tuple[str, ...], Series] = {}
+        self._lines: dict[tuple[str, ...], str] = {}
+        self._encoded: bytes | None = None
+        self._encoded_openmetrics: bytes | None = None
+
+    def labels(self, **labels: Any) -> Series:
+        """Return the series of the labels, creating it if missing."""
+        labelvalues = tuple(str(labels[name]) for name in self.labelnames)
+        if (series := self._series.get(labelvalues)) is not None:
+            return series
+        with self.lock:
+            if (series := self._series.get(labelvalues)) is None:
+                labelstr = ",".join(
+                    f'{self.labelnames[index]}="'
+                    f'{_escape_label_value(labelvalues[index])}"'
+                    for index in self._label_order
+                )
+                series = self._series[labelvalues] = Series(
+                    self, labelvalues, f"{{{labelstr}}}"
+                )
+                self.dirty.add(labelvalues)
+        return series
+
+    def remove(self, *labelvalues: Any) -> None:
+        """Remove the series of the label values."""
+        key = tuple(str(value) for value in labelvalues)
+        with self.lock:
+            del self._series[key]
+            self._remove_lines(key)
+            self.dirty.discard(key)
+            self._encoded = None
+            self._encoded_openmetrics = None
+
+    def collect(self) -> list[prometheus_client.Metric]:
+        """Return the family in the data model of prometheus_client."""
+        metric = prometheus_client.Metric(self.name, self.documentation, self.type)
+        with self.lock:
+            series = list(self._series.values())
+        for item in series:
+            self._add_samples(
+                metric, dict(zip(self.labelnames, item.labelvalues, strict=True)), item
+            )
+        return [metric]
+
+    def encode(self) -> bytes:
+        """Return the family in the Prometheus text format."""
+        with self.lock:
+            self._encode_dirty()
+            if self._encoded is None:
+                self._encoded = self._encode_family().encode()
+            return self._encoded
+
+    def encode_openmetrics(self) -> bytes:
+        """Return the family in the OpenMetrics text format."""
+        with self.lock:
+            self._encode_dirty()
+            if self._encoded_openmetrics is None:
+                self._encoded_openmetrics = self._encode_openmetrics_family().encode()
+            return self._encoded_openmetrics
+
+    def _encode_dirty(self) -> None:
+        """Encode the series updated since the family was encoded."""
+        if not self.dirty:
+            return
+        for labelvalues in self.dirty:
+            # Series removed after being updated are not exposed anymore
+            if (series := self._series.get(labelvalues)) is not None:
+                self._lines[labelvalues] = self._encode_series(series)
+        self.dirty.clear()
+        self._encoded = None
+        self._encoded_openmetrics = None
+
+    def _add_samples(
+        self, metric: prometheus_client.Metric, labels: dict[str, str], series: Series
+    ) -> None:
+        metric.add_sample(self.name, labels, series.value)
+
+    def _remove_lines(self, labelvalues: tuple[str, ...]) -> None:
+        self._lines.pop(labelvalues, None)
+
+    def _encode_series(self, series: Series) -> str:
+        return f"{self.name}{series.labelstr} {_format_value(series.value)}\n"
+
+    def _encode_family(self) -> str:
+        return "".join(
+            (
+                f"# HELP {self.name} {_escape_help(self.documentation)}\n",
+                f"# TYPE {self.name} {self.type}\n",
+                *self._lines.values(),
+            )
+        )
+
+    def _encode_openmetrics_family(self) -> str:
+        return "".join(
+            (
+                f"# HELP {self.name} {_escape_openmetrics_help(self.documentation)}\n",
+                f"# TYPE {self.name} {self.type}\n",
+                *self._lines.values(),
+            )
+        )
+
+
+class Gauge(MetricFamily):
+    """A gauge metric family."""
+
+    type = "gauge"
+
+
+class Counter(MetricFamily):
+    """A counter metric family, exposing the creation time of its series."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: list[str]) -> None:
+        """Initialize the counter."""
+        super().__init__(name, documentation, labelnames)
+        self._created_lines: dict[tuple[str, ...], str] = {}
+
+    def _add_samples(
+        self, metric: prometheus_client.Metric, labels: dict[str, str], series: Series
+    ) -> None:
+        metric.add_sample(f"{self.name}_total", labels, series.value)
+        metric.add_sample(f"{self.name}_created", labels, series.created)
+
+    def _remove_lines(self, labelvalues: tuple[str, ...]) -> None:
+        super()._remove_lines(labelvalues)
+        self._created_lines.pop(labelvalues, None)
+
+    def _encode_series(self, series: Series) -> str:
+        if series.labelvalues not in self._created_lines:
+            self._created_lines[series.labelvalues] = (
+                f"{self.name}_created{series.labelstr} "
+                f"{_format_value(series.created)}\n"
+            )
+        return f"{self.name}_total{series.labelstr} {_format_value(series.value)}\n"
+
+    def _encode_family(self) -> str:
+        documentation = _escape_help(self.documentation)
+        return "".join(
+            (
+                f"# HELP {self.name}_total {documentation}\n",
+                f"# TYPE {self.name}_total counter\n",
+                *self._lines.values(),
+                f"# HELP {self.name}_created {documentation}\n",
+                f"# TYPE {self.name}_created gauge\n",
+                *self._created_lines.values(),
+            )
+        )
+
+    def _encode_openmetrics_family(self) -> str:
+        # The samples of a series are grouped in the OpenMetrics format
+        return "".join(
+            (
+                f"# HELP {self.name} {_escape_openmetrics_help(self.documentation)}\n",
+                f"# TYPE {self.name} counter\n",
+                *(
+                    line + self._created_lines[labelvalues]
+                    for labelvalues, line in self._lines.items()
+                ),
+            )
+        )
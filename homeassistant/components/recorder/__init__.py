@@ -32,6 +32,7 @@ from . import entity_registry, websocket_api
 from .const import (  # noqa: F401
     CONF_DB_INTEGRITY_CHECK,
     DOMAIN,
+    EVENT_RECORDER_STATISTICS_UPDATED,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_METHODS,
     SQLITE_URL_PREFIX,
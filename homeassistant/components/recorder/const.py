@@ -27,6 +27,10 @@ DOMAIN = "recorder"
 
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
+# Fired when statistics are changed other than by compiling them, the event
+# data has the ids of the changed statistics
+EVENT_RECORDER_STATISTICS_UPDATED = "recorder_statistics_updated"
+
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
@@ -65,11 +69,15 @@ LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 INTEGRATION_PLATFORM_COMPILE_STATISTICS = "compile_statistics"
 INTEGRATION_PLATFORM_VALIDATE_STATISTICS = "validate_statistics"
 INTEGRATION_PLATFORM_LIST_STATISTIC_IDS = "list_statistic_ids"
+# Called in the recorder thread with each recorded state_changed event,
+# or with None when state changes are not recorded because recording is disabled
+INTEGRATION_PLATFORM_PROCESS_STATE_CHANGED = "process_state_changed"
 
 INTEGRATION_PLATFORM_METHODS = {
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
+    INTEGRATION_PLATFORM_PROCESS_STATE_CHANGED,
 }
 
 
@@ -84,7 +84,9 @@ from .migration import (
     EventIDPostMigration,
     EventsContextIDMigration,
     EventTypeIDMigration,
+    MigrationTask,
     StatesContextIDMigration,
+    StatisticsRollupsMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
@@ -229,6 +231,8 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        # The time zone of the statistics rollups, None while they are compiled
+        self.statistics_rollups_time_zone: str | None = None
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
@@ -240,6 +244,11 @@ class Recorder(threading.Thread):
         self._nightly_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
         self.enabled = True
+        # Recorder platforms which follow the recorded state changes,
+        # only accessed from the recorder thread
+        self.state_changed_processors: dict[
+            str, Callable[[Event[EventStateChangedData] | None], None]
+        ] = {}
 
         # For safety we default to the lowest value for max_bind_vars
         # of all the DB types (SQLITE_MAX_BIND_VARS).
@@ -541,8 +550,21 @@ class Recorder(threading.Thread):
     def _async_five_minute_tasks(self, now: datetime) -> None:
         """Run tasks every five minutes."""
         self.queue_task(ADJUST_LRU_SIZE_TASK)
+        self._async_check_statistics_rollups_time_zone()
         self.async_periodic_statistics()
 
+    @callback
+    def _async_check_statistics_rollups_time_zone(self) -> None:
+        """Recompile the statistics rollups if the time zone has been changed."""
+        if self.statistics_rollups_time_zone is None or (
+            self.statistics_rollups_time_zone == str(dt_util.get_default_time_zone())
+        ):
+            return
+        self.statistics_rollups_time_zone = None
+        self.queue_task(
+            MigrationTask(StatisticsRollupsMigration(self.schema_version, {}))
+        )
+
     def _adjust_lru_size(self) -> None:
         """Trigger the LRU adjustment.
 
@@ -820,6 +842,7 @@ class Recorder(threading.Thread):
                 EventTypeIDMigration,
                 EntityIDMigration,
                 EventIDPostMigration,
+                StatisticsRollupsMigration,
             ):
                 migrator = migrator_cls(schema_status.start_version, migration_changes)
                 migrator.do_migrate(self, session)
@@ -1038,15 +1061,35 @@ class Recorder(threading.Thread):
 
     def _process_one_event(self, event: Event[Any]) -> None:
         if not self.enabled:
+            if (
+                self.state_changed_processors
+                and event.event_type == EVENT_STATE_CHANGED
+            ):
+                # Let the processors know they are missing state changes
+                self._run_state_changed_processors(None)
             return
         if event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
+            if self.state_changed_processors:
+                self._run_state_changed_processors(event)
         else:
             self._process_non_state_changed_event_into_session(event)
         # Commit if the commit interval is zero
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _run_state_changed_processors(
+        self, event: Event[EventStateChangedData] | None
+    ) -> None:
+        """Pass a recorded state change to the recorder platforms following them."""
+        for domain, processor in self.state_changed_processors.items():
+            try:
+                processor(event)
+            except Exception:
+                _LOGGER.exception(
+                    "Error processing state change in recorder platform %s", domain
+                )
+
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
         session = self.event_session
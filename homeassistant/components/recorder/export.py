@@ -0,0 +1,166 @@
+"""Export states and statistics column by column."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Iterator
+from contextlib import AbstractContextManager
+from datetime import datetime
+from typing import Any, Final, Literal
+
+from sqlalchemy import Select, and_, or_, select
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.session import Session
+
+from .db_schema import (
+    StateAttributes,
+    States,
+    StatesMeta,
+    Statistics,
+    StatisticsBase,
+    StatisticsMeta,
+    StatisticsShortTerm,
+)
+
+DEFAULT_CHUNK_SIZE: Final = 10000
+MAX_CHUNK_SIZE: Final = 100000
+
+type ColumnType = Literal["float", "str"]
+
+STATE_COLUMNS: Final[dict[str, ColumnType]] = {
+    "entity_id": "str",
+    "state": "str",
+    "attributes": "str",
+    "last_changed": "float",
+    "last_updated": "float",
+}
+STATISTIC_COLUMNS: Final[dict[str, ColumnType]] = {
+    "statistic_id": "str",
+    "start": "float",
+    "mean": "float",
+    "min": "float",
+    "max": "float",
+    "last_reset": "float",
+    "state": "float",
+    "sum": "float",
+}
+
+
+def _export_columnar(
+    sessions: Callable[[], AbstractContextManager[Session]],
+    stmt: Select,
+    order: tuple[InstrumentedAttribute[float | None], InstrumentedAttribute[int]],
+    columns: Collection[str],
+    chunk_size: int,
+) -> Iterator[dict[str, list[Any]]]:
+    """Export the rows of a statement as chunks of columns.
+
+    Each chunk is read with a new session, continuing after the position
+    in order of the last row of the previous chunk. No transaction is held
+    open while a chunk is written and only one chunk is held in memory.
+    """
+    order_by, unique = order
+    stmt = stmt.add_columns(order_by, unique).order_by(order_by, unique)
+    chunk_stmt = stmt.limit(chunk_size)
+    while True:
+        with sessions() as session:
+            rows = session.execute(chunk_stmt).all()
+        if not rows:
+            return
+        *values, order_by_values, unique_values = map(list, zip(*rows, strict=True))
+        yield dict(zip(columns, values, strict=True))
+        if len(rows) < chunk_size:
+            return
+        chunk_stmt = stmt.where(
+            or_(
+                order_by > order_by_values[-1],
+                and_(order_by == order_by_values[-1], unique > unique_values[-1]),
+            )
+        ).limit(chunk_size)
+
+
+def export_states(
+    sessions: Callable[[], AbstractContextManager[Session]],
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: Collection[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[dict[str, list[Any]]]:
+    """Export the states of a period ordered by last_updated.
+
+    Yields chunks of at most chunk_size states, each chunk maps the names
+    of STATE_COLUMNS to a list of values. Each chunk is read in a session
+    opened with sessions.
+    """
+    stmt = (
+        select(
+            StatesMeta.entity_id,
+            States.state,
+            StateAttributes.shared_attrs,
+            States.last_changed_ts,
+            States.last_updated_ts,
+        )
+        .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        .outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+        .where(States.last_updated_ts >= start_time.timestamp())
+    )
+    if end_time is not None:
+        stmt = stmt.where(States.last_updated_ts < end_time.timestamp())
+    if entity_ids is not None:
+        stmt = stmt.where(StatesMeta.entity_id.in_(entity_ids))
+    for chunk in _export_columnar(
+        sessions,
+        stmt,
+        (States.last_updated_ts, States.state_id),
+        STATE_COLUMNS,
+        chunk_size,
+    ):
+        # last_changed is only stored when it differs from last_updated
+        chunk["last_changed"] = [
+            last_updated if last_changed is None else last_changed
+            for last_changed, last_updated in zip(
+                chunk["last_changed"], chunk["last_updated"], strict=True
+            )
+        ]
+        yield chunk
+
+
+def export_statistics(
+    sessions: Callable[[], AbstractContextManager[Session]],
+    start_time: datetime,
+    end_time: datetime | None = None,
+    statistic_ids: Collection[str] | None = None,
+    period: Literal["5minute", "hour"] = "hour",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[dict[str, list[Any]]]:
+    """Export the statistics of a period ordered by start.
+
+    Yields chunks of at most chunk_size rows, each chunk maps the names
+    of STATISTIC_COLUMNS to a list of values. Each chunk is read in a
+    session opened with sessions.
+    """
+    table: type[StatisticsBase] = Statistics
+    if period == "5minute":
+        table = StatisticsShortTerm
+    stmt = (
+        select(
+            StatisticsMeta.statistic_id,
+            table.start_ts,
+            table.mean,
+            table.min,
+            table.max,
+            table.last_reset_ts,
+            table.state,
+            table.sum,
+        )
+        .join(StatisticsMeta, table.metadata_id == StatisticsMeta.id)
+        .where(table.start_ts >= start_time.timestamp())
+    )
+    if end_time is not None:
+        stmt = stmt.where(table.start_ts < end_time.timestamp())
+    if statistic_ids is not None:
+        stmt = stmt.where(StatisticsMeta.statistic_id.in_(statistic_ids))
+    yield from _export_columnar(
+        sessions, stmt, (table.start_ts, table.id), STATISTIC_COLUMNS, chunk_size
+    )
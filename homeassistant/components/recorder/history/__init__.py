@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
@@ -11,6 +12,7 @@ from homeassistant.core import HomeAssistant, State
 
 from ... import recorder
 from ..filters import Filters
+from ..util import DEFAULT_YIELD_STATES_ROWS
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
@@ -18,6 +20,7 @@ from .modern import (
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    stream_significant_states_with_session as _modern_stream_significant_states_with_session,
 )
 
 # These are the APIs of this package
@@ -29,6 +32,7 @@ __all__ = [
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "stream_significant_states_with_session",
 ]
 
 
@@ -152,6 +156,56 @@ def get_significant_states_with_session(
     )
 
 
+def stream_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_YIELD_STATES_ROWS,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Stream the significant states of a time period in chunks per entity."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states_with_session as _legacy_get_significant_states_with_session,
+        )
+
+        # The legacy schema is only used until the migration is done
+        return iter(
+            _legacy_get_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                compressed_state_format,
+            ).items()
+        )
+    return _modern_stream_significant_states_with_session(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+        chunk_size,
+    )
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import batched, groupby
 from operator import itemgetter
 from typing import Any, cast
 
@@ -21,6 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -37,7 +38,7 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
-from ..util import execute_stmt_lambda_element, session_scope
+from ..util import DEFAULT_YIELD_STATES_ROWS, execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -253,8 +254,40 @@ def get_significant_states_with_session(
         include_start_time_state = False
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
+    stmt = _significant_states_lambda_stmt(
+        start_time_ts,
+        end_time_ts,
+        metadata_ids,
+        metadata_ids_in_significant_domains,
+        significant_changes_only,
+        no_attributes,
+        include_start_time_state,
+        run_start_ts,
+    )
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts if include_start_time_state else None,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def _significant_states_lambda_stmt(
+    start_time_ts: float,
+    end_time_ts: float | None,
+    metadata_ids: list[int],
+    metadata_ids_in_significant_domains: list[int],
+    significant_changes_only: bool,
+    no_attributes: bool,
+    include_start_time_state: bool,
+    run_start_ts: float | None,
+) -> StatementLambdaElement:
+    """Return the significant states statement ordered by metadata_id."""
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
-    stmt = lambda_stmt(
+    return lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
             end_time_ts,
@@ -275,15 +308,84 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
-        entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+
+
+def stream_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_YIELD_STATES_ROWS,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Stream the states of get_significant_states_with_session.
+
+    The states of all entities are read with a single query ordered by
+    metadata_id, the rows are fetched with yield_per so drivers which
+    support it use a server side cursor. The states are yielded as
+    (entity_id, states) chunks of at most chunk_size states while the rows
+    are read, consecutive chunks of an entity continue its list. The
+    entities are in the order of their metadata_id, not of entity_ids.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    instance = recorder.get_instance(hass)
+    if not (
+        entity_id_to_metadata_id := instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+    ) or not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+        return
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    metadata_ids_in_significant_domains: list[int] = []
+    if significant_changes_only:
+        metadata_ids_in_significant_domains = [
+            metadata_id
+            for metadata_id, entity_id in metadata_id_to_entity_id.items()
+            if split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS
+        ]
+    run_start_ts: float | None = None
+    if include_start_time_state and not (
+        run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+    ):
+        include_start_time_state = False
+    stmt = _significant_states_lambda_stmt(
+        dt_util.utc_to_timestamp(start_time),
+        datetime_to_timestamp_or_none(end_time),
+        metadata_ids,
+        metadata_ids_in_significant_domains,
+        significant_changes_only,
+        no_attributes,
+        include_start_time_state,
+        run_start_ts,
     )
+    rows = session.connection().execute(
+        stmt, execution_options={"yield_per": chunk_size}
+    )
+    start_time_ts = (
+        dt_util.utc_to_timestamp(start_time) if include_start_time_state else None
+    )
+    for metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        states = _iter_entity_states(
+            group,
+            start_time_ts,
+            entity_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes,
+        )
+        for chunk in batched(states, chunk_size):
+            yield entity_id, list(chunk)
 
 
 def get_full_significant_states_with_session(
@@ -671,6 +773,73 @@ def _get_single_entity_start_time_stmt(
     )
 
 
+def _iter_entity_states(
+    rows: Iterator[Row],
+    start_time_ts: float | None,
+    entity_id: str,
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+) -> Iterator[State | dict[str, Any]]:
+    """Convert the sorted rows of a single entity lazily.
+
+    This is the streaming counterpart of _sorted_states_to_dict.
+    """
+    state_class: Callable[
+        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
+        State | dict[str, Any],
+    ]
+    if compressed_state_format:
+        state_class = row_to_compressed_state
+        attr_time = COMPRESSED_STATE_LAST_UPDATED
+        attr_state = COMPRESSED_STATE_STATE
+    else:
+        state_class = LazyState
+        attr_time = LAST_CHANGED_KEY
+        attr_state = STATE_KEY
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    attr_cache: dict[str, dict[str, Any]] = {}
+
+    if not minimal_response or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS:
+        for db_state in rows:
+            yield state_class(
+                db_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                db_state[state_idx],
+                db_state[last_updated_ts_idx],
+                False,
+            )
+        return
+
+    if (first_state := next(rows, None)) is None:
+        return
+    prev_state: str = first_state[state_idx]
+    yield state_class(
+        first_state,
+        attr_cache,
+        start_time_ts,
+        entity_id,
+        prev_state,
+        first_state[last_updated_ts_idx],
+        no_attributes,
+    )
+    _utc_from_timestamp = dt_util.utc_from_timestamp
+    for row in rows:
+        if (state := row[state_idx]) == prev_state:
+            continue
+        prev_state = state
+        if compressed_state_format:
+            yield {attr_state: state, attr_time: row[last_updated_ts_idx]}
+        else:
+            yield {
+                attr_state: state,
+                attr_time: _utc_from_timestamp(row[last_updated_ts_idx]).isoformat(),
+            }
+
+
 def _sorted_states_to_dict(
     states: Iterable[Row],
     start_time_ts: float | None,
@@ -30,6 +30,7 @@ from sqlalchemy.sql.expression import true
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
 
@@ -76,7 +77,9 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -100,7 +103,7 @@ from .queries import (
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import get_start_time
+from .statistics import compile_statistics_rollups, get_start_time
 from .tasks import (
     CommitTask,
     EntityIDPostMigrationTask,
@@ -124,6 +127,8 @@ if TYPE_CHECKING:
 # Schema version 42 was introduced in HA Core 2023.11
 LIVE_MIGRATION_MIN_SCHEMA_VERSION = 42
 
+STATISTICS_ROLLUPS_BATCH_SIZE = 10
+
 MIGRATION_NOTE_OFFLINE = (
     "Note: this may take several hours on large databases and slow machines. "
     "Home Assistant will not start until the upgrade is completed. Please be patient "
@@ -1522,6 +1527,15 @@ class _SchemaVersion44Migrator(_SchemaVersionMigrator, target_version=44):
         )
 
 
+class _SchemaVersion45Migrator(_SchemaVersionMigrator, target_version=45):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The rollup tables are usually created by create_all when connecting,
+        # they are compiled by StatisticsRollupsMigration after the migration
+        for table in (StatisticsDaily, StatisticsMonthly):
+            cast(Table, table.__table__).create(self.engine, checkfirst=True)
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2456,6 +2470,90 @@ class EventIDPostMigration(BaseRunTimeMigration):
         return NeedsMigrateResult(needs_migrate=False, migration_done=True)
 
 
+class StatisticsRollupsMigration(BaseRunTimeMigration):
+    """Migration to compile the daily and monthly rollups of the statistics.
+
+    The rollups are compiled in the local time zone, the migration is also
+    used to recompile them when the time zone is changed.
+    """
+
+    migration_id = "statistics_rollups"
+    task = MigrationTask
+
+    def __init__(self, schema_version: int, migration_changes: dict[str, int]) -> None:
+        """Initialize a new StatisticsRollupsMigration."""
+        super().__init__(schema_version, migration_changes)
+        self.time_zone: str | None = None
+        self.last_metadata_id = 0
+
+    def migrate_data(self, instance: Recorder) -> bool:  # type: ignore[override]
+        """Compile the rollups of some statistics, returns True if completed."""
+        return self._migrate_data(instance, self)
+
+    @staticmethod
+    @retryable_database_job("compile statistics rollups")
+    def _migrate_data(instance: Recorder, migrator: StatisticsRollupsMigration) -> bool:
+        """Compile the rollups of some statistics, returns True if completed."""
+        time_zone = str(dt_util.get_default_time_zone())
+        _LOGGER.debug("Compiling statistics rollups")
+        with session_scope(session=instance.get_session()) as session:
+            if migrator.time_zone != time_zone:
+                # Start over if the time zone was changed while compiling
+                migrator.time_zone = time_zone
+                migrator.last_metadata_id = 0
+                session.query(MigrationChanges).filter_by(
+                    migration_id=StatisticsRollupsMigration.migration_id
+                ).delete(synchronize_session=False)
+                for table in (StatisticsDaily, StatisticsMonthly):
+                    session.query(table).delete(synchronize_session=False)
+            if metadata_ids := [
+                metadata_id
+                for (metadata_id,) in session.query(StatisticsMeta.id)
+                .filter(StatisticsMeta.id > migrator.last_metadata_id)
+                .order_by(StatisticsMeta.id)
+                .limit(STATISTICS_ROLLUPS_BATCH_SIZE)
+            ]:
+                compile_statistics_rollups(session, metadata_ids)
+                migrator.last_metadata_id = metadata_ids[-1]
+            # If there is more work to do return False
+            # so that we can be called again
+            if is_done := not metadata_ids:
+                _mark_migration_done(session, StatisticsRollupsMigration)
+
+        _LOGGER.debug("Compiling statistics rollups done=%s", is_done)
+        return is_done
+
+    def migration_done(self, instance: Recorder, session: Session | None) -> None:
+        """Will be called after migrate returns True or if migration is not needed."""
+        instance.statistics_rollups_time_zone = self.time_zone or str(
+            dt_util.get_default_time_zone()
+        )
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> NeedsMigrateResult:
+        """Return if the migration needs to run."""
+        if session.query(Statistics.id).first() is not None:
+            return NeedsMigrateResult(needs_migrate=True, migration_done=False)
+        return NeedsMigrateResult(needs_migrate=False, migration_done=True)
+
+    def needs_migrate(self, instance: Recorder, session: Session) -> bool:
+        """Return if the migration needs to run.
+
+        The rollups also need to be recompiled if the time zone has been
+        changed since they were compiled, which is noticed by the newest
+        daily rollup not starting at midnight.
+        """
+        if super().needs_migrate(instance, session):
+            return True
+        if (
+            last_start_ts := session.query(func.max(StatisticsDaily.start_ts)).scalar()
+        ) is None:
+            return False
+        last_start = dt_util.as_local(dt_util.utc_from_timestamp(last_start_ts))
+        return last_start != last_start.replace(hour=0, minute=0, second=0)
+
+
 def _mark_migration_done(
     session: Session, migration: type[BaseRunTimeMigration]
 ) -> None:
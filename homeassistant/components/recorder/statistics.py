@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Collection, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
@@ -11,12 +11,14 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
+import time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text, update
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
@@ -59,6 +61,8 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -590,6 +594,7 @@ def _compile_statistics(
     if start.minute == 55:
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
+        _compile_completed_statistics_rollups(session, start)
 
     session.add(StatisticsRuns(start=start))
 
@@ -735,7 +740,16 @@ def get_metadata(
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
-        instance.statistics_meta_manager.delete(session, statistic_ids)
+        statistics_meta_manager = instance.statistics_meta_manager
+        if metadata := statistics_meta_manager.get_many(
+            session, statistic_ids=set(statistic_ids)
+        ):
+            metadata_ids = [metadata_id for metadata_id, _ in metadata.values()]
+            for table in (StatisticsDaily, StatisticsMonthly):
+                session.query(table).filter(table.metadata_id.in_(metadata_ids)).delete(
+                    synchronize_session=False
+                )
+        statistics_meta_manager.delete(session, statistic_ids)
 
 
 def update_statistics_metadata(
@@ -1102,6 +1116,233 @@ def _reduce_statistics_per_month(
     )
 
 
+_STATISTICS_ROLLUPS: tuple[
+    tuple[
+        type[StatisticsDaily | StatisticsMonthly],
+        Callable[
+            [],
+            tuple[
+                Callable[[float, float], bool], Callable[[float], tuple[float, float]]
+            ],
+        ],
+    ],
+    ...,
+] = (
+    (StatisticsDaily, reduce_day_ts_factory),
+    (StatisticsMonthly, reduce_month_ts_factory),
+)
+
+
+def _compile_statistics_rollup(
+    session: Session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    period_start_end: Callable[[float], tuple[float, float]],
+    metadata_ids: Collection[int] | None,
+    start_ts: float | None,
+    end_ts: float | None,
+) -> None:
+    """Replace the rollups of the hourly statistics during start_ts - end_ts.
+
+    The rollups are reduced the same way as _reduce_statistics reduces the
+    hourly statistics, so a query can use them instead of the hourly statistics.
+    """
+
+    def _filters(_table: type[StatisticsBase]) -> list[ColumnElement[bool]]:
+        filters: list[ColumnElement[bool]] = []
+        if metadata_ids is not None:
+            filters.append(_table.metadata_id.in_(metadata_ids))
+        if start_ts is not None:
+            filters.append(_table.start_ts >= start_ts)
+        if end_ts is not None:
+            filters.append(_table.start_ts < end_ts)
+        return filters
+
+    # Existing rollups are updated in place rather than deleted and inserted
+    # again, the new rows could otherwise collide with rows which are still
+    # pending deletion in the session
+    existing_ids: dict[tuple[int | None, float | None], int] = {
+        (row.metadata_id, row.start_ts): row.id
+        for row in session.query(table.id, table.metadata_id, table.start_ts).filter(
+            *_filters(table)
+        )
+    }
+
+    hourly_stats = (
+        session.query(
+            Statistics.metadata_id,
+            Statistics.start_ts,
+            Statistics.mean,
+            Statistics.min,
+            Statistics.max,
+            Statistics.last_reset_ts,
+            Statistics.state,
+            Statistics.sum,
+        )
+        .filter(*_filters(Statistics))
+        .order_by(Statistics.metadata_id, Statistics.start_ts)
+    )
+    rollups: list[StatisticsBase] = []
+    updated_rollups: list[dict[str, Any]] = []
+    for (metadata_id, period_start_ts), rows in groupby(
+        hourly_stats, lambda row: (row.metadata_id, period_start_end(row.start_ts)[0])
+    ):
+        max_values: list[float] = []
+        mean_values: list[float] = []
+        min_values: list[float] = []
+        for row in rows:
+            if row.max is not None:
+                max_values.append(row.max)
+            if row.mean is not None:
+                mean_values.append(row.mean)
+            if row.min is not None:
+                min_values.append(row.min)
+        # The last hour of the period has the last_reset, state and sum
+        rollup: StatisticDataTimestamp = {
+            "start_ts": period_start_ts,
+            "last_reset_ts": row.last_reset_ts,
+            "state": row.state,
+            "sum": row.sum,
+        }
+        if max_values:
+            rollup["max"] = max(max_values)
+        if mean_values:
+            rollup["mean"] = cast(float, mean(mean_values))
+        if min_values:
+            rollup["min"] = min(min_values)
+        if (
+            rollup_id := existing_ids.pop((metadata_id, period_start_ts), None)
+        ) is None:
+            rollups.append(table.from_stats_ts(metadata_id, rollup))
+            continue
+        updated_rollups.append(
+            {
+                "id": rollup_id,
+                "created_ts": time.time(),
+                "mean": rollup.get("mean"),
+                "min": rollup.get("min"),
+                "max": rollup.get("max"),
+                "last_reset_ts": rollup["last_reset_ts"],
+                "state": rollup["state"],
+                "sum": rollup["sum"],
+            }
+        )
+    if existing_ids:
+        # The hourly statistics of these rollups no longer exist
+        session.query(table).filter(table.id.in_(existing_ids.values())).delete(
+            synchronize_session=False
+        )
+    if updated_rollups:
+        session.execute(update(table), updated_rollups)
+    session.add_all(rollups)
+
+
+def compile_statistics_rollups(
+    session: Session,
+    metadata_ids: Collection[int] | None,
+    first_start_ts: float | None = None,
+    last_start_ts: float | None = None,
+) -> None:
+    """Recompile the daily and monthly rollups of hourly statistics.
+
+    The rollups of the periods containing the hours between first_start_ts and
+    last_start_ts are recompiled, all rollups are recompiled if omitted.
+    """
+    for table, period_ts_factory in _STATISTICS_ROLLUPS:
+        _, period_start_end = period_ts_factory()
+        _compile_statistics_rollup(
+            session,
+            table,
+            period_start_end,
+            metadata_ids,
+            None if first_start_ts is None else period_start_end(first_start_ts)[0],
+            None if last_start_ts is None else period_start_end(last_start_ts)[1],
+        )
+
+
+def _compile_completed_statistics_rollups(session: Session, start: datetime) -> None:
+    """Compile the daily and monthly rollups of the periods ending with an hour."""
+    hour_start_ts = start.replace(minute=0).timestamp()
+    hour_end_ts = hour_start_ts + Statistics.duration.total_seconds()
+    for table, period_ts_factory in _STATISTICS_ROLLUPS:
+        _, period_start_end = period_ts_factory()
+        period_start_ts, period_end_ts = period_start_end(hour_start_ts)
+        if period_end_ts <= hour_end_ts:
+            _compile_statistics_rollup(
+                session, table, period_start_end, None, period_start_ts, period_end_ts
+            )
+
+
+def _get_statistics_rollup(
+    hass: HomeAssistant,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> (
+    tuple[
+        type[StatisticsDaily | StatisticsMonthly],
+        Callable[[float], tuple[float, float]],
+    ]
+    | None
+):
+    """Return the rollup table which can be reduced to period, if any."""
+    if get_instance(hass).statistics_rollups_time_zone != str(
+        dt_util.get_default_time_zone()
+    ):
+        # The rollups are being compiled for the current time zone
+        return None
+    # The mean of a week can't be reduced from the means of its days
+    # because the days don't have the same number of hours
+    if period == "day" or (period == "week" and "mean" not in types):
+        return StatisticsDaily, reduce_day_ts_factory()[1]
+    if period == "month":
+        return StatisticsMonthly, reduce_month_ts_factory()[1]
+    return None
+
+
+def _get_statistics_with_rollup(
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    period_start_end: Callable[[float], tuple[float, float]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> list[Row]:
+    """Return rollups of completed periods and hourly statistics of the rest.
+
+    The rows are sorted by metadata_id and start_ts like the rows of a single
+    query of the hourly statistics.
+    """
+    rollup_end = start_time
+    if last_run := session.query(func.max(StatisticsRuns.start)).scalar():
+        # The hourly statistics are compiled with the last 5-minute period of
+        # the hour, the rollups of the periods which have ended with it
+        compiled_until = (
+            process_timestamp(last_run) + StatisticsShortTerm.duration
+        ).replace(minute=0)
+        rollup_end = dt_util.utc_from_timestamp(
+            period_start_end(compiled_until.timestamp())[0]
+        )
+
+    stats: list[Row] = []
+    if start_time < rollup_end:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time,
+            rollup_end if end_time is None else min(end_time, rollup_end),
+            metadata_ids,
+            table,
+            types,
+        )
+        stats.extend(execute_stmt_lambda_element(session, stmt, orm_rows=False))
+    if end_time is None or rollup_end < end_time:
+        stmt = _generate_statistics_during_period_stmt(
+            max(start_time, rollup_end), end_time, metadata_ids, Statistics, types
+        )
+        stats.extend(execute_stmt_lambda_element(session, stmt, orm_rows=False))
+    # Sorting is stable, the rollups stay in front of the hourly statistics
+    stats.sort(key=itemgetter(0))
+    return stats
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1757,12 +1998,18 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    stats: Sequence[Row]
+    if rollup := _get_statistics_rollup(hass, period, types):
+        stats = _get_statistics_with_rollup(
+            session, start_time, end_time, metadata_ids, *rollup, types
+        )
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
     if not stats:
         return {}
@@ -2355,13 +2602,19 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    start_timestamps: list[float] = []
     for stat in statistics:
+        start_timestamps.append(stat["start"].timestamp())
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
 
     if table != StatisticsShortTerm:
+        if table == Statistics and start_timestamps:
+            compile_statistics_rollups(
+                session, (metadata_id,), min(start_timestamps), max(start_timestamps)
+            )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2491,6 +2744,10 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        compile_statistics_rollups(
+            session, (metadata[statistic_id][0],), start_time.timestamp()
+        )
+
     return True
 
 
@@ -2554,6 +2811,7 @@ def change_statistics_unit(
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
+        compile_statistics_rollups(session, (metadata_id,))
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
@@ -7,6 +7,7 @@ import asyncio
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 import logging
 import threading
 from typing import TYPE_CHECKING, Any
@@ -15,7 +16,11 @@ from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    EVENT_RECORDER_STATISTICS_UPDATED,
+    INTEGRATION_PLATFORM_PROCESS_STATE_CHANGED,
+)
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -38,6 +43,13 @@ class RecorderTask:
         """Handle the task."""
 
 
+def _fire_statistics_updated(instance: Recorder, statistic_ids: list[str]) -> None:
+    """Let listeners know statistics have been changed."""
+    instance.hass.bus.fire(
+        EVENT_RECORDER_STATISTICS_UPDATED, {"statistic_ids": statistic_ids}
+    )
+
+
 @dataclass(slots=True)
 class ChangeStatisticsUnitTask(RecorderTask):
     """Object to store statistics_id and unit to convert unit of statistics."""
@@ -54,6 +66,7 @@ class ChangeStatisticsUnitTask(RecorderTask):
             self.new_unit_of_measurement,
             self.old_unit_of_measurement,
         )
+        _fire_statistics_updated(instance, [self.statistic_id])
 
 
 @dataclass(slots=True)
@@ -65,6 +78,7 @@ class ClearStatisticsTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
         statistics.clear_statistics(instance, self.statistic_ids)
+        _fire_statistics_updated(instance, self.statistic_ids)
 
 
 @dataclass(slots=True)
@@ -83,6 +97,10 @@ class UpdateStatisticsMetadataTask(RecorderTask):
             self.new_statistic_id,
             self.new_unit_of_measurement,
         )
+        statistic_ids = [self.statistic_id]
+        if isinstance(self.new_statistic_id, str):
+            statistic_ids.append(self.new_statistic_id)
+        _fire_statistics_updated(instance, statistic_ids)
 
 
 @dataclass(slots=True)
@@ -194,6 +212,7 @@ class ImportStatisticsTask(RecorderTask):
         if statistics.import_statistics(
             instance, self.metadata, self.statistics, self.table
         ):
+            _fire_statistics_updated(instance, [self.metadata["statistic_id"]])
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(
@@ -219,6 +238,7 @@ class AdjustStatisticsTask(RecorderTask):
             self.sum_adjustment,
             self.adjustment_unit,
         ):
+            _fire_statistics_updated(instance, [self.statistic_id])
             return
         # Schedule a new adjust statistics task if this one didn't finish
         instance.queue_task(
@@ -306,6 +326,12 @@ class AddRecorderPlatformTask(RecorderTask):
         platform = self.platform
         platforms: dict[str, Any] = hass.data[DOMAIN].recorder_platforms
         platforms[domain] = platform
+        if process_state_changed := getattr(
+            platform, INTEGRATION_PLATFORM_PROCESS_STATE_CHANGED, None
+        ):
+            instance.state_changed_processors[domain] = partial(
+                process_state_changed, hass
+            )
 
 
 @dataclass(slots=True)
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager
 from datetime import datetime as dt
+from functools import partial
 from typing import Any, Literal, cast
 
+from sqlalchemy.orm.session import Session
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
@@ -32,6 +37,7 @@ from homeassistant.util.unit_conversion import (
     VolumeFlowRateConverter,
 )
 
+from .export import DEFAULT_CHUNK_SIZE, MAX_CHUNK_SIZE, export_states, export_statistics
 from .models import StatisticPeriod
 from .statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
@@ -44,7 +50,7 @@ from .statistics import (
     statistics_during_period,
     validate_statistics,
 )
-from .util import PERIOD_SCHEMA, get_instance, resolve_period
+from .util import PERIOD_SCHEMA, get_instance, resolve_period, session_scope
 
 UNIT_SCHEMA = vol.Schema(
     {
@@ -74,6 +80,8 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_adjust_sum_statistics)
     websocket_api.async_register_command(hass, ws_change_statistics_unit)
     websocket_api.async_register_command(hass, ws_clear_statistics)
+    websocket_api.async_register_command(hass, ws_export_states)
+    websocket_api.async_register_command(hass, ws_export_statistics)
     websocket_api.async_register_command(hass, ws_get_statistic_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
@@ -474,3 +482,128 @@ def ws_import_statistics(
     else:
         async_add_external_statistics(hass, metadata, stats)
     connection.send_result(msg["id"])
+
+
+def _next_export_message(
+    msg_id: int, chunks: Iterator[dict[str, list[Any]]]
+) -> tuple[bytes, int] | None:
+    """Read and encode the next chunk of an export with its number of rows."""
+    if (chunk := next(chunks, None)) is None:
+        return None
+    return (
+        json_bytes(messages.event_message(msg_id, {"columns": chunk})),
+        len(next(iter(chunk.values()))),
+    )
+
+
+async def _async_ws_export(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    export: Callable[
+        [Callable[[], AbstractContextManager[Session]]],
+        Iterator[dict[str, list[Any]]],
+    ],
+) -> None:
+    """Stream an export as events until it is complete or unsubscribed.
+
+    The next chunk is only read once the previous one was sent to the
+    client, each chunk is read in a short read only session.
+    """
+    msg_id: int = msg["id"]
+    instance = get_instance(hass)
+    cancel = asyncio.Event()
+    connection.subscriptions[msg_id] = cancel.set
+    connection.send_result(msg_id)
+    chunks = export(partial(session_scope, hass=hass, read_only=True))
+    rows = 0
+    while not cancel.is_set():
+        if (
+            message := await instance.async_add_executor_job(
+                _next_export_message, msg_id, chunks
+            )
+        ) is None:
+            connection.subscriptions.pop(msg_id, None)
+            connection.send_message(
+                messages.event_message(msg_id, {"complete": True, "rows": rows})
+            )
+            return
+        if cancel.is_set():
+            return
+        connection.send_message(message[0])
+        rows += message[1]
+        await connection.async_drain()
+
+
+def _export_end_time(msg: dict[str, Any]) -> dt | None:
+    """Return the end time of an export."""
+    if (end_time := msg.get("end_time")) is None:
+        return None
+    return dt_util.as_utc(end_time)
+
+
+EXPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required("start_time"): cv.datetime,
+        vol.Optional("end_time"): cv.datetime,
+        vol.Optional("chunk_size", default=DEFAULT_CHUNK_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_CHUNK_SIZE)
+        ),
+    }
+)
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/export_states",
+        vol.Optional("entity_ids"): [cv.entity_id],
+        **EXPORT_SCHEMA.schema,
+    }
+)
+@websocket_api.async_response
+async def ws_export_states(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Stream the states of a period column by column."""
+    await _async_ws_export(
+        hass,
+        connection,
+        msg,
+        partial(
+            export_states,
+            start_time=dt_util.as_utc(msg["start_time"]),
+            end_time=_export_end_time(msg),
+            entity_ids=msg.get("entity_ids"),
+            chunk_size=msg["chunk_size"],
+        ),
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/export_statistics",
+        vol.Optional("statistic_ids"): [str],
+        vol.Optional("period", default="hour"): vol.Any("5minute", "hour"),
+        **EXPORT_SCHEMA.schema,
+    }
+)
+@websocket_api.async_response
+async def ws_export_statistics(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Stream the long or short term statistics of a period column by column."""
+    await _async_ws_export(
+        hass,
+        connection,
+        msg,
+        partial(
+            export_statistics,
+            start_time=dt_util.as_utc(msg["start_time"]),
+            end_time=_export_end_time(msg),
+            statistic_ids=msg.get("statistic_ids"),
+            period=msg["period"],
+            chunk_size=msg["chunk_size"],
+        ),
+    )
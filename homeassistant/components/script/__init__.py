@@ -48,6 +48,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.reload import config_hash
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -295,6 +296,7 @@ class ScriptEntityConfig:
     raw_config: ConfigType | None
     validation_error: str | None
     validation_status: ValidationStatus
+    raw_config_hash: int | None
 
 
 async def _prepare_script_config(
@@ -320,6 +322,7 @@ async def _prepare_script_config(
                 raw_config,
                 validation_error,
                 validation_status,
+                config_hash(raw_config),
             )
         )
 
@@ -367,7 +370,11 @@ async def _async_process_config(
     def script_matches_config(
         script: BaseScriptEntity, config: ScriptEntityConfig
     ) -> bool:
-        return script.unique_id == config.key and script.raw_config == config.raw_config
+        return (
+            script.unique_id == config.key
+            and script.raw_config_hash == config.raw_config_hash
+            and script.raw_config == config.raw_config
+        )
 
     def find_matches(
         scripts: list[BaseScriptEntity],
@@ -375,24 +382,25 @@ async def _async_process_config(
     ) -> tuple[set[int], set[int]]:
         """Find matches between a list of script entities and a list of configurations.
 
-        A script or configuration is only allowed to match at most once to handle
-        the case of multiple scripts with identical configuration.
+        Script keys are unique, so configurations are indexed by key and each
+        script is only compared with the configuration sharing its key.
 
         Returns a tuple of sets of indices: ({script_matches}, {config_matches})
         """
         script_matches: set[int] = set()
         config_matches: set[int] = set()
+        script_configs_by_key: dict[str, tuple[int, ScriptEntityConfig]] = {
+            script_config.key: (config_idx, script_config)
+            for config_idx, script_config in enumerate(script_configs)
+        }
 
         for script_idx, script in enumerate(scripts):
-            for config_idx, script_config in enumerate(script_configs):
-                if config_idx in config_matches:
-                    # Only allow a script config to match at most once
-                    continue
-                if script_matches_config(script, script_config):
-                    script_matches.add(script_idx)
-                    config_matches.add(config_idx)
-                    # Only allow a script to match at most once
-                    break
+            if script.unique_id not in script_configs_by_key:
+                continue
+            config_idx, script_config = script_configs_by_key.pop(script.unique_id)
+            if script_matches_config(script, script_config):
+                script_matches.add(script_idx)
+                config_matches.add(config_idx)
 
         return script_matches, config_matches
 
@@ -427,6 +435,11 @@ class BaseScriptEntity(ToggleEntity, ABC):
 
     raw_config: ConfigType | None
 
+    @cached_property
+    def raw_config_hash(self) -> int | None:
+        """Return a hash of the raw config, used to match configs on reload."""
+        return config_hash(self.raw_config)
+
     @cached_property
     @abstractmethod
     def referenced_labels(self) -> set[str]:
@@ -18,6 +18,7 @@ from homeassistant.components.recorder import (
     history,
     statistics,
 )
+from homeassistant.components.recorder.db_schema import StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
@@ -30,12 +31,20 @@ from homeassistant.const import (
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
+from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.loader import async_suggest_report_issue
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
+from homeassistant.util.hass_dict import HassKey
 
 from .const import (
     ATTR_LAST_RESET,
@@ -73,6 +82,307 @@ WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
+DATA_STATE_CHANGES: HassKey[SensorStateChanges] = HassKey(
+    "sensor_recorder_state_changes"
+)
+
+_ENTITY_ID_PREFIX = f"{DOMAIN}."
+_PERIOD_SECONDS = StatisticsShortTerm.duration.total_seconds()
+
+
+class _PeriodStateChanges:
+    """The recorded state changes of a sensor during a short term period.
+
+    The state at the start of the period and the state changes during the
+    period are reduced as they are recorded. Measurement sensors keep running
+    min, max and time weighted sums of their significant changes. Sensors with
+    a sum keep only the state changes where the sum may be reset, since the
+    sum of a run of state changes without a reset only depends on its first
+    and last state.
+    """
+
+    __slots__ = (
+        "accumulated",
+        "complete",
+        "has_states",
+        "last_fstate",
+        "last_start",
+        "max",
+        "mean_start",
+        "min",
+        "start_state",
+        "state_class",
+        "sum_run_open",
+        "sum_states",
+        "unit",
+    )
+
+    def __init__(self, start_state: State, state_class: str) -> None:
+        """Initialize the period."""
+        # The last state before the period
+        self.start_state = start_state
+        self.state_class = state_class
+        # False if the period has to be compiled from the database instead
+        self.complete = True
+        self.has_states = False
+        self.unit: str | None | UndefinedType = UNDEFINED
+        self.min = math.inf
+        self.max = -math.inf
+        self.accumulated = 0.0
+        self.mean_start: datetime.datetime | None = None
+        self.last_start: datetime.datetime | None = None
+        self.last_fstate: float | None = None
+        self.sum_states: list[tuple[float, State]] = []
+        self.sum_run_open = False
+
+    def add(self, state: State, significant_changes_only: bool = True) -> None:
+        """Add a state."""
+        if state.attributes.get(ATTR_STATE_CLASS) != self.state_class:
+            self.complete = False
+            return
+        is_sum = self.state_class != SensorStateClass.MEASUREMENT
+        if (
+            significant_changes_only
+            and not is_sum
+            and state.last_changed_timestamp != state.last_updated_timestamp
+        ):
+            return
+        self.has_states = True
+        try:
+            fstate = float(state.state)
+        except (ValueError, TypeError):
+            return
+        if not math.isfinite(fstate):
+            return
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if self.unit is UNDEFINED:
+            self.unit = unit
+        elif unit != self.unit:
+            # The states are normalized with the statistics metadata
+            self.complete = False
+            return
+        if is_sum:
+            self._add_sum(fstate, state)
+            return
+        self.min = min(self.min, fstate)
+        self.max = max(self.max, fstate)
+        start_time = state.last_updated
+        if self.last_start is None:
+            self.mean_start = start_time
+        else:
+            assert self.last_fstate is not None
+            self.accumulated += (
+                self.last_fstate * (start_time - self.last_start).total_seconds()
+            )
+        self.last_fstate = fstate
+        self.last_start = start_time
+
+    def _add_sum(self, fstate: float, state: State) -> None:
+        """Add a state of a sensor with a sum."""
+        sum_states = self.sum_states
+        if sum_states:
+            last_fstate, last_state = sum_states[-1]
+            if (
+                0 <= last_fstate <= fstate
+                if self.state_class == SensorStateClass.TOTAL_INCREASING
+                else state.attributes.get(ATTR_LAST_RESET)
+                == last_state.attributes.get(ATTR_LAST_RESET)
+            ):
+                # The state continues the run of the last state
+                if self.sum_run_open:
+                    sum_states[-1] = (fstate, state)
+                else:
+                    sum_states.append((fstate, state))
+                    self.sum_run_open = True
+                return
+        sum_states.append((fstate, state))
+        self.sum_run_open = False
+
+    def mean(self, end: datetime.datetime) -> float:
+        """Return the time weighted average until end.
+
+        Matches _time_weighted_average.
+        """
+        assert (
+            self.mean_start is not None
+            and self.last_start is not None
+            and self.last_fstate is not None
+        )
+        accumulated = (
+            self.accumulated
+            + self.last_fstate * (end - self.last_start).total_seconds()
+        )
+        period_seconds = (end - self.mean_start).total_seconds()
+        if period_seconds == 0:
+            return 0.0
+        return accumulated / period_seconds
+
+
+class _SensorStateChanges:
+    """The recorded state changes of a sensor."""
+
+    __slots__ = ("known_since_ts", "last_state", "periods")
+
+    def __init__(self, state: State, known_since_ts: float) -> None:
+        """Initialize the state changes."""
+        # All state changes since this time are known
+        self.known_since_ts = known_since_ts
+        self.last_state = state
+        # The state changes of each period, by period start timestamp
+        self.periods: dict[float, _PeriodStateChanges] = {}
+
+
+class SensorStateChanges:
+    """Keep the recorded state changes of sensors with a state class.
+
+    The state changes are fed from the recorder thread as they are recorded,
+    and reduced per short term statistics period, so compiling statistics does
+    not have to read them back from the database. All methods must be called
+    from the recorder thread.
+    """
+
+    __slots__ = ("_compiled_until_ts", "_sensors", "run_start_ts")
+
+    def __init__(self, run_start_ts: float) -> None:
+        """Initialize the state changes."""
+        # Only states recorded during the recorder run are used as start state
+        self.run_start_ts = run_start_ts
+        self._sensors: dict[str, _SensorStateChanges] = {}
+        self._compiled_until_ts = 0.0
+
+    def process(self, event: Event[EventStateChangedData] | None) -> None:
+        """Process a recorded state change."""
+        if event is None:
+            # State changes are not recorded, what we have is no longer complete
+            self._sensors.clear()
+            return
+        entity_id = event.data["entity_id"]
+        if not entity_id.startswith(_ENTITY_ID_PREFIX):
+            return
+        new_state = event.data["new_state"]
+        if (
+            new_state is None
+            or new_state.attributes.get(ATTR_STATE_CLASS) not in DEFAULT_STATISTICS
+        ):
+            self._sensors.pop(entity_id, None)
+            return
+        last_updated_ts = new_state.last_updated_timestamp
+        if (sensor := self._sensors.get(entity_id)) is None:
+            self._sensors[entity_id] = _SensorStateChanges(new_state, last_updated_ts)
+            return
+        last_state = sensor.last_state
+        if last_updated_ts < last_state.last_updated_timestamp:
+            # Out of order, only the changes since the last one are complete
+            self._sensors[entity_id] = _SensorStateChanges(
+                new_state, last_state.last_updated_timestamp
+            )
+            return
+        period_start_ts = last_updated_ts - last_updated_ts % _PERIOD_SECONDS
+        if (period := sensor.periods.get(period_start_ts)) is None:
+            period = sensor.periods[period_start_ts] = self._start_period(
+                last_state,
+                dt_util.utc_from_timestamp(period_start_ts),
+                new_state.attributes[ATTR_STATE_CLASS],
+            )
+        if period.complete:
+            period.add(new_state)
+        sensor.last_state = new_state
+
+    def _start_period(
+        self, last_state: State, start: datetime.datetime, state_class: str
+    ) -> _PeriodStateChanges:
+        """Start a period with the state at its start.
+
+        Like the database, the state at the start is reported as changed at
+        the start if it was recorded during the recorder run.
+        """
+        period = _PeriodStateChanges(last_state, state_class)
+        if last_state.last_updated_timestamp >= self.run_start_ts:
+            period.add(
+                State(
+                    last_state.entity_id,
+                    last_state.state,
+                    last_state.attributes,
+                    last_changed=start,
+                    last_reported=start,
+                    last_updated=start,
+                    context=last_state.context,
+                    validate_entity_id=False,
+                ),
+                significant_changes_only=False,
+            )
+        return period
+
+    def periods(
+        self,
+        sensor_states: Iterable[State],
+        start: datetime.datetime,
+        end: datetime.datetime,
+    ) -> dict[str, _PeriodStateChanges]:
+        """Return the state changes during start - end.
+
+        Only sensors for which all state changes since before start are known
+        and which can be compiled without the database are included.
+        """
+        start_ts = start.timestamp()
+        if (
+            end - start != StatisticsShortTerm.duration
+            or start_ts % _PERIOD_SECONDS
+            or start_ts < self._compiled_until_ts
+        ):
+            return {}
+        history_start_ts = (start - datetime.timedelta.resolution).timestamp()
+        result: dict[str, _PeriodStateChanges] = {}
+        for state in sensor_states:
+            if (
+                sensor := self._sensors.get(state.entity_id)
+            ) is None or sensor.known_since_ts >= history_start_ts:
+                continue
+            state_class = state.attributes[ATTR_STATE_CLASS]
+            if (period := sensor.periods.get(start_ts)) is None:
+                # No state changes during the period, the state at the start
+                # is the start state of the next period or the last state
+                last_state = next(
+                    (
+                        next_period.start_state
+                        for period_start_ts, next_period in sensor.periods.items()
+                        if period_start_ts > start_ts
+                    ),
+                    sensor.last_state,
+                )
+                period = self._start_period(last_state, start, state_class)
+            if period.complete and period.state_class == state_class:
+                result[state.entity_id] = period
+        return result
+
+    def reset(self, run_start_ts: float) -> None:
+        """Forget all state changes when a new recorder run has started."""
+        self.run_start_ts = run_start_ts
+        self._sensors.clear()
+
+    def prune(self, end: datetime.datetime) -> None:
+        """Forget the state changes of periods which have been compiled."""
+        end_ts = end.timestamp()
+        self._compiled_until_ts = end_ts
+        for sensor in self._sensors.values():
+            for period_start_ts in [
+                period_start_ts
+                for period_start_ts in sensor.periods
+                if period_start_ts < end_ts
+            ]:
+                del sensor.periods[period_start_ts]
+
+
+def process_state_changed(
+    hass: HomeAssistant, event: Event[EventStateChangedData] | None
+) -> None:
+    """Process a recorded state change."""
+    if (state_changes := hass.data.get(DATA_STATE_CHANGES)) is None:
+        state_changes = hass.data[DATA_STATE_CHANGES] = SensorStateChanges(
+            get_instance(hass).recorder_runs_manager.recording_start.timestamp()
+        )
+    state_changes.process(event)
+
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
@@ -388,27 +698,25 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
-def compile_statistics(  # noqa: C901
+def _get_history(
     hass: HomeAssistant,
     session: Session,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
     start: datetime.datetime,
     end: datetime.datetime,
-) -> statistics.PlatformCompiledStatistics:
-    """Compile statistics for all entities during start-end."""
-    result: list[StatisticResult] = []
-
-    sensor_states = _get_sensor_states(hass)
-    wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
+) -> dict[str, list[State]]:
+    """Get the history of the sensors between start and end from the database."""
+    history_start = start - datetime.timedelta.resolution
+    history_list: dict[str, list[State]] = {}
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list: dict[str, list[State]] = {}
     if entities_full_history:
         history_list = history.get_full_significant_states_with_session(
             hass,
             session,
-            start - datetime.timedelta.resolution,
+            history_start,
             end,
             entity_ids=entities_full_history,
             significant_changes_only=False,
@@ -422,19 +730,58 @@ def compile_statistics(  # noqa: C901
         _history_list = history.get_full_significant_states_with_session(
             hass,
             session,
-            start - datetime.timedelta.resolution,
+            history_start,
             end,
             entity_ids=entities_significant_history,
         )
         history_list = {**history_list, **_history_list}
+    return history_list
+
+
+def compile_statistics(  # noqa: C901
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for all entities during start-end."""
+    result: list[StatisticResult] = []
+
+    sensor_states = _get_sensor_states(hass)
+    wanted_statistics = _wanted_statistics(sensor_states)
+    # Get history between start and end, the recorded state changes are used
+    # when available and the database is only queried for the rest
+    periods: dict[str, _PeriodStateChanges] = {}
+    recording_start = get_instance(hass).recorder_runs_manager.recording_start
+    if (state_changes := hass.data.get(DATA_STATE_CHANGES)) is not None:
+        if state_changes.run_start_ts != (run_start_ts := recording_start.timestamp()):
+            state_changes.reset(run_start_ts)
+        elif recording_start < start - datetime.timedelta.resolution:
+            periods = state_changes.periods(sensor_states, start, end)
+        state_changes.prune(end)
+    history_list = _get_history(
+        hass,
+        session,
+        [state for state in sensor_states if state.entity_id not in periods],
+        wanted_statistics,
+        start,
+        end,
+    )
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    measurement_periods: dict[str, _PeriodStateChanges] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if (period := periods.get(entity_id)) is not None and period.has_states:
+            if "sum" in wanted_statistics[entity_id]:
+                if period.sum_states:
+                    entities_with_float_states[entity_id] = period.sum_states
+            elif period.last_fstate is not None:
+                measurement_periods[entity_id] = period
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
-        if not (entity_history := history_list.get(entity_id, [_state])):
-            continue
+        entity_history = history_list.get(entity_id) or [_state]
         if not (float_states := _entity_history_to_float_and_state(entity_history)):
             continue
         entities_with_float_states[entity_id] = float_states
@@ -444,12 +791,51 @@ def compile_statistics(  # noqa: C901
     # that are not in the metadata table and we are not working
     # with them anyway.
     old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+        get_instance(hass),
+        session,
+        statistic_ids=set(entities_with_float_states) | set(measurement_periods),
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+
+    # The recorded state changes are not normalized, sensors with another unit
+    # than their statistics are compiled from the database
+    if to_normalize := [
+        _state
+        for _state in sensor_states
+        if (period := periods.get(_state.entity_id))
+        and _state.entity_id in old_metadatas
+        and (unit := old_metadatas[_state.entity_id][1]["unit_of_measurement"])
+        != period.unit
+        and unit in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER
+    ]:
+        history_list = _get_history(
+            hass, session, to_normalize, wanted_statistics, start, end
+        )
+        for _state in to_normalize:
+            entity_id = _state.entity_id
+            entities_with_float_states.pop(entity_id, None)
+            measurement_periods.pop(entity_id, None)
+            if float_states := _entity_history_to_float_and_state(
+                history_list.get(entity_id) or [_state]
+            ):
+                entities_with_float_states[entity_id] = float_states
+
+    to_process: list[
+        tuple[
+            str,
+            str | None,
+            str,
+            list[tuple[float, State]],
+            _PeriodStateChanges | None,
+        ]
+    ] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
+        state_class: str = _state.attributes[ATTR_STATE_CLASS]
+        if period := measurement_periods.get(entity_id):
+            assert period.unit is not UNDEFINED
+            to_process.append((entity_id, period.unit, state_class, [], period))
+            continue
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
         statistics_unit, valid_float_states = _normalize_states(
@@ -460,8 +846,9 @@ def compile_statistics(  # noqa: C901
         )
         if not valid_float_states:
             continue
-        state_class: str = _state.attributes[ATTR_STATE_CLASS]
-        to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
+        to_process.append(
+            (entity_id, statistics_unit, state_class, valid_float_states, None)
+        )
         if "sum" in wanted_statistics[entity_id]:
             to_query.add(entity_id)
 
@@ -473,6 +860,7 @@ def compile_statistics(  # noqa: C901
         statistics_unit,
         state_class,
         valid_float_states,
+        period,
     ) in to_process:
         # Check metadata
         if old_metadata := old_metadatas.get(entity_id):
@@ -511,6 +899,13 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if period is not None:
+            stat["max"] = period.max
+            stat["min"] = period.min
+            stat["mean"] = period.mean(end)
+            result.append({"meta": meta, "stat": stat})
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(
                 *itertools.islice(zip(*valid_float_states, strict=False), 1)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
+from fractions import Fraction
 import logging
 import math
 import statistics
@@ -182,6 +184,58 @@ STATS_BINARY_PERCENTAGE = {
     STAT_MEAN,
 }
 
+# Statistics calculated from a running sum of the samples
+STATS_NUMERIC_RUNNING_SUM = {
+    STAT_AVERAGE_TIMELESS,
+    STAT_DISTANCE_95P,
+    STAT_DISTANCE_99P,
+    STAT_MEAN,
+    STAT_STANDARD_DEVIATION,
+    STAT_SUM,
+    STAT_TOTAL,
+    STAT_VARIANCE,
+}
+
+# Statistics which also need a running sum of the squared samples
+STATS_NUMERIC_RUNNING_SUM_SQUARES = {
+    STAT_DISTANCE_95P,
+    STAT_DISTANCE_99P,
+    STAT_STANDARD_DEVIATION,
+    STAT_VARIANCE,
+}
+
+# Statistics calculated from the samples kept in sorted order
+STATS_NUMERIC_SORTED = {
+    STAT_DISTANCE_ABSOLUTE,
+    STAT_MEDIAN,
+    STAT_PERCENTILE,
+    STAT_VALUE_MAX,
+    STAT_VALUE_MIN,
+}
+
+type _PairTerm = Callable[[Any, datetime, Any, datetime], float]
+
+# Statistics calculated from a running sum over each pair of consecutive samples,
+# the term of a pair is calculated from the older and the newer sample and age
+STATS_NUMERIC_PAIR_TERMS: dict[str, _PairTerm] = {
+    STAT_AVERAGE_LINEAR: lambda old, old_age, new, new_age: (
+        0.5 * (new + old) * (new_age - old_age).total_seconds()
+    ),
+    STAT_AVERAGE_STEP: lambda old, old_age, new, new_age: (
+        old * (new_age - old_age).total_seconds()
+    ),
+    STAT_NOISINESS: lambda old, old_age, new, new_age: abs(new - old),
+    STAT_SUM_DIFFERENCES: lambda old, old_age, new, new_age: abs(new - old),
+    STAT_SUM_DIFFERENCES_NONNEGATIVE: lambda old, old_age, new, new_age: (
+        new - old if new >= old else new - 0
+    ),
+}
+STATS_BINARY_PAIR_TERMS: dict[str, _PairTerm] = {
+    STAT_AVERAGE_STEP: lambda old, old_age, new, new_age: (
+        (new_age - old_age).total_seconds() if old is True else 0
+    ),
+}
+
 CONF_STATE_CHARACTERISTIC = "state_characteristic"
 CONF_SAMPLES_MAX_BUFFER_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
@@ -194,6 +248,46 @@ DEFAULT_PRECISION = 2
 ICON = "mdi:calculator"
 
 
+class RunningSum:
+    """Exact sum of values, or of their squares, which are added and removed.
+
+    The sum is kept as a fraction so removing values does not accumulate
+    rounding errors and the results match the statistics module.
+    """
+
+    __slots__ = ("_sum", "_non_finite", "_squared")
+
+    def __init__(self, squared: bool = False) -> None:
+        """Initialize the running sum."""
+        self._sum = Fraction(0)
+        self._non_finite = 0
+        self._squared = squared
+
+    def _exact_term(self, value: float) -> Fraction:
+        """Return the exact term of a value."""
+        term = Fraction(value)
+        return term * term if self._squared else term
+
+    def add(self, value: float) -> None:
+        """Add a value to the sum."""
+        if math.isfinite(value):
+            self._sum += self._exact_term(value)
+        else:
+            self._non_finite += 1
+
+    def remove(self, value: float) -> None:
+        """Remove a previously added value from the sum."""
+        if math.isfinite(value):
+            self._sum -= self._exact_term(value)
+        else:
+            self._non_finite -= 1
+
+    @property
+    def exact(self) -> Fraction | None:
+        """Return the exact sum, None if it includes infinite or NaN values."""
+        return None if self._non_finite else self._sum
+
+
 def valid_state_characteristic_configuration(config: dict[str, Any]) -> dict[str, Any]:
     """Validate that the characteristic selected is valid for the source sensor type, throw if it isn't."""
     is_binary = split_entity_id(config[CONF_ENTITY_ID])[0] == BINARY_SENSOR_DOMAIN
@@ -366,6 +460,26 @@ class StatisticsSensor(SensorEntity):
         self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
         self.attributes: dict[str, StateType] = {}
 
+        # Running aggregates of the samples, only the ones needed to calculate
+        # the configured characteristic are kept up to date
+        self._running_sum: RunningSum | None = None
+        self._running_sum_squares: RunningSum | None = None
+        self._sorted_states: list[float] | None = None
+        self._non_finite_states = 0
+        self._count_on = 0
+        self._pair_term: _PairTerm | None = None
+        self._running_pair_sum = RunningSum()
+        if self.is_binary:
+            self._pair_term = STATS_BINARY_PAIR_TERMS.get(state_characteristic)
+        else:
+            if state_characteristic in STATS_NUMERIC_RUNNING_SUM:
+                self._running_sum = RunningSum()
+            if state_characteristic in STATS_NUMERIC_RUNNING_SUM_SQUARES:
+                self._running_sum_squares = RunningSum(squared=True)
+            if state_characteristic in STATS_NUMERIC_SORTED:
+                self._sorted_states = []
+            self._pair_term = STATS_NUMERIC_PAIR_TERMS.get(state_characteristic)
+
         self._state_characteristic_fn: Callable[[], StateType | datetime] = (
             self._callable_characteristic_fn(self._state_characteristic)
         )
@@ -417,10 +531,9 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._add_sample(new_state.state == "on", new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                self._add_sample(float(new_state.state), new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -433,6 +546,48 @@ class StatisticsSensor(SensorEntity):
 
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
+    def _add_sample(self, value: float | bool, age: datetime) -> None:
+        """Add a sample to the buffer and the running aggregates."""
+        if len(self.states) == self._samples_max_buffer_size:
+            self._remove_oldest_sample()
+        if self._pair_term is not None and self.states:
+            self._running_pair_sum.add(
+                self._pair_term(self.states[-1], self.ages[-1], value, age)
+            )
+        self.states.append(value)
+        self.ages.append(age)
+        if value is True:
+            self._count_on += 1
+        if self._running_sum is not None:
+            self._running_sum.add(value)
+        if self._running_sum_squares is not None:
+            self._running_sum_squares.add(value)
+        if self._sorted_states is not None:
+            if math.isfinite(value):
+                insort(self._sorted_states, value)
+            else:
+                self._non_finite_states += 1
+
+    def _remove_oldest_sample(self) -> None:
+        """Remove the oldest sample from the buffer and the running aggregates."""
+        value = self.states.popleft()
+        age = self.ages.popleft()
+        if self._pair_term is not None and self.states:
+            self._running_pair_sum.remove(
+                self._pair_term(value, age, self.states[0], self.ages[0])
+            )
+        if value is True:
+            self._count_on -= 1
+        if self._running_sum is not None:
+            self._running_sum.remove(value)
+        if self._running_sum_squares is not None:
+            self._running_sum_squares.remove(value)
+        if self._sorted_states is not None:
+            if math.isfinite(value):
+                del self._sorted_states[bisect_left(self._sorted_states, value)]
+            else:
+                self._non_finite_states -= 1
+
     def _derive_unit_of_measurement(self, new_state: State) -> str | None:
         base_unit: str | None = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         unit: str | None
@@ -544,8 +699,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._remove_oldest_sample()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
@@ -697,29 +851,29 @@ class StatisticsSensor(SensorEntity):
 
     # Statistics for numeric sensor
 
+    def _pair_sum(self) -> float:
+        """Return the sum of the pair terms of the configured characteristic."""
+        if (exact := self._running_pair_sum.exact) is not None:
+            return float(exact)
+        assert self._pair_term is not None
+        pair_term = self._pair_term
+        total: float = 0
+        for i in range(1, len(self.states)):
+            total += pair_term(
+                self.states[i - 1], self.ages[i - 1], self.states[i], self.ages[i]
+            )
+        return total
+
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._pair_sum() / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._pair_sum() / age_range_seconds
         return None
 
     def _stat_average_timeless(self) -> StateType:
@@ -777,11 +931,15 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
+            if (sorted_states := self._finite_sorted_states()) is not None:
+                return sorted_states[-1] - sorted_states[0]
             return max(self.states) - min(self.states)
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
+            if (total := self._exact_sum()) is not None:
+                return float(total / len(self.states))
             return statistics.mean(self.states)
         return None
 
@@ -794,6 +952,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
+            if (sorted_states := self._finite_sorted_states()) is not None:
+                count = len(sorted_states)
+                if count % 2 == 1:
+                    return sorted_states[count // 2]
+                i = count // 2
+                return (sorted_states[i - 1] + sorted_states[i]) / 2
             return statistics.median(self.states)
         return None
 
@@ -804,34 +968,42 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
+            if (sorted_states := self._finite_sorted_states()) is not None:
+                # Same as statistics.quantiles with n=100 and the exclusive
+                # method, but only for the configured percentile
+                count = len(sorted_states)
+                m = count + 1
+                j = min(max(self._percentile * m // 100, 1), count - 1)
+                delta = self._percentile * m - j * 100
+                return (
+                    sorted_states[j - 1] * (100 - delta) + sorted_states[j] * delta
+                ) / 100
             percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
             return percentiles[self._percentile - 1]
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
+            if (variance := self._exact_variance()) is not None:
+                return math.sqrt(variance)
             return statistics.stdev(self.states)
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
+            if (total := self._exact_sum()) is not None:
+                return float(total)
             return sum(self.states)
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                abs(j - i)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return self._pair_sum()
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return self._pair_sum()
         return None
 
     def _stat_total(self) -> StateType:
@@ -839,29 +1011,54 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
+            if (sorted_states := self._finite_sorted_states()) is not None:
+                return sorted_states[-1]
             return max(self.states)
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
+            if (sorted_states := self._finite_sorted_states()) is not None:
+                return sorted_states[0]
             return min(self.states)
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
+            if (variance := self._exact_variance()) is not None:
+                return float(variance)
             return statistics.variance(self.states)
         return None
 
+    def _exact_sum(self) -> Fraction | None:
+        """Return the exact sum of the samples if it is kept."""
+        if self._running_sum is None:
+            return None
+        return self._running_sum.exact
+
+    def _exact_variance(self) -> Fraction | None:
+        """Return the exact sample variance if the sums it needs are kept."""
+        if (
+            self._running_sum_squares is None
+            or (sum_squares := self._running_sum_squares.exact) is None
+            or (total := self._exact_sum()) is None
+        ):
+            return None
+        count = len(self.states)
+        return (sum_squares - total * total / count) / (count - 1)
+
+    def _finite_sorted_states(self) -> list[float] | None:
+        """Return the samples in sorted order if they are kept."""
+        if self._sorted_states is None or self._non_finite_states:
+            return None
+        return self._sorted_states
+
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return 100 / age_range_seconds * on_seconds
+            return 100 / age_range_seconds * self._pair_sum()
         return None
 
     def _stat_binary_average_timeless(self) -> StateType:
@@ -871,10 +1068,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return self._count_on
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - self._count_on
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -884,5 +1081,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * self._count_on
         return None
@@ -19,6 +19,7 @@ FORMAT_CONTENT_TYPE = {HLS_PROVIDER: "application/vnd.apple.mpegurl"}
 
 OUTPUT_IDLE_TIMEOUT = 300  # Idle timeout due to inactivity
 
+KEYFRAME_IMAGE_CACHE_SIZE = 4  # Number of image sizes cached per keyframe
 NUM_PLAYLIST_SEGMENTS = 3  # Number of segments to use in HLS playlist
 MAX_SEGMENTS = 5  # Max number of segments to keep around
 TARGET_SEGMENT_DURATION_NON_LL_HLS = 2.0  # Each segment is about this many seconds
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 import datetime
 from enum import IntEnum
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
@@ -22,16 +23,18 @@ from homeassistant.util.decorator import Registry
 from .const import (
     ATTR_STREAMS,
     DOMAIN,
+    KEYFRAME_IMAGE_CACHE_SIZE,
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
     from . import Stream
+    from .diagnostics import Diagnostics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -142,6 +145,11 @@ class Segment:
         """Return reconstructed data for all parts as bytes, without init."""
         return b"".join([part.data for part in self.parts])
 
+    @property
+    def etag(self) -> str:
+        """Return the entity tag of the data of the parts added so far."""
+        return f"{self.stream_id}-{self.sequence}-{len(self.parts)}"
+
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
 
@@ -423,10 +431,14 @@ class KeyFrameConverter:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
         get_image schedules _generate_image in an executor thread
-        _generate_image will try to create an image from the packet
+        _generate_image will try to decode a frame from the packet
         _generate_image will clear the packet, so there will only be one attempt per packet
+        _generate_image encodes the last decoded frame at the requested size
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
+
+    The images of the last decoded frame are cached per size and orientation,
+    so they are only encoded again once a new keyframe arrives.
     """
 
     def __init__(
@@ -434,6 +446,7 @@ class KeyFrameConverter:
         hass: HomeAssistant,
         stream_settings: StreamSettings,
         dynamic_stream_settings: DynamicStreamSettings,
+        diagnostics: Diagnostics,
     ) -> None:
         """Initialize."""
 
@@ -446,11 +459,14 @@ class KeyFrameConverter:
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        self._frame: VideoFrame | None = None
+        self._images: dict[tuple[int | None, int | None, int], bytes] = {}
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
         self._stream_settings = stream_settings
         self._dynamic_stream_settings = dynamic_stream_settings
+        self._diagnostics = diagnostics
 
     def stash_keyframe_packet(self, packet: Packet) -> None:
         """Store the keyframe and set the asyncio.Event from the event loop.
@@ -484,18 +500,23 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
-    def _generate_image(self, width: int | None, height: int | None) -> None:
-        """Generate the keyframe image.
+    def _image_key(
+        self, width: int | None, height: int | None
+    ) -> tuple[int | None, int | None, int]:
+        """Return the key of an image in the cache of the last keyframe."""
+        if width and height:
+            return (width, height, self._dynamic_stream_settings.orientation)
+        return (None, None, self._dynamic_stream_settings.orientation)
 
-        This is run in an executor thread, but since it is called within an
-        the asyncio lock from the main thread, there will only be one entry
-        at a time per instance.
-        """
+    def _decode_keyframe(self) -> None:
+        """Decode the stashed keyframe packet.
 
-        if not (self._turbojpeg and self._packet and self._codec_context):
-            return
+        This is run in an executor thread by _generate_image.
+        """
+        assert self._codec_context
         packet = self._packet
         self._packet = None
+        start = time.perf_counter()
         for _ in range(2):  # Retry once if codec context needs to be flushed
             try:
                 # decode packet (flush afterwards)
@@ -513,7 +534,29 @@ class KeyFrameConverter:
             _LOGGER.debug("Unable to decode keyframe")
             return
         if frames:
-            frame = frames[0]
+            self._frame = frames[0]
+            self._images.clear()
+            self._diagnostics.record_duration(
+                "keyframe_decode", time.perf_counter() - start
+            )
+
+    def _generate_image(self, width: int | None, height: int | None) -> None:
+        """Generate the keyframe image.
+
+        This is run in an executor thread, but since it is called within an
+        the asyncio lock from the main thread, there will only be one entry
+        at a time per instance.
+        """
+
+        if not (self._turbojpeg and self._codec_context):
+            return
+        if self._packet:
+            self._decode_keyframe()
+        if (frame := self._frame) is None:
+            return
+        key = self._image_key(width, height)
+        if (image := self._images.get(key)) is None:
+            start = time.perf_counter()
             if width and height:
                 if self._dynamic_stream_settings.orientation >= 5:
                     frame = frame.reformat(width=height, height=width)
@@ -523,7 +566,14 @@ class KeyFrameConverter:
                 frame.to_ndarray(format="bgr24"),
                 self._dynamic_stream_settings.orientation,
             )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            image = bytes(self._turbojpeg.encode(bgr_array))
+            self._diagnostics.record_duration(
+                "keyframe_encode", time.perf_counter() - start
+            )
+            if len(self._images) >= KEYFRAME_IMAGE_CACHE_SIZE:
+                del self._images[next(iter(self._images))]
+            self._images[key] = image
+        self._image = image
 
     async def async_get_image(
         self,
@@ -538,5 +588,13 @@ class KeyFrameConverter:
             self._event.clear()
             await self._event.wait()
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+            if self._packet is None and (
+                image := self._images.get(self._image_key(width, height))
+            ):
+                # No new keyframe since the image was encoded
+                self._image = image
+            else:
+                await self._hass.async_add_executor_job(
+                    self._generate_image, width, height
+                )
         return self._image
@@ -17,6 +17,7 @@ class Diagnostics:
         """Initialize Diagnostics."""
         self._counter: Counter = Counter()
         self._values: dict[str, Any] = {}
+        self._durations: dict[str, dict[str, float]] = {}
 
     def increment(self, key: str) -> None:
         """Increment a counter for the specified key/event."""
@@ -26,8 +27,18 @@ class Diagnostics:
         """Update a key/value pair."""
         self._values[key] = value
 
+    def record_duration(self, key: str, duration: float) -> None:
+        """Record how long an operation took in seconds."""
+        if (durations := self._durations.get(key)) is None:
+            durations = self._durations[key] = {"count": 0, "total": 0.0, "max": 0.0}
+        durations["count"] += 1
+        durations["total"] += duration
+        durations["max"] = max(durations["max"], duration)
+
     def as_dict(self) -> dict[str, Any]:
         """Return diagnostics as a debug dictionary."""
-        result = {k: self._counter[k] for k in self._counter}
+        result: dict[str, Any] = {k: self._counter[k] for k in self._counter}
         result.update(self._values)
+        for key, durations in self._durations.items():
+            result[f"{key}_duration"] = dict(durations)
         return result
@@ -5,7 +5,7 @@ from __future__ import annotations
 from http import HTTPStatus
 from typing import TYPE_CHECKING, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 
 from homeassistant.core import HomeAssistant, callback
 
@@ -363,7 +363,7 @@ class HlsPartView(StreamView):
 
     async def handle(
         self, request: web.Request, stream: Stream, sequence: str, part_num: str
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Handle part."""
         track: HlsStreamOutput = cast(
             HlsStreamOutput, stream.add_provider(HLS_PROVIDER)
@@ -388,11 +388,10 @@ class HlsPartView(StreamView):
             await track.part_recv(timeout=track.stream_settings.hls_part_timeout)
         if int(part_num) >= len(segment.parts):
             return web.HTTPRequestRangeNotSatisfiable()
-        return web.Response(
-            body=segment.parts[int(part_num)].data,
-            headers={
-                "Content-Type": "video/iso.segment",
-            },
+        return await _async_send_segment_data(
+            request,
+            [segment.parts[int(part_num)].data],
+            f"{segment.stream_id}-{segment.sequence}.{part_num}",
         )
 
 
@@ -425,9 +424,62 @@ class HlsSegmentView(StreamView):
                 body=None,
                 status=HTTPStatus.NOT_FOUND,
             )
+        return await _async_send_segment_data(
+            request, [part.data for part in segment.parts], segment.etag
+        )
+
+
+async def _async_send_segment_data(
+    request: web.Request, chunks: list[bytes], etag: str
+) -> web.StreamResponse:
+    """Send the data of a segment or part without joining the chunks.
+
+    The viewers share the entity tag of the data, and a single byte range
+    of it can be requested.
+    """
+    if any(match.value in (etag, "*") for match in request.if_none_match or ()):
         return web.Response(
-            body=segment.get_data(),
-            headers={
-                "Content-Type": "video/iso.segment",
-            },
+            status=HTTPStatus.NOT_MODIFIED, headers={hdrs.ETAG: f'"{etag}"'}
         )
+
+    size = sum(len(chunk) for chunk in chunks)
+    status = HTTPStatus.OK
+    headers = {
+        "Content-Type": "video/iso.segment",
+        hdrs.ACCEPT_RANGES: "bytes",
+        hdrs.ETAG: f'"{etag}"',
+    }
+    start, stop = 0, size
+    if hdrs.RANGE in request.headers:
+        try:
+            start, stop, _ = request.http_range.indices(size)
+        except ValueError:
+            # Malformed or multiple ranges, send the whole data
+            start, stop = 0, size
+        else:
+            if start >= stop:
+                return web.Response(
+                    status=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+                    headers={hdrs.CONTENT_RANGE: f"bytes */{size}"},
+                )
+            status = HTTPStatus.PARTIAL_CONTENT
+            headers[hdrs.CONTENT_RANGE] = f"bytes {start}-{stop - 1}/{size}"
+
+    if len(chunks) == 1:
+        return web.Response(
+            status=status, headers=headers, body=memoryview(chunks[0])[start:stop]
+        )
+
+    response = web.StreamResponse(status=status, headers=headers)
+    response.content_length = stop - start
+    await response.prepare(request)
+    offset = 0
+    for chunk in chunks:
+        end = offset + len(chunk)
+        if end > start and offset < stop:
+            await response.write(
+                memoryview(chunk)[max(start - offset, 0) : stop - offset]
+            )
+        offset = end
+    await response.write_eof()
+    return response
@@ -14,7 +14,7 @@ from homeassistant.helpers import discovery
 from homeassistant.helpers.device import (
     async_remove_stale_devices_links_keep_current_device,
 )
-from homeassistant.helpers.reload import async_reload_integration_platforms
+from homeassistant.helpers.reload import async_reload_integration_platforms, config_hash
 from homeassistant.helpers.service import async_register_admin_service
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_integration
@@ -88,14 +88,25 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _process_config(hass: HomeAssistant, hass_config: ConfigType) -> None:
     """Process config."""
-    coordinators: list[TriggerUpdateCoordinator] | None = hass.data.pop(DOMAIN, None)
-
-    # Remove old ones
-    if coordinators:
-        for coordinator in coordinators:
-            coordinator.async_remove()
+    old_coordinators: list[TriggerUpdateCoordinator] | None = hass.data.pop(
+        DOMAIN, None
+    )
+    old_coordinators_by_hash: dict[int | None, list[TriggerUpdateCoordinator]] = {}
+    if old_coordinators is not None:
+        for coordinator in old_coordinators:
+            old_coordinators_by_hash.setdefault(
+                config_hash(coordinator.config), []
+            ).append(coordinator)
 
     async def init_coordinator(hass, conf_section):
+        # Keep coordinators with unchanged config, their triggers stay attached
+        # and their last data is rendered by the re-created entities.
+        candidates = old_coordinators_by_hash.get(config_hash(conf_section), [])
+        for idx, coordinator in enumerate(candidates):
+            if coordinator.config == conf_section:
+                del candidates[idx]
+                coordinator.async_setup_platforms(hass_config)
+                return coordinator
         coordinator = TriggerUpdateCoordinator(hass, conf_section)
         await coordinator.async_setup(hass_config)
         return coordinator
@@ -125,3 +136,8 @@ async def _process_config(hass: HomeAssistant, hass_config: ConfigType) -> None:
 
     if coordinator_tasks:
         hass.data[DOMAIN] = await asyncio.gather(*coordinator_tasks)
+
+    # Remove coordinators which were changed or removed
+    for candidates in old_coordinators_by_hash.values():
+        for coordinator in candidates:
+            coordinator.async_remove()
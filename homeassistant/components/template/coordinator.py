@@ -50,6 +50,11 @@ class TriggerUpdateCoordinator(DataUpdateCoordinator):
                 EVENT_HOMEASSISTANT_START, self._attach_triggers
             )
 
+        self.async_setup_platforms(hass_config)
+
+    @callback
+    def async_setup_platforms(self, hass_config: ConfigType) -> None:
+        """Create the entities for this coordinator."""
         for platform_domain in PLATFORMS:
             if platform_domain in self.config:
                 self.hass.async_create_task(
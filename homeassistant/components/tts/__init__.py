@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Mapping
+from collections.abc import AsyncGenerator, AsyncIterable, Mapping
+from contextlib import suppress
 from datetime import datetime
 from functools import cached_property, partial
 import hashlib
@@ -39,7 +40,13 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HassJob, HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_component import EntityComponent
@@ -56,12 +63,19 @@ from .const import (
     ATTR_OPTIONS,
     CONF_CACHE,
     CONF_CACHE_DIR,
+    CONF_CACHE_MAX_FILES,
+    CONF_CACHE_MAX_SIZE,
     CONF_TIME_MEMORY,
     DATA_TTS_MANAGER,
     DEFAULT_CACHE,
     DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_MAX_FILES,
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_MEMORY_MAX_FILES,
+    DEFAULT_MEMORY_MAX_SIZE,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
+    TtsAudioStreamType,
     TtsAudioType,
 )
 from .helper import get_engine_instance
@@ -84,6 +98,7 @@ __all__ = [
     "PLATFORM_SCHEMA",
     "SampleFormat",
     "Provider",
+    "TtsAudioStreamType",
     "TtsAudioType",
     "Voice",
 ]
@@ -91,6 +106,7 @@ __all__ = [
 _LOGGER = logging.getLogger(__name__)
 
 ATTR_PLATFORM = "platform"
+ATTR_ENGINE_ID = "engine_id"
 ATTR_AUDIO_OUTPUT = "audio_output"
 ATTR_PREFERRED_FORMAT = "preferred_format"
 ATTR_PREFERRED_SAMPLE_RATE = "preferred_sample_rate"
@@ -108,6 +124,7 @@ _PREFFERED_FORMAT_OPTIONS: Final[set[str]] = {
 CONF_LANG = "language"
 
 SERVICE_CLEAR_CACHE = "clear_cache"
+SERVICE_WARM_CACHE = "warm_cache"
 
 _RE_LEGACY_VOICE_FILE = re.compile(
     r"([a-f0-9]{40})_([^_]+)_([^_]+)_([a-z_]+)\.[a-z0-9]{3,4}"
@@ -118,6 +135,66 @@ _RE_VOICE_FILE = re.compile(
 KEY_PATTERN = "{0}_{1}_{2}_{3}"
 
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
+SCHEMA_SERVICE_WARM_CACHE = vol.Schema(
+    {
+        vol.Optional(ATTR_ENGINE_ID): cv.string,
+        vol.Required(ATTR_MESSAGE): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_LANGUAGE): cv.string,
+        vol.Optional(ATTR_OPTIONS): dict,
+    }
+)
+
+_STREAM_CHUNK_SIZE = 8192
+
+
+class TTSAudioStream:
+    """Audio chunks of a message while it is generated.
+
+    Every reader gets all chunks from the start, also when it starts reading
+    after the first chunks were generated.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stream."""
+        self._chunks: list[bytes] = []
+        self._done = False
+        self._error: BaseException | None = None
+        self._updated = asyncio.Event()
+
+    @callback
+    def async_append(self, chunk: bytes) -> None:
+        """Add a generated chunk."""
+        self._chunks.append(chunk)
+        self._async_notify()
+
+    @callback
+    def async_finish(self, error: BaseException | None = None) -> None:
+        """End the stream, with the error that stopped the generation."""
+        self._done = True
+        self._error = error
+        self._async_notify()
+
+    @callback
+    def _async_notify(self) -> None:
+        """Wake up the readers waiting for a chunk."""
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+    async def async_iterate(self) -> AsyncGenerator[bytes]:
+        """Yield the chunks generated so far and the ones that follow."""
+        index = 0
+        while True:
+            if index < len(self._chunks):
+                index += 1
+                yield self._chunks[index - 1]
+            elif self._error is not None:
+                raise HomeAssistantError(
+                    f"Error generating audio: {self._error}"
+                ) from self._error
+            elif self._done:
+                return
+            else:
+                await self._updated.wait()
 
 
 class TTSCache(TypedDict):
@@ -125,7 +202,8 @@ class TTSCache(TypedDict):
 
     filename: str
     voice: bytes
-    pending: asyncio.Task | None
+    pending: asyncio.Task[bytes] | None
+    stream: TTSAudioStream | None
 
 
 @callback
@@ -293,6 +371,81 @@ def _convert_audio(
         return output_file.read()
 
 
+async def _async_stream_convert_audio(
+    ffmpeg_binary: str,
+    from_extension: str,
+    audio: AsyncIterable[bytes],
+    to_extension: str,
+    to_sample_rate: int | None = None,
+    to_sample_channels: int | None = None,
+) -> AsyncGenerator[bytes]:
+    """Convert an audio stream to a preferred format with an ffmpeg pipe.
+
+    Formats like WAV that store the length of the audio in their header can
+    not be written in a streaming fashion, use async_convert_audio for those.
+    """
+    command = [ffmpeg_binary, "-f", from_extension, "-i", "pipe:"]
+    command.extend(["-f", to_extension])
+
+    if to_sample_rate is not None:
+        command.extend(["-ar", str(to_sample_rate)])
+
+    if to_sample_channels is not None:
+        command.extend(["-ac", str(to_sample_channels)])
+
+    if to_extension == "mp3":
+        # Max quality for MP3
+        command.extend(["-q:a", "0"])
+
+    command.append("pipe:")
+
+    proc = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    assert proc.stdin and proc.stdout and proc.stderr
+
+    async def write_audio() -> None:
+        """Feed the audio to ffmpeg while its output is read."""
+        assert proc.stdin
+        try:
+            async for chunk in audio:
+                proc.stdin.write(chunk)
+                await proc.stdin.drain()
+        finally:
+            proc.stdin.close()
+
+    write_task = asyncio.create_task(write_audio())
+    # Read the errors while converting, ffmpeg blocks when the pipe is full
+    stderr_task = asyncio.create_task(proc.stderr.read())
+    try:
+        while chunk := await proc.stdout.read(_STREAM_CHUNK_SIZE):
+            yield chunk
+    except BaseException:
+        # Stop converting when the output is no longer read
+        with suppress(ProcessLookupError):
+            proc.kill()
+        raise
+    finally:
+        write_task.cancel()
+        (write_result,) = await asyncio.gather(write_task, return_exceptions=True)
+        # The process can only be waited for once its output is read
+        await proc.stdout.read()
+        stderr = await stderr_task
+        returncode = await proc.wait()
+
+    if returncode != 0:
+        _LOGGER.error(stderr.decode())
+        raise RuntimeError(
+            f"Unexpected error while running ffmpeg with arguments: {command}."
+            "See log for details."
+        )
+    if isinstance(write_result, Exception):
+        raise write_result
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up TTS."""
     websocket_api.async_register_command(hass, websocket_list_engines)
@@ -304,8 +457,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     use_cache: bool = conf.get(CONF_CACHE, DEFAULT_CACHE)
     cache_dir: str = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
     time_memory: int = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
-
-    tts = SpeechManager(hass, use_cache, cache_dir, time_memory)
+    cache_max_size: int = conf.get(CONF_CACHE_MAX_SIZE, DEFAULT_CACHE_MAX_SIZE)
+    cache_max_files: int = conf.get(CONF_CACHE_MAX_FILES, DEFAULT_CACHE_MAX_FILES)
+
+    tts = SpeechManager(
+        hass,
+        use_cache,
+        cache_dir,
+        time_memory,
+        cache_max_size=cache_max_size * 1024 * 1024,
+        cache_max_files=cache_max_files,
+    )
 
     try:
         await tts.async_init_cache()
@@ -348,6 +510,27 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         schema=SCHEMA_SERVICE_CLEAR_CACHE,
     )
 
+    async def async_warm_cache_handle(service: ServiceCall) -> None:
+        """Handle warm cache service call."""
+        if (
+            engine := async_resolve_engine(hass, service.data.get(ATTR_ENGINE_ID))
+        ) is None:
+            raise HomeAssistantError("No TTS engine found")
+        for message in service.data[ATTR_MESSAGE]:
+            await tts.async_warm_cache(
+                engine,
+                message,
+                language=service.data.get(ATTR_LANGUAGE),
+                options=service.data.get(ATTR_OPTIONS),
+            )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WARM_CACHE,
+        async_warm_cache_handle,
+        schema=SCHEMA_SERVICE_WARM_CACHE,
+    )
+
     for setup in platform_setups:
         # Tasks are created as tracked tasks to ensure startup
         # waits for them to finish, but we explicitly do not
@@ -490,6 +673,17 @@ class TextToSpeechEntity(RestoreEntity, cached_properties=CACHED_PROPERTIES_WITH
             message=message, language=language, options=options
         )
 
+    @final
+    async def internal_async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> TtsAudioStreamType:
+        """Process an audio stream to TTS service."""
+        self.__last_tts_loaded = dt_util.utcnow().isoformat()
+        self.async_write_ha_state()
+        return await self.async_stream_tts_audio(
+            message=message, language=language, options=options
+        )
+
     def get_tts_audio(
         self, message: str, language: str, options: dict[str, Any]
     ) -> TtsAudioType:
@@ -507,6 +701,27 @@ class TextToSpeechEntity(RestoreEntity, cached_properties=CACHED_PROPERTIES_WITH
             partial(self.get_tts_audio, message, language, options=options)
         )
 
+    async def async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> TtsAudioStreamType:
+        """Load tts audio from the engine as chunks while it is synthesized.
+
+        Return a tuple of file extension and an async iterable of the chunks
+        of data. Engines that synthesize a message progressively override
+        this, by default the audio of async_get_tts_audio is a single chunk.
+        """
+        extension, data = await self.async_get_tts_audio(
+            message=message, language=language, options=options
+        )
+        if data is None:
+            return extension, None
+        return extension, _async_single_chunk(data)
+
+
+async def _async_single_chunk(data: bytes) -> AsyncGenerator[bytes]:
+    """Yield audio data as a single chunk."""
+    yield data
+
 
 def _hash_options(options: dict) -> str:
     """Hashes an options dictionary."""
@@ -527,18 +742,32 @@ class SpeechManager:
         use_cache: bool,
         cache_dir: str,
         time_memory: int,
+        cache_max_size: int = DEFAULT_CACHE_MAX_SIZE * 1024 * 1024,
+        cache_max_files: int = DEFAULT_CACHE_MAX_FILES,
+        memory_max_size: int = DEFAULT_MEMORY_MAX_SIZE * 1024 * 1024,
+        memory_max_files: int = DEFAULT_MEMORY_MAX_FILES,
     ) -> None:
-        """Initialize a speech store."""
+        """Initialize a speech store.
+
+        Both caches are ordered from the least to the most recently used
+        speech, which is evicted first when a cache grows over its limits.
+        """
         self.hass = hass
         self.providers: dict[str, Provider] = {}
 
         self.use_cache = use_cache
         self.cache_dir = cache_dir
         self.time_memory = time_memory
+        self.cache_max_size = cache_max_size
+        self.cache_max_files = cache_max_files
+        self.memory_max_size = memory_max_size
+        self.memory_max_files = memory_max_files
         self.file_cache: dict[str, str] = {}
+        self.file_cache_size: dict[str, int] = {}
         self.mem_cache: dict[str, TTSCache] = {}
+        self._mem_cache_timers: dict[str, CALLBACK_TYPE] = {}
 
-    def _init_cache(self) -> dict[str, str]:
+    def _init_cache(self) -> dict[str, tuple[str, int]]:
         """Init cache folder and fetch files."""
         try:
             self.cache_dir = _init_tts_cache_dir(self.hass, self.cache_dir)
@@ -552,22 +781,87 @@ class SpeechManager:
 
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
-        self.file_cache.update(await self.hass.async_add_executor_job(self._init_cache))
+        cache_files = await self.hass.async_add_executor_job(self._init_cache)
+        for cache_key, (filename, size) in cache_files.items():
+            self.file_cache[cache_key] = filename
+            self.file_cache_size[cache_key] = size
+        await self._async_evict_files()
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
+        for cancel in self._mem_cache_timers.values():
+            cancel()
+        self._mem_cache_timers = {}
         self.mem_cache = {}
 
-        def remove_files() -> None:
-            """Remove files from filesystem."""
-            for filename in self.file_cache.values():
-                try:
-                    os.remove(os.path.join(self.cache_dir, filename))
-                except OSError as err:
-                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
-
-        await self.hass.async_add_executor_job(remove_files)
+        await self.hass.async_add_executor_job(
+            self._remove_files, list(self.file_cache.values())
+        )
         self.file_cache = {}
+        self.file_cache_size = {}
+
+    def _remove_files(self, filenames: list[str]) -> None:
+        """Remove files from filesystem."""
+        for filename in filenames:
+            try:
+                os.remove(os.path.join(self.cache_dir, filename))
+            except OSError as err:
+                _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+
+    async def _async_evict_files(self) -> None:
+        """Remove the least recently used files over the limits of the file cache.
+
+        This method is a coroutine.
+        """
+        cache_size = sum(self.file_cache_size.values())
+        filenames: list[str] = []
+        # The most recently used file is kept, even when it is over the limits
+        for cache_key in list(self.file_cache)[:-1]:
+            if (
+                cache_size <= self.cache_max_size
+                and len(self.file_cache) <= self.cache_max_files
+            ):
+                break
+            cache_size -= self.file_cache_size.pop(cache_key, 0)
+            filenames.append(self.file_cache.pop(cache_key))
+
+        if filenames:
+            _LOGGER.debug("Evicting %d files from the TTS cache", len(filenames))
+            await self.hass.async_add_executor_job(self._remove_files, filenames)
+
+    async def async_warm_cache(
+        self,
+        engine: str,
+        message: str,
+        language: str | None = None,
+        options: dict | None = None,
+    ) -> None:
+        """Generate the speech of a message into the file cache, unless it is there.
+
+        This method is a coroutine.
+        """
+        if (engine_instance := get_engine_instance(self.hass, engine)) is None:
+            raise HomeAssistantError(f"Provider {engine} not found")
+
+        language, options = self.process_options(engine_instance, language, options)
+        cache_key = self._generate_cache_key(message, language, options, engine)
+
+        if cache_key in self.file_cache:
+            # Mark the file as used, also for the order after a restart
+            self.file_cache[cache_key] = filename = self.file_cache.pop(cache_key)
+            await self.hass.async_add_executor_job(
+                os.utime, os.path.join(self.cache_dir, filename)
+            )
+            return
+
+        if cache_key not in self.mem_cache:
+            await self._async_get_tts_audio(
+                engine_instance, cache_key, message, False, language, options
+            )
+        cached = self.mem_cache[cache_key]
+        data = await pending if (pending := cached["pending"]) else cached["voice"]
+        if cache_key not in self.file_cache:
+            await self._async_save_tts_audio(cache_key, cached["filename"], data)
 
     @callback
     def async_register_legacy_engine(
@@ -644,6 +938,7 @@ class SpeechManager:
         # Is speech already in memory
         if cache_key in self.mem_cache:
             filename = self.mem_cache[cache_key]["filename"]
+            self._async_touch_mem(cache_key)
         # Is file store in file cache
         elif use_cache and cache_key in self.file_cache:
             filename = self.file_cache[cache_key]
@@ -673,19 +968,19 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
-            if use_cache and cache_key in self.file_cache:
-                await self._async_file_to_mem(cache_key)
-            else:
-                await self._async_get_tts_audio(
-                    engine_instance, cache_key, message, use_cache, language, options
-                )
+        if cache_key in self.mem_cache:
+            self._async_touch_mem(cache_key)
+        elif use_cache and cache_key in self.file_cache:
+            await self._async_file_to_mem(cache_key)
+        else:
+            await self._async_get_tts_audio(
+                engine_instance, cache_key, message, use_cache, language, options
+            )
 
-        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
         cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
+        extension = os.path.splitext(cached["filename"])[1][1:]
+        if pending := cached["pending"]:
+            return extension, await pending
         return extension, cached["voice"]
 
     @callback
@@ -742,21 +1037,36 @@ class SpeechManager:
         else:
             sample_channels = options.pop(ATTR_PREFERRED_SAMPLE_CHANNELS, None)
 
-        async def get_tts_data() -> str:
+        # Only engines that synthesize progressively are served while generated,
+        # the others are served with their length and ID3 tags once complete
+        stream: TTSAudioStream | None = None
+        if (
+            isinstance(engine_instance, TextToSpeechEntity)
+            and type(engine_instance).async_stream_tts_audio
+            is not TextToSpeechEntity.async_stream_tts_audio
+        ):
+            stream = TTSAudioStream()
+
+        async def get_tts_data() -> bytes:
             """Handle data available."""
             if engine_instance.name is None or engine_instance.name is UNDEFINED:
                 raise HomeAssistantError("TTS engine name is not set.")
 
+            audio: AsyncIterable[bytes] | None
             if isinstance(engine_instance, Provider):
                 extension, data = await engine_instance.async_get_tts_audio(
                     message, language, options
                 )
+                audio = None if data is None else _async_single_chunk(data)
             else:
-                extension, data = await engine_instance.internal_async_get_tts_audio(
+                (
+                    extension,
+                    audio,
+                ) = await engine_instance.internal_async_stream_tts_audio(
                     message, language, options
                 )
 
-            if data is None or extension is None:
+            if audio is None or extension is None:
                 raise HomeAssistantError(
                     f"No TTS from {engine_instance.name} for '{message}'"
                 )
@@ -770,11 +1080,22 @@ class SpeechManager:
                 or (sample_channels is not None)
             )
 
-            if needs_conversion:
+            if needs_conversion and final_extension == "wav":
+                # WAV stores the length of the audio in its header
                 data = await async_convert_audio(
                     self.hass,
                     extension,
-                    data,
+                    b"".join([chunk async for chunk in audio]),
+                    to_extension=final_extension,
+                    to_sample_rate=sample_rate,
+                    to_sample_channels=sample_channels,
+                )
+                audio = _async_single_chunk(data)
+            elif needs_conversion:
+                audio = _async_stream_convert_audio(
+                    ffmpeg.get_ffmpeg_manager(self.hass).binary,
+                    extension,
+                    audio,
                     to_extension=final_extension,
                     to_sample_rate=sample_rate,
                     to_sample_channels=sample_channels,
@@ -791,6 +1112,14 @@ class SpeechManager:
                     f"TTS filename '{filename}' from {engine_instance.name} is invalid!"
                 )
 
+            chunks: list[bytes] = []
+            async for chunk in audio:
+                chunks.append(chunk)
+                if stream is not None:
+                    # Serve the chunks while the rest of the audio is generated
+                    stream.async_append(chunk)
+            data = b"".join(chunks)
+
             # Save to memory
             if final_extension == "mp3":
                 data = self.write_tags(
@@ -804,14 +1133,21 @@ class SpeechManager:
                     self._async_save_tts_audio(cache_key, filename, data)
                 )
 
-            return filename
+            return data
 
         audio_task = self.hass.async_create_task(get_tts_data(), eager_start=False)
 
         def handle_error(_future: asyncio.Future) -> None:
-            """Handle error."""
-            if audio_task.exception():
+            """Handle error and end the stream."""
+            error: BaseException | None
+            if audio_task.cancelled():
+                error = asyncio.CancelledError()
+            else:
+                error = audio_task.exception()
+            if error:
                 self.mem_cache.pop(cache_key, None)
+            if stream is not None:
+                stream.async_finish(error)
 
         audio_task.add_done_callback(handle_error)
 
@@ -820,6 +1156,7 @@ class SpeechManager:
             "filename": filename,
             "voice": b"",
             "pending": audio_task,
+            "stream": stream,
         }
         return filename
 
@@ -839,9 +1176,14 @@ class SpeechManager:
 
         try:
             await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[cache_key] = filename
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+
+        self.file_cache.pop(cache_key, None)
+        self.file_cache[cache_key] = filename
+        self.file_cache_size[cache_key] = len(data)
+        await self._async_evict_files()
 
     async def _async_file_to_mem(self, cache_key: str) -> None:
         """Load voice from file cache into memory.
@@ -854,14 +1196,17 @@ class SpeechManager:
         voice_file = os.path.join(self.cache_dir, filename)
 
         def load_speech() -> bytes:
-            """Load a speech from filesystem."""
+            """Load a speech from filesystem and mark it as used."""
             with open(voice_file, "rb") as speech:
-                return speech.read()
+                data = speech.read()
+            os.utime(voice_file)
+            return data
 
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
+            self.file_cache.pop(cache_key, None)
+            self.file_cache_size.pop(cache_key, None)
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
         self._async_store_to_memcache(cache_key, filename, data)
@@ -870,19 +1215,45 @@ class SpeechManager:
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
-        """Store data to memcache and set timer to remove it."""
+        """Store data to memcache and evict the least recently used speech."""
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": data,
             "pending": None,
+            "stream": None,
         }
+        self._async_touch_mem(cache_key)
+
+        cache_size = sum(len(cached["voice"]) for cached in self.mem_cache.values())
+        # The speech just stored is kept, even when it is over the limits
+        for evict_key, cached in list(self.mem_cache.items())[:-1]:
+            if (
+                cache_size <= self.memory_max_size
+                and len(self.mem_cache) <= self.memory_max_files
+            ):
+                break
+            if cached["pending"] is None:
+                cache_size -= len(cached["voice"])
+                self._async_remove_from_mem(evict_key)
+
+    @callback
+    def _async_touch_mem(self, cache_key: str) -> None:
+        """Mark speech in memcache as used and restart the timer to remove it."""
+        cached = self.mem_cache[cache_key] = self.mem_cache.pop(cache_key)
+        if cache_key in self.file_cache:
+            self.file_cache[cache_key] = self.file_cache.pop(cache_key)
+        if (cancel := self._mem_cache_timers.pop(cache_key, None)) is not None:
+            cancel()
+        if cached["pending"] is not None:
+            return
 
         @callback
         def async_remove_from_mem(_: datetime) -> None:
             """Cleanup memcache."""
+            self._mem_cache_timers.pop(cache_key, None)
             self.mem_cache.pop(cache_key, None)
 
-        async_call_later(
+        self._mem_cache_timers[cache_key] = async_call_later(
             self.hass,
             self.time_memory,
             HassJob(
@@ -892,9 +1263,46 @@ class SpeechManager:
             ),
         )
 
+    @callback
+    def _async_remove_from_mem(self, cache_key: str) -> None:
+        """Remove speech from memcache."""
+        if (cancel := self._mem_cache_timers.pop(cache_key, None)) is not None:
+            cancel()
+        self.mem_cache.pop(cache_key, None)
+
     async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
 
+        This method is a coroutine.
+        """
+        cache_key = await self._async_load_tts(filename)
+        cached = self.mem_cache[cache_key]
+        content, _ = mimetypes.guess_type(filename)
+        if pending := cached["pending"]:
+            return content, await pending
+        return content, cached["voice"]
+
+    async def async_stream_tts(
+        self, filename: str
+    ) -> tuple[str | None, bytes | AsyncIterable[bytes]]:
+        """Read a voice file, as a stream of chunks while it is generated.
+
+        The voice is only streamed if the engine synthesizes it progressively.
+
+        This method is a coroutine.
+        """
+        cache_key = await self._async_load_tts(filename)
+        cached = self.mem_cache[cache_key]
+        content, _ = mimetypes.guess_type(filename)
+        if (stream := cached["stream"]) is not None:
+            return content, stream.async_iterate()
+        if pending := cached["pending"]:
+            return content, await pending
+        return content, cached["voice"]
+
+    async def _async_load_tts(self, filename: str) -> str:
+        """Load a voice file into memory and return its cache key.
+
         This method is a coroutine.
         """
         if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
@@ -906,18 +1314,14 @@ class SpeechManager:
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
-        if cache_key not in self.mem_cache:
-            if cache_key not in self.file_cache:
-                raise HomeAssistantError(f"{cache_key} not in cache!")
+        if cache_key in self.mem_cache:
+            self._async_touch_mem(cache_key)
+        elif cache_key in self.file_cache:
             await self._async_file_to_mem(cache_key)
+        else:
+            raise HomeAssistantError(f"{cache_key} not in cache!")
 
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
-
-        content, _ = mimetypes.guess_type(filename)
-        return content, cached["voice"]
+        return cache_key
 
     @staticmethod
     def write_tags(
@@ -982,20 +1386,24 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
-def _get_cache_files(cache_dir: str) -> dict[str, str]:
-    """Return a dict of given engine files."""
-    cache = {}
+def _get_cache_files(cache_dir: str) -> dict[str, tuple[str, int]]:
+    """Return the files and sizes of the engines, least recently used first."""
+    cache: list[tuple[float, str, str, int]] = []
 
-    folder_data = os.listdir(cache_dir)
-    for file_data in folder_data:
-        if (record := _RE_VOICE_FILE.match(file_data)) or (
-            record := _RE_LEGACY_VOICE_FILE.match(file_data)
-        ):
-            key = KEY_PATTERN.format(
-                record.group(1), record.group(2), record.group(3), record.group(4)
-            )
-            cache[key.lower()] = file_data.lower()
-    return cache
+    with os.scandir(cache_dir) as folder_data:
+        for file_data in folder_data:
+            if (record := _RE_VOICE_FILE.match(file_data.name)) or (
+                record := _RE_LEGACY_VOICE_FILE.match(file_data.name)
+            ):
+                key = KEY_PATTERN.format(
+                    record.group(1), record.group(2), record.group(3), record.group(4)
+                )
+                stat = file_data.stat()
+                cache.append(
+                    (stat.st_mtime, key.lower(), file_data.name.lower(), stat.st_size)
+                )
+    cache.sort()
+    return {key: (filename, size) for _, key, filename, size in cache}
 
 
 class TextToSpeechUrlView(HomeAssistantView):
@@ -1055,15 +1463,34 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
         try:
-            content, data = await self.tts.async_read_tts(filename)
+            content, audio = await self.tts.async_stream_tts(filename)
+            if isinstance(audio, bytes):
+                return web.Response(body=audio, content_type=content)
+            # Wait for the first chunk, an error before it is still a 404
+            chunks = aiter(audio)
+            chunk = await anext(chunks, b"")
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
-        return web.Response(body=data, content_type=content)
+        # Send the audio while the rest of it is generated
+        response = web.StreamResponse()
+        if content is not None:
+            response.content_type = content
+        await response.prepare(request)
+        try:
+            await response.write(chunk)
+            async for chunk in chunks:
+                await response.write(chunk)
+        except HomeAssistantError as err:
+            _LOGGER.error("Error on load tts: %s", err)
+            response.force_close()
+            return response
+        await response.write_eof()
+        return response
 
 
 @websocket_api.websocket_command(
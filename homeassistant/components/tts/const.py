@@ -1,5 +1,7 @@
 """Text-to-speech constants."""
 
+from collections.abc import AsyncIterable
+
 ATTR_CACHE = "cache"
 ATTR_LANGUAGE = "language"
 ATTR_MESSAGE = "message"
@@ -7,15 +9,22 @@ ATTR_OPTIONS = "options"
 
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
+CONF_CACHE_MAX_FILES = "cache_max_files"
+CONF_CACHE_MAX_SIZE = "cache_max_size"
 CONF_FIELDS = "fields"
 CONF_TIME_MEMORY = "time_memory"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
+DEFAULT_CACHE_MAX_FILES = 10000
+DEFAULT_CACHE_MAX_SIZE = 512  # MiB
 DEFAULT_TIME_MEMORY = 300
+DEFAULT_MEMORY_MAX_FILES = 100
+DEFAULT_MEMORY_MAX_SIZE = 32  # MiB
 
 DOMAIN = "tts"
 
 DATA_TTS_MANAGER = "tts_manager"
 
 type TtsAudioType = tuple[str | None, bytes | None]
+type TtsAudioStreamType = tuple[str | None, AsyncIterable[bytes] | None]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Coroutine, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -45,6 +45,7 @@ class ActiveConnection:
         "supported_features",
         "handlers",
         "binary_handlers",
+        "_drain",
     )
 
     def __init__(
@@ -54,6 +55,7 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        drain: Callable[[], Coroutine[Any, Any, None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -69,6 +71,7 @@ class ActiveConnection:
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        self._drain = drain
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -87,6 +90,15 @@ class ActiveConnection:
             description += " " + describe_request(request)
         return description
 
+    async def async_drain(self) -> None:
+        """Wait until the messages queued for the client are sent.
+
+        Commands streaming large responses can wait between messages to not
+        queue them faster than the client reads them.
+        """
+        if self._drain is not None:
+            await self._drain()
+
     def context(self, msg: dict[str, Any]) -> Context:
         """Return a context."""
         return Context(user_id=self.user.id)
@@ -81,6 +81,7 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_drain_futures",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -104,6 +105,7 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        self._drain_futures: list[asyncio.Future[None]] = []
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -140,6 +142,7 @@ class WebSocketHandler:
         try:
             while not wsock.closed:
                 if not message_queue:
+                    self._release_drain_futures()
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
 
@@ -171,6 +174,23 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._release_drain_futures()
+
+    async def _async_drain(self) -> None:
+        """Wait until the queued messages are sent to the client."""
+        if self._closing or not self._message_queue:
+            return
+        future: asyncio.Future[None] = self._loop.create_future()
+        self._drain_futures.append(future)
+        await future
+
+    @callback
+    def _release_drain_futures(self) -> None:
+        """Release the senders waiting for the queue to be sent."""
+        drain_futures, self._drain_futures = self._drain_futures, []
+        for future in drain_futures:
+            if not future.done():
+                future.set_result(None)
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -323,7 +343,13 @@ class WebSocketHandler:
 
         send_bytes_text = partial(writer.send, binary=False)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._async_drain,
         )
         connection = None
         disconnect_warn = None
@@ -62,6 +62,9 @@ from .loader import async_suggest_report_issue
 from .setup import (
     DATA_SETUP_DONE,
     SetupPhases,
+    async_config_entry_setup_is_dependency,
+    async_config_entry_setup_priority,
+    async_get_config_entry_setup_limiter,
     async_pause_setup,
     async_process_deps_reqs,
     async_setup_component,
@@ -601,7 +604,15 @@ class ConfigEntry(Generic[_DataT]):
             with async_start_setup(
                 hass, integration=self.domain, group=self.entry_id, phase=setup_phase
             ):
-                result = await component.async_setup_entry(hass, self)
+                if domain_is_integration and not (
+                    async_config_entry_setup_is_dependency(hass, self.domain)
+                ):
+                    async with async_get_config_entry_setup_limiter(hass).async_slot(
+                        hass, async_config_entry_setup_priority(integration)
+                    ):
+                        result = await component.async_setup_entry(hass, self)
+                else:
+                    result = await component.async_setup_entry(hass, self)
 
             if not isinstance(result, bool):
                 _LOGGER.error(  # type: ignore[unreachable]
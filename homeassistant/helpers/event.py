@@ -8,7 +8,7 @@ from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 import logging
 from random import randint
 import time
@@ -75,6 +75,7 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TIMER_WHEEL: HassKey[_TimerWheel] = HassKey("timer_wheel")
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -89,6 +90,10 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# Point in time trackers due within the same tick share an event loop timer,
+# which fires at the end of the tick.
+TIMER_WHEEL_TICK_MICROSECONDS = 10000
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _StateEventDataT = TypeVar("_StateEventDataT", bound=EventStateEventData)
 
@@ -1467,49 +1472,171 @@ def async_track_point_in_time(
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
 
 
-@dataclass(slots=True)
-class _TrackPointUTCTime:
-    hass: HomeAssistant
-    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
-    utc_point_in_time: datetime
-    expected_fire_timestamp: float
-    _cancel_callback: asyncio.TimerHandle | None = None
+class _TimerSlot:
+    """Point in time trackers which are due within the same tick."""
 
-    def async_attach(self) -> None:
-        """Initialize track job."""
-        loop = self.hass.loop
-        self._cancel_callback = loop.call_at(
-            loop.time() + self.expected_fire_timestamp - time.time(), self
-        )
+    __slots__ = ("hass", "wheel", "tick", "timestamp", "trackers", "handle")
+
+    def __init__(
+        self, hass: HomeAssistant, wheel: _TimerWheel, tick: int, timestamp: float
+    ) -> None:
+        """Initialize the slot and schedule it with the event loop."""
+        self.hass = hass
+        self.wheel = wheel
+        self.tick = tick
+        self.timestamp = timestamp
+        # Dict used as an insertion ordered set
+        self.trackers: dict[_TrackPointUTCTime, None] = {}
+        loop = hass.loop
+        self.handle = loop.call_at(loop.time() + timestamp - time.time(), self)
+
+    def __repr__(self) -> str:
+        """Return the representation of the slot."""
+        return f"<_TimerSlot timestamp={self.timestamp} trackers={len(self.trackers)}>"
 
     @callback
     def __call__(self) -> None:
-        """Call the action.
-
-        We implement this as __call__ so when debug logging logs the object
-        it shows the name of the job. This is especially helpful when asyncio
-        debug logging is enabled as we can see the name of the job that is
-        being called that is blocking the event loop.
-        """
+        """Fire all trackers in the slot."""
         # Depending on the available clock support (including timer hardware
         # and the OS kernel) it can happen that we fire a little bit too early
         # as measured by utcnow(). That is bad when callbacks have assumptions
         # about the current time. Thus, we rearm the timer for the remaining
         # time.
-        if (delta := (self.expected_fire_timestamp - time_tracker_timestamp())) > 0:
+        if (delta := (self.timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
             loop = self.hass.loop
-            self._cancel_callback = loop.call_at(loop.time() + delta, self)
+            self.handle = loop.call_at(loop.time() + delta, self)
             return
 
-        self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
+        self.wheel.async_remove_slot(self)
+        trackers = self.trackers
+        for tracker in list(trackers):
+            # A tracker may have been cancelled by an earlier tracker in the slot
+            if trackers.pop(tracker, False) is None:
+                tracker.async_run()
 
     @callback
     def async_cancel(self) -> None:
-        """Cancel the call_at."""
+        """Cancel the slot."""
+        self.handle.cancel()
+        self.wheel.async_remove_slot(self)
+
+
+class _TimerWheel:
+    """Schedule point in time trackers in slots per tick.
+
+    Trackers due within the same tick of TIMER_WHEEL_TICK_MICROSECONDS, like
+    time pattern triggers spread over the first half of a second, share a
+    single event loop timer firing at the end of the tick. Trackers are never
+    fired early and at most one tick late. Cancelling a tracker removes it
+    from its slot and the event loop timer is only cancelled once the slot is
+    empty.
+    """
+
+    __slots__ = ("hass", "slots")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self.hass = hass
+        self.slots: dict[int, _TimerSlot] = {}
+
+    @callback
+    def async_add(self, tracker: _TrackPointUTCTime) -> _TimerSlot:
+        """Add a tracker to the slot of the tick it is due in."""
+        # Round up to the end of the tick, in whole microseconds to not be
+        # off by a tick for timestamps on a tick boundary
+        tick = -(
+            -round(tracker.expected_fire_timestamp * 1_000_000)
+            // TIMER_WHEEL_TICK_MICROSECONDS
+        )
+        if (slot := self.slots.get(tick)) is None:
+            slot = self.slots[tick] = _TimerSlot(
+                self.hass, self, tick, tick * TIMER_WHEEL_TICK_MICROSECONDS / 1_000_000
+            )
+        slot.trackers[tracker] = None
+        return slot
+
+    @callback
+    def async_remove_slot(self, slot: _TimerSlot) -> None:
+        """Remove a slot which fired or no longer has trackers."""
+        if self.slots.get(slot.tick) is slot:
+            del self.slots[slot.tick]
+
+
+@callback
+def _async_get_timer_wheel(hass: HomeAssistant) -> _TimerWheel:
+    """Return the timer wheel."""
+    if (wheel := hass.data.get(_TIMER_WHEEL)) is None:
+        wheel = hass.data[_TIMER_WHEEL] = _TimerWheel(hass)
+    return wheel
+
+
+def _job_integration(job: HassJob[..., Any]) -> str:
+    """Return the integration or module which created a job."""
+    target: Any = job.target
+    while isinstance(target, partial):
+        target = target.func
+    # Helpers which schedule a point in time tracker on behalf of a job
+    if isinstance(
+        owner_job := getattr(getattr(target, "__self__", None), "job", None), HassJob
+    ):
+        return _job_integration(owner_job)
+    module: str = getattr(target, "__module__", None) or "unknown"
+    parts = module.split(".")
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    if parts[:2] == ["homeassistant", "components"] and len(parts) > 2:
+        return parts[2]
+    return module
+
+
+@callback
+def async_get_timer_counts(hass: HomeAssistant) -> dict[str, int]:
+    """Return the number of scheduled point in time trackers per integration."""
+    counts: defaultdict[str, int] = defaultdict(int)
+    if (wheel := hass.data.get(_TIMER_WHEEL)) is None:
+        return {}
+    for slot in wheel.slots.values():
+        for tracker in slot.trackers:
+            counts[_job_integration(tracker.job)] += 1
+    return dict(counts)
+
+
+@dataclass(slots=True, eq=False)
+class _TrackPointUTCTime:
+    hass: HomeAssistant
+    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    utc_point_in_time: datetime
+    expected_fire_timestamp: float
+    _slot: _TimerSlot | None = None
+
+    def async_attach(self) -> None:
+        """Initialize track job."""
+        self._slot = _async_get_timer_wheel(self.hass).async_add(self)
+
+    @callback
+    def async_run(self) -> None:
+        """Call the action.
+
+        Exceptions are logged with this object in the message, so the log shows
+        the name of the job which raised, as if it had been called directly by
+        the event loop.
+        """
+        try:
+            self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
+        except Exception as exc:  # noqa: BLE001
+            self.hass.loop.call_exception_handler(
+                {"message": f"Exception in callback {self!r}", "exception": exc}
+            )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Remove the tracker from its slot."""
         if TYPE_CHECKING:
-            assert self._cancel_callback is not None
-        self._cancel_callback.cancel()
+            assert self._slot is not None
+        slot = self._slot
+        if slot.trackers.pop(self, False) is None and not slot.trackers:
+            slot.async_cancel()
 
 
 @callback
@@ -1769,10 +1896,27 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+@lru_cache(maxsize=256)
+def _find_next_time_expression_time(
+    now: datetime,
+    tzinfo: Any,
+    fold: int,
+    time_match_expression: tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]],
+) -> datetime:
+    """Find the next datetime from now for which the time expression matches.
+
+    Cached since time trackers with the same pattern fire in the same second
+    and would otherwise each compute the same next time. The tzinfo and fold
+    are part of the key because datetimes in different timezones, or in both
+    folds of the hour repeated when DST ends, compare equal.
+    """
+    return dt_util.find_next_time_expression_time(now, *time_match_expression)
+
+
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
     hass: HomeAssistant
-    time_match_expression: tuple[list[int], list[int], list[int]]
+    time_match_expression: tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]
     microsecond: int
     local: bool
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
@@ -1796,8 +1940,11 @@ class _TrackUTCTimeChange:
     def _calculate_next(self, utc_now: datetime) -> datetime:
         """Calculate and set the next time the trigger should fire."""
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        return dt_util.find_next_time_expression_time(
-            localized_now, *self.time_match_expression
+        return _find_next_time_expression_time(
+            localized_now.replace(microsecond=0),
+            localized_now.tzinfo,
+            localized_now.fold,
+            self.time_match_expression,
         ).replace(microsecond=self.microsecond)
 
     @callback
@@ -1850,9 +1997,9 @@ def async_track_utc_time_change(
         return async_track_time_interval(hass, action, timedelta(seconds=1))
 
     job = HassJob(action, f"track time change {hour}:{minute}:{second} local={local}")
-    matching_seconds = dt_util.parse_time_expression(second, 0, 59)
-    matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
-    matching_hours = dt_util.parse_time_expression(hour, 0, 23)
+    matching_seconds = tuple(dt_util.parse_time_expression(second, 0, 59))
+    matching_minutes = tuple(dt_util.parse_time_expression(minute, 0, 59))
+    matching_hours = tuple(dt_util.parse_time_expression(hour, 0, 23))
     # Avoid aligning all time trackers to the same fraction of a second
     # since it can create a thundering herd problem
     # https://github.com/home-assistant/core/issues/82231
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Iterable
+from datetime import timedelta
 import logging
 from typing import Any, Literal, overload
 
+import orjson
+
 from homeassistant import config as conf_util
 from homeassistant.const import SERVICE_RELOAD
 from homeassistant.core import HomeAssistant, ServiceCall, callback
@@ -17,7 +20,9 @@ from homeassistant.setup import async_setup_component
 from .entity import Entity
 from .entity_component import EntityComponent
 from .entity_platform import EntityPlatform, async_get_platforms
+from .json import json_encoder_default
 from .service import async_register_admin_service
+from .template import Template
 from .typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -171,6 +176,39 @@ async def async_integration_yaml_config(
     )
 
 
+def config_hash(config: Any) -> int | None:
+    """Return a hash of a raw configuration which is stable within a run.
+
+    Used by integrations which diff their configuration on reload to find
+    unchanged items without comparing every item against every other item.
+    Validated configurations are hashed by the source of their templates and
+    the seconds of their time periods. Returns None if the configuration
+    can't be serialized, callers are then expected to fall back to comparing
+    the configurations directly.
+    """
+    if config is None:
+        return None
+    try:
+        return hash(
+            orjson.dumps(
+                config,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS,
+                default=_config_hash_default,
+            )
+        )
+    except TypeError:
+        return None
+
+
+def _config_hash_default(obj: Any) -> Any:
+    """Convert the objects of validated configurations for hashing."""
+    if isinstance(obj, Template):
+        return obj.template
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    return json_encoder_default(obj)
+
+
 @callback
 def async_get_platform_without_config_entry(
     hass: HomeAssistant, integration_name: str, integration_platform_name: str
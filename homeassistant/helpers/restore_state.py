@@ -96,6 +96,77 @@ class StoredState:
         )
 
 
+class _LazyStoredState(StoredState):
+    """Stored state loaded from storage, decoded when it is first accessed.
+
+    Most stored states are not restored before the next dump, those are
+    written back as they were loaded without creating State objects.
+    """
+
+    def __init__(self, json_dict: dict[str, Any]) -> None:
+        """Initialize a stored state from a dict loaded from storage."""
+        self._json_dict: dict[str, Any] | None = json_dict
+        self._state: State | None = None
+        self._extra_data: ExtraStoredData | None = None
+        self._last_seen: datetime | None = None
+
+    def _decode(self) -> None:
+        """Decode the state and the extra data."""
+        if (json_dict := self._json_dict) is None:
+            return
+        decoded = StoredState.from_dict(json_dict)
+        self._state = decoded.state
+        self._extra_data = decoded.extra_data
+        self._last_seen = decoded.last_seen
+        self._json_dict = None
+
+    @property
+    def state(self) -> State:
+        """Return the stored state."""
+        self._decode()
+        return cast(State, self._state)
+
+    @state.setter
+    def state(self, state: State) -> None:
+        """Set the stored state."""
+        self._decode()
+        self._state = state
+
+    @property
+    def extra_data(self) -> ExtraStoredData | None:
+        """Return the extra data."""
+        self._decode()
+        return self._extra_data
+
+    @extra_data.setter
+    def extra_data(self, extra_data: ExtraStoredData | None) -> None:
+        """Set the extra data."""
+        self._decode()
+        self._extra_data = extra_data
+
+    @property
+    def last_seen(self) -> datetime:
+        """Return when the state was last seen."""
+        if self._last_seen is None:
+            last_seen = cast(dict[str, Any], self._json_dict)["last_seen"]
+            if isinstance(last_seen, str):
+                last_seen = dt_util.parse_datetime(last_seen)
+            self._last_seen = last_seen
+        return cast(datetime, self._last_seen)
+
+    @last_seen.setter
+    def last_seen(self, last_seen: datetime) -> None:
+        """Set when the state was last seen."""
+        self._decode()
+        self._last_seen = last_seen
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the stored state to be JSON serialized."""
+        if (json_dict := self._json_dict) is not None:
+            return json_dict
+        return super().as_dict()
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -164,7 +235,7 @@ class RestoreStateData:
             self.last_states = {}
         else:
             self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+                item["state"]["entity_id"]: _LazyStoredState(item)
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
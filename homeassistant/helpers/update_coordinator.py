@@ -4,11 +4,13 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Generator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import cached_property
 import logging
-from random import randint
+from random import randint, random
 from time import monotonic
 from typing import Any, Generic, Protocol
 import urllib.error
@@ -18,14 +20,15 @@ import requests
 from typing_extensions import TypeVar
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.const import CONF_HOST, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
     ConfigEntryNotReady,
 )
 from homeassistant.util.dt import utcnow
+from homeassistant.util.hass_dict import HassKey
 
 from . import entity, event
 from .debounce import Debouncer
@@ -33,6 +36,19 @@ from .debounce import Debouncer
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+# Limits for refreshes scheduled by the update interval of coordinators with a
+# config entry, requested refreshes and the first refresh of a config entry
+# are not limited.
+MAX_CONCURRENT_SCHEDULED_REFRESHES_PER_INTEGRATION = 8
+MAX_CONCURRENT_SCHEDULED_REFRESHES_PER_HOST = 2
+# Number of consecutive failures after which the update interval backs off,
+# and the maximum factor the update interval is multiplied with.
+BACKOFF_AFTER_FAILURES = 3
+MAX_BACKOFF_FACTOR = 8
+# Refreshes scheduled while Home Assistant is starting are spread over half
+# the update interval, but at most this many seconds.
+MAX_STARTUP_REFRESH_JITTER = 30
+
 _DataT = TypeVar("_DataT", default=dict[str, Any])
 _DataUpdateCoordinatorT = TypeVar(
     "_DataUpdateCoordinatorT",
@@ -45,6 +61,124 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+@dataclass(slots=True)
+class RefreshStatistics:
+    """Statistics of the refreshes of a coordinator."""
+
+    refreshes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_duration: float | None = None
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    queued_refreshes: int = 0
+    last_queue_wait: float | None = None
+    max_queue_wait: float = 0.0
+    total_queue_wait: float = 0.0
+
+    @property
+    def mean_duration(self) -> float | None:
+        """Return the mean duration of a refresh."""
+        if not self.refreshes:
+            return None
+        return self.total_duration / self.refreshes
+
+    @property
+    def mean_queue_wait(self) -> float | None:
+        """Return the mean time a scheduled refresh waited for a refresh slot."""
+        if not self.queued_refreshes:
+            return None
+        return self.total_queue_wait / self.queued_refreshes
+
+    @callback
+    def async_record_queue_wait(self, wait: float) -> None:
+        """Record the time a scheduled refresh waited for a refresh slot."""
+        self.queued_refreshes += 1
+        self.last_queue_wait = wait
+        self.total_queue_wait += wait
+        self.max_queue_wait = max(self.max_queue_wait, wait)
+
+    @callback
+    def async_record(self, duration: float, success: bool) -> None:
+        """Record a finished refresh."""
+        self.refreshes += 1
+        self.last_duration = duration
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+        if success:
+            self.consecutive_failures = 0
+        else:
+            self.failures += 1
+            self.consecutive_failures += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "last_duration": self.last_duration,
+            "mean_duration": self.mean_duration,
+            "max_duration": self.max_duration,
+            "last_queue_wait": self.last_queue_wait,
+            "mean_queue_wait": self.mean_queue_wait,
+            "max_queue_wait": self.max_queue_wait,
+        }
+
+
+class _RefreshScheduler:
+    """Limit how many scheduled refreshes run concurrently.
+
+    Coordinators are limited per integration of their config entry. The
+    coordinators which connect to the same host, as configured in their
+    config entry, are additionally limited per host.
+    """
+
+    __slots__ = ("coordinators", "_domain_semaphores", "_host_semaphores")
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self.coordinators: set[DataUpdateCoordinator[Any]] = set()
+        self._domain_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def async_limit(
+        self, domain: str | None, host: str | None
+    ) -> AsyncGenerator[None]:
+        """Wait for a free refresh slot."""
+        if domain is None:
+            yield
+            return
+        if (domain_semaphore := self._domain_semaphores.get(domain)) is None:
+            domain_semaphore = self._domain_semaphores[domain] = asyncio.Semaphore(
+                MAX_CONCURRENT_SCHEDULED_REFRESHES_PER_INTEGRATION
+            )
+        if host is None:
+            async with domain_semaphore:
+                yield
+            return
+        if (host_semaphore := self._host_semaphores.get(host)) is None:
+            host_semaphore = self._host_semaphores[host] = asyncio.Semaphore(
+                MAX_CONCURRENT_SCHEDULED_REFRESHES_PER_HOST
+            )
+        async with host_semaphore, domain_semaphore:
+            yield
+
+
+_REFRESH_SCHEDULER: HassKey[_RefreshScheduler] = HassKey(
+    "update_coordinator_refresh_scheduler"
+)
+
+
+@callback
+def _async_get_refresh_scheduler(hass: HomeAssistant) -> _RefreshScheduler:
+    """Return the refresh scheduler."""
+    if (scheduler := hass.data.get(_REFRESH_SCHEDULER)) is None:
+        scheduler = hass.data[_REFRESH_SCHEDULER] = _RefreshScheduler()
+    return scheduler
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -61,6 +195,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Unless :attr:`backoff_on_failure` is set to ``False``, the update interval
+    doubles for each consecutive failed refresh after ``BACKOFF_AFTER_FAILURES``
+    failures, up to ``MAX_BACKOFF_FACTOR`` times the update interval, until
+    a refresh succeeds again.
     """
 
     def __init__(
@@ -74,6 +213,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        backoff_on_failure: bool = True,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -86,6 +226,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.backoff_on_failure = backoff_on_failure
+        self.refresh_statistics = RefreshStatistics()
+        self._refresh_domain: str | None = None
+        self._refresh_host: str | None = None
+        if self.config_entry:
+            self._refresh_domain = self.config_entry.domain
+            if isinstance(host := self.config_entry.data.get(CONF_HOST), str):
+                self._refresh_host = host
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -157,6 +305,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         # This is the first listener, set up interval.
         if schedule_refresh:
+            _async_get_refresh_scheduler(self.hass).coordinators.add(self)
             self._schedule_refresh()
 
         return remove_listener
@@ -170,6 +319,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
         self._shutdown_requested = True
+        _async_get_refresh_scheduler(self.hass).coordinators.discard(self)
         self._async_unsub_refresh()
         self._async_unsub_shutdown()
         self._debounced_refresh.async_shutdown()
@@ -177,6 +327,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     @callback
     def _unschedule_refresh(self) -> None:
         """Unschedule any pending refresh since there is no longer any listeners."""
+        _async_get_refresh_scheduler(self.hass).coordinators.discard(self)
         self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
 
@@ -228,9 +379,24 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         hass = self.hass
         loop = hass.loop
 
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
-        )
+        interval = self._update_interval_seconds
+        if (
+            self.backoff_on_failure
+            and (failures := self.refresh_statistics.consecutive_failures)
+            >= BACKOFF_AFTER_FAILURES
+        ):
+            # Jitter the backed off interval so coordinators which fail
+            # together, like when a shared endpoint is down, drift apart.
+            factor = min(
+                2 ** (failures - BACKOFF_AFTER_FAILURES + 1), MAX_BACKOFF_FACTOR
+            )
+            interval *= factor / 2 * (1 + random())
+        elif hass.state is not CoreState.running:
+            # Coordinators set up while Home Assistant is starting would
+            # otherwise all refresh at the same time.
+            interval += random() * min(interval / 2, MAX_STARTUP_REFRESH_JITTER)
+
+        next_refresh = int(loop.time()) + self._microsecond + interval
         self._unsub_refresh = loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
         ).cancel
@@ -255,7 +421,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        queued = monotonic()
+        async with _async_get_refresh_scheduler(self.hass).async_limit(
+            self._refresh_domain, self._refresh_host
+        ):
+            self.refresh_statistics.async_record_queue_wait(monotonic() - queued)
+            await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
@@ -343,9 +514,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
-            start = monotonic()
-
+        start = monotonic()
         auth_failed = False
         previous_update_success = self.last_update_success
         previous_data = self.data
@@ -430,11 +599,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
-            if log_timing:
+            duration = monotonic() - start
+            self.refresh_statistics.async_record(duration, self.last_update_success)
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
                     self.name,
-                    monotonic() - start,  # pylint: disable=possibly-used-before-assignment
+                    duration,
                     self.last_update_success,
                 )
             if not auth_failed and self._listeners and not self.hass.is_stopping:
@@ -478,6 +649,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         self.data = data
         self.last_update_success = True
+        self.refresh_statistics.consecutive_failures = 0
         self.logger.debug(
             "Manually updated %s data",
             self.name,
@@ -501,6 +673,39 @@ class TimestampDataUpdateCoordinator(DataUpdateCoordinator[_DataT]):
             self.last_update_success_time = utcnow()
 
 
+@callback
+def async_get_refresh_statistics(
+    hass: HomeAssistant, config_entry_id: str | None = None
+) -> list[dict[str, Any]]:
+    """Return the refresh statistics of coordinators with listeners.
+
+    If a config entry id is passed, only the coordinators of that config entry
+    are included.
+    """
+    if (scheduler := hass.data.get(_REFRESH_SCHEDULER)) is None:
+        return []
+    return [
+        {
+            "name": coordinator.name,
+            "config_entry_id": (
+                coordinator.config_entry.entry_id if coordinator.config_entry else None
+            ),
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            **coordinator.refresh_statistics.as_dict(),
+        }
+        for coordinator in scheduler.coordinators
+        if config_entry_id is None
+        or (
+            coordinator.config_entry is not None
+            and coordinator.config_entry.entry_id == config_entry_id
+        )
+    ]
+
+
 class BaseCoordinatorEntity[
     _BaseDataUpdateCoordinatorT: BaseDataUpdateCoordinatorProtocol
 ](entity.Entity):
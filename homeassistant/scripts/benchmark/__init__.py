@@ -6,6 +6,7 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import logging
 from timeit import default_timer as timer
 
@@ -17,6 +18,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +310,205 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def statistics_sensor_large_buffer(hass):
+    """Add 100k samples to statistics sensors with a 10k samples buffer."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics.sensor import StatisticsSensor
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    await dr.async_load(hass)
+    await er.async_load(hass)
+
+    samples = 10**5
+    sensors = [
+        StatisticsSensor(
+            hass,
+            "sensor.source",
+            characteristic,
+            None,
+            characteristic,
+            10**4,
+            None,
+            False,
+            2,
+            50,
+        )
+        for characteristic in (
+            "average_linear",
+            "mean",
+            "median",
+            "percentile",
+            "standard_deviation",
+            "sum_differences",
+        )
+    ]
+    now = dt_util.utcnow()
+    states = [
+        core.State(
+            "sensor.source",
+            str((idx * 7919) % 1000 / 10),
+            last_updated=now + timedelta(seconds=idx),
+        )
+        for idx in range(samples)
+    ]
+
+    start = timer()
+
+    for state in states:
+        for sensor in sensors:
+            sensor._add_state_to_queue(state)  # noqa: SLF001
+            sensor._update_value()  # noqa: SLF001
+
+    return timer() - start
+
+
+@benchmark
+async def conversation_recognize(hass):
+    """Recognize a corpus of utterances with 3000 exposed entity names."""
+    # pylint: disable-next=import-outside-toplevel
+    from hassil.intents import TextSlotList
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.conversation.default_agent import DefaultAgent
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.conversation.models import ConversationInput
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.conversation.sentence_index import SlotListIndex
+
+    areas = [
+        "kitchen",
+        "bedroom",
+        "living room",
+        "office",
+        "garage",
+        "hallway",
+        "bathroom",
+        "basement",
+        "attic",
+        "porch",
+    ]
+    devices = [
+        "light",
+        "lamp",
+        "fan",
+        "heater",
+        "outlet",
+        "switch",
+        "speaker",
+        "tv",
+        "blinds",
+        "door",
+    ]
+    names = [
+        f"{area} {device} {idx}"
+        for idx in range(30)
+        for area in areas
+        for device in devices
+    ]
+    slot_lists = {
+        "area": TextSlotList.from_tuples(
+            [(area, area) for area in areas], allow_template=False
+        ),
+        "name": TextSlotList.from_tuples(
+            [(name, name, {"domain": "light"}) for name in names],
+            allow_template=False,
+        ),
+        "floor": TextSlotList.from_tuples(
+            [("first floor", "first floor")], allow_template=False
+        ),
+    }
+    corpus = [
+        "turn on the kitchen light 17",
+        "turn off the lights in the bedroom",
+        "what is the temperature in the living room",
+        "set office lamp 3 brightness to 50%",
+        "is the garage door 2 open",
+        "what time is it",
+        "close the blinds in the bedroom",
+        "how many lights are on in the kitchen",
+        "turn off all the lights",
+        "set the bedroom fan 4 to 30 percent",
+        "what's the weather like",
+        "set a timer for 5 minutes",
+        "turn on the lights on the first floor",
+        "turn off the attic",
+    ]
+
+    agent = DefaultAgent(hass, {})
+    lang_intents = agent._load_intents("en")  # noqa: SLF001
+    slot_list_index = SlotListIndex(slot_lists)
+
+    start = timer()
+
+    for text in corpus:
+        agent._recognize(  # noqa: SLF001
+            ConversationInput(text, core.Context(), None, None, "en"),
+            lang_intents,
+            slot_lists,
+            None,
+            "en",
+            slot_list_index,
+        )
+
+    return timer() - start
+
+
+@benchmark
+async def assist_pipeline_audio(hass):
+    """Process 30 seconds of audio from 8 satellites like an Assist pipeline."""
+    import array  # pylint: disable=import-outside-toplevel
+    import math  # pylint: disable=import-outside-toplevel
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.assist_pipeline.audio_enhancer import MicroVadEnhancer
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.assist_pipeline.const import (
+        BYTES_PER_CHUNK,
+        MS_PER_CHUNK,
+        SAMPLE_RATE,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.assist_pipeline.pipeline import _multiply_volume
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.assist_pipeline.vad import (
+        AudioBuffer,
+        VoiceCommandSegmenter,
+        chunk_samples,
+    )
+
+    satellites = 8
+    # A tone in the chunks of 1024 samples satellites usually send
+    samples = array.array(
+        "h",
+        (
+            int(8000 * math.sin(2 * math.pi * 440 * idx / SAMPLE_RATE))
+            for idx in range(30 * SAMPLE_RATE)
+        ),
+    ).tobytes()
+    chunks = [samples[idx : idx + 2048] for idx in range(0, len(samples), 2048)]
+
+    start = timer()
+
+    for _ in range(satellites):
+        chunking_buffer = AudioBuffer(BYTES_PER_CHUNK)
+        enhancer = MicroVadEnhancer(0, 0, True)
+        segmenter = VoiceCommandSegmenter(timeout_seconds=60)
+        timestamp_ms = 0
+        for chunk in chunks:
+            chunk = _multiply_volume(chunk, 2.0)
+            for sub_chunk in chunk_samples(chunk, BYTES_PER_CHUNK, chunking_buffer):
+                enhanced = enhancer.enhance_chunk(sub_chunk, timestamp_ms)
+                segmenter.process(MS_PER_CHUNK / 1000, enhanced.is_speech)
+                timestamp_ms += MS_PER_CHUNK
+
+    return timer() - start
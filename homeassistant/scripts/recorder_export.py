@@ -0,0 +1,162 @@
+"""Script to export the states or statistics of the recorder database."""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterator
+from datetime import datetime
+from functools import partial
+import gzip
+import importlib.util
+import os
+from typing import Any
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from homeassistant.components.recorder import DEFAULT_DB_FILE, DEFAULT_URL
+from homeassistant.components.recorder.export import (
+    DEFAULT_CHUNK_SIZE,
+    STATE_COLUMNS,
+    STATISTIC_COLUMNS,
+    ColumnType,
+    export_states,
+    export_statistics,
+)
+from homeassistant.config import get_default_config_dir
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import dt as dt_util
+
+# mypy: allow-untyped-calls, allow-untyped-defs
+
+FORMATS = ("parquet", "arrow", "jsonl")
+
+
+def _datetime(value: str) -> datetime:
+    """Parse a date and time argument."""
+    if (parsed := dt_util.parse_datetime(value)) is None:
+        raise argparse.ArgumentTypeError(f"Invalid date and time: {value}")
+    return dt_util.as_utc(parsed)
+
+
+def run(args: list[str]) -> int:
+    """Export states or statistics to a columnar file."""
+    parser = argparse.ArgumentParser(
+        description="Export the states or statistics of the recorder database"
+    )
+    parser.add_argument("--script", choices=["recorder_export"])
+    parser.add_argument(
+        "-c",
+        "--config",
+        default=get_default_config_dir(),
+        help="Directory that contains the Home Assistant configuration",
+    )
+    parser.add_argument(
+        "--db-url",
+        help="Database URL, defaults to the database in the configuration directory",
+    )
+    parser.add_argument(
+        "--start", type=_datetime, required=True, help="Start of the period"
+    )
+    parser.add_argument("--end", type=_datetime, help="End of the period")
+    parser.add_argument(
+        "--statistics",
+        choices=["5minute", "hour"],
+        help="Export the short or long term statistics instead of the states",
+    )
+    parser.add_argument(
+        "--id",
+        action="append",
+        dest="ids",
+        help="Entity or statistic id to export, can be repeated",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        help="File format, parquet if pyarrow is installed and jsonl otherwise",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Number of rows fetched and written at a time",
+    )
+    parser.add_argument("output", help="File to write the export to")
+    parsed = parser.parse_args(args)
+
+    file_format = parsed.format
+    if file_format is None:
+        file_format = (
+            "parquet" if importlib.util.find_spec("pyarrow") is not None else "jsonl"
+        )
+    db_url = parsed.db_url or DEFAULT_URL.format(
+        hass_config_path=os.path.join(parsed.config, DEFAULT_DB_FILE)
+    )
+
+    engine = create_engine(db_url)
+    sessions = partial(Session, engine)
+    if parsed.statistics:
+        columns = STATISTIC_COLUMNS
+        chunks = export_statistics(
+            sessions,
+            parsed.start,
+            parsed.end,
+            parsed.ids,
+            parsed.statistics,
+            parsed.chunk_size,
+        )
+    else:
+        columns = STATE_COLUMNS
+        chunks = export_states(
+            sessions, parsed.start, parsed.end, parsed.ids, parsed.chunk_size
+        )
+    if file_format == "jsonl":
+        rows = _write_jsonl(chunks, parsed.output)
+    else:
+        rows = _write_arrow(chunks, columns, parsed.output, file_format)
+    engine.dispose()
+
+    print(f"Exported {rows} rows to {parsed.output}")  # noqa: T201
+    return 0
+
+
+def _write_jsonl(chunks: Iterator[dict[str, list[Any]]], path: str) -> int:
+    """Write one gzip compressed JSON object of columns per line."""
+    rows = 0
+    with gzip.open(path, "wb") as file:
+        for chunk in chunks:
+            file.write(json_bytes(chunk) + b"\n")
+            rows += len(next(iter(chunk.values())))
+    return rows
+
+
+def _write_arrow(
+    chunks: Iterator[dict[str, list[Any]]],
+    columns: dict[str, ColumnType],
+    path: str,
+    file_format: str,
+) -> int:
+    """Write the chunks as record batches of a Parquet or Arrow IPC file."""
+    # pylint: disable-next=import-outside-toplevel
+    import pyarrow as pa
+
+    schema = pa.schema(
+        [
+            (name, pa.float64() if column_type == "float" else pa.string())
+            for name, column_type in columns.items()
+        ]
+    )
+    if file_format == "parquet":
+        # pylint: disable-next=import-outside-toplevel
+        import pyarrow.parquet as pq
+
+        writer = pq.ParquetWriter(path, schema)
+    else:
+        writer = pa.ipc.new_file(path, schema)
+    rows = 0
+    with writer:
+        for chunk in chunks:
+            table = pa.Table.from_pydict(chunk, schema=schema)
+            writer.write_table(table)
+            rows += table.num_rows
+    return rows
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Awaitable, Callable, Generator, Mapping
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Mapping
 import contextlib
 import contextvars
 from enum import StrEnum
 from functools import partial
+from heapq import heappop, heappush
+from itertools import count
 import logging.handlers
 import time
 from types import ModuleType
@@ -39,6 +41,11 @@ current_setup_group: contextvars.ContextVar[tuple[str, str | None] | None] = (
     contextvars.ContextVar("current_setup_group", default=None)
 )
 
+# Set while a config entry setup holds a slot of the config entry setup limiter
+_config_entry_setup_slot_held: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "config_entry_setup_slot_held", default=False
+)
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -74,6 +81,20 @@ DATA_SETUP_TIME: HassKey[
 
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
+# DATA_CONFIG_ENTRY_SETUP_LIMITER limits how many config entries are
+# setting up at the same time.
+DATA_CONFIG_ENTRY_SETUP_LIMITER: HassKey[ConfigEntrySetupLimiter] = HassKey(
+    "config_entry_setup_limiter"
+)
+
+# Maximum number of config entries which are setting up at the same time
+MAX_CONCURRENT_CONFIG_ENTRY_SETUPS = 24
+
+# Config entries of integrations with a lower priority are set up first
+# when config entries are waiting for a setup slot.
+CONFIG_ENTRY_SETUP_PRIORITY_LOCAL = 0
+CONFIG_ENTRY_SETUP_PRIORITY_CLOUD = 1
+
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
     "bootstrap_persistent_errors"
 )
@@ -677,6 +698,107 @@ class SetupPhases(StrEnum):
     """Wait time for the platforms to import."""
     WAIT_IMPORT_PACKAGES = "wait_import_packages"
     """Wait time for the packages to import."""
+    WAIT_CONFIG_ENTRY_SETUP_SLOT = "wait_config_entry_setup_slot"
+    """Wait time for a free config entry setup slot."""
+
+
+class ConfigEntrySetupLimiter:
+    """Limit how many config entries are setting up at the same time.
+
+    Config entries waiting for a slot are set up in order of priority, config
+    entries of local integrations are set up before those of cloud integrations.
+
+    Config entries which are set up while setting up another config entry,
+    for example because the other config entry sets up a dependency, don't
+    wait for a slot as that could deadlock. Neither do config entries of
+    integrations other integrations depend on, see
+    async_config_entry_setup_is_dependency.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the limiter."""
+        self.limit = limit
+        self.active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = count()
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of config entries waiting for a slot."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    @contextlib.asynccontextmanager
+    async def async_slot(
+        self, hass: core.HomeAssistant, priority: int
+    ) -> AsyncGenerator[None]:
+        """Hold a setup slot, waiting for one to become free if needed."""
+        if _config_entry_setup_slot_held.get():
+            yield
+            return
+
+        if self.active < self.limit:
+            self.active += 1
+        else:
+            future: asyncio.Future[None] = hass.loop.create_future()
+            heappush(self._waiters, (priority, next(self._counter), future))
+            try:
+                with async_pause_setup(hass, SetupPhases.WAIT_CONFIG_ENTRY_SETUP_SLOT):
+                    await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The slot was handed over before we were cancelled
+                    self._release()
+                raise
+
+        token = _config_entry_setup_slot_held.set(True)
+        try:
+            yield
+        finally:
+            _config_entry_setup_slot_held.reset(token)
+            self._release()
+
+    def _release(self) -> None:
+        """Hand the slot over to the next waiter or free it."""
+        while self._waiters:
+            _, _, future = heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+
+@singleton.singleton(DATA_CONFIG_ENTRY_SETUP_LIMITER)
+def async_get_config_entry_setup_limiter(
+    hass: core.HomeAssistant,
+) -> ConfigEntrySetupLimiter:
+    """Return the config entry setup limiter."""
+    return ConfigEntrySetupLimiter(MAX_CONCURRENT_CONFIG_ENTRY_SETUPS)
+
+
+def async_config_entry_setup_priority(integration: loader.Integration) -> int:
+    """Return the priority of setting up config entries of an integration."""
+    iot_class = integration.manifest.get("iot_class") or ""
+    if iot_class.startswith("cloud"):
+        return CONFIG_ENTRY_SETUP_PRIORITY_CLOUD
+    return CONFIG_ENTRY_SETUP_PRIORITY_LOCAL
+
+
+@core.callback
+def async_config_entry_setup_is_dependency(
+    hass: core.HomeAssistant, domain: str
+) -> bool:
+    """Return True if a loaded integration depends on an integration.
+
+    Config entries of such integrations are set up without a slot. The config
+    entries depending on them may wait for them to be set up in another task,
+    for example with async_setup_component, while holding all slots.
+    """
+    for int_or_fut in hass.data[loader.DATA_INTEGRATIONS].values():
+        if type(int_or_fut) is loader.Integration and (
+            domain in int_or_fut.dependencies or domain in int_or_fut.after_dependencies
+        ):
+            return True
+    return False
 
 
 @singleton.singleton(DATA_SETUP_STARTED)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import bisect
+from collections.abc import Sequence
 from contextlib import suppress
 import datetime as dt
 from functools import lru_cache, partial
@@ -414,7 +415,7 @@ def _dst_offset_diff(dattim: dt.datetime) -> dt.timedelta:
     ).utcoffset()
 
 
-def _lower_bound(arr: list[int], cmp: int) -> int | None:
+def _lower_bound(arr: Sequence[int], cmp: int) -> int | None:
     """Return the first value in arr greater or equal to cmp.
 
     Return None if no such value exists.
@@ -426,9 +427,9 @@ def _lower_bound(arr: list[int], cmp: int) -> int | None:
 
 def find_next_time_expression_time(
     now: dt.datetime,  # pylint: disable=redefined-outer-name
-    seconds: list[int],
-    minutes: list[int],
-    hours: list[int],
+    seconds: Sequence[int],
+    minutes: Sequence[int],
+    hours: Sequence[int],
 ) -> dt.datetime:
     """Find the next datetime from now for which the time expression matches.
 
@@ -85,6 +85,62 @@ async def test_pipeline_from_audio_stream_auto(
     assert mock_stt_provider.received[1].startswith(b"part2")
 
 
+async def test_pipeline_from_audio_stream_stt_engine_slot(
+    hass: HomeAssistant,
+    mock_stt_provider: MockSttProvider,
+    init_components,
+) -> None:
+    """Test speech-to-text only waits for its engine after the voice command."""
+    scheduler = hass.data[DOMAIN].scheduler
+    scheduler.async_set_concurrency({"test": 1})
+    release = await scheduler.async_acquire(
+        "other_pipeline", assist_pipeline.PipelineStage.STT, "test"
+    )
+
+    events: list[assist_pipeline.PipelineEvent] = []
+
+    async def audio_data():
+        yield make_10ms_chunk(b"part1")
+        yield make_10ms_chunk(b"part2")
+        yield b""
+
+    pipeline_task = asyncio.create_task(
+        assist_pipeline.async_pipeline_from_audio_stream(
+            hass,
+            context=Context(),
+            event_callback=events.append,
+            stt_metadata=stt.SpeechMetadata(
+                language="",
+                format=stt.AudioFormats.WAV,
+                codec=stt.AudioCodecs.PCM,
+                bit_rate=stt.AudioBitRates.BITRATE_16,
+                sample_rate=stt.AudioSampleRates.SAMPLERATE_16000,
+                channel=stt.AudioChannels.CHANNEL_MONO,
+            ),
+            stt_stream=audio_data(),
+            audio_settings=assist_pipeline.AudioSettings(is_vad_enabled=False),
+        )
+    )
+    async with asyncio.timeout(1):
+        while not scheduler.queues["test"].waiting:
+            await asyncio.sleep(0)
+
+    # The whole voice command was passed on while the engine was busy
+    assert len(mock_stt_provider.received) == 2
+    assert not any(
+        event.type == assist_pipeline.PipelineEventType.STT_END for event in events
+    )
+
+    release()
+    await pipeline_task
+    assert any(
+        event.type == assist_pipeline.PipelineEventType.STT_END for event in events
+    )
+    stt_latency = scheduler.latency[events[0].data["pipeline"]]["stt"]
+    assert stt_latency.queued.count == 1
+    assert stt_latency.processing.count == 1
+
+
 async def test_pipeline_from_audio_stream_legacy(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
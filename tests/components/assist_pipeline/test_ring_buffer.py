@@ -37,3 +37,23 @@ def test_ring_buffer_put_too_large() -> None:
     assert len(rb) == 10
     assert rb.pos == 2
     assert rb.getvalue() == bytes([3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
+
+
+def test_ring_buffer_put_not_full() -> None:
+    """Test putting data past the middle of a buffer that is not full."""
+    rb = RingBuffer(10)
+    rb.put(bytes([1, 2, 3]))
+    rb.put(bytes([4, 5, 6, 7]))
+    assert len(rb) == 7
+    assert rb.pos == 7
+    assert rb.getvalue() == bytes([1, 2, 3, 4, 5, 6, 7])
+
+
+def test_ring_buffer_put_much_too_large() -> None:
+    """Test putting data more than twice as large as the buffer."""
+    rb = RingBuffer(10)
+    rb.put(bytes([1, 2, 3]))
+    rb.put(bytes(range(4, 29)))
+    assert len(rb) == 10
+    assert rb.pos == 8
+    assert rb.getvalue() == bytes(range(19, 29))
@@ -0,0 +1,145 @@
+"""Tests for the scheduling of pipeline stages."""
+
+import asyncio
+
+import pytest
+
+from homeassistant.components.assist_pipeline.scheduler import (
+    LatencyHistogram,
+    StageScheduler,
+)
+
+
+def test_latency_histogram() -> None:
+    """Test latencies are counted in their buckets."""
+    histogram = LatencyHistogram(buckets=(0.5, 1.0))
+    histogram.add(0.1)
+    histogram.add(0.5)
+    histogram.add(0.75)
+    histogram.add(2.0)
+
+    assert histogram.as_dict() == {
+        "buckets": [0.5, 1.0],
+        "counts": [2, 1, 1],
+        "count": 4,
+        "sum": 3.35,
+    }
+
+
+async def test_unlimited_concurrency() -> None:
+    """Test engines without a configured concurrency never make stages wait."""
+    scheduler = StageScheduler()
+    releases = [
+        await scheduler.async_acquire("pipeline", "stt", "stt.engine") for _ in range(5)
+    ]
+    assert scheduler.queues["stt.engine"].active == 5
+
+    for release in releases:
+        release()
+    assert scheduler.queues["stt.engine"].active == 0
+
+    latency = scheduler.latency["pipeline"]["stt"]
+    assert latency.queued.count == 5
+    assert latency.processing.count == 5
+
+
+async def test_priority() -> None:
+    """Test waiting stages get the engine by priority, then in order."""
+    scheduler = StageScheduler()
+    scheduler.async_set_concurrency({"conversation.engine": 1})
+    release = await scheduler.async_acquire("pipeline", "intent", "conversation.engine")
+
+    order: list[str] = []
+
+    async def process(name: str, priority: int) -> None:
+        async with scheduler.async_slot(
+            "pipeline", "intent", "conversation.engine", priority
+        ):
+            order.append(name)
+
+    tasks = [
+        asyncio.create_task(process("low", 0)),
+        asyncio.create_task(process("high", 10)),
+        asyncio.create_task(process("low 2", 0)),
+        asyncio.create_task(process("medium", 5)),
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queues["conversation.engine"].waiting == 4
+    assert not order
+
+    release()
+    await asyncio.gather(*tasks)
+    assert order == ["high", "medium", "low", "low 2"]
+    assert scheduler.queues["conversation.engine"].active == 0
+    assert scheduler.latency["pipeline"]["intent"].queued.count == 5
+
+
+async def test_cancel_waiting() -> None:
+    """Test a cancelled stage leaves the queue without holding the engine."""
+    scheduler = StageScheduler()
+    scheduler.async_set_concurrency({"tts.engine": 1})
+    release = await scheduler.async_acquire("pipeline", "tts", "tts.engine")
+
+    waiting = asyncio.create_task(
+        scheduler.async_acquire("pipeline", "tts", "tts.engine")
+    )
+    await asyncio.sleep(0)
+    assert scheduler.queues["tts.engine"].waiting == 1
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert scheduler.queues["tts.engine"].waiting == 0
+
+    release()
+    assert scheduler.queues["tts.engine"].active == 0
+
+    # Releasing twice has no effect
+    release()
+    assert scheduler.queues["tts.engine"].active == 0
+    assert scheduler.latency["pipeline"]["tts"].processing.count == 1
+
+
+async def test_cancel_after_handover() -> None:
+    """Test the engine is passed on when it was handed to a cancelled stage."""
+    scheduler = StageScheduler()
+    scheduler.async_set_concurrency({"tts.engine": 1})
+    release = await scheduler.async_acquire("pipeline", "tts", "tts.engine")
+
+    first = asyncio.create_task(
+        scheduler.async_acquire("pipeline", "tts", "tts.engine")
+    )
+    second = asyncio.create_task(
+        scheduler.async_acquire("pipeline", "tts", "tts.engine")
+    )
+    await asyncio.sleep(0)
+
+    # The engine is handed to the first stage, which is cancelled before it runs
+    release()
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    (await second)()
+    assert scheduler.queues["tts.engine"].active == 0
+    assert scheduler.queues["tts.engine"].waiting == 0
+
+
+async def test_set_concurrency_starts_waiting() -> None:
+    """Test raising the concurrency starts waiting stages."""
+    scheduler = StageScheduler()
+    scheduler.async_set_concurrency({"stt.engine": 1})
+    release = await scheduler.async_acquire("pipeline", "stt", "stt.engine")
+
+    waiting = asyncio.create_task(
+        scheduler.async_acquire("other_pipeline", "stt", "stt.engine")
+    )
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    scheduler.async_set_concurrency({"stt.engine": 2})
+    (await waiting)()
+    release()
+
+    assert scheduler.queues["stt.engine"].active == 0
+    assert set(scheduler.latency) == {"pipeline", "other_pipeline"}
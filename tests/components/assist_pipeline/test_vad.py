@@ -105,3 +105,15 @@ def test_chunk_samples_leftover() -> None:
 
     assert len(chunks) == 1
     assert leftover_chunk_buffer.bytes() == bytes([5, 6])
+
+
+def test_chunk_samples_full_chunk() -> None:
+    """Test that chunk_samples passes on a full chunk without copying it."""
+    bytes_per_chunk = 5
+    samples = bytes([1, 2, 3, 4, 5])
+    leftover_chunk_buffer = AudioBuffer(bytes_per_chunk)
+    chunks = list(chunk_samples(samples, bytes_per_chunk, leftover_chunk_buffer))
+
+    assert len(chunks) == 1
+    assert chunks[0] is samples
+    assert not leftover_chunk_buffer
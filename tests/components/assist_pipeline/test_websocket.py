@@ -1641,6 +1641,49 @@ async def test_pipeline_debug_list_runs_wrong_pipeline(
     assert msg["result"] == {"pipeline_runs": []}
 
 
+async def test_pipeline_debug_latency(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    init_components,
+) -> None:
+    """Test getting the latency histograms of the stages of a pipeline."""
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {
+            "type": "assist_pipeline/run",
+            "start_stage": "intent",
+            "end_stage": "intent",
+            "input": {"text": "Are the lights on?"},
+            "priority": 5,
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    while msg.get("event", {}).get("type") != "run-end":
+        msg = await client.receive_json()
+
+    pipeline_data: PipelineData = hass.data[DOMAIN]
+    pipeline_id = list(pipeline_data.pipeline_debug)[0]
+
+    await client.send_json_auto_id(
+        {"type": "assist_pipeline/pipeline_debug/latency", "pipeline_id": pipeline_id}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert list(msg["result"]["stages"]) == ["intent"]
+    latency = msg["result"]["stages"]["intent"]
+    assert latency["queued"]["count"] == 1
+    assert latency["processing"]["count"] == 1
+
+    await client.send_json_auto_id(
+        {"type": "assist_pipeline/pipeline_debug/latency", "pipeline_id": "blah"}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"stages": {}}
+
+
 async def test_pipeline_debug_get_run_wrong_pipeline(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
@@ -1241,6 +1241,66 @@ async def test_reload_identical_automations_without_id(
         assert len(calls) == 10
 
 
+async def test_reload_matches_changed_and_unchanged_automations(
+    hass: HomeAssistant, calls: list[ServiceCall]
+) -> None:
+    """Test reload keeps unchanged automations and re-creates changed ones."""
+
+    def automation_config(alias: str, event_type: str, **extra: Any) -> dict:
+        return {
+            "alias": alias,
+            "trigger": {"platform": "event", "event_type": event_type},
+            "action": [{"action": "test.automation"}],
+            **extra,
+        }
+
+    config = {
+        automation.DOMAIN: [
+            automation_config("kept", "test_event"),
+            automation_config("changed", "test_event"),
+            automation_config("kept with id", "test_event", id="kept_id"),
+            automation_config("changed with id", "test_event", id="changed_id"),
+            automation_config("clone", "test_event"),
+            automation_config("clone", "test_event"),
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+    component = hass.data[automation.DOMAIN]
+    entities = {entity.entity_id: entity for entity in component.entities}
+    assert len(entities) == 6
+
+    config[automation.DOMAIN][1] = automation_config("changed", "test_event_2")
+    config[automation.DOMAIN][3] = automation_config(
+        "changed with id", "test_event_2", id="changed_id"
+    )
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=config,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    reloaded = {entity.entity_id: entity for entity in component.entities}
+    assert set(reloaded) == set(entities)
+    for entity_id in (
+        "automation.kept",
+        "automation.kept_with_id",
+        "automation.clone",
+        "automation.clone_2",
+    ):
+        assert reloaded[entity_id] is entities[entity_id]
+    for entity_id in ("automation.changed", "automation.changed_with_id"):
+        assert reloaded[entity_id] is not entities[entity_id]
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+    hass.bus.async_fire("test_event_2")
+    await hass.async_block_till_done()
+    assert len(calls) == 6
+
+
 @pytest.mark.parametrize(
     "automation_config",
     [
@@ -1,19 +1,31 @@
 """The tests for the camera component."""
 
-from collections.abc import Generator
+import asyncio
+from collections.abc import AsyncGenerator, Generator
 from http import HTTPStatus
 import io
 from types import ModuleType
+from typing import Any
 from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import camera
+from homeassistant.components.camera.broadcast import (
+    StillImageBroadcaster,
+    async_mjpeg_frames,
+)
 from homeassistant.components.camera.const import (
     DOMAIN,
+    PREF_IMAGE_CACHE_MAX_AGE,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
 )
+from homeassistant.components.camera.image_cache import (
+    MAX_CACHED_IMAGES,
+    CameraImageCache,
+)
 from homeassistant.components.websocket_api import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
@@ -193,6 +205,154 @@ async def test_get_image_from_camera_not_jpeg(hass: HomeAssistant) -> None:
     assert image.content == b"png"
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_concurrent_requests_share_fetch(hass: HomeAssistant) -> None:
+    """Test concurrent requests for an image share a single fetch."""
+    release = asyncio.Event()
+
+    async def camera_image(width: int | None = None, height: int | None = None):
+        await release.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=camera_image,
+    ) as mock_camera:
+        tasks = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        release.set()
+        images = await asyncio.gather(*tasks)
+
+        assert mock_camera.call_count == 1
+        assert [image.content for image in images] == [b"Test"] * 3
+
+        # The image is not cached by default
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera.call_count == 2
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_cache_max_age(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test images and their resized variants are cached up to the max age."""
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with (
+        patch(
+            "homeassistant.components.demo.camera.DemoCamera.image_cache_max_age",
+            new_callable=PropertyMock(return_value=10),
+        ),
+        patch(
+            "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+            return_value=turbo_jpeg,
+        ),
+        patch(
+            "homeassistant.components.demo.camera.Path.read_bytes",
+            autospec=True,
+            return_value=b"Valid jpeg",
+        ) as mock_camera,
+    ):
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Valid jpeg"
+        freezer.tick(5)
+        assert await camera.async_get_image(hass, "camera.demo_camera") == image
+        assert mock_camera.call_count == 1
+
+        # Resized from the cached image without fetching from the camera
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=4, height=3
+        )
+        assert image.content == EMPTY_8_6_JPEG
+        assert mock_camera.call_count == 1
+
+        freezer.tick(5)
+        await camera.async_get_image(hass, "camera.demo_camera", width=4, height=3)
+        assert mock_camera.call_count == 2
+
+    demo_camera = hass.data[DOMAIN].get_entity("camera.demo_camera")
+    assert demo_camera.image_cache.diagnostics() == {
+        "hits": 2,
+        "misses": 2,
+        "deduplicated": 0,
+        "cached_images": 2,
+    }
+
+
+async def test_image_cache_evicts_least_recently_used_variants(
+    hass: HomeAssistant,
+) -> None:
+    """Test the resized variants of an image are limited."""
+    image_cache = CameraImageCache()
+    fetch = AsyncMock(return_value=camera.Image("image/jpeg", b"full"))
+
+    def resize(image: camera.Image, width: int, height: int) -> camera.Image:
+        return camera.Image("image/jpeg", f"{width}x{height}".encode())
+
+    await image_cache.async_get_image(hass, None, None, 10, fetch, resize)
+    for width in range(1, MAX_CACHED_IMAGES + 2):
+        await image_cache.async_get_image(hass, width, width, 10, fetch, resize)
+        if width == 1:
+            continue
+        # The first variant is used again
+        await image_cache.async_get_image(hass, 1, 1, 10, fetch, resize)
+
+    assert fetch.call_count == 1
+    assert image_cache.diagnostics()["cached_images"] == MAX_CACHED_IMAGES
+    assert set(image_cache._images) == {
+        (None, None),
+        (1, 1),
+        *((width, width) for width in range(4, MAX_CACHED_IMAGES + 2)),
+    }
+
+
+@pytest.mark.usefixtures("mock_camera_with_device")
+async def test_image_cache_max_age_pref(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the image cache max age can be set as a camera preference."""
+    await async_setup_component(
+        hass, camera.DOMAIN, {camera.DOMAIN: {"platform": "demo"}}
+    )
+    await hass.async_block_till_done()
+    entity_id = entity_registry.async_get_entity_id(DOMAIN, "demo", "Demo camera")
+    client = await hass_ws_client(hass)
+
+    async def update_prefs(**prefs: Any) -> None:
+        await client.send_json_auto_id(
+            {"type": "camera/update_prefs", "entity_id": entity_id, **prefs}
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+    await update_prefs(orientation=3)
+    await update_prefs(image_cache_max_age=10)
+    assert entity_registry.async_get(entity_id).options[DOMAIN] == {
+        PREF_ORIENTATION: camera.Orientation.ROTATE_180,
+        PREF_IMAGE_CACHE_MAX_AGE: 10,
+    }
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_camera:
+        await camera.async_get_image(hass, entity_id)
+        await camera.async_get_image(hass, entity_id)
+        assert mock_camera.call_count == 1
+
+        # The max age of the camera is used again
+        await update_prefs(image_cache_max_age=None)
+        await camera.async_get_image(hass, entity_id)
+        assert mock_camera.call_count == 2
+
+
 @pytest.mark.usefixtures("mock_camera")
 async def test_get_stream_source_from_camera(
     hass: HomeAssistant, mock_stream_source: AsyncMock
@@ -619,6 +779,150 @@ async def test_camera_proxy_stream(hass_client: ClientSessionGenerator) -> None:
             assert response.status == HTTPStatus.BAD_GATEWAY
 
 
+@pytest.mark.usefixtures("mock_camera")
+async def test_camera_proxy_stream_shared(
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test the viewers of a still image stream share the camera images."""
+    release = asyncio.Event()
+    images = [b"frame1", None]
+
+    async def camera_image(width: int | None = None, height: int | None = None):
+        await release.wait()
+        return images.pop(0)
+
+    client = await hass_client()
+    url = "/api/camera_proxy_stream/camera.demo_camera?interval=0.5"
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=camera_image,
+    ) as mock_camera:
+        response_1 = await client.get(url)
+        response_2 = await client.get(url)
+        release.set()
+        bodies = [await response_1.read(), await response_2.read()]
+
+    # One fetch for the image and one ending the stream for both viewers
+    assert mock_camera.call_count == 2
+    for body in bodies:
+        # The first image is sent twice
+        assert body.count(b"Content-Length: 6\r\n\r\nframe1\r\n") == 2
+
+
+async def test_still_image_broadcaster_drops_images_for_slow_viewers(
+    hass: HomeAssistant,
+) -> None:
+    """Test a viewer only gets the latest image when it is slower than the camera."""
+    images: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+    async def camera_images() -> AsyncGenerator[bytes]:
+        while image := await images.get():
+            yield image
+
+    broadcaster = StillImageBroadcaster(hass, camera_images)
+    subscriber = broadcaster.async_subscribe()
+    for image in (b"1", b"2", b"3"):
+        images.put_nowait(image)
+    await hass.async_block_till_done()
+    assert await subscriber.async_next_image() == b"3"
+
+    # A new viewer starts from the latest image
+    late_subscriber = broadcaster.async_subscribe()
+    assert await late_subscriber.async_next_image() == b"3"
+
+    images.put_nowait(None)
+    await hass.async_block_till_done()
+    assert await subscriber.async_next_image() is None
+    assert await late_subscriber.async_next_image() is None
+
+    broadcaster.async_unsubscribe(subscriber)
+    assert broadcaster.has_subscribers
+    broadcaster.async_unsubscribe(late_subscriber)
+    assert not broadcaster.has_subscribers
+
+
+@pytest.mark.parametrize(
+    ("content_type", "body"),
+    [
+        (
+            "multipart/x-mixed-replace; boundary=myboundary",
+            b"--myboundary\r\nContent-Type: image/jpeg\r\nContent-Length: 6\r\n\r\n"
+            b"frame1\r\n--myboundary\r\nContent-Type: image/jpeg\r\n"
+            b"Content-Length: 8\r\n\r\n--frame2\r\n--myboundary--\r\n",
+        ),
+        (
+            'multipart/x-mixed-replace;boundary="--myboundary"',
+            b"--myboundary\r\nContent-Type: image/jpeg\r\n\r\nframe1\r\n"
+            b"--myboundary\r\nContent-Type: image/jpeg\r\n\r\n--frame2\r\n--myboundary--",
+        ),
+        (
+            "multipart/x-mixed-replace; boundary=myboundary",
+            b"preamble\r\n--myboundary\r\nContent-Type: image/jpeg\r\n\r\nframe1"
+            b"\r\n--myboundary\r\nContent-Length: 8\r\n\r\n--frame2\r\n",
+        ),
+    ],
+)
+async def test_mjpeg_frames(content_type: str, body: bytes) -> None:
+    """Test the images of a multipart stream are split on its boundary."""
+
+    async def chunks(size: int) -> AsyncGenerator[bytes]:
+        for index in range(0, len(body), size):
+            yield body[index : index + size]
+
+    for size in (1, 5, len(body)):
+        assert [
+            frame async for frame in async_mjpeg_frames(content_type, chunks(size))
+        ] == [b"frame1", b"--frame2"]
+
+
+async def test_mjpeg_frames_not_multipart() -> None:
+    """Test a stream which is not multipart is refused."""
+
+    async def chunks() -> AsyncGenerator[bytes]:
+        yield b"frame"
+
+    with pytest.raises(ValueError):
+        await anext(async_mjpeg_frames("image/jpeg", chunks()))
+
+
+@pytest.mark.usefixtures("mock_camera")
+async def test_camera_proxy_mjpeg_stream_shared(
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test the viewers of a proxied MJPEG stream share the camera stream."""
+    release = asyncio.Event()
+
+    async def iter_any() -> AsyncGenerator[bytes]:
+        await release.wait()
+        yield b"--frame\r\nContent-Length: 6\r\n\r\nframe1\r\n--frame--\r\n"
+
+    camera_response = Mock(
+        headers={"Content-Type": "multipart/x-mixed-replace; boundary=frame"}
+    )
+    camera_response.content.iter_any = iter_any
+    open_stream = AsyncMock(return_value=camera_response)
+
+    async def handle_async_mjpeg_stream(self, request):
+        return await self.handle_async_proxy_mjpeg_stream(request, open_stream)
+
+    client = await hass_client()
+    url = "/api/camera_proxy_stream/camera.demo_camera"
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.handle_async_mjpeg_stream",
+        handle_async_mjpeg_stream,
+    ):
+        response_1 = await client.get(url)
+        response_2 = await client.get(url)
+        release.set()
+        bodies = [await response_1.read(), await response_2.read()]
+
+    open_stream.assert_awaited_once()
+    camera_response.close.assert_called_once()
+    for body in bodies:
+        # The first image is sent twice
+        assert body.count(b"Content-Length: 6\r\n\r\nframe1\r\n") == 2
+
+
 @pytest.mark.usefixtures("mock_camera_web_rtc")
 async def test_websocket_web_rtc_offer(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -0,0 +1,89 @@
+"""Test the index of the words of sentence templates and slot lists."""
+
+from hassil.intents import Intents, TextSlotList
+
+from homeassistant.components.conversation.sentence_index import (
+    SentenceIndex,
+    SlotListIndex,
+)
+
+INTENTS = Intents.from_dict(
+    {
+        "language": "en",
+        "intents": {
+            "TurnOn": {
+                "data": [
+                    {"sentences": ["(turn|switch) on [the] {name}"]},
+                    {"sentences": ["activate <area> lights"]},
+                ]
+            },
+            "GetTime": {"data": [{"sentences": ["what time is it[?]"]}]},
+            "Wildcard": {"data": [{"sentences": ["{anything}"]}]},
+        },
+        "lists": {"name": {"values": []}, "anything": {"wildcard": True}},
+        "expansion_rules": {"area": "[in] [the] {area}"},
+    }
+)
+
+
+def _intent_data(intents: Intents) -> list[tuple[str, list[str]]]:
+    return [
+        (intent.name, intent_data.sentence_texts)
+        for intent in intents.intents.values()
+        for intent_data in intent.data
+    ]
+
+
+def test_sentence_index_prune() -> None:
+    """Test sentences are left out when the text lacks a required word."""
+    index = SentenceIndex(INTENTS)
+
+    assert _intent_data(index.prune("Turn on the kitchen light")) == [
+        ("TurnOn", ["(turn|switch) on [the] {name}"]),
+        ("Wildcard", ["{anything}"]),
+    ]
+    assert _intent_data(index.prune("Activate the lights in the kitchen")) == [
+        ("TurnOn", ["activate <area> lights"]),
+        ("Wildcard", ["{anything}"]),
+    ]
+    # Punctuation is ignored, parts of words are matched like hassil does
+    assert _intent_data(index.prune("What time is it?")) == [
+        ("GetTime", ["what time is it[?]"]),
+        ("Wildcard", ["{anything}"]),
+    ]
+    pruned = index.prune("Hello")
+    assert _intent_data(pruned) == [("Wildcard", ["{anything}"])]
+    assert pruned.expansion_rules is INTENTS.expansion_rules
+    assert pruned.slot_lists is INTENTS.slot_lists
+
+
+def test_slot_list_index_prune() -> None:
+    """Test slot list values are left out when the text lacks one of their words."""
+    slot_lists = {
+        "name": TextSlotList.from_tuples(
+            [
+                ("Kitchen Light", "Kitchen Light"),
+                ("Living-Room Lamp", "Living-Room Lamp"),
+                ("Mr. Coffee", "Mr. Coffee"),
+            ],
+            allow_template=False,
+        ),
+        "area": TextSlotList.from_tuples(
+            [("Kitchen", "Kitchen"), ("Office", "Office")], allow_template=False
+        ),
+    }
+    index = SlotListIndex(slot_lists)
+
+    pruned = index.prune("Turn on the kitchen lights")
+    assert [value.value_out for value in pruned["name"].values] == ["Kitchen Light"]
+    assert [value.value_out for value in pruned["area"].values] == ["Kitchen"]
+
+    pruned = index.prune("turn on the living room lamp and mr coffee")
+    assert [value.value_out for value in pruned["name"].values] == [
+        "Living-Room Lamp",
+        "Mr. Coffee",
+    ]
+    assert pruned["area"].values == []
+
+    # The lists themselves are left untouched
+    assert len(slot_lists["name"].values) == 3
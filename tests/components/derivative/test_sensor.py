@@ -7,13 +7,13 @@ import random
 from freezegun import freeze_time
 
 from homeassistant.components.derivative.const import DOMAIN
-from homeassistant.const import UnitOfPower, UnitOfTime
+from homeassistant.const import EVENT_STATE_CHANGED, UnitOfPower, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
-from tests.common import MockConfigEntry
+from tests.common import MockConfigEntry, async_capture_events, async_fire_time_changed
 
 
 async def test_state(hass: HomeAssistant) -> None:
@@ -390,3 +390,38 @@ async def test_device_id(
     derivative_entity = entity_registry.async_get("sensor.derivative")
     assert derivative_entity is not None
     assert derivative_entity.device_id == source_entity.device_id
+
+
+async def test_min_update_interval(hass: HomeAssistant) -> None:
+    """Test the state is written at most once per min_update_interval."""
+    writes = async_capture_events(hass, EVENT_STATE_CHANGED)
+    base = dt_util.utcnow()
+    with freeze_time(base) as freezer:
+        _, entity_id = await _setup_sensor(
+            hass,
+            {"unit_time": UnitOfTime.SECONDS, "min_update_interval": {"seconds": 10}},
+        )
+        for value in range(1, 26):
+            freezer.tick(1)
+            async_fire_time_changed(hass, dt_util.now())
+            hass.states.async_set(entity_id, value * value, {})
+            await hass.async_block_till_done()
+
+        writes = [
+            event for event in writes if event.data["entity_id"] == "sensor.power"
+        ]
+        assert [event.data["new_state"].state for event in writes] == [
+            "0",
+            "1.0",
+            "19.0",
+            "39.0",
+        ]
+
+        # The last derivative is written when the interval has passed
+        for _ in range(2):
+            freezer.tick(10)
+            async_fire_time_changed(hass, dt_util.now())
+            await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.power")
+    assert state.state == "49.0"
@@ -1,14 +1,18 @@
 """Test the Diagnostics integration."""
 
+from datetime import timedelta
 from http import HTTPStatus
+import logging
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from homeassistant import config_entries
 from homeassistant.components.websocket_api import TYPE_RESULT
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.system_info import async_get_system_info
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 
@@ -102,6 +106,7 @@ async def test_download_diagnostics(
     assert response == {
         "home_assistant": hass_sys_info,
         "setup_times": {},
+        "refresh_statistics": [],
         "custom_components": {
             "test": {
                 "documentation": "http://example.com",
@@ -265,9 +270,49 @@ async def test_download_diagnostics(
         },
         "data": {"device": "info"},
         "setup_times": {},
+        "refresh_statistics": [],
     }
 
 
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_download_diagnostics_refresh_statistics(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the refresh statistics of the config entry's coordinators are included."""
+    config_entry = MockConfigEntry(domain="fake_integration")
+    config_entry.add_to_hass(hass)
+    other_entry = MockConfigEntry(domain="fake_integration")
+    other_entry.add_to_hass(hass)
+
+    coordinators = []
+    for entry in (config_entry, other_entry):
+        config_entries.current_entry.set(entry)
+        coordinator = DataUpdateCoordinator[int](
+            hass,
+            logging.getLogger(__name__),
+            name=entry.entry_id,
+            update_method=AsyncMock(return_value=1),
+            update_interval=timedelta(seconds=30),
+        )
+        coordinator.async_add_listener(Mock())
+        await coordinator.async_refresh()
+        coordinators.append(coordinator)
+    config_entries.current_entry.set(None)
+
+    response = await _get_diagnostics_for_config_entry(hass, hass_client, config_entry)
+    assert response["refresh_statistics"] == [
+        {
+            "name": config_entry.entry_id,
+            "config_entry_id": config_entry.entry_id,
+            "update_interval": 30.0,
+            **coordinators[0].refresh_statistics.as_dict(),
+        }
+    ]
+
+    for coordinator in coordinators:
+        await coordinator.async_shutdown()
+
+
 async def test_failure_scenarios(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
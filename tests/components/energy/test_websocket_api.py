@@ -1,13 +1,17 @@
 """Test the Energy websocket API."""
 
 from typing import Any
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from homeassistant.components.energy import data, is_configured
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import (
+    EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
+    Recorder,
+)
 from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.components.recorder.util import get_instance
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -1159,3 +1163,169 @@ async def test_fossil_energy_consumption_check_missing_hour(
         hour3.isoformat(),
         hour4.isoformat(),
     ]
+
+
+async def test_statistics_during_periods(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test fetching statistics in a batch and caching the results."""
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 01:00:00"))
+    period3 = dt_util.as_utc(dt_util.parse_datetime("2021-09-02 00:00:00"))
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    for statistic_id, unit in (
+        ("test:total_energy_import", "kWh"),
+        ("test:total_energy_export", "Wh"),
+    ):
+        async_add_external_statistics(
+            hass,
+            {
+                "has_mean": False,
+                "has_sum": True,
+                "name": "Total energy",
+                "source": "test",
+                "statistic_id": statistic_id,
+                "unit_of_measurement": unit,
+            },
+            (
+                {"start": period1, "last_reset": None, "state": 0, "sum": 2},
+                {"start": period2, "last_reset": None, "state": 1, "sum": 3},
+                {"start": period3, "last_reset": None, "state": 2, "sum": 5},
+            ),
+        )
+    await async_wait_recording_done(hass)
+
+    queries = [
+        {
+            "start_time": period1.isoformat(),
+            "statistic_ids": ["test:total_energy_import", "test:total_energy_export"],
+            "period": "hour",
+            "types": ["change"],
+            "units": {"energy": "Wh"},
+        },
+        {
+            "start_time": period1.isoformat(),
+            "end_time": period3.isoformat(),
+            "statistic_ids": ["test:total_energy_import"],
+            "period": "day",
+            "types": ["sum"],
+        },
+    ]
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {"type": "energy/statistics_during_periods", "queries": queries}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    expected = []
+    for query in queries:
+        await client.send_json_auto_id(
+            {"type": "recorder/statistics_during_period", **query}
+        )
+        recorder_response = await client.receive_json()
+        assert recorder_response["success"]
+        expected.append(recorder_response["result"])
+    assert response["result"] == expected
+    assert response["result"][0]["test:total_energy_import"][0]["change"] == 2000
+    assert response["result"][1]["test:total_energy_import"][0]["sum"] == 3
+
+    # Identical queries are served from the cache
+    with patch(
+        "homeassistant.components.recorder.statistics.statistics_during_period",
+    ) as statistics_during_period:
+        await client.send_json_auto_id(
+            {"type": "energy/statistics_during_periods", "queries": queries[1:]}
+        )
+        response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == expected[1:]
+    assert not statistics_during_period.called
+
+    # The cache is invalidated when new statistics are compiled
+    hass.bus.async_fire(EVENT_RECORDER_HOURLY_STATISTICS_GENERATED)
+    await hass.async_block_till_done()
+    with patch(
+        "homeassistant.components.recorder.statistics.statistics_during_period",
+        return_value={},
+    ) as statistics_during_period:
+        await client.send_json_auto_id(
+            {"type": "energy/statistics_during_periods", "queries": queries[1:]}
+        )
+        response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == [{}]
+    assert statistics_during_period.call_count == 1
+
+    # Only results based on changed statistics are invalidated
+    instance = get_instance(hass)
+    instance.async_adjust_statistics("test:total_energy_export", period2, 1, "Wh")
+    await async_wait_recording_done(hass)
+    with patch(
+        "homeassistant.components.recorder.statistics.statistics_during_period",
+    ) as statistics_during_period:
+        await client.send_json_auto_id(
+            {"type": "energy/statistics_during_periods", "queries": queries[1:]}
+        )
+        response = await client.receive_json()
+    assert response["result"] == [{}]
+    assert not statistics_during_period.called
+
+    instance.async_adjust_statistics("test:total_energy_import", period2, 1, "kWh")
+    await async_wait_recording_done(hass)
+    await client.send_json_auto_id(
+        {"type": "energy/statistics_during_periods", "queries": queries[1:]}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"][0]["test:total_energy_import"][0]["sum"] == 4
+
+
+async def test_statistics_during_periods_checks(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test statistics_during_periods parameter validation."""
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {
+            "type": "energy/statistics_during_periods",
+            "queries": [
+                {
+                    "start_time": "donald_duck",
+                    "statistic_ids": ["test:total_energy_import"],
+                    "period": "hour",
+                }
+            ],
+        }
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"] == {
+        "code": "invalid_start_time",
+        "message": "Invalid start_time",
+    }
+
+    await client.send_json_auto_id(
+        {
+            "type": "energy/statistics_during_periods",
+            "queries": [
+                {
+                    "start_time": dt_util.utcnow().isoformat(),
+                    "end_time": "donald_duck",
+                    "statistic_ids": ["test:total_energy_import"],
+                    "period": "hour",
+                }
+            ],
+        }
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"] == {
+        "code": "invalid_end_time",
+        "message": "Invalid end_time",
+    }
@@ -1,14 +1,18 @@
 """The tests the History component."""
 
+import asyncio
+from collections.abc import Iterator
 from datetime import timedelta
 from http import HTTPStatus
 import json
-from unittest.mock import sentinel
+import threading
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
 
 from homeassistant.components import history
+from homeassistant.components.history.helpers import async_iterate_in_executor
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.components.recorder.models import process_timestamp
@@ -454,6 +458,102 @@ async def test_fetch_period_api_with_minimal_response(
     ).replace('"', "")
 
 
+async def test_fetch_period_api_streamed_in_chunks(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the fetch period view streams the states of every entity in chunks."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+
+    for state in range(3):
+        hass.states.async_set("sensor.power", state)
+        hass.states.async_set("sensor.energy", state * 10)
+        await async_wait_recording_done(hass)
+    client = await hass_client()
+    with patch("homeassistant.components.history.HISTORY_CHUNK_SIZE", 2):
+        response = await client.get(
+            f"/api/history/period/{now.isoformat()}",
+            params={
+                "filter_entity_id": "sensor.energy,sensor.unknown,sensor.power",
+                "minimal_response": "",
+            },
+        )
+    assert response.status == HTTPStatus.OK
+    assert response.headers["Content-Type"] == "application/json"
+    response_json = await response.json()
+    assert {
+        states[0]["entity_id"]: [state["state"] for state in states]
+        for states in response_json
+    } == {"sensor.energy": ["0", "10", "20"], "sensor.power": ["0", "1", "2"]}
+
+
+async def test_fetch_period_api_error_before_streaming(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
+) -> None:
+    """Test a failing query is an error response instead of a truncated stream."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.power", 1)
+    await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    with patch(
+        "homeassistant.components.recorder.history.stream_significant_states_with_session",
+        side_effect=RuntimeError("query failed"),
+    ):
+        response = await client.get(
+            f"/api/history/period/{now.isoformat()}",
+            params={"filter_entity_id": "sensor.power"},
+        )
+    assert response.status == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+async def test_iterate_in_executor_waits_for_consumer(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the executor job only reads ahead of the consumer by max_pending."""
+    produced: list[bytes] = []
+    waiting = threading.Event()
+
+    def produce() -> Iterator[bytes]:
+        for item in (b"1", b"2", b"3", b"4", b"5"):
+            produced.append(item)
+            if len(produced) == 3:
+                waiting.set()
+            yield item
+
+    chunks = async_iterate_in_executor(hass, produce, 2)
+    assert await anext(chunks) == b"1"
+    assert await hass.async_add_executor_job(waiting.wait, 5)
+    await asyncio.sleep(0.05)
+    # The item being consumed and the pending one hold the slots
+    assert len(produced) == 3
+
+    assert [item async for item in chunks] == [b"2", b"3", b"4", b"5"]
+
+
+async def test_iterate_in_executor_stopped(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the executor job stops when the consumer stops."""
+    produced: list[bytes] = []
+    done = threading.Event()
+
+    def produce() -> Iterator[bytes]:
+        try:
+            for item in (b"1", b"2", b"3", b"4", b"5"):
+                produced.append(item)
+                yield item
+        finally:
+            done.set()
+
+    chunks = async_iterate_in_executor(hass, produce, 1)
+    assert await anext(chunks) == b"1"
+    await chunks.aclose()
+    assert await hass.async_add_executor_job(done.wait, 5)
+    assert len(produced) < 5
+
+
 async def test_fetch_period_api_with_no_timestamp(
     hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
 ) -> None:
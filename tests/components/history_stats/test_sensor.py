@@ -1276,6 +1276,100 @@ async def test_measure_sliding_window(
     assert hass.states.get("sensor.sensor4").state == "41.7"
 
 
+async def test_sliding_window_evicts_without_querying_history(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a sliding window is maintained from state changes after startup."""
+    await hass.config.async_set_time_zone("UTC")
+    startup = dt_util.utcnow().replace(microsecond=0)
+    start_time = startup - timedelta(minutes=120)
+    t0 = startup - timedelta(minutes=90)
+    t1 = startup - timedelta(minutes=60)
+
+    # Start     t0        t1       Startup
+    # |--30min--|--30min--|--60min--|
+    # |---off---|---on----|---off---|
+
+    calls = 0
+
+    def _fake_states(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return {
+            "binary_sensor.state": [
+                ha.State("binary_sensor.state", "off", last_changed=start_time),
+                ha.State("binary_sensor.state", "on", last_changed=t0),
+                ha.State("binary_sensor.state", "off", last_changed=t1),
+            ]
+        }
+
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        freeze_time(startup),
+    ):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.state",
+                        "name": "sensor1",
+                        "state": "on",
+                        "end": "{{ now() }}",
+                        "duration": {"hours": 2},
+                        "type": "time",
+                    },
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.state",
+                        "name": "sensor2",
+                        "state": "on",
+                        "end": "{{ now() }}",
+                        "duration": {"hours": 2},
+                        "type": "count",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+        for i in range(1, 3):
+            await async_update_entity(hass, f"sensor.sensor{i}")
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "0.5"
+        assert hass.states.get("sensor.sensor2").state == "1"
+        history_calls = calls
+
+        # The window start passed t0, the on state is now the start state
+        now = startup + timedelta(minutes=45)
+        with freeze_time(now):
+            async_fire_time_changed(hass, now)
+            await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "0.25"
+        assert hass.states.get("sensor.sensor2").state == "1"
+
+        now += timedelta(minutes=5)
+        with freeze_time(now):
+            hass.states.async_set("binary_sensor.state", "on")
+            await hass.async_block_till_done()
+
+        now += timedelta(minutes=30)
+        with freeze_time(now):
+            async_fire_time_changed(hass, now)
+            await hass.async_block_till_done()
+
+        # All states before startup fell out of the window
+        assert hass.states.get("sensor.sensor1").state == "0.5"
+        assert hass.states.get("sensor.sensor2").state == "1"
+        assert calls == history_calls
+
+
 async def test_measure_from_end_going_backwards(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -1620,7 +1714,7 @@ async def test_end_time_with_microseconds_zeroed(
         assert hass.states.get("sensor.heatpump_compressor_today").state == "16.0"
         assert (
             hass.states.get("sensor.heatpump_compressor_today2").state
-            == "16.0002388888929"
+            == "16.0002388888889"
         )
 
 
@@ -1,13 +1,20 @@
 """The tests for http static files."""
 
+import gzip
 from http import HTTPStatus
 from pathlib import Path
+from unittest.mock import patch
 
 from aiohttp.test_utils import TestClient
 import pytest
 
 from homeassistant.components.http import StaticPathConfig
-from homeassistant.components.http.static import CachingStaticResource
+from homeassistant.components.http.static import (
+    CACHE_HEADER,
+    IMMUTABLE_CACHE_HEADER,
+    CachingStaticResource,
+    index_static_directory,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.http import KEY_ALLOW_CONFIGURED_CORS
@@ -63,3 +70,66 @@ async def test_async_register_static_paths(
     assert resp.status == HTTPStatus.OK
     resp = await client.get("/something_else/__init__.py")
     assert resp.status == HTTPStatus.OK
+
+
+async def test_static_resource_index(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test indexed files are served with their precompressed variants."""
+    (tmp_path / "app.0123abcd.js").write_bytes(b"console.log(1);")
+    (tmp_path / "app.0123abcd.js.gz").write_bytes(gzip.compress(b"console.log(1);"))
+    (tmp_path / "manifest.json").write_bytes(b"{}")
+    index = await hass.async_add_executor_job(index_static_directory, tmp_path)
+    (tmp_path / "added.txt").write_bytes(b"added")
+
+    app = hass.http.app
+    resource = CachingStaticResource("/static", tmp_path, index=index)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+
+    with patch.object(Path, "stat", side_effect=AssertionError("stat called")):
+        resp = await mock_http_client.get(
+            "/static/app.0123abcd.js", headers={"Accept-Encoding": "br, gzip"}
+        )
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert resp.headers["Cache-Control"] == IMMUTABLE_CACHE_HEADER
+        assert resp.content_type == "text/javascript"
+        assert await resp.read() == b"console.log(1);"
+        etag = resp.headers["ETag"]
+
+        resp = await mock_http_client.get(
+            "/static/app.0123abcd.js",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+        )
+        assert resp.status == HTTPStatus.NOT_MODIFIED
+
+        resp = await mock_http_client.get("/static/manifest.json")
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers["Cache-Control"] == CACHE_HEADER
+        assert await resp.json() == {}
+
+    # Files missing from the index are still served
+    resp = await mock_http_client.get("/static/added.txt")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == b"added"
+
+
+@pytest.mark.parametrize(
+    ("name", "cache_header"),
+    [
+        ("app.0123abcd.js", IMMUTABLE_CACHE_HEADER),
+        ("1010.v1vKN-oOh_0.js", IMMUTABLE_CACHE_HEADER),
+        ("en-0123456789abcdef0123456789abcdef.json", IMMUTABLE_CACHE_HEADER),
+        ("app.development.js", CACHE_HEADER),
+        ("my.placeholder.png", CACHE_HEADER),
+        ("manifest.json", CACHE_HEADER),
+    ],
+)
+async def test_static_resource_index_cache_header(
+    hass: HomeAssistant, tmp_path: Path, name: str, cache_header: str
+) -> None:
+    """Test only files with a content hash in their name are immutable."""
+    (tmp_path / name).write_bytes(b"")
+    index = await hass.async_add_executor_job(index_static_directory, tmp_path)
+    assert index[name].cache_header == cache_header
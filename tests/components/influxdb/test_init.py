@@ -5,6 +5,7 @@ from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
 import logging
+from pathlib import Path
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
@@ -51,6 +52,12 @@ def mock_batch_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
     )
 
 
+@pytest.fixture(autouse=True)
+def mock_config_dir(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Spool events in a temporary directory."""
+    hass.config.config_dir = str(tmp_path)
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture(
     request: pytest.FixtureRequest,
@@ -1372,17 +1379,27 @@ async def test_event_listener_scheduled_write(
         hass.states.async_set("entity.entity_id", 1)
         await hass.async_block_till_done()
         await async_wait_for_queue_to_process(hass)
+        await async_wait_for_queue_to_process(hass)
         assert mock_sleep.called
     assert write_api.call_count == 2
+    assert len(hass.data[influxdb.DOMAIN].spool) == 1
 
-    # Write works again
+    # Write works again, the spooled event is written first
     write_api.side_effect = None
+    hass.data[influxdb.DOMAIN]._replay_after = 0
     with patch.object(influxdb.time, "sleep") as mock_sleep:
         hass.states.async_set("entity.entity_id", "2")
         await hass.async_block_till_done()
         await async_wait_for_queue_to_process(hass)
+        await async_wait_for_queue_to_process(hass)
         assert not mock_sleep.called
-    assert write_api.call_count == 3
+    assert write_api.call_count == 4
+    assert len(hass.data[influxdb.DOMAIN].spool) == 0
+    values = [
+        write_call.args[0] if write_call.args else write_call.kwargs["record"]
+        for write_call in write_api.call_args_list[2:]
+    ]
+    assert [body[0]["fields"]["value"] for body in values] == [1, 2]
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,69 @@
+"""The tests for the InfluxDB spool."""
+
+from pathlib import Path
+
+import pytest
+
+from homeassistant.components.influxdb.spool import InfluxSpool
+
+
+def _batch(value: int, size: int = 1) -> list[dict]:
+    return [
+        {"measurement": "fake.entity", "tags": {}, "fields": {"value": value}}
+    ] * size
+
+
+def test_spool_replay_in_order(tmp_path: Path) -> None:
+    """Test spooled batches survive a restart and are replayed in order."""
+    spool = InfluxSpool(str(tmp_path / "spool"), 1024 * 1024)
+    assert not spool
+    for value in range(3):
+        assert spool.append(_batch(value, 2)) == 0
+    assert len(spool) == 6
+
+    spool = InfluxSpool(str(tmp_path / "spool"), 1024 * 1024)
+    assert len(spool) == 6
+
+    def _unavailable(json: list[dict]) -> None:
+        raise ConnectionError("fail")
+
+    with pytest.raises(ConnectionError):
+        spool.replay(_unavailable)
+    assert len(spool) == 6
+
+    written: list[list[dict]] = []
+    assert spool.replay(written.append) == 6
+    assert written == [_batch(0, 2), _batch(1, 2), _batch(2, 2)]
+    assert len(spool) == 0
+    assert spool.size == 0
+    assert not list((tmp_path / "spool").iterdir())
+
+
+def test_spool_invalid_batch(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test batches with invalid inputs are dropped from the spool."""
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024)
+    spool.append(_batch(0))
+    spool.append(_batch(1))
+
+    written: list[list[dict]] = []
+
+    def _write(json: list[dict]) -> None:
+        if json == _batch(0):
+            raise ValueError("invalid")
+        written.append(json)
+
+    assert spool.replay(_write) == 1
+    assert written == [_batch(1)]
+    assert "invalid" in caplog.text
+
+
+def test_spool_full(tmp_path: Path) -> None:
+    """Test the oldest batches are dropped when the spool is full."""
+    spool = InfluxSpool(str(tmp_path), 1)
+    assert spool.append(_batch(0, 3)) == 0
+    assert spool.append(_batch(1, 2)) == 3
+    assert len(spool) == 2
+
+    written: list[list[dict]] = []
+    spool.replay(written.append)
+    assert written == [_batch(1, 2)]
@@ -12,6 +12,7 @@ from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfDataRate,
@@ -32,6 +33,7 @@ import homeassistant.util.dt as dt_util
 
 from tests.common import (
     MockConfigEntry,
+    async_capture_events,
     async_fire_time_changed,
     mock_restore_cache_with_extra_data,
 )
@@ -927,3 +929,52 @@ async def test_on_no_max_sub_interval_expect_no_timebased_updates(
         await hass.async_block_till_done()
         state_after_100s = hass.states.get("sensor.integration")
         assert state_after_100s == state_after_last_state_change
+
+
+async def test_min_update_interval(hass: HomeAssistant) -> None:
+    """Test the state is written at most once per min_update_interval."""
+    config = {
+        "sensor": {
+            "platform": "integration",
+            "name": "integration",
+            "source": "sensor.power",
+            "round": 4,
+            "unit_time": UnitOfTime.SECONDS,
+            "min_update_interval": {"seconds": 10},
+        }
+    }
+    writes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    start_time = dt_util.utcnow()
+    with freeze_time(start_time) as freezer:
+        assert await async_setup_component(hass, "sensor", config)
+        await hass.async_block_till_done()
+        for value in range(25):
+            hass.states.async_set(
+                "sensor.power", value * 10, {ATTR_UNIT_OF_MEASUREMENT: UnitOfPower.WATT}
+            )
+            await hass.async_block_till_done()
+            freezer.tick(1)
+            async_fire_time_changed(hass, dt_util.now())
+            await hass.async_block_till_done()
+
+        # Every sample is integrated but the state is only written every 10 seconds
+        writes = [
+            event for event in writes if event.data["entity_id"] == "sensor.integration"
+        ]
+        assert [event.data["new_state"].state for event in writes] == [
+            STATE_UNKNOWN,
+            STATE_UNKNOWN,
+            "405.0000",
+            "1805.0000",
+        ]
+
+        # The last samples are written when the interval has passed
+        for _ in range(2):
+            freezer.tick(10)
+            async_fire_time_changed(hass, dt_util.now())
+            await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.integration")
+    assert state.state == "2880.0000"
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == "Ws"
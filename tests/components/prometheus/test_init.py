@@ -8,6 +8,7 @@ from unittest import mock
 
 from freezegun import freeze_time
 import prometheus_client
+from prometheus_client.openmetrics.parser import text_string_to_metric_families
 import pytest
 
 from homeassistant.components import (
@@ -209,6 +210,157 @@ async def test_view_default_namespace(
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_openmetrics(
+    client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
+) -> None:
+    """Test prometheus metrics view in the OpenMetrics format."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={
+            "Accept": "application/openmetrics-text; version=0.0.1",
+            "Accept-Encoding": "gzip",
+        },
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"].startswith("application/openmetrics-text")
+    assert resp.headers["content-encoding"] == "gzip"
+    body = (await resp.text()).split("\n")
+
+    assert "# TYPE state_change counter" in body
+    assert (
+        'entity_available{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in body
+    )
+    assert "# HELP python_info Python platform information" in body
+    assert body[-2:] == ["# EOF", ""]
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_openmetrics_prometheus_scrape(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test the OpenMetrics format is served for the Accept header of Prometheus."""
+
+    async def scrape() -> dict[str, prometheus_client.Metric]:
+        resp = await client.get(
+            prometheus.API_ENDPOINT,
+            headers={
+                "Accept": (
+                    "application/openmetrics-text;version=1.0.0,"
+                    "application/openmetrics-text;version=0.0.1;q=0.75,"
+                    "text/plain;version=0.0.4;q=0.5,*/*;q=0.1"
+                )
+            },
+        )
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers["content-type"].startswith("application/openmetrics-text")
+        # The parser rejects anything which is not valid OpenMetrics
+        return {
+            metric.name: metric
+            for metric in text_string_to_metric_families(await resp.text())
+        }
+
+    def sample_value(
+        metric: prometheus_client.Metric, name: str, entity_id: str
+    ) -> float:
+        return next(
+            sample.value
+            for sample in metric.samples
+            if sample.name == name and sample.labels["entity"] == entity_id
+        )
+
+    metrics = await scrape()
+    assert "python_info" in metrics
+    assert metrics["state_change"].type == "counter"
+    assert (
+        sample_value(
+            metrics["sensor_temperature_celsius"],
+            "sensor_temperature_celsius",
+            "sensor.outside_temperature",
+        )
+        == 15.6
+    )
+
+    hass.states.async_set(
+        "sensor.outside_temperature",
+        "17.2",
+        {
+            "device_class": "temperature",
+            "friendly_name": "Outside Temperature",
+            "unit_of_measurement": UnitOfTemperature.CELSIUS,
+        },
+    )
+    await hass.async_block_till_done()
+
+    metrics = await scrape()
+    assert (
+        sample_value(
+            metrics["sensor_temperature_celsius"],
+            "sensor_temperature_celsius",
+            "sensor.outside_temperature",
+        )
+        == 17.2
+    )
+    assert (
+        sample_value(
+            metrics["state_change"],
+            "state_change_total",
+            "sensor.outside_temperature",
+        )
+        == 2.0
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_updated_series(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test updated series are exposed while the others are kept."""
+    body = await generate_latest_metrics(client)
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 15.6' in body
+    )
+
+    hass.states.async_set(
+        "sensor.outside_temperature",
+        "17.2",
+        {
+            "device_class": "temperature",
+            "friendly_name": "Outside Temperature",
+            "unit_of_measurement": UnitOfTemperature.CELSIUS,
+        },
+    )
+    await hass.async_block_till_done()
+
+    body = await generate_latest_metrics(client)
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 17.2' in body
+    )
+    assert (
+        'state_change_total{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 2.0' in body
+    )
+    assert (
+        'entity_available{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in body
+    )
+    assert sum(line.startswith("state_change_created{") for line in body) == sum(
+        line.startswith("state_change_total{") for line in body
+    )
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(
     client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
@@ -2042,10 +2194,14 @@ def set_state_with_entry(
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
     """Mock the prometheus client."""
-    with mock.patch(f"{PROMETHEUS_PATH}.prometheus_client") as client:
-        counter_client = mock.MagicMock()
-        client.Counter = mock.MagicMock(return_value=counter_client)
-        setattr(counter_client, "labels", mock.MagicMock(return_value=mock.MagicMock()))
+    counter_client = mock.MagicMock()
+    setattr(counter_client, "labels", mock.MagicMock(return_value=mock.MagicMock()))
+    with (
+        mock.patch(f"{PROMETHEUS_PATH}.prometheus_client"),
+        mock.patch(
+            f"{PROMETHEUS_PATH}.Counter", mock.MagicMock(return_value=counter_client)
+        ),
+    ):
         yield counter_client
 
 
@@ -30,7 +30,7 @@ from homeassistant.components.recorder.models.legacy import (
 from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 import homeassistant.util.dt as dt_util
 
 from .common import (
@@ -717,6 +717,50 @@ async def test_get_significant_states_are_ordered(
     assert list(hist.keys()) == entity_ids
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("compressed_state_format", [True, False])
+async def test_stream_significant_states_with_session(
+    hass: HomeAssistant, minimal_response: bool, compressed_state_format: bool
+) -> None:
+    """Test streamed significant states match the states fetched at once."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+    entity_ids = [*reversed(states), "sensor.unknown"]
+
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids,
+        minimal_response=minimal_response,
+        compressed_state_format=compressed_state_format,
+    )
+    with session_scope(hass=hass, read_only=True) as session:
+        chunks = list(
+            history.stream_significant_states_with_session(
+                hass,
+                session,
+                zero,
+                four,
+                entity_ids,
+                minimal_response=minimal_response,
+                compressed_state_format=compressed_state_format,
+                chunk_size=1,
+            )
+        )
+
+    assert all(len(chunk) == 1 for _, chunk in chunks)
+    streamed: dict[str, list] = {}
+    for entity_id, chunk in chunks:
+        # The chunks of an entity are consecutive
+        assert entity_id not in streamed or entity_id == list(streamed)[-1]
+        streamed.setdefault(entity_id, []).extend(chunk)
+    assert sorted(streamed) == sorted(hist)
+    assert json_bytes({entity_id: streamed[entity_id] for entity_id in hist}) == (
+        json_bytes(hist)
+    )
+
+
 async def test_get_significant_states_only(
     hass: HomeAssistant,
 ) -> None:
@@ -7,7 +7,7 @@ import sys
 from unittest.mock import ANY, Mock, PropertyMock, call, patch
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.exc import (
     DatabaseError,
     InternalError,
@@ -623,6 +623,34 @@ def test_forgiving_add_index(recorder_db_url: str) -> None:
     engine.dispose()
 
 
+def test_create_statistics_rollup_tables(hass: HomeAssistant) -> None:
+    """Test the migration to schema version 45 creates the rollup tables."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    db_schema.Base.metadata.create_all(
+        engine,
+        [
+            table
+            for name, table in db_schema.Base.metadata.tables.items()
+            if name not in ("statistics_daily", "statistics_monthly")
+        ],
+    )
+    session_maker = scoped_session(sessionmaker(bind=engine, future=True))
+    assert not inspect(engine).has_table("statistics_daily")
+
+    migration._apply_update(Mock(), hass, engine, session_maker, 45, 44)
+    inspector = inspect(engine)
+    for table in ("statistics_daily", "statistics_monthly"):
+        assert inspector.has_table(table)
+        assert {index["name"] for index in inspector.get_indexes(table)} == {
+            f"ix_{table}_start_ts",
+            f"ix_{table}_statistic_id_start_ts",
+        }
+
+    # The tables are only created if they don't exist
+    migration._apply_update(Mock(), hass, engine, session_maker, 45, 44)
+    engine.dispose()
+
+
 def test_forgiving_drop_index(
     recorder_db_url: str, caplog: pytest.LogCaptureFixture
 ) -> None:
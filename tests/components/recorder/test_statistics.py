@@ -4,12 +4,17 @@ from datetime import timedelta
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -53,7 +58,12 @@ from .common import (
     statistics_during_period,
 )
 
-from tests.common import MockPlatform, mock_platform
+from tests.common import (
+    MockPlatform,
+    async_capture_events,
+    async_fire_time_changed,
+    mock_platform,
+)
 from tests.typing import RecorderInstanceGenerator, WebSocketGenerator
 
 
@@ -937,6 +947,49 @@ async def test_import_statistics(
     }
 
 
+async def test_statistics_updated_event(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test an event is fired when statistics are changed."""
+    events = async_capture_events(hass, recorder.EVENT_RECORDER_STATISTICS_UPDATED)
+    period = dt_util.as_utc(dt_util.parse_datetime("2022-10-01 00:00:00"))
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass, metadata, [{"start": period, "state": 0, "sum": 2}]
+    )
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    instance.async_adjust_statistics("test:total_energy_import", period, 1, "kWh")
+    await async_wait_recording_done(hass)
+    instance.async_change_statistics_unit(
+        "test:total_energy_import",
+        new_unit_of_measurement="Wh",
+        old_unit_of_measurement="kWh",
+    )
+    await async_wait_recording_done(hass)
+    instance.async_update_statistics_metadata(
+        "test:total_energy_import", new_statistic_id="test:total_energy"
+    )
+    await async_wait_recording_done(hass)
+    instance.async_clear_statistics(["test:total_energy"])
+    await async_wait_recording_done(hass)
+
+    assert [event.data["statistic_ids"] for event in events] == [
+        ["test:total_energy_import"],
+        ["test:total_energy_import"],
+        ["test:total_energy_import"],
+        ["test:total_energy_import", "test:total_energy"],
+        ["test:total_energy"],
+    ]
+
+
 async def test_external_statistics_errors(
     hass: HomeAssistant, setup_recorder: None, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -2636,3 +2689,202 @@ async def test_recorder_platform_with_partial_statistics_support(
 
     for meth in supported_methods:
         getattr(recorder_platform, meth).assert_called_once()
+
+
+@pytest.mark.freeze_time("2022-10-20 12:00:00+00:00")
+async def test_statistics_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test coarse periods are read from the statistics rollups."""
+    instance = recorder.get_instance(hass)
+    await async_wait_recording_done(hass)
+    assert instance.statistics_rollups_time_zone == hass.config.time_zone
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-09-28 03:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "mean": hour % 7 + 0.5,
+            "min": hour % 7 - 0.5,
+            "max": hour % 7 + 1.5,
+            "state": hour * 0.3,
+            "sum": hour * 1.1,
+        }
+        for hour in range(150)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    def _count_rollups() -> tuple[int, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return (
+                session.query(StatisticsDaily).count(),
+                session.query(StatisticsMonthly).count(),
+            )
+
+    # 7 local days in September and October
+    assert await instance.async_add_executor_job(_count_rollups) == (7, 2)
+
+    async def _assert_rollups_match_hourly_statistics() -> None:
+        queries = [
+            (period, types, units)
+            for period in ("day", "week", "month")
+            for types in (
+                {"last_reset", "max", "mean", "min", "state", "sum"},
+                {"change", "max", "min"},
+                {"sum"},
+            )
+            for units in (None, {"energy": "Wh"})
+        ]
+
+        def _query() -> list[dict[str, list[dict[str, Any]]]]:
+            return [
+                statistics.statistics_during_period(
+                    hass,
+                    start - timedelta(days=3),
+                    None,
+                    {"test:total_energy_import"},
+                    period,
+                    units,
+                    types,
+                )
+                for period, types, units in queries
+            ]
+
+        with patch.object(
+            statistics,
+            "_get_statistics_with_rollup",
+            wraps=statistics._get_statistics_with_rollup,
+        ) as get_statistics_with_rollup:
+            rollup_stats = await instance.async_add_executor_job(_query)
+        # A week including the mean can't be reduced from daily rollups
+        assert get_statistics_with_rollup.call_count == len(queries) - 2
+
+        instance.statistics_rollups_time_zone = None
+        hourly_stats = await instance.async_add_executor_job(_query)
+        instance.statistics_rollups_time_zone = hass.config.time_zone
+        for rollup_result, hourly_result in zip(
+            rollup_stats, hourly_stats, strict=True
+        ):
+            assert rollup_result.keys() == hourly_result.keys()
+            for statistic_id, rows in rollup_result.items():
+                # Converted units may differ in the last digit
+                assert rows == [
+                    pytest.approx(row) for row in hourly_result[statistic_id]
+                ]
+
+    await _assert_rollups_match_hourly_statistics()
+
+    # Adjusting the statistics recompiles the rollups
+    instance.async_adjust_statistics(
+        "test:total_energy_import", start + timedelta(hours=40), 100, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    await _assert_rollups_match_hourly_statistics()
+
+    # Importing statistics recompiles the rollups
+    external_statistics[60]["max"] = 100
+    async_add_external_statistics(hass, external_metadata, (external_statistics[60],))
+    await async_wait_recording_done(hass)
+    await _assert_rollups_match_hourly_statistics()
+
+    # Compiling the last hour of a day compiles its rollup
+    def _delete_rollups() -> None:
+        with session_scope(hass=hass) as session:
+            session.query(StatisticsDaily).delete()
+
+    await instance.async_add_executor_job(_delete_rollups)
+    do_adhoc_statistics(
+        hass, start=dt_util.as_utc(dt_util.parse_datetime("2022-09-30 23:55:00"))
+    )
+    await async_wait_recording_done(hass)
+    assert await instance.async_add_executor_job(_count_rollups) == (1, 2)
+
+    # Clearing the statistics deletes the rollups
+    instance.async_clear_statistics(["test:total_energy_import"])
+    await async_wait_recording_done(hass)
+    assert await instance.async_add_executor_job(_count_rollups) == (0, 0)
+
+
+@pytest.mark.freeze_time("2022-10-20 12:00:00+00:00")
+async def test_statistics_rollups_time_zone_change(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the statistics rollups are recompiled when the time zone is changed."""
+    instance = recorder.get_instance(hass)
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-09-28 00:00:00"))
+    external_statistics = [
+        {"start": start + timedelta(hours=hour), "state": hour, "sum": hour}
+        for hour in range(96)
+    ]
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    def _get_daily_rollup_starts() -> list[str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                dt_util.as_local(dt_util.utc_from_timestamp(start_ts)).isoformat()
+                for (start_ts,) in session.query(StatisticsDaily.start_ts).order_by(
+                    StatisticsDaily.start_ts
+                )
+            ]
+
+    assert await instance.async_add_executor_job(_get_daily_rollup_starts) == [
+        "2022-09-28T00:00:00-07:00",
+        "2022-09-29T00:00:00-07:00",
+        "2022-09-30T00:00:00-07:00",
+        "2022-10-01T00:00:00-07:00",
+    ]
+
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    with patch.object(
+        statistics,
+        "_get_statistics_with_rollup",
+        wraps=statistics._get_statistics_with_rollup,
+    ) as get_statistics_with_rollup:
+        stats = await instance.async_add_executor_job(
+            statistics_during_period, hass, start, None, None, "day"
+        )
+    # The rollups are not used until they are compiled in the new time zone
+    get_statistics_with_rollup.assert_not_called()
+    assert len(stats["test:total_energy_import"]) == 5
+
+    freezer.tick(timedelta(minutes=5))
+    async_fire_time_changed(hass)
+    for _ in range(3):
+        await async_wait_recording_done(hass)
+
+    assert instance.statistics_rollups_time_zone == "Europe/Vienna"
+    assert await instance.async_add_executor_job(_get_daily_rollup_starts) == [
+        "2022-09-28T00:00:00+02:00",
+        "2022-09-29T00:00:00+02:00",
+        "2022-09-30T00:00:00+02:00",
+        "2022-10-01T00:00:00+02:00",
+        "2022-10-02T00:00:00+02:00",
+    ]
+    assert (
+        await instance.async_add_executor_job(
+            statistics_during_period, hass, start, None, None, "day"
+        )
+        == stats
+    )
@@ -1,5 +1,6 @@
 """The tests for sensor recorder platform."""
 
+import asyncio
 import datetime
 from datetime import timedelta
 from statistics import fmean
@@ -10,7 +11,7 @@ from freezegun import freeze_time
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 
-from homeassistant.components import recorder
+from homeassistant.components import recorder, websocket_api
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.db_schema import Statistics, StatisticsShortTerm
 from homeassistant.components.recorder.statistics import (
@@ -22,7 +23,10 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.components.recorder.websocket_api import UNIT_SCHEMA
+from homeassistant.components.recorder.websocket_api import (
+    UNIT_SCHEMA,
+    _next_export_message,
+)
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import recorder as recorder_helper
@@ -40,7 +44,7 @@ from .common import (
 )
 from .conftest import InstrumentedMigration
 
-from tests.common import async_fire_time_changed
+from tests.common import MockUser, async_fire_time_changed
 from tests.typing import RecorderInstanceGenerator, WebSocketGenerator
 
 
@@ -3635,3 +3639,178 @@ async def test_import_statistics_with_last_reset(
             },
         ]
     }
+
+
+async def _async_receive_export(
+    client, result: bool = True
+) -> tuple[list[dict[str, list]], int]:
+    """Receive the chunks of an export until it is complete."""
+    if result:
+        response = await client.receive_json()
+        assert response["success"]
+    chunks = []
+    while "columns" in (event := (await client.receive_json())["event"]):
+        chunks.append(event["columns"])
+    assert event["complete"]
+    return chunks, event["rows"]
+
+
+async def test_export_states(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test streaming the states of a period column by column."""
+    now = dt_util.utcnow()
+    for state in range(3):
+        hass.states.async_set("sensor.test1", state, {"unit_of_measurement": "W"})
+        hass.states.async_set("sensor.test2", state * 2)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "recorder/export_states",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test1"],
+            "chunk_size": 2,
+        }
+    )
+    chunks, rows = await _async_receive_export(client)
+
+    assert rows == 3
+    assert [len(chunk["state"]) for chunk in chunks] == [2, 1]
+    assert chunks[0]["entity_id"] == ["sensor.test1", "sensor.test1"]
+    assert [state for chunk in chunks for state in chunk["state"]] == ["0", "1", "2"]
+    assert chunks[0]["attributes"][0] == '{"unit_of_measurement":"W"}'
+    assert chunks[0]["last_changed"] == chunks[0]["last_updated"]
+    assert chunks[0]["last_updated"][0] == pytest.approx(
+        hass.states.get("sensor.test1").last_updated.timestamp(), abs=60
+    )
+
+
+async def test_export_states_same_last_updated(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test states updated at the same time are exported once across chunks."""
+    now = dt_util.utcnow()
+    for entity in range(5):
+        hass.states.async_set(f"sensor.test{entity}", 1, timestamp=now.timestamp())
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "recorder/export_states",
+            "start_time": (now - timedelta(seconds=1)).isoformat(),
+            "chunk_size": 2,
+        }
+    )
+    chunks, rows = await _async_receive_export(client)
+
+    assert rows == 5
+    assert [len(chunk["state"]) for chunk in chunks] == [2, 2, 1]
+    assert sorted(
+        entity_id for chunk in chunks for entity_id in chunk["entity_id"]
+    ) == [f"sensor.test{entity}" for entity in range(5)]
+
+
+async def test_export_waits_for_client(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the next chunk is only read after the previous one was sent."""
+    now = dt_util.utcnow()
+    for state in range(3):
+        hass.states.async_set("sensor.test1", state)
+    await async_wait_recording_done(hass)
+
+    drained = asyncio.Event()
+    drain_calls = 0
+
+    async def async_drain(self) -> None:
+        nonlocal drain_calls
+        drain_calls += 1
+        await drained.wait()
+
+    client = await hass_ws_client()
+    with (
+        patch.object(websocket_api.ActiveConnection, "async_drain", async_drain),
+        patch(
+            "homeassistant.components.recorder.websocket_api._next_export_message",
+            wraps=_next_export_message,
+        ) as next_export_message,
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "recorder/export_states",
+                "start_time": now.isoformat(),
+                "chunk_size": 1,
+            }
+        )
+        assert (await client.receive_json())["success"]
+        assert len((await client.receive_json())["event"]["columns"]["state"]) == 1
+        await hass.async_block_till_done()
+        assert drain_calls == 1
+        assert next_export_message.call_count == 1
+
+        drained.set()
+        chunks, rows = await _async_receive_export(client, result=False)
+
+    assert len(chunks) == 2
+    assert rows == 3
+    assert next_export_message.call_count == 4
+
+
+async def test_export_statistics(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test streaming the statistics of a period column by column."""
+    now = get_start_time(dt_util.utcnow())
+    hass.config.units = METRIC_SYSTEM
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set(
+        "sensor.test1", 10, POWER_SENSOR_KW_ATTRIBUTES, timestamp=now.timestamp()
+    )
+    await async_wait_recording_done(hass)
+    do_adhoc_statistics(hass, start=now)
+    await async_recorder_block_till_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "recorder/export_statistics",
+            "start_time": now.isoformat(),
+            "period": "5minute",
+        }
+    )
+    chunks, rows = await _async_receive_export(client)
+
+    assert rows == 1
+    assert chunks == [
+        {
+            "statistic_id": ["sensor.test1"],
+            "start": [now.timestamp()],
+            "mean": [pytest.approx(10)],
+            "min": [pytest.approx(10)],
+            "max": [pytest.approx(10)],
+            "last_reset": [None],
+            "state": [None],
+            "sum": [None],
+        }
+    ]
+
+
+async def test_export_requires_admin(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test exports are only allowed for admins."""
+    hass_admin_user.groups = []
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {"type": "recorder/export_states", "start_time": dt_util.utcnow().isoformat()}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "unauthorized"
@@ -557,6 +557,42 @@ async def test_reload_unchanged_script(
         assert len(calls) == 2
 
 
+async def test_reload_matches_changed_and_unchanged_scripts(
+    hass: HomeAssistant, calls: list[ServiceCall]
+) -> None:
+    """Test reload keeps unchanged scripts and re-creates changed ones."""
+    config = {
+        script.DOMAIN: {
+            "kept": {"sequence": [{"action": "test.script"}]},
+            "clone": {"sequence": [{"action": "test.script"}]},
+            "changed": {"sequence": [{"action": "test.script"}]},
+        }
+    }
+    assert await async_setup_component(hass, script.DOMAIN, config)
+    component = hass.data[script.DOMAIN]
+    entities = {entity.entity_id: entity for entity in component.entities}
+    assert len(entities) == 3
+
+    config[script.DOMAIN]["changed"] = {
+        "sequence": [{"action": "test.script"}, {"action": "test.script"}]
+    }
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=config,
+    ):
+        await hass.services.async_call(script.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    reloaded = {entity.entity_id: entity for entity in component.entities}
+    assert set(reloaded) == set(entities)
+    assert reloaded["script.kept"] is entities["script.kept"]
+    assert reloaded["script.clone"] is entities["script.clone"]
+    assert reloaded["script.changed"] is not entities["script.changed"]
+
+    await hass.services.async_call(DOMAIN, "changed", blocking=True)
+    assert len(calls) == 2
+
+
 async def test_service_descriptions(hass: HomeAssistant) -> None:
     """Test that service descriptions are loaded and reloaded correctly."""
     # Test 1: has "description" but no "fields"
@@ -35,6 +35,7 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor.recorder import DATA_STATE_CHANGES
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component
@@ -247,6 +248,206 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_statistics_from_recorded_state_changes(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test compiling statistics from the recorded state changes."""
+    # The state changes have to be recorded after the recorder started
+    zero = get_start_time(dt_util.utcnow() + timedelta(minutes=15))
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    energy_attributes = {
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit_of_measurement": "kWh",
+    }
+    changes = [
+        (-60, "sensor.test1", "10", TEMPERATURE_SENSOR_ATTRIBUTES),
+        (-60, "sensor.test2", "100", energy_attributes),
+        (5, "sensor.test1", "-10", TEMPERATURE_SENSOR_ATTRIBUTES),
+        (10, "sensor.test2", "105", energy_attributes),
+        (55, "sensor.test1", "15", TEMPERATURE_SENSOR_ATTRIBUTES),
+        (60, "sensor.test2", "110", energy_attributes),
+        # Attribute changes are not significant for measurement sensors
+        (100, "sensor.test1", "15", {**TEMPERATURE_SENSOR_ATTRIBUTES, "extra": 1}),
+        (255, "sensor.test1", "30", TEMPERATURE_SENSOR_ATTRIBUTES),
+    ]
+    with freeze_time(zero) as freezer:
+        for seconds, entity_id, state, attributes in changes:
+            freezer.move_to(zero + timedelta(seconds=seconds))
+            hass.states.async_set(entity_id, state, attributes)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+
+    get_history.assert_not_called()
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(13.0),
+                "min": pytest.approx(-10.0),
+                "max": pytest.approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ],
+        "sensor.test2": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": pytest.approx(110.0),
+                "sum": pytest.approx(10.0),
+            }
+        ],
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
+async def test_compile_statistics_from_reduced_state_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test the recorded state changes are reduced while they are recorded."""
+    zero = get_start_time(dt_util.utcnow() + timedelta(minutes=15))
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    energy_attributes = {
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit_of_measurement": "kWh",
+    }
+    changes = [
+        (-60, "sensor.test1", "10", TEMPERATURE_SENSOR_ATTRIBUTES),
+        (-60, "sensor.test2", "100", energy_attributes),
+        (10, "sensor.test2", "101", energy_attributes),
+        (20, "sensor.test2", "102", energy_attributes),
+        (30, "sensor.test2", "103", energy_attributes),
+        # The meter was reset
+        (40, "sensor.test2", "50", energy_attributes),
+        (50, "sensor.test2", "51", energy_attributes),
+        (60, "sensor.test2", "52", energy_attributes),
+        # Changes of the next period recorded before the period is compiled
+        (305, "sensor.test1", "20", TEMPERATURE_SENSOR_ATTRIBUTES),
+        (305, "sensor.test2", "53", energy_attributes),
+    ]
+    with freeze_time(zero) as freezer:
+        for seconds, entity_id, state, attributes in changes:
+            freezer.move_to(zero + timedelta(seconds=seconds))
+            hass.states.async_set(entity_id, state, attributes)
+    await async_wait_recording_done(hass)
+
+    # Only the first and last state of a run without reset are kept
+    periods = hass.data[DATA_STATE_CHANGES].periods(
+        hass.states.async_all(DOMAIN), zero, zero + timedelta(minutes=5)
+    )
+    assert [state.state for _, state in periods["sensor.test2"].sum_states] == [
+        "100",
+        "103",
+        "50",
+        "52",
+    ]
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+
+    get_history.assert_not_called()
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(10.0),
+                "min": pytest.approx(10.0),
+                "max": pytest.approx(10.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ],
+        "sensor.test2": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": pytest.approx(52.0),
+                "sum": pytest.approx(55.0),
+            }
+        ],
+    }
+
+
+async def test_compile_statistics_from_recorded_state_changes_other_unit(
+    hass: HomeAssistant,
+) -> None:
+    """Test sensors with another unit than their statistics use the database."""
+    zero = get_start_time(dt_util.utcnow() + timedelta(minutes=15))
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    energy_attributes = {
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit_of_measurement": "kWh",
+    }
+    changes = [
+        (-60, "1", energy_attributes),
+        (310, "1500", {**energy_attributes, "unit_of_measurement": "Wh"}),
+        (360, "2000", {**energy_attributes, "unit_of_measurement": "Wh"}),
+    ]
+    with freeze_time(zero) as freezer:
+        for seconds, state, attributes in changes[:1]:
+            freezer.move_to(zero + timedelta(seconds=seconds))
+            hass.states.async_set("sensor.test1", state, attributes)
+        await async_wait_recording_done(hass)
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+        for seconds, state, attributes in changes[1:]:
+            freezer.move_to(zero + timedelta(seconds=seconds))
+            hass.states.async_set("sensor.test1", state, attributes)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history:
+        do_adhoc_statistics(hass, start=zero + timedelta(minutes=5))
+        await async_wait_recording_done(hass)
+
+    assert get_history.call_count == 1
+    assert get_history.call_args.kwargs["entity_ids"] == ["sensor.test1"]
+    stats = statistics_during_period(
+        hass, zero, period="5minute", units={"energy": "kWh"}
+    )
+    assert [(stat["state"], stat["sum"]) for stat in stats["sensor.test1"]] == [
+        (pytest.approx(1.0), pytest.approx(0.0)),
+        (pytest.approx(2.0), pytest.approx(1.0)),
+    ]
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
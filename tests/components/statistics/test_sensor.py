@@ -1435,6 +1435,73 @@ async def test_state_characteristics(hass: HomeAssistant) -> None:
             )
 
 
+async def test_state_characteristics_rolling_buffer(hass: HomeAssistant) -> None:
+    """Test the characteristics stay correct while samples leave the buffer."""
+    values = [3.5, -2, 17.25, 4, 4, 11.5, 7.125, 8, -6.75, 0, 13, 2.5, 2.5, 9, 1]
+    sampling_size = 4
+
+    def _differences(window: list[float]) -> list[tuple[float, float]]:
+        return list(zip(window, window[1:], strict=False))
+
+    expected_fns = {
+        "mean": statistics.mean,
+        "median": statistics.median,
+        "percentile": lambda window: statistics.quantiles(
+            window, n=100, method="exclusive"
+        )[29],
+        "standard_deviation": statistics.stdev,
+        "variance": statistics.variance,
+        "value_max": max,
+        "value_min": min,
+        "distance_absolute": lambda window: max(window) - min(window),
+        "sum": sum,
+        "sum_differences": lambda window: sum(
+            abs(j - i) for i, j in _differences(window)
+        ),
+        "sum_differences_nonnegative": lambda window: sum(
+            j - i if j >= i else j for i, j in _differences(window)
+        ),
+        "noisiness": lambda window: sum(abs(j - i) for i, j in _differences(window))
+        / (len(window) - 1),
+    }
+
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": f"test_{characteristic}",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": sampling_size,
+                    "precision": 6,
+                    "percentile": 30,
+                }
+                for characteristic in expected_fns
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    for index, value in enumerate(values):
+        hass.states.async_set("sensor.test_monitored", str(value), force_update=True)
+        await hass.async_block_till_done()
+        if index < sampling_size - 1:
+            continue
+        window = [
+            float(value) for value in values[index - sampling_size + 1 : index + 1]
+        ]
+        for characteristic, expected_fn in expected_fns.items():
+            state = hass.states.get(f"sensor.test_{characteristic}")
+            assert state is not None
+            assert state.state == str(round(expected_fn(window), 6)), (
+                f"value mismatch for characteristic '{characteristic}' "
+                f"with samples {window}"
+            )
+
+
 async def test_state_characteristic_mean_circular(hass: HomeAssistant) -> None:
     """Test the mean_circular state characteristic using angle data."""
     values_angular = [0, 10, 90.5, 180, 269.5, 350]
@@ -432,6 +432,51 @@ async def test_hls_max_segments(
     await stream.stop()
 
 
+async def test_hls_segment_etag_and_range(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test serving a segment with an entity tag and byte ranges."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    segment = Segment(sequence=0, duration=SEGMENT_DURATION)
+    segment.parts = [
+        Part(duration=SEGMENT_DURATION / 2, has_keyframe=True, data=b"abcdef"),
+        Part(duration=SEGMENT_DURATION / 2, has_keyframe=False, data=b"ghij"),
+    ]
+    hls.put(segment)
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    resp = await hls_client.get("/segment/0.m4s")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == b"abcdefghij"
+    assert resp.headers["Accept-Ranges"] == "bytes"
+    etag = resp.headers["ETag"]
+    assert etag == '"0-0-2"'
+
+    resp = await hls_client.get("/segment/0.m4s", headers={"If-None-Match": etag})
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    resp = await hls_client.get("/segment/0.m4s", headers={"Range": "bytes=4-7"})
+    assert resp.status == HTTPStatus.PARTIAL_CONTENT
+    assert await resp.read() == b"efgh"
+    assert resp.headers["Content-Range"] == "bytes 4-7/10"
+    assert resp.headers["ETag"] == etag
+
+    resp = await hls_client.get("/segment/0.m4s", headers={"Range": "bytes=-3"})
+    assert resp.status == HTTPStatus.PARTIAL_CONTENT
+    assert await resp.read() == b"hij"
+
+    resp = await hls_client.get("/segment/0.m4s", headers={"Range": "bytes=20-"})
+    assert resp.status == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+    assert resp.headers["Content-Range"] == "bytes */10"
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_hls_playlist_view_discontinuity(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
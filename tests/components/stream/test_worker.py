@@ -291,7 +291,9 @@ def run_worker(hass, stream, stream_source, stream_settings=None):
         {},
         stream_settings or hass.data[DOMAIN][ATTR_SETTINGS],
         stream_state,
-        KeyFrameConverter(hass, stream_settings, dynamic_stream_settings()),
+        KeyFrameConverter(
+            hass, stream_settings, dynamic_stream_settings(), stream._diagnostics
+        ),
         threading.Event(),
     )
 
@@ -1069,3 +1071,37 @@ async def test_get_image_rotated(hass: HomeAssistant, h264_video, filename) -> N
                 0
             ][0]
         ).all()
+
+
+async def test_get_image_cached_per_size(
+    hass: HomeAssistant, h264_video, filename
+) -> None:
+    """Test images of a keyframe are only encoded once per size."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        stream = create_stream(hass, h264_video, {}, dynamic_stream_settings())
+
+    with patch.object(hass.config, "is_allowed_path", return_value=True):
+        await stream.async_record(filename)
+    # Stop the worker so no new keyframe arrives, and use the converter
+    # directly as getting an image from the stream restarts the worker
+    await stream.stop()
+    converter = stream._keyframe_converter
+
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+    assert await converter.async_get_image() == EMPTY_8_6_JPEG
+    assert await converter.async_get_image() == EMPTY_8_6_JPEG
+    assert encode.call_count == 1
+    assert await converter.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+    assert await converter.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+    assert encode.call_count == 2
+    assert encode.call_args[0][0].shape == (3, 4, 3)
+
+    diagnostics = stream.get_diagnostics()
+    assert diagnostics["keyframe_decode_duration"]["count"] == 1
+    assert diagnostics["keyframe_encode_duration"]["count"] == 2
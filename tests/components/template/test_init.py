@@ -10,6 +10,7 @@ from homeassistant.components.template import DOMAIN
 from homeassistant.const import SERVICE_RELOAD
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.reload import config_hash
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
@@ -116,6 +117,59 @@ async def test_reloadable_can_remove(hass: HomeAssistant, start_ha) -> None:
     assert len(hass.states.async_all()) == 1
 
 
+@pytest.mark.parametrize(("count", "domain"), [(2, "template")])
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            "template": [
+                {
+                    "trigger": {"platform": "event", "event_type": "event_1"},
+                    "sensor": {
+                        "name": "top level",
+                        "state": "{{ trigger.event.data.source }}",
+                    },
+                },
+                {
+                    "trigger": {"platform": "event", "event_type": "event_2"},
+                    "sensor": {
+                        "name": "top level 2",
+                        "state": "{{ trigger.event.data.source }}",
+                    },
+                },
+            ],
+        },
+    ],
+)
+async def test_reload_keeps_unchanged_trigger_coordinators(
+    hass: HomeAssistant, start_ha
+) -> None:
+    """Test reload keeps the triggers and data of unchanged trigger based entities."""
+    hass.bus.async_fire("event_1", {"source": "init"})
+    hass.bus.async_fire("event_2", {"source": "init"})
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.top_level").state == "init"
+    assert hass.states.get("sensor.top_level_2").state == "init"
+    removed_coordinator, kept_coordinator = hass.data[DOMAIN]
+    # Coordinators are matched by the hash of their validated config
+    assert config_hash(kept_coordinator.config) is not None
+
+    await async_yaml_patch_helper(hass, "sensor_configuration.yaml")
+    assert hass.states.get("sensor.top_level") is None
+    assert hass.states.get("sensor.top_level_2").state == "init"
+    assert hass.data[DOMAIN] == [kept_coordinator]
+
+    # The removed coordinator no longer reacts to its trigger
+    with patch.object(removed_coordinator, "async_set_updated_data") as mock_update:
+        hass.bus.async_fire("event_1", {"source": "reload"})
+        await hass.async_block_till_done()
+    mock_update.assert_not_called()
+
+    hass.bus.async_fire("event_2", {"source": "reload"})
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.top_level_2").state == "reload"
+
+
 @pytest.mark.parametrize(("count", "domain"), [(1, "sensor")])
 @pytest.mark.parametrize(
     "config",
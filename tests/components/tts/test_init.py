@@ -1,7 +1,10 @@
 """The tests for the TTS component."""
 
 import asyncio
+from collections.abc import AsyncGenerator
+import hashlib
 from http import HTTPStatus
+import os
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -31,6 +34,7 @@ from .common import (
     SUPPORT_LANGUAGES,
     TEST_DOMAIN,
     MockProvider,
+    MockTTS,
     MockTTSEntity,
     get_media_source_url,
     mock_config_entry_setup,
@@ -38,7 +42,13 @@ from .common import (
     retrieve_media,
 )
 
-from tests.common import async_mock_service, mock_restore_cache
+from tests.common import (
+    MockModule,
+    async_mock_service,
+    mock_integration,
+    mock_platform,
+    mock_restore_cache,
+)
 from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 ORIG_WRITE_TAGS = tts.SpeechManager.write_tags
@@ -1217,6 +1227,105 @@ async def test_load_cache_retrieve_without_mem_cache(
     assert await req.read() == tts_data
 
 
+def _cache_key(message: str, language: str, engine: str) -> str:
+    """Return the cache key of a message without options."""
+    msg_hash = hashlib.sha1(bytes(message, "utf-8")).hexdigest()
+    return f"{msg_hash}_{language}_-_{engine}"
+
+
+async def test_cache_eviction(
+    hass: HomeAssistant,
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+) -> None:
+    """Test the least recently used speech is evicted from the caches."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+    manager.cache_max_files = 2
+    manager.memory_max_files = 2
+
+    for message in ("one", "two"):
+        await manager.async_get_tts_audio("tts.test", message, cache=True)
+        await hass.async_block_till_done()
+    # Use the first message again, so the second one is the least recently used
+    await manager.async_get_tts_audio("tts.test", "one", cache=True)
+    await manager.async_get_tts_audio("tts.test", "three", cache=True)
+    await hass.async_block_till_done()
+
+    expected = [
+        _cache_key(message, "en-us", "tts.test") for message in ("one", "three")
+    ]
+    assert list(manager.mem_cache) == expected
+    assert list(manager.file_cache) == expected
+    assert sorted(path.name for path in mock_tts_cache_dir.iterdir()) == sorted(
+        f"{cache_key}.mp3" for cache_key in expected
+    )
+
+
+async def test_cache_eviction_on_setup(
+    hass: HomeAssistant,
+    mock_provider: MockProvider,
+    mock_tts_cache_dir: Path,
+) -> None:
+    """Test the least recently used files are evicted when the cache is loaded."""
+    cache_keys = [_cache_key(message, "en", "test") for message in ("one", "two")]
+
+    def write_cache_files() -> None:
+        for index, cache_key in enumerate(cache_keys):
+            cache_file = mock_tts_cache_dir / f"{cache_key}.mp3"
+            cache_file.write_bytes(bytes(1024 * 1024))
+            os.utime(cache_file, (index, index))
+
+    await hass.async_add_executor_job(write_cache_files)
+    mock_integration(hass, MockModule(domain=TEST_DOMAIN))
+    mock_platform(hass, f"{TEST_DOMAIN}.{tts.DOMAIN}", MockTTS(mock_provider))
+    assert await async_setup_component(
+        hass, tts.DOMAIN, {tts.DOMAIN: {"platform": TEST_DOMAIN, "cache_max_size": 1}}
+    )
+    await hass.async_block_till_done()
+
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+    assert list(manager.file_cache) == [cache_keys[1]]
+    assert [path.name for path in mock_tts_cache_dir.iterdir()] == [
+        f"{cache_keys[1]}.mp3"
+    ]
+
+
+async def test_service_warm_cache(
+    hass: HomeAssistant,
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+) -> None:
+    """Test the warm cache service stores the messages in the file cache."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+
+    with patch.object(
+        mock_tts_entity, "get_tts_audio", return_value=("mp3", b"speech")
+    ) as mock_get_tts_audio:
+        await hass.services.async_call(
+            tts.DOMAIN,
+            tts.SERVICE_WARM_CACHE,
+            {tts.ATTR_ENGINE_ID: "tts.test", tts.ATTR_MESSAGE: ["one", "two"]},
+            blocking=True,
+        )
+        assert mock_get_tts_audio.call_count == 2
+
+        # Messages in the file cache are not generated again
+        await hass.services.async_call(
+            tts.DOMAIN,
+            tts.SERVICE_WARM_CACHE,
+            {tts.ATTR_MESSAGE: "one"},
+            blocking=True,
+        )
+        assert mock_get_tts_audio.call_count == 2
+
+    for message in ("one", "two"):
+        cache_file = mock_tts_cache_dir / (
+            f"{_cache_key(message, 'en-us', 'tts.test')}.mp3"
+        )
+        assert await hass.async_add_executor_job(cache_file.read_bytes) == b"speech"
+
+
 @pytest.mark.parametrize(
     ("setup", "data", "expected_url_suffix"),
     [
@@ -1560,6 +1669,156 @@ async def test_fetching_in_async(
     )
 
 
+async def test_streaming_in_async(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test audio is served while it is generated."""
+    chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+    class EntityWithStreaming(MockTTSEntity):
+        """Entity that streams audio chunks."""
+
+        async def async_stream_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioStreamType:
+            async def audio() -> AsyncGenerator[bytes]:
+                while (chunk := await chunks.get()) is not None:
+                    yield chunk
+
+            return ("mp3", audio())
+
+    await mock_config_entry_setup(hass, EntityWithStreaming(DEFAULT_LANG))
+
+    media_source_id = tts.generate_media_source_id(
+        hass, "test message", "tts.test", "en_US", cache=None
+    )
+    url = await get_media_source_url(hass, media_source_id)
+    client = await hass_client()
+
+    chunks.put_nowait(b"first ")
+    req = await client.get(url)
+    assert req.status == HTTPStatus.OK
+    assert await req.content.readexactly(6) == b"first "
+
+    chunks.put_nowait(b"second")
+    chunks.put_nowait(None)
+    assert await req.read() == b"second"
+
+    # The complete audio is cached
+    assert await tts.async_get_media_source_audio(hass, media_source_id) == (
+        "mp3",
+        b"first second",
+    )
+    req = await client.get(url)
+    assert req.status == HTTPStatus.OK
+    assert await req.read() == b"first second"
+
+
+async def test_not_streaming_served_complete(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test audio of engines that don't stream is served once it is tagged."""
+    tts_audio: asyncio.Future[bytes] = hass.loop.create_future()
+
+    class EntityWithoutStreaming(MockTTSEntity):
+        """Entity that returns the audio at once."""
+
+        async def async_get_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioType:
+            return ("mp3", await tts_audio)
+
+    await mock_config_entry_setup(hass, EntityWithoutStreaming(DEFAULT_LANG))
+
+    media_source_id = tts.generate_media_source_id(
+        hass, "test message", "tts.test", "en_US", cache=None
+    )
+    url = await get_media_source_url(hass, media_source_id)
+    client = await hass_client()
+
+    request = hass.async_create_task(client.get(url))
+    await asyncio.sleep(0)
+    assert not request.done()
+
+    with patch(
+        "homeassistant.components.tts.SpeechManager.write_tags",
+        return_value=b"tagged audio",
+    ):
+        tts_audio.set_result(b"audio")
+        req = await request
+    assert req.status == HTTPStatus.OK
+    assert req.headers["Content-Length"] == "12"
+    assert "Transfer-Encoding" not in req.headers
+    assert await req.read() == b"tagged audio"
+
+
+async def _async_chunks(*chunks: bytes) -> AsyncGenerator[bytes]:
+    """Yield the chunks of an audio stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_async_stream_convert_audio(tmp_path: Path) -> None:
+    """Test audio is streamed through the ffmpeg pipe."""
+    ffmpeg_binary = tmp_path / "ffmpeg"
+    ffmpeg_binary.write_text(f'#!/bin/sh\necho "$@" > {tmp_path}/args\ncat\n')
+    ffmpeg_binary.chmod(0o755)
+
+    audio = tts._async_stream_convert_audio(
+        str(ffmpeg_binary),
+        "wav",
+        _async_chunks(b"first ", b"second"),
+        "mp3",
+        to_sample_rate=22050,
+        to_sample_channels=1,
+    )
+    assert b"".join([chunk async for chunk in audio]) == b"first second"
+    assert (tmp_path / "args").read_text() == (
+        "-f wav -i pipe: -f mp3 -ar 22050 -ac 1 -q:a 0 pipe:\n"
+    )
+
+
+async def test_async_stream_convert_audio_error(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test ffmpeg failing while streaming audio raises an error."""
+    ffmpeg_binary = tmp_path / "ffmpeg"
+    ffmpeg_binary.write_text(
+        "#!/bin/sh\ncat > /dev/null\necho Invalid data >&2\nexit 1\n"
+    )
+    ffmpeg_binary.chmod(0o755)
+
+    audio = tts._async_stream_convert_audio(
+        str(ffmpeg_binary), "wav", _async_chunks(b"audio"), "ogg"
+    )
+    with pytest.raises(RuntimeError):
+        [chunk async for chunk in audio]
+    assert "Invalid data" in caplog.text
+
+
+async def test_async_stream_convert_audio_stopped(tmp_path: Path) -> None:
+    """Test ffmpeg is stopped when the converted audio is no longer read."""
+    ffmpeg_binary = tmp_path / "ffmpeg"
+    ffmpeg_binary.write_text(f"#!/bin/sh\necho $$ > {tmp_path}/pid\nexec cat\n")
+    ffmpeg_binary.chmod(0o755)
+    more_audio = asyncio.Event()
+
+    async def endless_audio() -> AsyncGenerator[bytes]:
+        yield b"first"
+        await more_audio.wait()
+        yield b"never"
+
+    audio = tts._async_stream_convert_audio(
+        str(ffmpeg_binary), "wav", endless_audio(), "ogg"
+    )
+    assert await anext(audio) == b"first"
+    await audio.aclose()
+
+    pid = int((tmp_path / "pid").read_text())
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
+
+
 @pytest.mark.parametrize(
     ("setup", "engine_id"),
     [
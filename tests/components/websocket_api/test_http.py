@@ -10,6 +10,7 @@ import pytest
 
 from homeassistant.components.websocket_api import (
     async_register_command,
+    async_response,
     const,
     http,
     websocket_command,
@@ -255,6 +256,48 @@ async def test_pending_msg_peak(
     assert "overload" in caplog.text
 
 
+async def test_drain(hass: HomeAssistant, hass_ws_client: WebSocketGenerator) -> None:
+    """Test a command can wait for its messages to be sent to the client."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    queue_sizes: list[int] = []
+
+    @websocket_command({"type": "drain"})
+    @async_response
+    async def async_drain(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        for _ in range(3):
+            connection.send_event(msg["id"], {"event": "any"})
+        queue_sizes.append(len(instance._message_queue))
+        await connection.async_drain()
+        queue_sizes.append(len(instance._message_queue))
+        connection.send_result(msg["id"])
+
+    async_register_command(hass, async_drain)
+
+    await websocket_client.send_json({"id": 5, "type": "drain"})
+    for _ in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == "event"
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "result"
+    assert queue_sizes == [3, 0]
+
+
 async def test_pending_msg_peak_recovery(
     hass: HomeAssistant,
     mock_low_peak,
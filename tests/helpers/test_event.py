@@ -30,6 +30,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_timer_counts,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -111,6 +112,115 @@ async def test_track_point_in_time(hass: HomeAssistant) -> None:
     assert len(runs) == 2
 
 
+async def test_track_point_in_time_shared_timer(hass: HomeAssistant) -> None:
+    """Test point in time trackers firing at the same time share a loop timer."""
+    birthday_paulus = datetime(1986, 7, 9, 12, 0, 0, tzinfo=dt_util.UTC)
+    runs = []
+
+    def scheduled_timers() -> int:
+        return sum(
+            1
+            for handle in hass.loop._scheduled
+            if isinstance(handle, asyncio.TimerHandle) and not handle.cancelled()
+        )
+
+    timers_before = scheduled_timers()
+    unsub_1 = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append(1)), birthday_paulus
+    )
+    async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append(2)), birthday_paulus
+    )
+    unsub_3 = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append(3)), birthday_paulus
+    )
+    assert scheduled_timers() == timers_before + 1
+    assert async_get_timer_counts(hass) == {"tests.helpers.test_event": 3}
+
+    unsub_3()
+    assert scheduled_timers() == timers_before + 1
+    assert async_get_timer_counts(hass) == {"tests.helpers.test_event": 2}
+
+    async_fire_time_changed(hass, birthday_paulus)
+    await hass.async_block_till_done()
+    assert runs == [1, 2]
+    assert async_get_timer_counts(hass) == {}
+
+    # Cancelling after the tracker fired is a no-op
+    unsub_1()
+    assert scheduled_timers() == timers_before
+
+    # Cancelling the last tracker in a slot cancels the loop timer
+    unsub = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append(4)), birthday_paulus
+    )
+    assert scheduled_timers() == timers_before + 1
+    unsub()
+    assert scheduled_timers() == timers_before
+    async_fire_time_changed(hass, birthday_paulus)
+    await hass.async_block_till_done()
+    assert runs == [1, 2]
+
+
+async def test_track_point_in_time_shared_timer_tick(hass: HomeAssistant) -> None:
+    """Test point in time trackers due in the same tick share a loop timer."""
+    point_in_time = datetime(2099, 7, 9, 12, 0, 0, tzinfo=dt_util.UTC)
+    runs = []
+
+    def scheduled_timers() -> int:
+        return sum(
+            1
+            for handle in hass.loop._scheduled
+            if isinstance(handle, asyncio.TimerHandle) and not handle.cancelled()
+        )
+
+    timers_before = scheduled_timers()
+    for run, microsecond in ((1, 1000), (2, 7000), (3, 10000), (4, 10001)):
+        async_track_point_in_utc_time(
+            hass,
+            callback(lambda x, run=run: runs.append(run)),
+            point_in_time.replace(microsecond=microsecond),
+        )
+    # The first three trackers are due in the same tick
+    assert scheduled_timers() == timers_before + 2
+
+    # Trackers fire at the end of their tick, never early
+    async_fire_time_changed_exact(hass, point_in_time.replace(microsecond=7000))
+    await hass.async_block_till_done()
+    assert runs == []
+
+    async_fire_time_changed_exact(hass, point_in_time.replace(microsecond=10000))
+    await hass.async_block_till_done()
+    assert runs == [1, 2, 3]
+
+    async_fire_time_changed_exact(hass, point_in_time.replace(microsecond=20000))
+    await hass.async_block_till_done()
+    assert runs == [1, 2, 3, 4]
+    assert scheduled_timers() == timers_before
+
+
+async def test_track_point_in_time_shared_timer_cancel_while_firing(
+    hass: HomeAssistant,
+) -> None:
+    """Test a tracker cancelled by another tracker in the same slot does not run."""
+    birthday_paulus = datetime(1986, 7, 9, 12, 0, 0, tzinfo=dt_util.UTC)
+    runs = []
+
+    @callback
+    def _cancel_other(_: datetime) -> None:
+        runs.append(1)
+        unsub_2()
+
+    async_track_point_in_utc_time(hass, _cancel_other, birthday_paulus)
+    unsub_2 = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append(2)), birthday_paulus
+    )
+
+    async_fire_time_changed(hass, birthday_paulus)
+    await hass.async_block_till_done()
+    assert runs == [1]
+
+
 async def test_track_point_in_time_drift_rearm(hass: HomeAssistant) -> None:
     """Test tasks with the time rolling backwards."""
     specific_runs = []
@@ -4378,6 +4488,61 @@ async def test_periodic_task_leaving_dst_2(
     unsub()
 
 
+# DST ends early morning October 31st 2021
+@pytest.mark.freeze_time("2021-10-31 02:29:59+02:00")
+async def test_periodic_task_leaving_dst_same_wall_time(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test trackers started at the same wall time in both folds when leaving dst."""
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    first_runs = []
+    second_runs = []
+
+    today = date.today().isoformat()
+
+    unsub_first = async_track_time_change(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: first_runs.append(x)),
+        minute=30,
+        second=0,
+    )
+
+    # The first task should fire
+    freezer.move_to(f"{today} 02:30:00.999999+02:00")
+    async_fire_time_changed(hass)
+    assert dt_util.now().fold == 0
+    await hass.async_block_till_done()
+    assert len(first_runs) == 1
+
+    # DST has ended, start a task at the same wall time as the first one
+    freezer.move_to(f"{today} 02:29:59+01:00")
+    assert dt_util.now().fold == 1
+    unsub_second = async_track_time_change(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: second_runs.append(x)),
+        minute=30,
+        second=0,
+    )
+
+    # The second task should not fire yet
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(second_runs) == 0
+
+    # Both tasks should fire
+    freezer.move_to(f"{today} 02:30:00.999999+01:00")
+    async_fire_time_changed(hass)
+    assert dt_util.now().fold == 1
+    await hass.async_block_till_done()
+    assert len(first_runs) == 2
+    assert len(second_runs) == 1
+
+    unsub_first()
+    unsub_second()
+
+
 async def test_call_later(hass: HomeAssistant) -> None:
     """Test calling an action later."""
     future = asyncio.get_running_loop().create_future()
@@ -1,5 +1,6 @@
 """Tests for the reload helper."""
 
+from datetime import timedelta
 import logging
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -17,7 +18,9 @@ from homeassistant.helpers.reload import (
     async_integration_yaml_config,
     async_reload_integration_platforms,
     async_setup_reload_service,
+    config_hash,
 )
+from homeassistant.helpers.template import Template
 from homeassistant.loader import async_get_integration
 
 from tests.common import (
@@ -275,3 +278,21 @@ async def test_async_integration_missing_yaml_config(hass: HomeAssistant) -> Non
         patch.object(config, "YAML_CONFIG_FILE", yaml_path),
     ):
         await async_integration_yaml_config(hass, DOMAIN)
+
+
+async def test_config_hash() -> None:
+    """Test hashing raw configurations."""
+    assert config_hash(None) is None
+    assert config_hash({"a": 1, "b": [1, 2]}) == config_hash({"b": [1, 2], "a": 1})
+    assert config_hash({"a": 1}) != config_hash({"a": 2})
+    assert config_hash({"a": object()}) is None
+
+
+async def test_config_hash_validated(hass: HomeAssistant) -> None:
+    """Test hashing validated configurations."""
+    assert config_hash(
+        {"value": Template("{{ 1 }}", hass), "for": timedelta(seconds=5)}
+    ) == config_hash({"value": Template("{{ 1 }}", hass), "for": timedelta(seconds=5)})
+    assert config_hash({"value": Template("{{ 1 }}", hass)}) != config_hash(
+        {"value": Template("{{ 2 }}", hass)}
+    )
@@ -18,6 +18,7 @@ from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -94,6 +95,85 @@ async def test_caching_data(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_loaded_states_decoded_on_access(hass: HomeAssistant) -> None:
+    """Test loaded states are only decoded when accessed."""
+    now = dt_util.utcnow()
+    stored_states = [
+        StoredState(State("input_boolean.b0", "on"), None, now),
+        StoredState(State("input_boolean.b1", "off", {"a": 1}), None, now),
+    ]
+
+    data = async_get(hass)
+    await hass.async_block_till_done()
+    await data.store.async_save([state.as_dict() for state in stored_states])
+
+    # Emulate a fresh load
+    hass.data.pop(DATA_RESTORE_STATE)
+    with (
+        patch("homeassistant.helpers.restore_state.Store.async_save"),
+        patch.object(
+            StoredState, "from_dict", wraps=StoredState.from_dict
+        ) as mock_from_dict,
+    ):
+        await async_load(hass)
+        await hass.async_block_till_done()
+        data = async_get(hass)
+        assert mock_from_dict.call_count == 0
+
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = "input_boolean.b1"
+        state = await entity.async_get_last_state()
+        assert mock_from_dict.call_count == 1
+
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        assert mock_from_dict.call_count == 1
+
+    assert state is not None
+    assert state.state == "off"
+    assert state.attributes == {"a": 1}
+    assert await entity.async_get_last_extra_data() is None
+
+    written_states = [
+        json_round_trip(written_state)
+        for written_state in mock_write_data.mock_calls[0][1][0]
+    ]
+    assert written_states == [
+        json_round_trip(stored_state.as_dict()) for stored_state in stored_states
+    ]
+
+
+async def test_loaded_states_changed(hass: HomeAssistant) -> None:
+    """Test changed loaded states are written back with the changes."""
+    now = dt_util.utcnow()
+    stored_state = StoredState(State("input_boolean.b0", "on"), None, now)
+
+    data = async_get(hass)
+    await hass.async_block_till_done()
+    await data.store.async_save([stored_state.as_dict()])
+
+    # Emulate a fresh load
+    hass.data.pop(DATA_RESTORE_STATE)
+    with patch("homeassistant.helpers.restore_state.Store.async_save"):
+        await async_load(hass)
+        await hass.async_block_till_done()
+    data = async_get(hass)
+
+    later = now + timedelta(minutes=5)
+    loaded_state = data.last_states["input_boolean.b0"]
+    loaded_state.last_seen = later
+    assert loaded_state.as_dict()["last_seen"] == later
+    assert loaded_state.state.state == "on"
+
+    loaded_state.extra_data = RestoredExtraData({"a": 1})
+    assert json_round_trip(loaded_state.as_dict()) == json_round_trip(
+        StoredState(stored_state.state, RestoredExtraData({"a": 1}), later).as_dict()
+    )
+
+
 async def test_async_get_instance_backwards_compatibility(hass: HomeAssistant) -> None:
     """Test async_get_instance backwards compatibility."""
     await async_load(hass)
@@ -1,5 +1,6 @@
 """Tests for the update coordinator."""
 
+import asyncio
 from datetime import datetime, timedelta
 import logging
 from unittest.mock import AsyncMock, Mock, patch
@@ -795,3 +796,277 @@ async def test_timestamp_date_update_coordinator(hass: HomeAssistant) -> None:
     unsub()
     await crd.async_refresh()
     assert len(last_update_success_times) == 1
+
+
+async def test_refresh_statistics(
+    hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
+) -> None:
+    """Test refresh statistics are recorded and exposed."""
+    assert crd.refresh_statistics.mean_duration is None
+    assert update_coordinator.async_get_refresh_statistics(hass) == []
+
+    unsub = crd.async_add_listener(Mock())
+    await crd.async_refresh()
+    crd.update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    await crd.async_refresh()
+
+    stats = crd.refresh_statistics
+    assert stats.refreshes == 2
+    assert stats.failures == 1
+    assert stats.consecutive_failures == 1
+    assert stats.max_duration >= stats.last_duration >= 0
+
+    assert update_coordinator.async_get_refresh_statistics(hass) == [
+        {
+            "name": "test",
+            "config_entry_id": None,
+            "update_interval": 10.0,
+            **stats.as_dict(),
+        }
+    ]
+
+    unsub()
+    assert update_coordinator.async_get_refresh_statistics(hass) == []
+
+
+async def test_backoff_on_failure(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the update interval backs off on consecutive failures."""
+    update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=update_method,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+    )
+    crd.async_add_listener(Mock())
+
+    async def _tick(interval: timedelta) -> int:
+        freezer.tick(interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        return update_method.call_count
+
+    with patch("homeassistant.helpers.update_coordinator.random", return_value=0.5):
+        await crd.async_refresh()
+
+        # The interval is kept until BACKOFF_AFTER_FAILURES failures
+        assert update_coordinator.BACKOFF_AFTER_FAILURES == 3
+        assert await _tick(DEFAULT_UPDATE_INTERVAL) == 2
+        assert await _tick(DEFAULT_UPDATE_INTERVAL) == 3
+
+        # Then it doubles for each failure, the jitter takes off a quarter
+        assert await _tick(DEFAULT_UPDATE_INTERVAL) == 3
+        assert await _tick(DEFAULT_UPDATE_INTERVAL / 2) == 4
+        assert await _tick(DEFAULT_UPDATE_INTERVAL * 2) == 4
+        assert await _tick(DEFAULT_UPDATE_INTERVAL) == 5
+
+        # The interval is multiplied at most MAX_BACKOFF_FACTOR times
+        backed_off = DEFAULT_UPDATE_INTERVAL * update_coordinator.MAX_BACKOFF_FACTOR
+        for call_count in range(6, 9):
+            assert await _tick(backed_off * 3 / 4) == call_count
+
+        # A successful refresh resets the interval
+        update_method.side_effect = None
+        update_method.return_value = 1
+        assert await _tick(backed_off * 3 / 4) == 9
+        assert await _tick(DEFAULT_UPDATE_INTERVAL) == 10
+
+    await crd.async_shutdown()
+
+
+async def test_backoff_on_failure_disabled(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the update interval is kept when backoff is disabled."""
+    update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=update_method,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        backoff_on_failure=False,
+    )
+    crd.async_add_listener(Mock())
+    await crd.async_refresh()
+
+    for call_count in range(2, 8):
+        freezer.tick(DEFAULT_UPDATE_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert update_method.call_count == call_count
+
+    await crd.async_shutdown()
+
+
+async def test_backoff_reset_by_manual_update(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test manually updated data ends the backoff."""
+    update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=update_method,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+    )
+    crd.async_add_listener(Mock())
+    for _ in range(update_coordinator.BACKOFF_AFTER_FAILURES):
+        await crd.async_refresh()
+
+    crd.async_set_updated_data(1)
+    assert crd.refresh_statistics.consecutive_failures == 0
+
+    freezer.tick(DEFAULT_UPDATE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert update_method.call_count == update_coordinator.BACKOFF_AFTER_FAILURES + 1
+
+    await crd.async_shutdown()
+
+
+async def test_startup_jitter(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test refreshes scheduled while Home Assistant is starting are spread."""
+    hass.set_state(CoreState.starting)
+    crd = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+
+    with patch("homeassistant.helpers.update_coordinator.random", return_value=0.5):
+        crd.async_add_listener(Mock())
+
+    # Half the interval is at most added, the jitter adds half of that
+    freezer.tick(DEFAULT_UPDATE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.data is None
+
+    freezer.tick(DEFAULT_UPDATE_INTERVAL / 4)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.data == 1
+
+    # Once started, refreshes are not jittered
+    hass.set_state(CoreState.running)
+    await crd.async_refresh()
+    assert crd.data == 2
+
+    freezer.tick(DEFAULT_UPDATE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.data == 3
+
+    await crd.async_shutdown()
+
+
+async def test_scheduled_refresh_concurrency_limit(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test scheduled refreshes to the same host are limited."""
+    running = 0
+    max_running = 0
+    release = asyncio.Event()
+
+    async def _refresh() -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+        return 1
+
+    entry = MockConfigEntry(data={"host": "1.2.3.4"})
+    config_entries.current_entry.set(entry)
+    coordinators = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name=f"test {idx}",
+            update_method=_refresh,
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+        )
+        for idx in range(4)
+    ]
+    config_entries.current_entry.set(None)
+    for crd in coordinators:
+        crd.async_add_listener(Mock())
+
+    freezer.tick(DEFAULT_UPDATE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=False)
+    assert running == update_coordinator.MAX_CONCURRENT_SCHEDULED_REFRESHES_PER_HOST
+
+    freezer.tick(5)
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert running == 0
+    assert max_running == update_coordinator.MAX_CONCURRENT_SCHEDULED_REFRESHES_PER_HOST
+    assert all(crd.data == 1 for crd in coordinators)
+
+    # The time waiting for a refresh slot is recorded next to the duration
+    assert all(crd.refresh_statistics.queued_refreshes == 1 for crd in coordinators)
+    assert sorted(crd.refresh_statistics.last_queue_wait for crd in coordinators) == [
+        0,
+        0,
+        5,
+        5,
+    ]
+    assert sorted(
+        crd.refresh_statistics.as_dict()["mean_queue_wait"] for crd in coordinators
+    ) == [0, 0, 5, 5]
+
+    for crd in coordinators:
+        await crd.async_shutdown()
+
+
+async def test_scheduled_refresh_integration_limit(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test scheduled refreshes are limited per integration."""
+    running: dict[str | None, int] = {}
+    release = asyncio.Event()
+
+    def _crd(domain: str | None) -> update_coordinator.DataUpdateCoordinator[int]:
+        async def _refresh() -> int:
+            running[domain] = running.get(domain, 0) + 1
+            await release.wait()
+            return 1
+
+        config_entries.current_entry.set(
+            MockConfigEntry(domain=domain) if domain else None
+        )
+        crd = update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name=f"test {domain}",
+            update_method=_refresh,
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+        )
+        config_entries.current_entry.set(None)
+        crd.async_add_listener(Mock())
+        return crd
+
+    limit = update_coordinator.MAX_CONCURRENT_SCHEDULED_REFRESHES_PER_INTEGRATION
+    coordinators = [
+        *(_crd("test") for _ in range(limit + 2)),
+        _crd("other"),
+        # Coordinators without a config entry are not limited
+        *(_crd(None) for _ in range(limit + 2)),
+    ]
+
+    freezer.tick(DEFAULT_UPDATE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=False)
+    assert running == {"test": limit, "other": 1, None: limit + 2}
+
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert running == {"test": limit + 2, "other": 1, None: limit + 2}
+    assert all(crd.data == 1 for crd in coordinators)
+
+    for crd in coordinators:
+        await crd.async_shutdown()
@@ -0,0 +1,148 @@
+"""Test the script to export the recorder database."""
+
+import gzip
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from homeassistant.components.recorder.db_schema import (
+    Base,
+    StateAttributes,
+    States,
+    StatesMeta,
+    Statistics,
+    StatisticsMeta,
+)
+from homeassistant.scripts import recorder_export
+from homeassistant.util.json import json_loads
+
+START = 1700000000.0
+
+
+@pytest.fixture
+def db_url(tmp_path: Path) -> str:
+    """Return the URL of a database with a few states and statistics."""
+    db_url = f"sqlite:///{tmp_path / 'home-assistant_v2.db'}"
+    engine = create_engine(db_url)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                StatesMeta(metadata_id=1, entity_id="sensor.power"),
+                StatesMeta(metadata_id=2, entity_id="sensor.energy"),
+                StateAttributes(attributes_id=1, shared_attrs='{"unit":"W"}'),
+                StatisticsMeta(
+                    id=1,
+                    statistic_id="sensor.energy",
+                    source="recorder",
+                    has_mean=False,
+                    has_sum=True,
+                ),
+            ]
+        )
+        session.add_all(
+            States(
+                metadata_id=index % 2 + 1,
+                state=str(index),
+                attributes_id=1 if index % 2 == 0 else None,
+                last_changed_ts=None if index % 3 else START,
+                last_updated_ts=START + index,
+            )
+            for index in range(5)
+        )
+        session.add_all(
+            Statistics(
+                metadata_id=1,
+                start_ts=START + index * 3600,
+                created_ts=START + index * 3600,
+                state=index,
+                sum=index * 2,
+            )
+            for index in range(3)
+        )
+        session.commit()
+    engine.dispose()
+    return db_url
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    with gzip.open(path) as file:
+        return [json_loads(line) for line in file]
+
+
+def test_export_states(
+    db_url: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test exporting states in chunks of columns."""
+    output = tmp_path / "states.jsonl.gz"
+    assert (
+        recorder_export.run(
+            [
+                "--db-url",
+                db_url,
+                "--start",
+                "2023-11-14T22:13:21+00:00",
+                "--format",
+                "jsonl",
+                "--chunk-size",
+                "2",
+                str(output),
+            ]
+        )
+        == 0
+    )
+    assert "Exported 4 rows" in capsys.readouterr().out
+
+    assert _read_jsonl(output) == [
+        {
+            "entity_id": ["sensor.energy", "sensor.power"],
+            "state": ["1", "2"],
+            "attributes": [None, '{"unit":"W"}'],
+            "last_changed": [START + 1, START + 2],
+            "last_updated": [START + 1, START + 2],
+        },
+        {
+            "entity_id": ["sensor.energy", "sensor.power"],
+            "state": ["3", "4"],
+            "attributes": [None, '{"unit":"W"}'],
+            "last_changed": [START, START + 4],
+            "last_updated": [START + 3, START + 4],
+        },
+    ]
+
+
+def test_export_statistics(db_url: str, tmp_path: Path) -> None:
+    """Test exporting statistics of an entity in a period."""
+    output = tmp_path / "statistics.jsonl.gz"
+    recorder_export.run(
+        [
+            "--db-url",
+            db_url,
+            "--statistics",
+            "hour",
+            "--id",
+            "sensor.energy",
+            "--start",
+            "2023-11-14T22:13:20+00:00",
+            "--end",
+            "2023-11-15T00:13:20+00:00",
+            "--format",
+            "jsonl",
+            str(output),
+        ]
+    )
+
+    assert _read_jsonl(output) == [
+        {
+            "statistic_id": ["sensor.energy", "sensor.energy"],
+            "start": [START, START + 3600],
+            "mean": [None, None],
+            "min": [None, None],
+            "max": [None, None],
+            "last_reset": [None, None],
+            "state": [0.0, 1.0],
+            "sum": [0.0, 2.0],
+        }
+    ]
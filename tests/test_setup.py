@@ -1229,3 +1229,183 @@ async def test_async_prepare_setup_platform(
         await setup.async_prepare_setup_platform(hass, {}, "button", "test") is None
     )
     assert button_platform is not None
+
+
+async def test_config_entry_setup_limiter(hass: HomeAssistant) -> None:
+    """Test config entries waiting for a setup slot are set up by priority."""
+    limiter = setup.ConfigEntrySetupLimiter(1)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def _setup(name: str, priority: int, nested: bool = False) -> None:
+        async with limiter.async_slot(hass, priority):
+            order.append(name)
+            if nested:
+                # Nested setups don't wait for a slot
+                async with limiter.async_slot(hass, priority):
+                    order.append(f"{name}_nested")
+            await release.wait()
+
+    first = hass.async_create_task(
+        _setup("first", setup.CONFIG_ENTRY_SETUP_PRIORITY_LOCAL, nested=True)
+    )
+    await asyncio.sleep(0)
+    cloud = hass.async_create_task(
+        _setup("cloud", setup.CONFIG_ENTRY_SETUP_PRIORITY_CLOUD)
+    )
+    cancelled = hass.async_create_task(
+        _setup("cancelled", setup.CONFIG_ENTRY_SETUP_PRIORITY_LOCAL)
+    )
+    local = hass.async_create_task(
+        _setup("local", setup.CONFIG_ENTRY_SETUP_PRIORITY_LOCAL)
+    )
+    await asyncio.sleep(0)
+    assert order == ["first", "first_nested"]
+    assert limiter.active == 1
+    assert limiter.waiting == 3
+
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert limiter.waiting == 2
+
+    release.set()
+    await asyncio.gather(first, cloud, local)
+    assert order == ["first", "first_nested", "local", "cloud"]
+    assert limiter.active == 0
+    assert limiter.waiting == 0
+
+
+async def test_config_entry_setup_priority(hass: HomeAssistant) -> None:
+    """Test config entries of local integrations are set up before cloud ones."""
+    order: list[str] = []
+
+    class MockFlowHandler(config_entries.ConfigFlow):
+        """Define a mock flow handler."""
+
+        VERSION = 1
+
+    async def mock_async_setup_entry(hass, entry):
+        """Mock setting up an entry."""
+        order.append(entry.domain)
+        await asyncio.sleep(0)
+        return True
+
+    for domain, iot_class in (
+        ("cloud_comp", "cloud_polling"),
+        ("local_comp", "local_push"),
+    ):
+        mock_integration(
+            hass,
+            MockModule(
+                domain,
+                async_setup_entry=mock_async_setup_entry,
+                partial_manifest={"iot_class": iot_class},
+            ),
+        )
+        mock_platform(hass, f"{domain}.config_flow", None)
+        MockConfigEntry(domain=domain).add_to_hass(hass)
+
+    with (
+        patch.dict(
+            config_entries.HANDLERS,
+            {"cloud_comp": MockFlowHandler, "local_comp": MockFlowHandler},
+        ),
+        patch.object(setup, "MAX_CONCURRENT_CONFIG_ENTRY_SETUPS", 1),
+    ):
+        limiter = setup.async_get_config_entry_setup_limiter(hass)
+        # Keep the only slot busy so both config entries have to wait
+        blocker = asyncio.Event()
+        slot_taken = asyncio.Event()
+
+        async def _hold_slot() -> None:
+            async with limiter.async_slot(hass, 0):
+                slot_taken.set()
+                await blocker.wait()
+
+        hold_task = hass.async_create_task(_hold_slot())
+        await slot_taken.wait()
+
+        setup_task = hass.async_create_task(
+            setup.async_setup_component(hass, "cloud_comp", {})
+        )
+        local_setup_task = hass.async_create_task(
+            setup.async_setup_component(hass, "local_comp", {})
+        )
+        for _ in range(100):
+            if limiter.waiting == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert order == []
+        assert limiter.waiting == 2
+
+        blocker.set()
+        assert await setup_task
+        assert await local_setup_task
+        await hold_task
+
+    assert order == ["local_comp", "cloud_comp"]
+    assert limiter.active == 0
+
+
+async def test_config_entry_setup_waiting_for_dependency(hass: HomeAssistant) -> None:
+    """Test a config entry holding the only slot can wait for a dependency."""
+    dependency_set_up = asyncio.Event()
+
+    class MockFlowHandler(config_entries.ConfigFlow):
+        """Define a mock flow handler."""
+
+        VERSION = 1
+
+    async def mock_async_setup_entry_comp(hass, entry):
+        """Mock setting up an entry waiting for its dependency."""
+        await dependency_set_up.wait()
+        return True
+
+    async def mock_async_setup_entry_dependency(hass, entry):
+        """Mock setting up an entry of the dependency."""
+        dependency_set_up.set()
+        return True
+
+    mock_integration(
+        hass,
+        MockModule(
+            "comp",
+            async_setup_entry=mock_async_setup_entry_comp,
+            partial_manifest={"after_dependencies": ["dependency"]},
+        ),
+    )
+    mock_integration(
+        hass,
+        MockModule("dependency", async_setup_entry=mock_async_setup_entry_dependency),
+    )
+    for domain in ("comp", "dependency"):
+        mock_platform(hass, f"{domain}.config_flow", None)
+        MockConfigEntry(domain=domain).add_to_hass(hass)
+
+    with (
+        patch.dict(
+            config_entries.HANDLERS,
+            {"comp": MockFlowHandler, "dependency": MockFlowHandler},
+        ),
+        patch.object(setup, "MAX_CONCURRENT_CONFIG_ENTRY_SETUPS", 1),
+    ):
+        limiter = setup.async_get_config_entry_setup_limiter(hass)
+        comp_setup_task = hass.async_create_task(
+            setup.async_setup_component(hass, "comp", {})
+        )
+        for _ in range(100):
+            if limiter.active == 1:
+                break
+            await asyncio.sleep(0.01)
+        assert limiter.active == 1
+
+        # The dependency is set up in another task while comp holds the slot
+        dependency_setup_task = hass.async_create_task(
+            setup.async_setup_component(hass, "dependency", {})
+        )
+        async with asyncio.timeout(5):
+            assert await dependency_setup_task
+            assert await comp_setup_task
+
+    assert limiter.active == 0
+    assert limiter.waiting == 0